@@ -0,0 +1,26 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccSn(betterproto.Message):
+    resource: "AccountResourceSnapshot" = betterproto.message_field(1)
+    character: "AccountCharacterSnapshot" = betterproto.message_field(2)
+    mail: "AccountMailRecord" = betterproto.message_field(3)
+    achievement: "AccountAchievementSnapshot" = betterproto.message_field(4)
+    misc: "AccountMiscSnapshot" = betterproto.message_field(5)
+    gift_code: "AccountGiftCodeRecord" = betterproto.message_field(6)
+
+
+from .. import (  # noqa: E402
+    AccountAchievementSnapshot,
+    AccountCharacterSnapshot,
+    AccountGiftCodeRecord,
+    AccountMailRecord,
+    AccountMiscSnapshot,
+    AccountResourceSnapshot,
+)
@@ -0,0 +1,55 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Account(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    nickname: str = betterproto.string_field(2)
+    login_time: int = betterproto.uint32_field(3)
+    logout_time: int = betterproto.uint32_field(4)
+    room_id: int = betterproto.uint32_field(5)
+    anti_addiction: "AntiAddiction" = betterproto.message_field(6)
+    title: int = betterproto.uint32_field(7)
+    signature: str = betterproto.string_field(8)
+    email: str = betterproto.string_field(9)
+    email_verify: int = betterproto.uint32_field(10)
+    gold: int = betterproto.uint32_field(11)
+    diamond: int = betterproto.uint32_field(12)
+    avatar_id: int = betterproto.uint32_field(13)
+    vip: int = betterproto.uint32_field(14)
+    birthday: int = betterproto.int32_field(15)
+    phone: str = betterproto.string_field(16)
+    phone_verify: int = betterproto.uint32_field(17)
+    platform_diamond: List["AccountPlatformDiamond"] = betterproto.message_field(18)
+    level: "AccountLevel" = betterproto.message_field(21)
+    level3: "AccountLevel" = betterproto.message_field(22)
+    avatar_frame: int = betterproto.uint32_field(23)
+    skin_ticket: int = betterproto.uint32_field(24)
+    platform_skin_ticket: List["AccountPlatformSkinTicket"] = betterproto.message_field(
+        25
+    )
+    verified: int = betterproto.uint32_field(26)
+    challenge_levels: List["AccountChallengeLevel"] = betterproto.message_field(27)
+    frozen_state: int = betterproto.uint32_field(29)
+    achievement_count: List["AccountAchievementCount"] = betterproto.message_field(28)
+    loading_image: List[int] = betterproto.uint32_field(30)
+    favorite_hu: List["FavoriteHu"] = betterproto.message_field(34)
+    badges: List["AccountBadge"] = betterproto.message_field(35)
+
+
+from .. import (  # noqa: E402
+    AccountAchievementCount,
+    AccountBadge,
+    AccountChallengeLevel,
+    AccountLevel,
+    AccountPlatformDiamond,
+    AccountPlatformSkinTicket,
+    AntiAddiction,
+    FavoriteHu,
+)
@@ -0,0 +1,25 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountAchievementSnapshot(betterproto.Message):
+    achievements: List["AchievementProgress"] = betterproto.message_field(1)
+    rewarded_group: "AccountAchievementSnapshotRewardedGroupSnapshot" = (
+        betterproto.message_field(2)
+    )
+    version: "AccountAchievementSnapshotAchievementVersion" = betterproto.message_field(
+        3
+    )
+
+
+from .. import (  # noqa: E402
+    AccountAchievementSnapshotAchievementVersion,
+    AccountAchievementSnapshotRewardedGroupSnapshot,
+    AchievementProgress,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountActiveState(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    login_time: int = betterproto.uint32_field(2)
+    logout_time: int = betterproto.uint32_field(3)
+    is_online: bool = betterproto.bool_field(4)
+    playing: "AccountPlayingGame" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    AccountPlayingGame,
+)
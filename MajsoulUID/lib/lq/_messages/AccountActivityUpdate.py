@@ -0,0 +1,43 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountActivityUpdate(betterproto.Message):
+    mine_data: List["MineActivityData"] = betterproto.message_field(1)
+    rpg_data: List["RpgActivity"] = betterproto.message_field(2)
+    feed_data: List["ActivityFeedData"] = betterproto.message_field(3)
+    spot_data: List["ActivitySpotData"] = betterproto.message_field(4)
+    friend_gift_data: List["ActivityFriendGiftData"] = betterproto.message_field(5)
+    upgrade_data: List["ActivityUpgradeData"] = betterproto.message_field(6)
+    gacha_data: List["ActivityGachaUpdateData"] = betterproto.message_field(7)
+    simulation_data: List["ActivitySimulationData"] = betterproto.message_field(8)
+    combining_data: List["ActivityCombiningLqData"] = betterproto.message_field(9)
+    village_data: List["ActivityVillageData"] = betterproto.message_field(10)
+    festival_data: List["ActivityFestivalData"] = betterproto.message_field(11)
+    island_data: List["ActivityIslandData"] = betterproto.message_field(12)
+    amulet_data: List["ActivityAmuletData"] = betterproto.message_field(13)
+    story_data: List["ActivityStoryData"] = betterproto.message_field(14)
+
+
+from .. import (  # noqa: E402
+    ActivityAmuletData,
+    ActivityCombiningLqData,
+    ActivityFeedData,
+    ActivityFestivalData,
+    ActivityFriendGiftData,
+    ActivityGachaUpdateData,
+    ActivityIslandData,
+    ActivitySimulationData,
+    ActivitySpotData,
+    ActivityStoryData,
+    ActivityUpgradeData,
+    ActivityVillageData,
+    MineActivityData,
+    RpgActivity,
+)
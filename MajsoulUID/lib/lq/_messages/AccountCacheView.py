@@ -0,0 +1,34 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountCacheView(betterproto.Message):
+    cache_version: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    nickname: str = betterproto.string_field(3)
+    login_time: int = betterproto.uint32_field(4)
+    logout_time: int = betterproto.uint32_field(5)
+    is_online: bool = betterproto.bool_field(6)
+    room_id: int = betterproto.uint32_field(7)
+    title: int = betterproto.uint32_field(8)
+    avatar_id: int = betterproto.uint32_field(9)
+    vip: int = betterproto.uint32_field(10)
+    level: "AccountLevel" = betterproto.message_field(11)
+    playing_game: "AccountPlayingGame" = betterproto.message_field(12)
+    level3: "AccountLevel" = betterproto.message_field(13)
+    avatar_frame: int = betterproto.uint32_field(14)
+    verified: int = betterproto.uint32_field(15)
+    ban_deadline: int = betterproto.uint32_field(16)
+    comment_ban: int = betterproto.uint32_field(17)
+    ban_state: int = betterproto.uint32_field(18)
+
+
+from .. import (  # noqa: E402
+    AccountLevel,
+    AccountPlayingGame,
+)
@@ -0,0 +1,29 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountCharacterSnapshot(betterproto.Message):
+    created_characters: List[int] = betterproto.uint32_field(1)
+    removed_characters: List["Character"] = betterproto.message_field(2)
+    modified_characters: List["Character"] = betterproto.message_field(3)
+    main_character: "AccountCharacterSnapshotMainCharacterSnapshot" = (
+        betterproto.message_field(4)
+    )
+    skins: "AccountCharacterSnapshotSkinsSnapshot" = betterproto.message_field(5)
+    hidden_characters: "AccountCharacterSnapshotHiddenCharacter" = (
+        betterproto.message_field(6)
+    )
+
+
+from .. import (  # noqa: E402
+    AccountCharacterSnapshotHiddenCharacter,
+    AccountCharacterSnapshotMainCharacterSnapshot,
+    AccountCharacterSnapshotSkinsSnapshot,
+    Character,
+)
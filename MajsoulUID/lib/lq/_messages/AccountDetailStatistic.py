@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatistic(betterproto.Message):
+    game_mode: List["AccountStatisticByGameMode"] = betterproto.message_field(1)
+    fan: List["AccountStatisticByFan"] = betterproto.message_field(2)
+    liujumanguan: int = betterproto.uint32_field(3)
+    fan_achieved: List["AccountFanAchieved"] = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    AccountFanAchieved,
+    AccountStatisticByFan,
+    AccountStatisticByGameMode,
+)
@@ -0,0 +1,31 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2(betterproto.Message):
+    friend_room_statistic: "AccountDetailStatistic" = betterproto.message_field(1)
+    rank_statistic: "AccountDetailStatisticV2RankStatistic" = betterproto.message_field(
+        2
+    )
+    customized_contest_statistic: (
+        "AccountDetailStatisticV2CustomizedContestStatistic"
+    ) = betterproto.message_field(3)
+    leisure_match_statistic: "AccountDetailStatistic" = betterproto.message_field(4)
+    challenge_match_statistic: "AccountDetailStatisticV2ChallengeStatistic" = (
+        betterproto.message_field(5)
+    )
+    activity_match_statistic: "AccountDetailStatistic" = betterproto.message_field(6)
+    ab_match_statistic: "AccountDetailStatistic" = betterproto.message_field(7)
+
+
+from .. import (  # noqa: E402
+    AccountDetailStatistic,
+    AccountDetailStatisticV2ChallengeStatistic,
+    AccountDetailStatisticV2CustomizedContestStatistic,
+    AccountDetailStatisticV2RankStatistic,
+)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2ChallengeStatistic(betterproto.Message):
+    all_season: "AccountDetailStatistic" = betterproto.message_field(1)
+    season_data_list: List["AccountDetailStatisticV2ChallengeStatisticSeasonData"] = (
+        betterproto.message_field(2)
+    )
+
+
+from .. import (  # noqa: E402
+    AccountDetailStatistic,
+    AccountDetailStatisticV2ChallengeStatisticSeasonData,
+)
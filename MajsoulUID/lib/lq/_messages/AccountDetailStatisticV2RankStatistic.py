@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2RankStatistic(betterproto.Message):
+    total_statistic: "AccountDetailStatisticV2RankStatisticRankData" = (
+        betterproto.message_field(1)
+    )
+    month_statistic: "AccountDetailStatisticV2RankStatisticRankData" = (
+        betterproto.message_field(2)
+    )
+    month_refresh_time: int = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    AccountDetailStatisticV2RankStatisticRankData,
+)
@@ -0,0 +1,12 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountGiftCodeRecord(betterproto.Message):
+    used_gift_code: List[str] = betterproto.string_field(1)
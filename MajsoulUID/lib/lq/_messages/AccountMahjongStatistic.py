@@ -0,0 +1,34 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatistic(betterproto.Message):
+    final_position_counts: List[int] = betterproto.uint32_field(1)
+    recent_round: "AccountMahjongStatisticRoundSummary" = betterproto.message_field(2)
+    recent_hu: "AccountMahjongStatisticHuSummary" = betterproto.message_field(3)
+    highest_hu: "HighestHuRecord" = betterproto.message_field(4)
+    recent_20_hu_summary: "AccountMahjongStatisticLiqi20Summary" = (
+        betterproto.message_field(6)
+    )
+    recent_10_hu_summary: "AccountMahjongStatisticLiQi10Summary" = (
+        betterproto.message_field(7)
+    )
+    recent_10_game_result: List["AccountMahjongStatisticGameResult"] = (
+        betterproto.message_field(8)
+    )
+
+
+from .. import (  # noqa: E402
+    AccountMahjongStatisticGameResult,
+    AccountMahjongStatisticHuSummary,
+    AccountMahjongStatisticLiQi10Summary,
+    AccountMahjongStatisticLiqi20Summary,
+    AccountMahjongStatisticRoundSummary,
+    HighestHuRecord,
+)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatisticHuSummary(betterproto.Message):
+    total_count: int = betterproto.uint32_field(1)
+    dora_round_count: int = betterproto.uint32_field(2)
+    total_fan: int = betterproto.uint32_field(3)
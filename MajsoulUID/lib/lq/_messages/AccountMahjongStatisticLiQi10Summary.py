@@ -0,0 +1,12 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatisticLiQi10Summary(betterproto.Message):
+    total_xuanshang: int = betterproto.uint32_field(1)
+    total_fanshu: int = betterproto.uint32_field(2)
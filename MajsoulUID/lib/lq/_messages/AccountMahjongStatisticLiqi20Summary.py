@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatisticLiqi20Summary(betterproto.Message):
+    total_count: int = betterproto.uint32_field(1)
+    total_lidora_count: int = betterproto.uint32_field(2)
+    average_hu_point: int = betterproto.uint32_field(3)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatisticRoundSummary(betterproto.Message):
+    total_count: int = betterproto.uint32_field(1)
+    rong_count: int = betterproto.uint32_field(2)
+    zimo_count: int = betterproto.uint32_field(3)
+    fangchong_count: int = betterproto.uint32_field(4)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMailRecordMailSnapshot(betterproto.Message):
+    mail_id: int = betterproto.uint32_field(1)
+    reference_id: int = betterproto.uint32_field(2)
+    create_time: int = betterproto.uint32_field(3)
+    expire_time: int = betterproto.uint32_field(4)
+    take_attachment: int = betterproto.uint32_field(5)
+    attachments: List["RewardSlot"] = betterproto.message_field(6)
+
+
+from .. import (  # noqa: E402
+    RewardSlot,
+)
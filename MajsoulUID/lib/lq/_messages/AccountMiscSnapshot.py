@@ -0,0 +1,34 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshot(betterproto.Message):
+    faith_data: "FaithData" = betterproto.message_field(1)
+    vip_reward_gained: "AccountMiscSnapshotAccountVipRewardSnapshot" = (
+        betterproto.message_field(2)
+    )
+    vip: "AccountMiscSnapshotAccountVip" = betterproto.message_field(3)
+    shop_info: "ShopInfo" = betterproto.message_field(4)
+    month_ticket: "AccountMiscSnapshotAccountMonthTicketSnapshot" = (
+        betterproto.message_field(5)
+    )
+    recharged: "AccountMiscSnapshotAccountRechargeInfo" = betterproto.message_field(6)
+    month_ticket_v2: "AccountMiscSnapshotAccountMonthTicketSnapshotV2" = (
+        betterproto.message_field(7)
+    )
+
+
+from .. import (  # noqa: E402
+    AccountMiscSnapshotAccountMonthTicketSnapshot,
+    AccountMiscSnapshotAccountMonthTicketSnapshotV2,
+    AccountMiscSnapshotAccountRechargeInfo,
+    AccountMiscSnapshotAccountVip,
+    AccountMiscSnapshotAccountVipRewardSnapshot,
+    FaithData,
+    ShopInfo,
+)
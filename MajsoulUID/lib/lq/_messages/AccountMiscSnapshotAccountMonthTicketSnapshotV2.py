@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotAccountMonthTicketSnapshotV2(betterproto.Message):
+    end_time: int = betterproto.uint32_field(1)
+    last_pay_time: int = betterproto.uint32_field(2)
+    record_start_time: int = betterproto.uint32_field(3)
+    history: List[int] = betterproto.uint32_field(4)
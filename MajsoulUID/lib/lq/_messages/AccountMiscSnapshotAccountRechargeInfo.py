@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotAccountRechargeInfo(betterproto.Message):
+    records: List["AccountMiscSnapshotAccountRechargeInfoRechargeRecord"] = (
+        betterproto.message_field(1)
+    )
+    has_data: int = betterproto.uint32_field(2)
+
+
+from .. import (  # noqa: E402
+    AccountMiscSnapshotAccountRechargeInfoRechargeRecord,
+)
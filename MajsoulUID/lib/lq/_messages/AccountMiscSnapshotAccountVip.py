@@ -0,0 +1,11 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotAccountVip(betterproto.Message):
+    vip: int = betterproto.uint32_field(1)
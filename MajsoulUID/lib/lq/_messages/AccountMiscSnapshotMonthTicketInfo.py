@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotMonthTicketInfo(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    end_time: int = betterproto.uint32_field(2)
+    last_pay_time: int = betterproto.uint32_field(3)
+    record_start_time: int = betterproto.uint32_field(4)
+    history: List[int] = betterproto.uint32_field(5)
@@ -0,0 +1,30 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountResourceSnapshot(betterproto.Message):
+    bag_item: List["AccountResourceSnapshotBagItemSnapshot"] = (
+        betterproto.message_field(1)
+    )
+    currency: List["AccountResourceSnapshotCurrencySnapshot"] = (
+        betterproto.message_field(2)
+    )
+    title: "AccountResourceSnapshotTitleSnapshot" = betterproto.message_field(3)
+    used_title: "AccountResourceSnapshotUsedTitleSnapshot" = betterproto.message_field(
+        4
+    )
+    currency_convert: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    AccountResourceSnapshotBagItemSnapshot,
+    AccountResourceSnapshotCurrencySnapshot,
+    AccountResourceSnapshotTitleSnapshot,
+    AccountResourceSnapshotUsedTitleSnapshot,
+)
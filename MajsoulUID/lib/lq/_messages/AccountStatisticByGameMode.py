@@ -0,0 +1,35 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountStatisticByGameMode(betterproto.Message):
+    mode: int = betterproto.uint32_field(1)
+    game_count_sum: int = betterproto.uint32_field(2)
+    game_final_position: List[int] = betterproto.uint32_field(3)
+    fly_count: int = betterproto.uint32_field(4)
+    gold_earn_sum: float = betterproto.float_field(5)
+    round_count_sum: int = betterproto.uint32_field(6)
+    dadian_sum: float = betterproto.float_field(7)
+    round_end: List["AccountStatisticByGameModeRoundEndData"] = (
+        betterproto.message_field(8)
+    )
+    ming_count_sum: int = betterproto.uint32_field(9)
+    liqi_count_sum: int = betterproto.uint32_field(10)
+    xun_count_sum: int = betterproto.uint32_field(11)
+    highest_lianzhuang: int = betterproto.uint32_field(12)
+    score_earn_sum: int = betterproto.uint32_field(13)
+    rank_score: List["AccountStatisticByGameModeRankScore"] = betterproto.message_field(
+        14
+    )
+
+
+from .. import (  # noqa: E402
+    AccountStatisticByGameModeRankScore,
+    AccountStatisticByGameModeRoundEndData,
+)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountStatisticData(betterproto.Message):
+    mahjong_category: int = betterproto.uint32_field(1)
+    game_category: int = betterproto.uint32_field(2)
+    statistic: "AccountMahjongStatistic" = betterproto.message_field(3)
+    game_type: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    AccountMahjongStatistic,
+)
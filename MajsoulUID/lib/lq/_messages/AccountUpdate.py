@@ -0,0 +1,51 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdate(betterproto.Message):
+    numerical: List["AccountUpdateNumericalUpdate"] = betterproto.message_field(1)
+    character: "AccountUpdateCharacterUpdate" = betterproto.message_field(2)
+    bag: "BagUpdate" = betterproto.message_field(3)
+    achievement: "AccountUpdateAchievementUpdate" = betterproto.message_field(4)
+    shilian: "AccountShiLian" = betterproto.message_field(5)
+    daily_task: "AccountUpdateDailyTaskUpdate" = betterproto.message_field(6)
+    title: "AccountUpdateTitleUpdate" = betterproto.message_field(7)
+    new_recharged_list: List[int] = betterproto.uint32_field(8)
+    activity_task: "AccountUpdateTaskUpdate" = betterproto.message_field(9)
+    activity_flip_task: "AccountUpdateTaskUpdate" = betterproto.message_field(10)
+    activity_period_task: "AccountUpdateTaskUpdate" = betterproto.message_field(11)
+    activity_random_task: "AccountUpdateTaskUpdate" = betterproto.message_field(12)
+    challenge: "AccountUpdateAccountChallengeUpdate" = betterproto.message_field(13)
+    ab_match: "AccountUpdateAccountAbMatchUpdate" = betterproto.message_field(14)
+    activity: "AccountActivityUpdate" = betterproto.message_field(15)
+    activity_segment_task: "AccountUpdateSegmentTaskUpdate" = betterproto.message_field(
+        16
+    )
+    month_ticket: "AccountUpdateMonthTicketUpdate" = betterproto.message_field(17)
+    main_character: "AccountUpdateMainCharacterUpdate" = betterproto.message_field(18)
+    badge: "AccountUpdateBadgeUpdate" = betterproto.message_field(19)
+
+
+from .. import (  # noqa: E402
+    AccountActivityUpdate,
+    AccountShiLian,
+    AccountUpdateAccountAbMatchUpdate,
+    AccountUpdateAccountChallengeUpdate,
+    AccountUpdateAchievementUpdate,
+    AccountUpdateBadgeUpdate,
+    AccountUpdateCharacterUpdate,
+    AccountUpdateDailyTaskUpdate,
+    AccountUpdateMainCharacterUpdate,
+    AccountUpdateMonthTicketUpdate,
+    AccountUpdateNumericalUpdate,
+    AccountUpdateSegmentTaskUpdate,
+    AccountUpdateTaskUpdate,
+    AccountUpdateTitleUpdate,
+    BagUpdate,
+)
@@ -0,0 +1,25 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateAccountAbMatchUpdate(betterproto.Message):
+    match_id: int = betterproto.uint32_field(1)
+    match_count: int = betterproto.uint32_field(2)
+    buy_in_count: int = betterproto.uint32_field(3)
+    point: int = betterproto.uint32_field(4)
+    rewarded: bool = betterproto.bool_field(5)
+    match_max_point: List["AccountUpdateAccountAbMatchUpdateMatchPoint"] = (
+        betterproto.message_field(6)
+    )
+    quit: bool = betterproto.bool_field(7)
+
+
+from .. import (  # noqa: E402
+    AccountUpdateAccountAbMatchUpdateMatchPoint,
+)
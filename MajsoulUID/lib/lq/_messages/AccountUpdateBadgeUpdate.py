@@ -0,0 +1,17 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateBadgeUpdate(betterproto.Message):
+    progresses: List["BadgeAchieveProgress"] = betterproto.message_field(1)
+
+
+from .. import (  # noqa: E402
+    BadgeAchieveProgress,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateCharacterUpdate(betterproto.Message):
+    characters: List["Character"] = betterproto.message_field(2)
+    skins: List[int] = betterproto.uint32_field(3)
+    finished_endings: List[int] = betterproto.uint32_field(4)
+    rewarded_endings: List[int] = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    Character,
+)
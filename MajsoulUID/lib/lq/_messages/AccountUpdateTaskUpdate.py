@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateTaskUpdate(betterproto.Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+    task_list: List[int] = betterproto.uint32_field(2)
+
+
+from .. import (  # noqa: E402
+    TaskProgress,
+)
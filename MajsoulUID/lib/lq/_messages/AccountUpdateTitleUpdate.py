@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateTitleUpdate(betterproto.Message):
+    new_titles: List[int] = betterproto.uint32_field(1)
+    remove_titles: List[int] = betterproto.uint32_field(2)
@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AchievementProgress(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    counter: int = betterproto.uint32_field(2)
+    achieved: bool = betterproto.bool_field(3)
+    rewarded: bool = betterproto.bool_field(4)
+    achieved_time: int = betterproto.uint32_field(5)
@@ -0,0 +1,26 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionAnGangAddGang(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    tiles: str = betterproto.string_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+    doras: List[str] = betterproto.string_field(6)
+    zhenting: bool = betterproto.bool_field(7)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(8)
+    muyu: "MuyuInfo" = betterproto.message_field(9)
+
+
+from .. import (  # noqa: E402
+    MuyuInfo,
+    OptionalOperationList,
+    TingPaiInfo,
+)
@@ -0,0 +1,27 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionChangeTile(betterproto.Message):
+    in_tiles: List[str] = betterproto.string_field(1)
+    in_tile_states: List[int] = betterproto.int32_field(2)
+    out_tiles: List[str] = betterproto.string_field(3)
+    out_tile_states: List[int] = betterproto.int32_field(4)
+    doras: List[str] = betterproto.string_field(5)
+    tingpais0: List["TingPaiDiscardInfo"] = betterproto.message_field(6)
+    tingpais1: List["TingPaiInfo"] = betterproto.message_field(7)
+    operation: "OptionalOperationList" = betterproto.message_field(8)
+    change_type: int = betterproto.uint32_field(9)
+
+
+from .. import (  # noqa: E402
+    OptionalOperationList,
+    TingPaiDiscardInfo,
+    TingPaiInfo,
+)
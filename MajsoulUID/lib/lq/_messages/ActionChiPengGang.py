@@ -0,0 +1,35 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionChiPengGang(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    tiles: List[str] = betterproto.string_field(3)
+    froms: List[int] = betterproto.uint32_field(4)
+    liqi: "LiQiSuccess" = betterproto.message_field(5)
+    operation: "OptionalOperationList" = betterproto.message_field(6)
+    zhenting: bool = betterproto.bool_field(7)
+    tingpais: List["TingPaiDiscardInfo"] = betterproto.message_field(8)
+    tile_states: List[int] = betterproto.uint32_field(9)
+    muyu: "MuyuInfo" = betterproto.message_field(10)
+    scores: List[int] = betterproto.int32_field(11)
+    liqibang: int = betterproto.uint32_field(12)
+    yongchang: "YongchangInfo" = betterproto.message_field(13)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(14)
+
+
+from .. import (  # noqa: E402
+    HunZhiYiJiBuffInfo,
+    LiQiSuccess,
+    MuyuInfo,
+    OptionalOperationList,
+    TingPaiDiscardInfo,
+    YongchangInfo,
+)
@@ -0,0 +1,36 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionDiscardTile(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    tile: str = betterproto.string_field(2)
+    is_liqi: bool = betterproto.bool_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+    moqie: bool = betterproto.bool_field(5)
+    zhenting: bool = betterproto.bool_field(6)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    is_wliqi: bool = betterproto.bool_field(9)
+    tile_state: int = betterproto.uint32_field(10)
+    muyu: "MuyuInfo" = betterproto.message_field(11)
+    revealed: bool = betterproto.bool_field(12)
+    scores: List[int] = betterproto.int32_field(13)
+    liqibang: int = betterproto.uint32_field(14)
+    yongchang: "YongchangInfo" = betterproto.message_field(25)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(26)
+
+
+from .. import (  # noqa: E402
+    HunZhiYiJiBuffInfo,
+    MuyuInfo,
+    OptionalOperationList,
+    TingPaiInfo,
+    YongchangInfo,
+)
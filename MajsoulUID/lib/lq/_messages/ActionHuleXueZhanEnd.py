@@ -0,0 +1,28 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionHuleXueZhanEnd(betterproto.Message):
+    hules: List["HuInfoXueZhanMid"] = betterproto.message_field(1)
+    old_scores: List[int] = betterproto.int32_field(2)
+    delta_scores: List[int] = betterproto.int32_field(3)
+    scores: List[int] = betterproto.int32_field(4)
+    wait_timeout: int = betterproto.uint32_field(5)
+    gameend: "GameEnd" = betterproto.message_field(6)
+    doras: List[str] = betterproto.string_field(7)
+    muyu: "MuyuInfo" = betterproto.message_field(8)
+    hules_history: List["HuleInfo"] = betterproto.message_field(9)
+
+
+from .. import (  # noqa: E402
+    GameEnd,
+    HuInfoXueZhanMid,
+    HuleInfo,
+    MuyuInfo,
+)
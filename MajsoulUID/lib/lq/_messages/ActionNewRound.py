@@ -0,0 +1,42 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionNewRound(betterproto.Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    tiles: List[str] = betterproto.string_field(4)
+    dora: str = betterproto.string_field(5)
+    scores: List[int] = betterproto.int32_field(6)
+    operation: "OptionalOperationList" = betterproto.message_field(7)
+    liqibang: int = betterproto.uint32_field(8)
+    tingpais0: List["TingPaiDiscardInfo"] = betterproto.message_field(9)
+    tingpais1: List["TingPaiInfo"] = betterproto.message_field(10)
+    al: bool = betterproto.bool_field(11)
+    md5: str = betterproto.string_field(12)
+    left_tile_count: int = betterproto.uint32_field(13)
+    doras: List[str] = betterproto.string_field(14)
+    opens: List["NewRoundOpenedTiles"] = betterproto.message_field(15)
+    muyu: "MuyuInfo" = betterproto.message_field(16)
+    ju_count: int = betterproto.uint32_field(17)
+    field_spell: int = betterproto.uint32_field(18)
+    sha256: str = betterproto.string_field(19)
+    yongchang: "YongchangInfo" = betterproto.message_field(20)
+    salt_sha256: str = betterproto.string_field(21)
+
+
+from .. import (  # noqa: E402
+    MuyuInfo,
+    NewRoundOpenedTiles,
+    OptionalOperationList,
+    TingPaiDiscardInfo,
+    TingPaiInfo,
+    YongchangInfo,
+)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionPrototype(betterproto.Message):
+    step: int = betterproto.uint32_field(1)
+    name: str = betterproto.string_field(2)
+    data: bytes = betterproto.bytes_field(3)
@@ -0,0 +1,27 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionRevealTile(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    is_liqi: bool = betterproto.bool_field(2)
+    is_wliqi: bool = betterproto.bool_field(3)
+    moqie: bool = betterproto.bool_field(4)
+    scores: List[int] = betterproto.int32_field(5)
+    liqibang: int = betterproto.uint32_field(6)
+    operation: "OptionalOperationList" = betterproto.message_field(7)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(8)
+    tile: str = betterproto.string_field(9)
+    zhenting: bool = betterproto.bool_field(10)
+
+
+from .. import (  # noqa: E402
+    OptionalOperationList,
+    TingPaiInfo,
+)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionSelectGap(betterproto.Message):
+    gap_types: List[int] = betterproto.uint32_field(1)
+    tingpais0: List["TingPaiDiscardInfo"] = betterproto.message_field(2)
+    tingpais1: List["TingPaiInfo"] = betterproto.message_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    OptionalOperationList,
+    TingPaiDiscardInfo,
+    TingPaiInfo,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActionUnveilTile(betterproto.Message):
+    seat: int = betterproto.int32_field(1)
+    scores: List[int] = betterproto.int32_field(2)
+    liqibang: int = betterproto.uint32_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    OptionalOperationList,
+)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    game: "AmuletGameData" = betterproto.message_field(2)
+    version: int = betterproto.uint32_field(3)
+    upgrade: "ActivityAmuletUpgradeData" = betterproto.message_field(4)
+    illustrated_book: "ActivityAmuletIllustratedBookData" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    ActivityAmuletIllustratedBookData,
+    ActivityAmuletUpgradeData,
+    AmuletGameData,
+)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletHuRecord(betterproto.Message):
+    point: str = betterproto.string_field(1)
+    pai: str = betterproto.string_field(2)
+    fan: int = betterproto.uint64_field(3)
+    base: int = betterproto.uint64_field(4)
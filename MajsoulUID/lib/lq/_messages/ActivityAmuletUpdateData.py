@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletUpdateData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    game_update: "AmuletGameUpdateData" = betterproto.message_field(2)
+    game_empty: bool = betterproto.bool_field(3)
+
+
+from .. import (  # noqa: E402
+    AmuletGameUpdateData,
+)
@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityArenaData(betterproto.Message):
+    win_count: int = betterproto.uint32_field(1)
+    lose_count: int = betterproto.uint32_field(2)
+    activity_id: int = betterproto.uint32_field(3)
+    enter_time: int = betterproto.uint32_field(4)
+    daily_enter_count: int = betterproto.uint32_field(5)
+    daily_enter_time: int = betterproto.uint32_field(6)
+    max_win_count: int = betterproto.uint32_field(7)
+    total_win_count: int = betterproto.uint32_field(8)
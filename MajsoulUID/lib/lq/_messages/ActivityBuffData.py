@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityBuffData(betterproto.Message):
+    buff_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(5)
+    count: int = betterproto.uint32_field(6)
+    update_time: int = betterproto.uint32_field(7)
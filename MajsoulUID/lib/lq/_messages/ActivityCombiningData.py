@@ -0,0 +1,30 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    workbench: List["ActivityCombiningWorkbench"] = betterproto.message_field(2)
+    orders: List["ActivityCombiningOrderData"] = betterproto.message_field(3)
+    recycle_bin: "ActivityCombiningWorkbench" = betterproto.message_field(4)
+    menu: "ActivityCombiningMenuData" = betterproto.message_field(5)
+    current_order_id: int = betterproto.uint32_field(6)
+    bonus: "ActivityCombiningDataBonusData" = betterproto.message_field(7)
+    unlocked_craft: List[int] = betterproto.uint32_field(8)
+    craft_pool: List["ActivityCombiningPoolData"] = betterproto.message_field(9)
+    order_pool: List["ActivityCombiningPoolData"] = betterproto.message_field(10)
+
+
+from .. import (  # noqa: E402
+    ActivityCombiningDataBonusData,
+    ActivityCombiningMenuData,
+    ActivityCombiningOrderData,
+    ActivityCombiningPoolData,
+    ActivityCombiningWorkbench,
+)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningLqData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    workbench: List["ActivityCombiningWorkbench"] = betterproto.message_field(2)
+    orders: List["ActivityCombiningOrderData"] = betterproto.message_field(3)
+    recycle_bin: "ActivityCombiningWorkbench" = betterproto.message_field(4)
+    unlocked_craft: List[int] = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    ActivityCombiningOrderData,
+    ActivityCombiningWorkbench,
+)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningOrderData(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    pos: int = betterproto.uint32_field(2)
+    craft_id: int = betterproto.uint32_field(3)
+    unlock_day: int = betterproto.uint32_field(4)
@@ -0,0 +1,25 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFeedData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    feed_count: int = betterproto.uint32_field(2)
+    friend_receive_data: "ActivityFeedDataCountWithTimeData" = (
+        betterproto.message_field(3)
+    )
+    friend_send_data: "ActivityFeedDataCountWithTimeData" = betterproto.message_field(4)
+    gift_inbox: List["ActivityFeedDataGiftBoxData"] = betterproto.message_field(5)
+    max_inbox_id: int = betterproto.uint32_field(6)
+
+
+from .. import (  # noqa: E402
+    ActivityFeedDataCountWithTimeData,
+    ActivityFeedDataGiftBoxData,
+)
@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFeedDataGiftBoxData(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    item_id: int = betterproto.uint32_field(2)
+    count: int = betterproto.uint32_field(3)
+    from_account_id: int = betterproto.uint32_field(4)
+    time: int = betterproto.uint32_field(5)
+    received: int = betterproto.uint32_field(6)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFestivalData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+    proposal_list: List["FestivalProposalData"] = betterproto.message_field(3)
+    event_list: List[int] = betterproto.uint32_field(4)
+    buy_record: "SignedTimeCounterData" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    FestivalProposalData,
+    SignedTimeCounterData,
+)
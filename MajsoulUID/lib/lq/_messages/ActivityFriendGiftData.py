@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFriendGiftData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    max_inbox_id: int = betterproto.uint32_field(2)
+    receive_data: "ActivityFriendGiftDataCountWithTimeData" = betterproto.message_field(
+        3
+    )
+    send_data: "ActivityFriendGiftDataCountWithTimeData" = betterproto.message_field(4)
+    gift_inbox: List["ActivityFriendGiftDataGiftBoxData"] = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    ActivityFriendGiftDataCountWithTimeData,
+    ActivityFriendGiftDataGiftBoxData,
+)
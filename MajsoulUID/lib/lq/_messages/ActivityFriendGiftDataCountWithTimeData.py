@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFriendGiftDataCountWithTimeData(betterproto.Message):
+    count: int = betterproto.uint32_field(1)
+    last_update_time: int = betterproto.uint32_field(2)
+    send_friend_id: List[int] = betterproto.uint32_field(3)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityIslandData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    zone: int = betterproto.uint32_field(2)
+    bags: List["IslandBagData"] = betterproto.message_field(3)
+    zones: List["IslandZoneData"] = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    IslandBagData,
+    IslandZoneData,
+)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityRankPointData(betterproto.Message):
+    leaderboard_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.int32_field(2)
+    gained_reward: bool = betterproto.bool_field(3)
+    gainable_time: int = betterproto.uint32_field(4)
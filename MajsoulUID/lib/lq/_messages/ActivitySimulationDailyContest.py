@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySimulationDailyContest(betterproto.Message):
+    day: int = betterproto.uint32_field(1)
+    characters: List[int] = betterproto.uint32_field(2)
+    records: List["ActivitySimulationGameRecord"] = betterproto.message_field(3)
+    round: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    ActivitySimulationGameRecord,
+)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySimulationData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    stats: List[int] = betterproto.uint32_field(2)
+    stamina_update_time: int = betterproto.uint32_field(3)
+    daily_contest: List["ActivitySimulationDailyContest"] = betterproto.message_field(4)
+    train_records: List["ActivitySimulationTrainRecord"] = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    ActivitySimulationDailyContest,
+    ActivitySimulationTrainRecord,
+)
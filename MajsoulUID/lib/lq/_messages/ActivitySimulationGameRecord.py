@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySimulationGameRecord(betterproto.Message):
+    round: int = betterproto.uint32_field(1)
+    seats: List[int] = betterproto.uint32_field(2)
+    uuid: str = betterproto.string_field(3)
+    start_time: int = betterproto.uint32_field(4)
+    scores: List[int] = betterproto.int32_field(5)
+    messages: List["ActivitySimulationGameRecordMessage"] = betterproto.message_field(6)
+
+
+from .. import (  # noqa: E402
+    ActivitySimulationGameRecordMessage,
+)
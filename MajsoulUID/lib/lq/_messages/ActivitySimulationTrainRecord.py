@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySimulationTrainRecord(betterproto.Message):
+    time: int = betterproto.uint32_field(1)
+    modify_stats: List[int] = betterproto.int32_field(2)
+    final_stats: List[int] = betterproto.uint32_field(3)
+    type: int = betterproto.uint32_field(4)
@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySpotDataSpotData(betterproto.Message):
+    unique_id: int = betterproto.uint32_field(1)
+    rewarded: int = betterproto.uint32_field(2)
+    unlocked_ending: List[int] = betterproto.uint32_field(3)
+    unlocked: int = betterproto.uint32_field(4)
@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ActivityVillageData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    buildings: List["VillageBuildingData"] = betterproto.message_field(2)
+    trip: List["VillageTripData"] = betterproto.message_field(3)
+    tasks: List["VillageTaskData"] = betterproto.message_field(6)
+    round: int = betterproto.uint32_field(7)
+
+
+from .. import (  # noqa: E402
+    VillageBuildingData,
+    VillageTaskData,
+    VillageTripData,
+)
@@ -0,0 +1,33 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletActivityHookEffect(betterproto.Message):
+    add_dora: List[int] = betterproto.uint32_field(1)
+    add_tian_dora: List[str] = betterproto.string_field(3)
+    add_effect: List[int] = betterproto.uint32_field(4)
+    remove_effect: List[int] = betterproto.uint32_field(5)
+    add_buff: List[int] = betterproto.uint32_field(6)
+    remove_buff: List[int] = betterproto.uint32_field(7)
+    add_coin: int = betterproto.int32_field(9)
+    tile_replace: List["AmuletReplace"] = betterproto.message_field(11)
+    add_fan: int = betterproto.int64_field(12)
+    add_base: int = betterproto.int64_field(13)
+    modify_fan: List["AmuletFan"] = betterproto.message_field(14)
+    id: int = betterproto.uint32_field(15)
+    modify_dora: bool = betterproto.bool_field(16)
+    uid: int = betterproto.uint32_field(17)
+    add_show_tile: List[int] = betterproto.uint32_field(18)
+    add_dora_count: int = betterproto.int32_field(19)
+
+
+from .. import (  # noqa: E402
+    AmuletFan,
+    AmuletReplace,
+)
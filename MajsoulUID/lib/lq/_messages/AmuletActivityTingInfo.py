@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletActivityTingInfo(betterproto.Message):
+    tile: str = betterproto.string_field(1)
+    fan: int = betterproto.uint64_field(2)
+    ting_tile: str = betterproto.string_field(3)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletFan(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    val: int = betterproto.int32_field(2)
+    count: int = betterproto.uint32_field(3)
+    yiman: bool = betterproto.bool_field(4)
@@ -0,0 +1,61 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameData(betterproto.Message):
+    pool: List["AmuletTile"] = betterproto.message_field(1)
+    tile_replace: List["AmuletTile"] = betterproto.message_field(2)
+    tian_dora: List[str] = betterproto.string_field(3)
+    mountain: List[int] = betterproto.uint32_field(4)
+    dora: List[int] = betterproto.uint32_field(5)
+    hands: List[int] = betterproto.uint32_field(7)
+    ming: List["AmuletMingInfo"] = betterproto.message_field(8)
+    effect_list: List["AmuletEffectData"] = betterproto.message_field(9)
+    buff_list: List["AmuletBuffData"] = betterproto.message_field(10)
+    level: int = betterproto.uint32_field(11)
+    point: str = betterproto.string_field(13)
+    coin: int = betterproto.uint32_field(14)
+    shop: "AmuletGameShopData" = betterproto.message_field(16)
+    used: List[int] = betterproto.uint32_field(20)
+    boss_buff: List[int] = betterproto.uint32_field(21)
+    stage: int = betterproto.uint32_field(22)
+    desktop: List[int] = betterproto.uint32_field(24)
+    show_desktop: List[int] = betterproto.uint32_field(25)
+    desktop_remain: int = betterproto.uint32_field(26)
+    free_effect_list: List[int] = betterproto.uint32_field(27)
+    show_desktop_tiles: List["AmuletShowDesktopTileData"] = betterproto.message_field(
+        28
+    )
+    change_tile_count: int = betterproto.uint32_field(29)
+    ting_list: List["AmuletActivityTingInfo"] = betterproto.message_field(30)
+    next_operation: List["AmuletGameOperation"] = betterproto.message_field(31)
+    shop_buff_list: List["AmuletBuffData"] = betterproto.message_field(32)
+    remain_change_tile_count: int = betterproto.int32_field(33)
+    used_desktop: List[int] = betterproto.uint32_field(34)
+    after_gang: int = betterproto.uint32_field(35)
+    record_data: List["AmuletGameRecordData"] = betterproto.message_field(36)
+    skill_buff_list: List["AmuletBuffData"] = betterproto.message_field(37)
+    max_effect_count: int = betterproto.uint32_field(38)
+    highest_hu: "ActivityAmuletHuRecord" = betterproto.message_field(39)
+    total_consumed_coin: int = betterproto.uint32_field(40)
+    boss_buff_id: List[int] = betterproto.uint32_field(41)
+
+
+from .. import (  # noqa: E402
+    ActivityAmuletHuRecord,
+    AmuletActivityTingInfo,
+    AmuletBuffData,
+    AmuletEffectData,
+    AmuletGameOperation,
+    AmuletGameRecordData,
+    AmuletGameShopData,
+    AmuletMingInfo,
+    AmuletShowDesktopTileData,
+    AmuletTile,
+)
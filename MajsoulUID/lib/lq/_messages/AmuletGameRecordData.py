@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameRecordData(betterproto.Message):
+    key: int = betterproto.uint32_field(1)
+    int_value: int = betterproto.int32_field(2)
+    str_value: str = betterproto.string_field(3)
+    int_arr_value: List[int] = betterproto.int32_field(4)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameShopData(betterproto.Message):
+    goods: List["AmuletGameShopGoods"] = betterproto.message_field(1)
+    effect_list: List[int] = betterproto.uint32_field(2)
+    shop_refresh_count: int = betterproto.uint32_field(3)
+    refresh_price: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    AmuletGameShopGoods,
+)
@@ -0,0 +1,42 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameUpdateData(betterproto.Message):
+    tile_replace: List["AmuletTile"] = betterproto.message_field(1)
+    tian_dora: List[str] = betterproto.string_field(2)
+    dora: List[int] = betterproto.uint32_field(4)
+    hands: List[int] = betterproto.uint32_field(7)
+    ming: List["AmuletMingInfo"] = betterproto.message_field(8)
+    effect_list: List["AmuletEffectData"] = betterproto.message_field(9)
+    buff_list: List["AmuletEffectData"] = betterproto.message_field(10)
+    point: str = betterproto.string_field(13)
+    coin: int = betterproto.uint32_field(14)
+    stage: int = betterproto.uint32_field(22)
+    desktop_remain: int = betterproto.uint32_field(26)
+    show_desktop_tiles: List["AmuletShowDesktopTileData"] = betterproto.message_field(
+        28
+    )
+    ting_list: List["AmuletActivityTingInfo"] = betterproto.message_field(30)
+    next_operation: List["AmuletGameOperation"] = betterproto.message_field(31)
+    used_desktop: List[int] = betterproto.uint32_field(34)
+    highest_hu: "ActivityAmuletHuRecord" = betterproto.message_field(35)
+    records: "ActivityAmuletRecord" = betterproto.message_field(36)
+
+
+from .. import (  # noqa: E402
+    ActivityAmuletHuRecord,
+    ActivityAmuletRecord,
+    AmuletActivityTingInfo,
+    AmuletEffectData,
+    AmuletGameOperation,
+    AmuletMingInfo,
+    AmuletShowDesktopTileData,
+    AmuletTile,
+)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHuleInfo(betterproto.Message):
+    tile: int = betterproto.uint32_field(1)
+    fan_list: List["AmuletFan"] = betterproto.message_field(2)
+    fan: int = betterproto.uint64_field(3)
+    point: str = betterproto.string_field(4)
+    base: int = betterproto.uint64_field(5)
+
+
+from .. import (  # noqa: E402
+    AmuletFan,
+)
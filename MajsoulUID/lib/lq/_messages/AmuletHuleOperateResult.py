@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHuleOperateResult(betterproto.Message):
+    hu_final: "AmuletHuleInfo" = betterproto.message_field(2)
+    hu_base: "AmuletHuleInfo" = betterproto.message_field(3)
+    hook_effect: List["AmuletActivityHookEffect"] = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    AmuletActivityHookEffect,
+    AmuletHuleInfo,
+)
@@ -0,0 +1,12 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletReplace(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    tile: str = betterproto.string_field(2)
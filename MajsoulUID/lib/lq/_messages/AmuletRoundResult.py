@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletRoundResult(betterproto.Message):
+    hu_result: "AmuletHuleOperateResult" = betterproto.message_field(2)
+    deal_result: "AmuletDealTileResult" = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    AmuletDealTileResult,
+    AmuletHuleOperateResult,
+)
@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class AmuletUpgradeResult(betterproto.Message):
+    remain_rounds: List["AmuletRoundResult"] = betterproto.message_field(1)
+    point_coin: int = betterproto.uint32_field(2)
+    level_coin: int = betterproto.uint32_field(3)
+    shop: "AmuletGameShopData" = betterproto.message_field(4)
+    hook_effect: List["AmuletActivityHookEffect"] = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    AmuletActivityHookEffect,
+    AmuletGameShopData,
+    AmuletRoundResult,
+)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Announcement(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    title: str = betterproto.string_field(2)
+    content: str = betterproto.string_field(3)
+    header_image: str = betterproto.string_field(4)
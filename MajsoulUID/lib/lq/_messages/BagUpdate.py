@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class BagUpdate(betterproto.Message):
+    update_items: List["Item"] = betterproto.message_field(1)
+    update_daily_gain_record: List["ItemGainRecords"] = betterproto.message_field(2)
+
+
+from .. import (  # noqa: E402
+    Item,
+    ItemGainRecords,
+)
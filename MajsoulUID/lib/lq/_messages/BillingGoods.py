@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class BillingGoods(betterproto.Message):
+    id: str = betterproto.string_field(1)
+    name: str = betterproto.string_field(2)
+    desc: str = betterproto.string_field(3)
+    icon: str = betterproto.string_field(4)
+    resource_id: int = betterproto.uint32_field(5)
+    resource_count: int = betterproto.uint32_field(6)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class BillingProduct(betterproto.Message):
+    goods: "BillingGoods" = betterproto.message_field(1)
+    currency_code: str = betterproto.string_field(2)
+    currency_price: int = betterproto.uint32_field(3)
+    sort_weight: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    BillingGoods,
+)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Character(betterproto.Message):
+    charid: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+    exp: int = betterproto.uint32_field(3)
+    views: List["ViewSlot"] = betterproto.message_field(4)
+    skin: int = betterproto.uint32_field(5)
+    is_upgraded: bool = betterproto.bool_field(6)
+    extra_emoji: List[int] = betterproto.uint32_field(7)
+    rewarded_level: List[int] = betterproto.uint32_field(8)
+
+
+from .. import (  # noqa: E402
+    ViewSlot,
+)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ChestDataV2(betterproto.Message):
+    chest_id: int = betterproto.uint32_field(1)
+    total_open_count: int = betterproto.uint32_field(2)
+    face_black_count: int = betterproto.uint32_field(3)
+    ticket_face_black_count: int = betterproto.uint32_field(4)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ChuanmaGang(betterproto.Message):
+    old_scores: List[int] = betterproto.int32_field(1)
+    delta_scores: List[int] = betterproto.int32_field(2)
+    scores: List[int] = betterproto.int32_field(3)
+    gameend: "GameEnd" = betterproto.message_field(4)
+    hules_history: List["HuleInfo"] = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    GameEnd,
+    HuleInfo,
+)
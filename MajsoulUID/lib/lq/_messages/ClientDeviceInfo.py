@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ClientDeviceInfo(betterproto.Message):
+    platform: str = betterproto.string_field(1)
+    hardware: str = betterproto.string_field(2)
+    os: str = betterproto.string_field(3)
+    os_version: str = betterproto.string_field(4)
+    is_browser: bool = betterproto.bool_field(5)
+    software: str = betterproto.string_field(6)
+    sale_platform: str = betterproto.string_field(7)
+    hardware_vendor: str = betterproto.string_field(8)
+    model_number: str = betterproto.string_field(9)
+    screen_width: int = betterproto.uint32_field(10)
+    screen_height: int = betterproto.uint32_field(11)
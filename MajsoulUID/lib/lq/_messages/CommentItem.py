@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class CommentItem(betterproto.Message):
+    comment_id: int = betterproto.uint32_field(1)
+    timestamp: int = betterproto.uint32_field(2)
+    commenter: "PlayerBaseView" = betterproto.message_field(3)
+    content: str = betterproto.string_field(4)
+    is_banned: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    PlayerBaseView,
+)
@@ -0,0 +1,61 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ContestDetailRule(betterproto.Message):
+    init_point: int = betterproto.uint32_field(5)
+    fandian: int = betterproto.uint32_field(6)
+    can_jifei: bool = betterproto.bool_field(7)
+    tianbian_value: int = betterproto.uint32_field(8)
+    liqibang_value: int = betterproto.uint32_field(9)
+    changbang_value: int = betterproto.uint32_field(10)
+    noting_fafu_1: int = betterproto.uint32_field(11)
+    noting_fafu_2: int = betterproto.uint32_field(12)
+    noting_fafu_3: int = betterproto.uint32_field(13)
+    have_liujumanguan: bool = betterproto.bool_field(14)
+    have_qieshangmanguan: bool = betterproto.bool_field(15)
+    have_biao_dora: bool = betterproto.bool_field(16)
+    have_gang_biao_dora: bool = betterproto.bool_field(17)
+    ming_dora_immediately_open: bool = betterproto.bool_field(18)
+    have_li_dora: bool = betterproto.bool_field(19)
+    have_gang_li_dora: bool = betterproto.bool_field(20)
+    have_sifenglianda: bool = betterproto.bool_field(21)
+    have_sigangsanle: bool = betterproto.bool_field(22)
+    have_sijializhi: bool = betterproto.bool_field(23)
+    have_jiuzhongjiupai: bool = betterproto.bool_field(24)
+    have_sanjiahele: bool = betterproto.bool_field(25)
+    have_toutiao: bool = betterproto.bool_field(26)
+    have_helelianzhuang: bool = betterproto.bool_field(27)
+    have_helezhongju: bool = betterproto.bool_field(28)
+    have_tingpailianzhuang: bool = betterproto.bool_field(29)
+    have_tingpaizhongju: bool = betterproto.bool_field(30)
+    have_yifa: bool = betterproto.bool_field(31)
+    have_nanruxiru: bool = betterproto.bool_field(32)
+    jingsuanyuandian: int = betterproto.uint32_field(33)
+    shunweima_2: int = betterproto.int32_field(34)
+    shunweima_3: int = betterproto.int32_field(35)
+    shunweima_4: int = betterproto.int32_field(36)
+    bianjietishi: bool = betterproto.bool_field(37)
+    ai_level: int = betterproto.uint32_field(38)
+    have_zimosun: bool = betterproto.bool_field(39)
+    disable_multi_yukaman: bool = betterproto.bool_field(40)
+    guyi_mode: int = betterproto.uint32_field(41)
+    disable_leijiyiman: bool = betterproto.bool_field(42)
+    dora3_mode: int = betterproto.uint32_field(43)
+    xuezhandaodi: int = betterproto.uint32_field(44)
+    huansanzhang: int = betterproto.uint32_field(45)
+    chuanma: int = betterproto.uint32_field(46)
+    disable_double_yakuman: int = betterproto.uint32_field(62)
+    disable_composite_yakuman: int = betterproto.uint32_field(63)
+    enable_shiti: int = betterproto.uint32_field(64)
+    enable_nontsumo_liqi: int = betterproto.uint32_field(65)
+    disable_double_wind_four_fu: int = betterproto.uint32_field(66)
+    disable_angang_guoshi: int = betterproto.uint32_field(67)
+    enable_renhe: int = betterproto.uint32_field(68)
+    enable_baopai_extend_settings: int = betterproto.uint32_field(69)
+    fanfu: int = betterproto.uint32_field(70)
@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ContestDetailRuleV2(betterproto.Message):
+    game_rule: "ContestDetailRule" = betterproto.message_field(1)
+    extra_rule: "ContestDetailRuleV2ExtraRule" = betterproto.message_field(2)
+
+
+from .. import (  # noqa: E402
+    ContestDetailRule,
+    ContestDetailRuleV2ExtraRule,
+)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ContestSetting(betterproto.Message):
+    level_limit: List["ContestSettingLevelLimit"] = betterproto.message_field(1)
+    game_limit: int = betterproto.uint32_field(2)
+    system_broadcast: int = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    ContestSettingLevelLimit,
+)
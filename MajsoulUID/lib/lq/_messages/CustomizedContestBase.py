@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestBase(betterproto.Message):
+    unique_id: int = betterproto.uint32_field(1)
+    contest_id: int = betterproto.uint32_field(2)
+    contest_name: str = betterproto.string_field(3)
+    state: int = betterproto.uint32_field(4)
+    creator_id: int = betterproto.uint32_field(5)
+    create_time: int = betterproto.uint32_field(6)
+    start_time: int = betterproto.uint32_field(7)
+    finish_time: int = betterproto.uint32_field(8)
+    open: bool = betterproto.bool_field(9)
+    contest_type: int = betterproto.uint32_field(10)
+    public_notice: str = betterproto.string_field(11)
+    check_state: int = betterproto.uint32_field(12)
+    checking_name: str = betterproto.string_field(13)
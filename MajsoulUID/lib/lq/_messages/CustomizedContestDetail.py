@@ -0,0 +1,35 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestDetail(betterproto.Message):
+    unique_id: int = betterproto.uint32_field(1)
+    contest_id: int = betterproto.uint32_field(2)
+    contest_name: str = betterproto.string_field(3)
+    state: int = betterproto.uint32_field(4)
+    creator_id: int = betterproto.uint32_field(5)
+    create_time: int = betterproto.uint32_field(6)
+    start_time: int = betterproto.uint32_field(7)
+    finish_time: int = betterproto.uint32_field(8)
+    open: bool = betterproto.bool_field(9)
+    rank_rule: int = betterproto.uint32_field(10)
+    game_mode: "GameMode" = betterproto.message_field(11)
+    private_notice: str = betterproto.string_field(12)
+    observer_switch: int = betterproto.uint32_field(13)
+    emoji_switch: int = betterproto.uint32_field(14)
+    contest_type: int = betterproto.uint32_field(15)
+    disable_broadcast: int = betterproto.uint32_field(16)
+    signup_start_time: int = betterproto.uint32_field(17)
+    signup_end_time: int = betterproto.uint32_field(18)
+    signup_type: int = betterproto.uint32_field(19)
+    auto_match: int = betterproto.uint32_field(20)
+
+
+from .. import (  # noqa: E402
+    GameMode,
+)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestGameEndItem(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    nickname: str = betterproto.string_field(2)
+    total_point: int = betterproto.int32_field(3)
@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestPlayerReport(betterproto.Message):
+    rank_rule: int = betterproto.uint32_field(1)
+    rank: int = betterproto.uint32_field(2)
+    point: int = betterproto.int32_field(3)
+    game_ranks: List[int] = betterproto.uint32_field(4)
+    total_game_count: int = betterproto.uint32_field(5)
@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Error(betterproto.Message):
+    code: int = betterproto.uint32_field(1)
+    u32_params: List[int] = betterproto.uint32_field(2)
+    str_params: List[str] = betterproto.string_field(3)
+    json_param: str = betterproto.string_field(4)
@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ExecuteReward(betterproto.Message):
+    reward: "RewardSlot" = betterproto.message_field(1)
+    replace: "RewardSlot" = betterproto.message_field(2)
+    replace_count: int = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    RewardSlot,
+)
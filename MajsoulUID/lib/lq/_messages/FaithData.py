@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class FaithData(betterproto.Message):
+    faith_id: int = betterproto.uint32_field(1)
+    total_open_count: int = betterproto.uint32_field(2)
+    consume_count: int = betterproto.uint32_field(3)
+    modify_count: int = betterproto.int32_field(4)
@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class FakeRandomRecords(betterproto.Message):
+    item_id: int = betterproto.uint32_field(1)
+    special_item_id: int = betterproto.uint32_field(2)
+    gain_count: int = betterproto.uint32_field(3)
+    gain_history: List[int] = betterproto.uint32_field(4)
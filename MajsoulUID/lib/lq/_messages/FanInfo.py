@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class FanInfo(betterproto.Message):
+    name: str = betterproto.string_field(1)
+    val: int = betterproto.uint32_field(2)
+    id: int = betterproto.uint32_field(3)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class FavoriteHu(betterproto.Message):
+    category: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    hu: "HighestHuRecord" = betterproto.message_field(3)
+    mode: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    HighestHuRecord,
+)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class FeedActivityData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    feed_count: int = betterproto.uint32_field(2)
+    friend_receive_data: "FeedActivityDataCountWithTimeData" = (
+        betterproto.message_field(3)
+    )
+    friend_send_data: "FeedActivityDataCountWithTimeData" = betterproto.message_field(4)
+    gift_inbox: List["FeedActivityDataGiftBoxData"] = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    FeedActivityDataCountWithTimeData,
+    FeedActivityDataGiftBoxData,
+)
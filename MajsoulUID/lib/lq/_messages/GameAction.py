@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameAction(betterproto.Message):
+    passed: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    result: bytes = betterproto.bytes_field(3)
+    user_input: "GameUserInput" = betterproto.message_field(4)
+    user_event: "GameUserEvent" = betterproto.message_field(5)
+    game_event: int = betterproto.uint32_field(6)
+
+
+from .. import (  # noqa: E402
+    GameUserEvent,
+    GameUserInput,
+)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameChiPengGang(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    index: int = betterproto.uint32_field(2)
+    cancel_operation: bool = betterproto.bool_field(3)
+    timeuse: int = betterproto.uint32_field(6)
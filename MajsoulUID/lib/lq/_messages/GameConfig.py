@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameConfig(betterproto.Message):
+    category: int = betterproto.uint32_field(1)
+    mode: "GameMode" = betterproto.message_field(2)
+    meta: "GameMetaData" = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    GameMetaData,
+    GameMode,
+)
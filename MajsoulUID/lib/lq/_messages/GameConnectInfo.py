@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameConnectInfo(betterproto.Message):
+    connect_token: str = betterproto.string_field(2)
+    game_uuid: str = betterproto.string_field(3)
+    location: str = betterproto.string_field(4)
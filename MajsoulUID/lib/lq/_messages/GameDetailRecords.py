@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameDetailRecords(betterproto.Message):
+    records: List[bytes] = betterproto.bytes_field(1)
+    version: int = betterproto.uint32_field(2)
+    actions: List["GameAction"] = betterproto.message_field(3)
+    bar: bytes = betterproto.bytes_field(4)
+
+
+from .. import (  # noqa: E402
+    GameAction,
+)
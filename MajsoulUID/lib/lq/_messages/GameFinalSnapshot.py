@@ -0,0 +1,38 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshot(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    state: int = betterproto.uint32_field(2)
+    category: int = betterproto.uint32_field(3)
+    mode: "GameMode" = betterproto.message_field(4)
+    meta: "GameMetaData" = betterproto.message_field(5)
+    calculate_param: "GameFinalSnapshotCalculateParam" = betterproto.message_field(6)
+    create_time: int = betterproto.uint32_field(7)
+    start_time: int = betterproto.uint32_field(8)
+    finish_time: int = betterproto.uint32_field(9)
+    seats: List["GameFinalSnapshotGameSeat"] = betterproto.message_field(10)
+    rounds: List["GameRoundSnapshot"] = betterproto.message_field(11)
+    account_views: List["PlayerGameView"] = betterproto.message_field(12)
+    final_players: List["GameFinalSnapshotFinalPlayer"] = betterproto.message_field(13)
+    afk_info: List["GameFinalSnapshotAfkInfo"] = betterproto.message_field(14)
+    robot_views: List["PlayerGameView"] = betterproto.message_field(15)
+
+
+from .. import (  # noqa: E402
+    GameFinalSnapshotAfkInfo,
+    GameFinalSnapshotCalculateParam,
+    GameFinalSnapshotFinalPlayer,
+    GameFinalSnapshotGameSeat,
+    GameMetaData,
+    GameMode,
+    GameRoundSnapshot,
+    PlayerGameView,
+)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshotAfkInfo(betterproto.Message):
+    deal_tile_count: int = betterproto.uint32_field(1)
+    moqie_count: int = betterproto.uint32_field(2)
+    seat: int = betterproto.uint32_field(3)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshotCalculateParam(betterproto.Message):
+    init_point: int = betterproto.uint32_field(1)
+    jingsuanyuandian: int = betterproto.uint32_field(2)
+    rank_points: List[int] = betterproto.int32_field(3)
@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshotFinalPlayer(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    total_point: int = betterproto.int32_field(2)
+    part_point_1: int = betterproto.int32_field(3)
+    part_point_2: int = betterproto.int32_field(4)
+    grading_score: int = betterproto.int32_field(5)
+    gold: int = betterproto.int32_field(6)
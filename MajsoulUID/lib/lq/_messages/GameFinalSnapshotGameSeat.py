@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshotGameSeat(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    notify_endpoint: "NetworkEndpoint" = betterproto.message_field(3)
+    client_address: str = betterproto.string_field(4)
+    is_connected: bool = betterproto.bool_field(5)
+
+
+from .. import (  # noqa: E402
+    NetworkEndpoint,
+)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameLiveHead(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    game_config: "GameConfig" = betterproto.message_field(3)
+    players: List["PlayerGameView"] = betterproto.message_field(4)
+    seat_list: List[int] = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    GameConfig,
+    PlayerGameView,
+)
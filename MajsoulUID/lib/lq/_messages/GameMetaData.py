@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameMetaData(betterproto.Message):
+    room_id: int = betterproto.uint32_field(1)
+    mode_id: int = betterproto.uint32_field(2)
+    contest_uid: int = betterproto.uint32_field(3)
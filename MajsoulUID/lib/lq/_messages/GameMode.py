@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameMode(betterproto.Message):
+    mode: int = betterproto.uint32_field(1)
+    ai: bool = betterproto.bool_field(4)
+    extendinfo: str = betterproto.string_field(5)
+    detail_rule: "GameDetailRule" = betterproto.message_field(6)
+    testing_environment: "GameTestingEnvironmentSet" = betterproto.message_field(7)
+    game_setting: "GameSetting" = betterproto.message_field(8)
+
+
+from .. import (  # noqa: E402
+    GameDetailRule,
+    GameSetting,
+    GameTestingEnvironmentSet,
+)
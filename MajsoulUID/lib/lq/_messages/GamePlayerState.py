@@ -0,0 +1,11 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+import betterproto
+
+
+class GamePlayerState(betterproto.Enum):
+    NULL = 0
+    AUTH = 1
+    SYNCING = 2
+    READY = 3
@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameRestore(betterproto.Message):
+    snapshot: "GameSnapshot" = betterproto.message_field(1)
+    actions: List["ActionPrototype"] = betterproto.message_field(2)
+    passed_waiting_time: int = betterproto.uint32_field(3)
+    game_state: int = betterproto.uint32_field(4)
+    start_time: int = betterproto.uint32_field(5)
+    last_pause_time_ms: int = betterproto.uint32_field(6)
+
+
+from .. import (  # noqa: E402
+    ActionPrototype,
+    GameSnapshot,
+)
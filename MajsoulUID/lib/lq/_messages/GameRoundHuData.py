@@ -0,0 +1,30 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundHuData(betterproto.Message):
+    hupai: "GameRoundHuDataHuPai" = betterproto.message_field(1)
+    fans: List["GameRoundHuDataFan"] = betterproto.message_field(2)
+    score: int = betterproto.uint32_field(3)
+    xun: int = betterproto.uint32_field(4)
+    title_id: int = betterproto.uint32_field(5)
+    fan_sum: int = betterproto.uint32_field(6)
+    fu_sum: int = betterproto.uint32_field(7)
+    yakuman_count: int = betterproto.uint32_field(8)
+    biao_dora_count: int = betterproto.uint32_field(9)
+    red_dora_count: int = betterproto.uint32_field(10)
+    li_dora_count: int = betterproto.uint32_field(11)
+    babei_count: int = betterproto.uint32_field(12)
+    xuan_shang_count: int = betterproto.uint32_field(13)
+
+
+from .. import (  # noqa: E402
+    GameRoundHuDataFan,
+    GameRoundHuDataHuPai,
+)
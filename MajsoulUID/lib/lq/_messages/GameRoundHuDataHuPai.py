@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundHuDataHuPai(betterproto.Message):
+    tile: str = betterproto.string_field(1)
+    seat: int = betterproto.uint32_field(2)
+    liqi: int = betterproto.uint32_field(3)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundPlayerResult(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    hands: List[str] = betterproto.string_field(2)
+    ming: List[str] = betterproto.string_field(3)
+    liqi_type: int = betterproto.uint32_field(4)
+    is_fulu: bool = betterproto.bool_field(5)
+    is_liujumanguan: bool = betterproto.bool_field(6)
+    lian_zhuang: int = betterproto.uint32_field(7)
+    hu: "GameRoundHuData" = betterproto.message_field(8)
+
+
+from .. import (  # noqa: E402
+    GameRoundHuData,
+)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameRuleSetting(betterproto.Message):
+    round_type: int = betterproto.uint32_field(1)
+    shiduan: bool = betterproto.bool_field(2)
+    dora_count: int = betterproto.uint32_field(3)
+    thinking_type: int = betterproto.uint32_field(4)
+    use_detail_rule: bool = betterproto.bool_field(5)
+    detail_rule_v2: "ContestDetailRuleV2" = betterproto.message_field(6)
+
+
+from .. import (  # noqa: E402
+    ContestDetailRuleV2,
+)
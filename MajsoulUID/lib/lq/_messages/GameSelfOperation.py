@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameSelfOperation(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    index: int = betterproto.uint32_field(2)
+    tile: str = betterproto.string_field(3)
+    cancel_operation: bool = betterproto.bool_field(4)
+    moqie: bool = betterproto.bool_field(5)
+    timeuse: int = betterproto.uint32_field(6)
+    tile_state: int = betterproto.int32_field(7)
+    change_tiles: List[str] = betterproto.string_field(8)
+    tile_states: List[int] = betterproto.int32_field(9)
+    gap_type: int = betterproto.uint32_field(10)
@@ -0,0 +1,26 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameSnapshot(betterproto.Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    index_player: int = betterproto.uint32_field(4)
+    left_tile_count: int = betterproto.uint32_field(5)
+    hands: List[str] = betterproto.string_field(6)
+    doras: List[str] = betterproto.string_field(7)
+    liqibang: int = betterproto.uint32_field(8)
+    players: List["GameSnapshotPlayerSnapshot"] = betterproto.message_field(9)
+    zhenting: bool = betterproto.bool_field(10)
+
+
+from .. import (  # noqa: E402
+    GameSnapshotPlayerSnapshot,
+)
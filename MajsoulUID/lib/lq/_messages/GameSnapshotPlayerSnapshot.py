@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameSnapshotPlayerSnapshot(betterproto.Message):
+    score: int = betterproto.int32_field(1)
+    liqiposition: int = betterproto.int32_field(2)
+    tilenum: int = betterproto.uint32_field(3)
+    qipais: List[str] = betterproto.string_field(4)
+    mings: List["GameSnapshotPlayerSnapshotFulu"] = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    GameSnapshotPlayerSnapshotFulu,
+)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameSnapshotPlayerSnapshotFulu(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    tile: List[str] = betterproto.string_field(2)
+    from_: List[int] = betterproto.uint32_field(3)
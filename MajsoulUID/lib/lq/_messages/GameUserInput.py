@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class GameUserInput(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    emo: int = betterproto.uint32_field(3)
+    operation: "GameSelfOperation" = betterproto.message_field(10)
+    cpg: "GameChiPengGang" = betterproto.message_field(11)
+    vote: "GameVoteGameEnd" = betterproto.message_field(12)
+
+
+from .. import (  # noqa: E402
+    GameChiPengGang,
+    GameSelfOperation,
+    GameVoteGameEnd,
+)
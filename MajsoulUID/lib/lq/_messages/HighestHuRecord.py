@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class HighestHuRecord(betterproto.Message):
+    fanshu: int = betterproto.uint32_field(1)
+    doranum: int = betterproto.uint32_field(2)
+    title: str = betterproto.string_field(3)
+    hands: List[str] = betterproto.string_field(4)
+    ming: List[str] = betterproto.string_field(5)
+    hupai: str = betterproto.string_field(6)
+    title_id: int = betterproto.uint32_field(7)
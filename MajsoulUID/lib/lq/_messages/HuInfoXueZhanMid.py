@@ -0,0 +1,27 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class HuInfoXueZhanMid(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    hand_count: int = betterproto.uint32_field(2)
+    hand: List[str] = betterproto.string_field(3)
+    ming: List[str] = betterproto.string_field(4)
+    hu_tile: str = betterproto.string_field(5)
+    zimo: bool = betterproto.bool_field(6)
+    yiman: bool = betterproto.bool_field(7)
+    count: int = betterproto.uint32_field(8)
+    fans: List["FanInfo"] = betterproto.message_field(9)
+    fu: int = betterproto.uint32_field(10)
+    title_id: int = betterproto.uint32_field(11)
+
+
+from .. import (  # noqa: E402
+    FanInfo,
+)
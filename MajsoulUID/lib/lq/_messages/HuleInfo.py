@@ -0,0 +1,42 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class HuleInfo(betterproto.Message):
+    hand: List[str] = betterproto.string_field(1)
+    ming: List[str] = betterproto.string_field(2)
+    hu_tile: str = betterproto.string_field(3)
+    seat: int = betterproto.uint32_field(4)
+    zimo: bool = betterproto.bool_field(5)
+    qinjia: bool = betterproto.bool_field(6)
+    liqi: bool = betterproto.bool_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    li_doras: List[str] = betterproto.string_field(9)
+    yiman: bool = betterproto.bool_field(10)
+    count: int = betterproto.uint32_field(11)
+    fans: List["FanInfo"] = betterproto.message_field(12)
+    fu: int = betterproto.uint32_field(13)
+    title: str = betterproto.string_field(14)
+    point_rong: int = betterproto.uint32_field(15)
+    point_zimo_qin: int = betterproto.uint32_field(16)
+    point_zimo_xian: int = betterproto.uint32_field(17)
+    title_id: int = betterproto.uint32_field(18)
+    point_sum: int = betterproto.uint32_field(19)
+    dadian: int = betterproto.uint32_field(20)
+    baopai: int = betterproto.uint32_field(21)
+    baopai_seats: List[int] = betterproto.uint32_field(22)
+    lines: List[str] = betterproto.string_field(23)
+    tianming_bonus: int = betterproto.uint32_field(24)
+    baida_changed: List[str] = betterproto.string_field(25)
+    hu_tile_bai_da_changed: str = betterproto.string_field(26)
+
+
+from .. import (  # noqa: E402
+    FanInfo,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class IslandZoneData(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    currency_used: "SignedTimeCounterData" = betterproto.message_field(2)
+    goods_records: List["IslandGoodsData"] = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    IslandGoodsData,
+    SignedTimeCounterData,
+)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ItemGainRecords(betterproto.Message):
+    record_time: int = betterproto.uint32_field(1)
+    limit_source_id: int = betterproto.uint32_field(2)
+    records: List["ItemGainRecord"] = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    ItemGainRecord,
+)
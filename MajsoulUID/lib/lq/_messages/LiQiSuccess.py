@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class LiQiSuccess(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    score: int = betterproto.int32_field(2)
+    liqibang: int = betterproto.uint32_field(3)
+    failed: bool = betterproto.bool_field(4)
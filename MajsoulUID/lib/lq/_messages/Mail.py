@@ -0,0 +1,29 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Mail(betterproto.Message):
+    mail_id: int = betterproto.uint32_field(1)
+    state: int = betterproto.uint32_field(2)
+    take_attachment: bool = betterproto.bool_field(3)
+    title: str = betterproto.string_field(4)
+    content: str = betterproto.string_field(5)
+    attachments: List["RewardSlot"] = betterproto.message_field(6)
+    create_time: int = betterproto.uint32_field(7)
+    expire_time: int = betterproto.uint32_field(8)
+    reference_id: int = betterproto.uint32_field(9)
+    title_i18_n: List["I18NContext"] = betterproto.message_field(10)
+    content_i18_n: List["I18NContext"] = betterproto.message_field(11)
+    template_id: int = betterproto.uint32_field(12)
+
+
+from .. import (  # noqa: E402
+    I18NContext,
+    RewardSlot,
+)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class MonthTicketInfo(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    end_time: int = betterproto.uint32_field(2)
+    last_pay_time: int = betterproto.uint32_field(3)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class MuyuInfo(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    count_max: int = betterproto.uint32_field(3)
+    id: int = betterproto.uint32_field(4)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NetworkEndpoint(betterproto.Message):
+    family: str = betterproto.string_field(1)
+    address: str = betterproto.string_field(2)
+    port: int = betterproto.uint32_field(3)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NoTileScoreInfo(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    old_scores: List[int] = betterproto.int32_field(2)
+    delta_scores: List[int] = betterproto.int32_field(3)
+    hand: List[str] = betterproto.string_field(4)
+    ming: List[str] = betterproto.string_field(5)
+    doras: List[str] = betterproto.string_field(6)
+    score: int = betterproto.uint32_field(7)
+    taxes: List[int] = betterproto.int32_field(8)
+    lines: List[str] = betterproto.string_field(9)
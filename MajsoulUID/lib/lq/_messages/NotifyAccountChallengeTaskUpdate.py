@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAccountChallengeTaskUpdate(betterproto.Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+    level: int = betterproto.uint32_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+    match_count: int = betterproto.uint32_field(4)
+    ticket_id: int = betterproto.uint32_field(5)
+    rewarded_season: List[int] = betterproto.uint32_field(6)
+
+
+from .. import (  # noqa: E402
+    TaskProgress,
+)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityRewardV2(betterproto.Message):
+    activity_reward: List["NotifyActivityRewardV2ActivityReward"] = (
+        betterproto.message_field(1)
+    )
+
+
+from .. import (  # noqa: E402
+    NotifyActivityRewardV2ActivityReward,
+)
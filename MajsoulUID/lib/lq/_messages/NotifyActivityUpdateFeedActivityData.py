@@ -0,0 +1,28 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityUpdateFeedActivityData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    feed_count: int = betterproto.uint32_field(2)
+    friend_receive_data: "NotifyActivityUpdateFeedActivityDataCountWithTimeData" = (
+        betterproto.message_field(3)
+    )
+    friend_send_data: "NotifyActivityUpdateFeedActivityDataCountWithTimeData" = (
+        betterproto.message_field(4)
+    )
+    gift_inbox: List["NotifyActivityUpdateFeedActivityDataGiftBoxData"] = (
+        betterproto.message_field(5)
+    )
+
+
+from .. import (  # noqa: E402
+    NotifyActivityUpdateFeedActivityDataCountWithTimeData,
+    NotifyActivityUpdateFeedActivityDataGiftBoxData,
+)
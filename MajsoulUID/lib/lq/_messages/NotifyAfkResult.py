@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAfkResult(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    ban_end_time: int = betterproto.uint32_field(2)
+    game_uuid: str = betterproto.string_field(3)
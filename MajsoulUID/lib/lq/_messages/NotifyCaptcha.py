@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCaptcha(betterproto.Message):
+    check_id: int = betterproto.uint32_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    random_str: str = betterproto.string_field(3)
+    type: int = betterproto.uint32_field(4)
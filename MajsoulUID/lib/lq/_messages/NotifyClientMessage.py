@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyClientMessage(betterproto.Message):
+    sender: "PlayerBaseView" = betterproto.message_field(1)
+    type: int = betterproto.uint32_field(2)
+    content: str = betterproto.string_field(3)
+
+
+from .. import (  # noqa: E402
+    PlayerBaseView,
+)
@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCustomContestAccountMsg(betterproto.Message):
+    unique_id: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    sender: str = betterproto.string_field(3)
+    content: str = betterproto.string_field(4)
+    verified: int = betterproto.uint32_field(5)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCustomContestSystemMsg(betterproto.Message):
+    unique_id: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    uuid: str = betterproto.string_field(3)
+    game_start: "CustomizedContestGameStart" = betterproto.message_field(4)
+    game_end: "CustomizedContestGameEnd" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    CustomizedContestGameEnd,
+    CustomizedContestGameStart,
+)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyDailyTaskUpdate(betterproto.Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+    max_daily_task_count: int = betterproto.uint32_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    TaskProgress,
+)
@@ -0,0 +1,26 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishReward(betterproto.Message):
+    mode_id: int = betterproto.uint32_field(1)
+    level_change: "NotifyGameFinishRewardLevelChange" = betterproto.message_field(2)
+    match_chest: "NotifyGameFinishRewardMatchChest" = betterproto.message_field(3)
+    main_character: "NotifyGameFinishRewardMainCharacter" = betterproto.message_field(4)
+    character_gift: "NotifyGameFinishRewardCharacterGift" = betterproto.message_field(5)
+    badges: List["BadgeAchieveProgress"] = betterproto.message_field(6)
+
+
+from .. import (  # noqa: E402
+    BadgeAchieveProgress,
+    NotifyGameFinishRewardCharacterGift,
+    NotifyGameFinishRewardLevelChange,
+    NotifyGameFinishRewardMainCharacter,
+    NotifyGameFinishRewardMatchChest,
+)
@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardLevelChange(betterproto.Message):
+    origin: "AccountLevel" = betterproto.message_field(1)
+    final: "AccountLevel" = betterproto.message_field(2)
+    type: int = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    AccountLevel,
+)
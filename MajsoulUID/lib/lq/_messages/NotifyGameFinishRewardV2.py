@@ -0,0 +1,30 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardV2(betterproto.Message):
+    mode_id: int = betterproto.uint32_field(1)
+    level_change: "NotifyGameFinishRewardV2LevelChange" = betterproto.message_field(2)
+    match_chest: "NotifyGameFinishRewardV2MatchChest" = betterproto.message_field(3)
+    main_character: "NotifyGameFinishRewardV2MainCharacter" = betterproto.message_field(
+        4
+    )
+    character_gift: "NotifyGameFinishRewardV2CharacterGift" = betterproto.message_field(
+        5
+    )
+    badges: List["BadgeAchieveProgress"] = betterproto.message_field(6)
+
+
+from .. import (  # noqa: E402
+    BadgeAchieveProgress,
+    NotifyGameFinishRewardV2CharacterGift,
+    NotifyGameFinishRewardV2LevelChange,
+    NotifyGameFinishRewardV2MainCharacter,
+    NotifyGameFinishRewardV2MatchChest,
+)
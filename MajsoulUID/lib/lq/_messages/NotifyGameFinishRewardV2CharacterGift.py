@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardV2CharacterGift(betterproto.Message):
+    origin: int = betterproto.uint32_field(1)
+    final: int = betterproto.uint32_field(2)
+    add: int = betterproto.uint32_field(3)
+    is_graded: bool = betterproto.bool_field(4)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardV2MainCharacter(betterproto.Message):
+    level: int = betterproto.uint32_field(1)
+    exp: int = betterproto.uint32_field(2)
+    add: int = betterproto.uint32_field(3)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardV2MatchChest(betterproto.Message):
+    chest_id: int = betterproto.uint32_field(1)
+    origin: int = betterproto.uint32_field(2)
+    final: int = betterproto.uint32_field(3)
+    is_graded: bool = betterproto.bool_field(4)
+    rewards: List["RewardSlot"] = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    RewardSlot,
+)
@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyMatchGameStart(betterproto.Message):
+    game_url: str = betterproto.string_field(1)
+    connect_token: str = betterproto.string_field(2)
+    game_uuid: str = betterproto.string_field(3)
+    match_mode_id: int = betterproto.uint32_field(4)
+    location: str = betterproto.string_field(5)
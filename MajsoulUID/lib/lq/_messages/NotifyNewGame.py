@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyNewGame(betterproto.Message):
+    game_uuid: str = betterproto.string_field(1)
+    player_list: List[str] = betterproto.string_field(2)
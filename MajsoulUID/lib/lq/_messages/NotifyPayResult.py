@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyPayResult(betterproto.Message):
+    pay_result: int = betterproto.uint32_field(1)
+    order_id: str = betterproto.string_field(2)
+    goods_id: int = betterproto.uint32_field(3)
+    new_month_ticket: int = betterproto.uint32_field(4)
+    resource_modify: List["NotifyPayResultResourceModify"] = betterproto.message_field(
+        5
+    )
+
+
+from .. import (  # noqa: E402
+    NotifyPayResultResourceModify,
+)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRoomPlayerDressing(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    dressing: bool = betterproto.bool_field(2)
+    account_list: "NotifyRoomPlayerDressingAccountDressingState" = (
+        betterproto.message_field(3)
+    )
+    seq: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    NotifyRoomPlayerDressingAccountDressingState,
+)
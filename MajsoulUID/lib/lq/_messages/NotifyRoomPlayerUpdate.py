@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRoomPlayerUpdate(betterproto.Message):
+    owner_id: int = betterproto.uint32_field(3)
+    robot_count: int = betterproto.uint32_field(4)
+    player_list: List["PlayerGameView"] = betterproto.message_field(5)
+    seq: int = betterproto.uint32_field(6)
+    robots: List["PlayerGameView"] = betterproto.message_field(7)
+    positions: List[int] = betterproto.uint32_field(8)
+
+
+from .. import (  # noqa: E402
+    PlayerGameView,
+)
@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class NotifyVipLevelChange(betterproto.Message):
+    gift_limit: int = betterproto.uint32_field(1)
+    friend_max_count: int = betterproto.uint32_field(2)
+    zhp_free_refresh_limit: int = betterproto.uint32_field(3)
+    zhp_cost_refresh_limit: int = betterproto.uint32_field(4)
+    buddy_bonus: float = betterproto.float_field(5)
+    record_collect_limit: int = betterproto.uint32_field(6)
@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class OptionalOperation(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    combination: List[str] = betterproto.string_field(2)
+    change_tiles: List[str] = betterproto.string_field(3)
+    change_tile_states: List[int] = betterproto.int32_field(4)
+    gap_type: int = betterproto.uint32_field(5)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class OptionalOperationList(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    operation_list: List["OptionalOperation"] = betterproto.message_field(2)
+    time_add: int = betterproto.uint32_field(4)
+    time_fixed: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    OptionalOperation,
+)
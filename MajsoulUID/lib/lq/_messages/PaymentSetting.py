@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSetting(betterproto.Message):
+    open_payment: int = betterproto.uint32_field(1)
+    payment_info_show_type: int = betterproto.uint32_field(2)
+    payment_info: str = betterproto.string_field(3)
+    wechat: "PaymentSettingWechatData" = betterproto.message_field(4)
+    alipay: "PaymentSettingAlipayData" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    PaymentSettingAlipayData,
+    PaymentSettingWechatData,
+)
@@ -0,0 +1,12 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSettingAlipayData(betterproto.Message):
+    disable_create: bool = betterproto.bool_field(1)
+    payment_source_platform: int = betterproto.uint32_field(2)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSettingV2(betterproto.Message):
+    open_payment: int = betterproto.uint32_field(1)
+    payment_platforms: List["PaymentSettingV2PaymentSettingUnit"] = (
+        betterproto.message_field(2)
+    )
+
+
+from .. import (  # noqa: E402
+    PaymentSettingV2PaymentSettingUnit,
+)
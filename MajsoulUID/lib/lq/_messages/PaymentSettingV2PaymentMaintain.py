@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSettingV2PaymentMaintain(betterproto.Message):
+    start_time: int = betterproto.uint32_field(1)
+    end_time: int = betterproto.uint32_field(2)
+    goods_click_action: int = betterproto.uint32_field(3)
+    goods_click_text: str = betterproto.string_field(4)
+    enabled_channel: List[str] = betterproto.string_field(5)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSettingV2PaymentSettingUnit(betterproto.Message):
+    platform: str = betterproto.string_field(1)
+    is_show: bool = betterproto.bool_field(2)
+    goods_click_action: int = betterproto.uint32_field(3)
+    goods_click_text: str = betterproto.string_field(4)
+    maintain: "PaymentSettingV2PaymentMaintain" = betterproto.message_field(5)
+    enable_for_frozen_account: bool = betterproto.bool_field(6)
+    extra_data: str = betterproto.string_field(7)
+    enabled_channel: List[str] = betterproto.string_field(8)
+
+
+from .. import (  # noqa: E402
+    PaymentSettingV2PaymentMaintain,
+)
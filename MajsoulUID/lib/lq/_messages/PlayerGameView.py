@@ -0,0 +1,28 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class PlayerGameView(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    avatar_id: int = betterproto.uint32_field(2)
+    title: int = betterproto.uint32_field(3)
+    nickname: str = betterproto.string_field(4)
+    level: "AccountLevel" = betterproto.message_field(5)
+    character: "Character" = betterproto.message_field(6)
+    level3: "AccountLevel" = betterproto.message_field(7)
+    avatar_frame: int = betterproto.uint32_field(8)
+    verified: int = betterproto.uint32_field(9)
+    views: List["ViewSlot"] = betterproto.message_field(10)
+
+
+from .. import (  # noqa: E402
+    AccountLevel,
+    Character,
+    ViewSlot,
+)
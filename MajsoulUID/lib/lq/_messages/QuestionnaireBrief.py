@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireBrief(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    version_id: int = betterproto.uint32_field(2)
+    effective_time_start: int = betterproto.uint32_field(3)
+    effective_time_end: int = betterproto.uint32_field(4)
+    rewards: List["QuestionnaireReward"] = betterproto.message_field(5)
+    banner_title: str = betterproto.string_field(6)
+    title: str = betterproto.string_field(7)
+
+
+from .. import (  # noqa: E402
+    QuestionnaireReward,
+)
@@ -0,0 +1,30 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireQuestion(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    title: str = betterproto.string_field(2)
+    describe: str = betterproto.string_field(3)
+    type: str = betterproto.string_field(4)
+    sub_type: str = betterproto.string_field(5)
+    options: List["QuestionnaireQuestionQuestionOption"] = betterproto.message_field(6)
+    option_random_sort: bool = betterproto.bool_field(7)
+    require: bool = betterproto.bool_field(8)
+    max_choice: int = betterproto.uint32_field(9)
+    next_question: List["QuestionnaireQuestionNextQuestionData"] = (
+        betterproto.message_field(10)
+    )
+    matrix_row: List[str] = betterproto.string_field(11)
+
+
+from .. import (  # noqa: E402
+    QuestionnaireQuestionNextQuestionData,
+    QuestionnaireQuestionQuestionOption,
+)
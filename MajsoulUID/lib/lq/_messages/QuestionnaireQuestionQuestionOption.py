@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireQuestionQuestionOption(betterproto.Message):
+    label: str = betterproto.string_field(1)
+    value: str = betterproto.string_field(2)
+    allow_input: bool = betterproto.bool_field(3)
@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordBaBei(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    doras: List[str] = betterproto.string_field(6)
+    operations: List["OptionalOperationList"] = betterproto.message_field(7)
+    moqie: bool = betterproto.bool_field(8)
+    tile_state: int = betterproto.uint32_field(10)
+    muyu: "MuyuInfo" = betterproto.message_field(11)
+
+
+from .. import (  # noqa: E402
+    MuyuInfo,
+    OptionalOperationList,
+)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordBaBeiInfo(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    is_zi_mo: bool = betterproto.bool_field(2)
+    is_chong: bool = betterproto.bool_field(3)
+    is_bei: bool = betterproto.bool_field(4)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordChangeTile(betterproto.Message):
+    doras: List[str] = betterproto.string_field(1)
+    tingpai: List["RecordChangeTileTingPai"] = betterproto.message_field(2)
+    change_tile_infos: List["RecordChangeTileChangeTile"] = betterproto.message_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+    change_type: int = betterproto.uint32_field(5)
+    operations: List["OptionalOperationList"] = betterproto.message_field(6)
+
+
+from .. import (  # noqa: E402
+    OptionalOperationList,
+    RecordChangeTileChangeTile,
+    RecordChangeTileTingPai,
+)
@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordChangeTileChangeTile(betterproto.Message):
+    in_tiles: List[str] = betterproto.string_field(1)
+    in_tile_states: List[int] = betterproto.int32_field(2)
+    out_tiles: List[str] = betterproto.string_field(3)
+    out_tile_states: List[int] = betterproto.int32_field(4)
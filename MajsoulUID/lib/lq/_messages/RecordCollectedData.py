@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordCollectedData(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    remarks: str = betterproto.string_field(2)
+    start_time: int = betterproto.uint32_field(3)
+    end_time: int = betterproto.uint32_field(4)
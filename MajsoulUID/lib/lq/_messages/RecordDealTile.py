@@ -0,0 +1,30 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordDealTile(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    tile: str = betterproto.string_field(2)
+    left_tile_count: int = betterproto.uint32_field(3)
+    liqi: "LiQiSuccess" = betterproto.message_field(5)
+    doras: List[str] = betterproto.string_field(6)
+    zhenting: List[bool] = betterproto.bool_field(7)
+    operation: "OptionalOperationList" = betterproto.message_field(8)
+    tile_state: int = betterproto.uint32_field(9)
+    muyu: "MuyuInfo" = betterproto.message_field(11)
+    tile_index: int = betterproto.uint32_field(12)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(13)
+
+
+from .. import (  # noqa: E402
+    HunZhiYiJiBuffInfo,
+    LiQiSuccess,
+    MuyuInfo,
+    OptionalOperationList,
+)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordFillAwaitingTiles(betterproto.Message):
+    awaiting_tiles: List[str] = betterproto.string_field(1)
+    left_tile_count: int = betterproto.uint32_field(2)
+    operation: "OptionalOperationList" = betterproto.message_field(3)
+    liqi: "LiQiSuccess" = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    LiQiSuccess,
+    OptionalOperationList,
+)
@@ -0,0 +1,25 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordGame(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+    config: "GameConfig" = betterproto.message_field(5)
+    accounts: List["RecordGameAccountInfo"] = betterproto.message_field(11)
+    result: "GameEndResult" = betterproto.message_field(12)
+    robots: List["RecordGameAccountInfo"] = betterproto.message_field(13)
+
+
+from .. import (  # noqa: E402
+    GameConfig,
+    GameEndResult,
+    RecordGameAccountInfo,
+)
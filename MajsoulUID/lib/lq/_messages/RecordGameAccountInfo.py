@@ -0,0 +1,29 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordGameAccountInfo(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    seat: int = betterproto.uint32_field(2)
+    nickname: str = betterproto.string_field(3)
+    avatar_id: int = betterproto.uint32_field(4)
+    character: "Character" = betterproto.message_field(5)
+    title: int = betterproto.uint32_field(6)
+    level: "AccountLevel" = betterproto.message_field(7)
+    level3: "AccountLevel" = betterproto.message_field(8)
+    avatar_frame: int = betterproto.uint32_field(9)
+    verified: int = betterproto.uint32_field(10)
+    views: List["ViewSlot"] = betterproto.message_field(11)
+
+
+from .. import (  # noqa: E402
+    AccountLevel,
+    Character,
+    ViewSlot,
+)
@@ -0,0 +1,38 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordHuleInfo(betterproto.Message):
+    hand: List[str] = betterproto.string_field(1)
+    ming: List[str] = betterproto.string_field(2)
+    hu_tile: str = betterproto.string_field(3)
+    seat: int = betterproto.uint32_field(4)
+    zimo: bool = betterproto.bool_field(5)
+    qinjia: bool = betterproto.bool_field(6)
+    liqi: bool = betterproto.bool_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    li_doras: List[str] = betterproto.string_field(9)
+    yiman: bool = betterproto.bool_field(10)
+    count: int = betterproto.uint32_field(11)
+    fans: List["RecordHuleInfoRecordFanInfo"] = betterproto.message_field(12)
+    fu: int = betterproto.uint32_field(13)
+    point_zimo_qin: int = betterproto.uint32_field(14)
+    point_zimo_xian: int = betterproto.uint32_field(15)
+    title_id: int = betterproto.uint32_field(16)
+    point_sum: int = betterproto.uint32_field(17)
+    dadian: int = betterproto.uint32_field(18)
+    is_jue_zhang: bool = betterproto.bool_field(19)
+    xun: int = betterproto.uint32_field(20)
+    ting_type: int = betterproto.uint32_field(21)
+    ting_mian: int = betterproto.uint32_field(22)
+
+
+from .. import (  # noqa: E402
+    RecordHuleInfoRecordFanInfo,
+)
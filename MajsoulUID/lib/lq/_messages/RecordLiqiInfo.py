@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordLiqiInfo(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    score: int = betterproto.uint32_field(2)
+    is_w: bool = betterproto.bool_field(3)
+    is_zhen_ting: bool = betterproto.bool_field(4)
+    xun: int = betterproto.uint32_field(5)
+    is_success: bool = betterproto.bool_field(6)
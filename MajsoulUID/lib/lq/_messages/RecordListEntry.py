@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordListEntry(betterproto.Message):
+    version: int = betterproto.uint32_field(1)
+    uuid: str = betterproto.string_field(2)
+    start_time: int = betterproto.uint32_field(3)
+    end_time: int = betterproto.uint32_field(4)
+    tag: int = betterproto.uint32_field(5)
+    subtag: int = betterproto.uint32_field(6)
+    players: List["RecordPlayerResult"] = betterproto.message_field(7)
+
+
+from .. import (  # noqa: E402
+    RecordPlayerResult,
+)
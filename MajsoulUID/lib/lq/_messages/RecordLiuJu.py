@@ -0,0 +1,27 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordLiuJu(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    gameend: "GameEnd" = betterproto.message_field(2)
+    seat: int = betterproto.uint32_field(3)
+    tiles: List[str] = betterproto.string_field(4)
+    liqi: "LiQiSuccess" = betterproto.message_field(5)
+    allplayertiles: List[str] = betterproto.string_field(6)
+    muyu: "MuyuInfo" = betterproto.message_field(7)
+    hules_history: List["HuleInfo"] = betterproto.message_field(9)
+
+
+from .. import (  # noqa: E402
+    GameEnd,
+    HuleInfo,
+    LiQiSuccess,
+    MuyuInfo,
+)
@@ -0,0 +1,26 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordLockTile(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    scores: List[int] = betterproto.int32_field(2)
+    liqibang: int = betterproto.uint32_field(3)
+    tile: str = betterproto.string_field(4)
+    operation: List["OptionalOperationList"] = betterproto.message_field(5)
+    zhentings: List[bool] = betterproto.bool_field(6)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    lock_state: int = betterproto.int32_field(9)
+
+
+from .. import (  # noqa: E402
+    OptionalOperationList,
+    TingPaiInfo,
+)
@@ -0,0 +1,45 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordNewRound(betterproto.Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    dora: str = betterproto.string_field(4)
+    scores: List[int] = betterproto.int32_field(5)
+    liqibang: int = betterproto.uint32_field(6)
+    tiles0: List[str] = betterproto.string_field(7)
+    tiles1: List[str] = betterproto.string_field(8)
+    tiles2: List[str] = betterproto.string_field(9)
+    tiles3: List[str] = betterproto.string_field(10)
+    tingpai: List["RecordNewRoundTingPai"] = betterproto.message_field(11)
+    operation: "OptionalOperationList" = betterproto.message_field(12)
+    md5: str = betterproto.string_field(13)
+    paishan: str = betterproto.string_field(14)
+    left_tile_count: int = betterproto.uint32_field(15)
+    doras: List[str] = betterproto.string_field(16)
+    opens: List["NewRoundOpenedTiles"] = betterproto.message_field(17)
+    muyu: "MuyuInfo" = betterproto.message_field(18)
+    operations: List["OptionalOperationList"] = betterproto.message_field(19)
+    ju_count: int = betterproto.uint32_field(20)
+    field_spell: int = betterproto.uint32_field(21)
+    sha256: str = betterproto.string_field(22)
+    yongchang: "YongchangInfo" = betterproto.message_field(23)
+    salt_sha256: str = betterproto.string_field(24)
+    salt: str = betterproto.string_field(25)
+
+
+from .. import (  # noqa: E402
+    MuyuInfo,
+    NewRoundOpenedTiles,
+    OptionalOperationList,
+    RecordNewRoundTingPai,
+    YongchangInfo,
+)
@@ -0,0 +1,25 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordNoTile(betterproto.Message):
+    liujumanguan: bool = betterproto.bool_field(1)
+    players: List["NoTilePlayerInfo"] = betterproto.message_field(2)
+    scores: List["NoTileScoreInfo"] = betterproto.message_field(3)
+    gameend: bool = betterproto.bool_field(4)
+    muyu: "MuyuInfo" = betterproto.message_field(5)
+    hules_history: List["HuleInfo"] = betterproto.message_field(9)
+
+
+from .. import (  # noqa: E402
+    HuleInfo,
+    MuyuInfo,
+    NoTilePlayerInfo,
+    NoTileScoreInfo,
+)
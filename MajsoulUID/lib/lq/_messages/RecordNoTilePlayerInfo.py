@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordNoTilePlayerInfo(betterproto.Message):
+    tingpai: bool = betterproto.bool_field(3)
+    hand: List[str] = betterproto.string_field(4)
+    tings: List["RecordTingPaiInfo"] = betterproto.message_field(5)
+    liuman: bool = betterproto.bool_field(6)
+
+
+from .. import (  # noqa: E402
+    RecordTingPaiInfo,
+)
@@ -0,0 +1,28 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordPlayerResult(betterproto.Message):
+    rank: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    nickname: str = betterproto.string_field(3)
+    level: "AccountLevel" = betterproto.message_field(4)
+    level3: "AccountLevel" = betterproto.message_field(5)
+    pt: int = betterproto.int32_field(7)
+    point: int = betterproto.int32_field(8)
+    max_hu_type: int = betterproto.uint32_field(9)
+    action_liqi: int = betterproto.uint32_field(10)
+    action_rong: int = betterproto.uint32_field(11)
+    action_zimo: int = betterproto.uint32_field(12)
+    action_chong: int = betterproto.uint32_field(13)
+    verified: int = betterproto.uint32_field(14)
+
+
+from .. import (  # noqa: E402
+    AccountLevel,
+)
@@ -0,0 +1,34 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordRoundInfo(betterproto.Message):
+    name: str = betterproto.string_field(1)
+    chang: int = betterproto.uint32_field(2)
+    ju: int = betterproto.uint32_field(3)
+    ben: int = betterproto.uint32_field(4)
+    scores: List[int] = betterproto.uint32_field(5)
+    liqi_infos: List["RecordLiqiInfo"] = betterproto.message_field(7)
+    gang_infos: List["RecordGangInfo"] = betterproto.message_field(8)
+    peipai_infos: List["RecordPeiPaiInfo"] = betterproto.message_field(9)
+    babai_infos: List["RecordBaBeiInfo"] = betterproto.message_field(10)
+    hules_info: "RecordHulesInfo" = betterproto.message_field(11)
+    liuju_info: "RecordLiujuInfo" = betterproto.message_field(12)
+    no_tile_info: "RecordNoTileInfo" = betterproto.message_field(13)
+
+
+from .. import (  # noqa: E402
+    RecordBaBeiInfo,
+    RecordGangInfo,
+    RecordHulesInfo,
+    RecordLiqiInfo,
+    RecordLiujuInfo,
+    RecordNoTileInfo,
+    RecordPeiPaiInfo,
+)
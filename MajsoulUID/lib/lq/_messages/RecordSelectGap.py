@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RecordSelectGap(betterproto.Message):
+    gap_types: List[int] = betterproto.uint32_field(1)
+    tingpai: List["RecordSelectGapTingPai"] = betterproto.message_field(2)
+    operation: "OptionalOperationList" = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    OptionalOperationList,
+    RecordSelectGapTingPai,
+)
@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqAuthGame(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    token: str = betterproto.string_field(2)
+    game_uuid: str = betterproto.string_field(3)
+    session: str = betterproto.string_field(4)
+    gift: str = betterproto.string_field(5)
+    vs: int = betterproto.uint32_field(6)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqBindEmail(betterproto.Message):
+    email: str = betterproto.string_field(1)
+    code: str = betterproto.string_field(2)
+    password: str = betterproto.string_field(3)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqBindPhoneNumber(betterproto.Message):
+    code: str = betterproto.string_field(1)
+    phone: str = betterproto.string_field(2)
+    password: str = betterproto.string_field(3)
+    multi_bind_version: bool = betterproto.bool_field(4)
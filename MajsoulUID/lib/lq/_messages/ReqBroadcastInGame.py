@@ -0,0 +1,12 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqBroadcastInGame(betterproto.Message):
+    content: str = betterproto.string_field(1)
+    except_self: bool = betterproto.bool_field(2)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqBuyFromShop(betterproto.Message):
+    goods_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    ver_price: List["ReqBuyFromShopItem"] = betterproto.message_field(3)
+    ver_goods: List["ReqBuyFromShopItem"] = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    ReqBuyFromShopItem,
+)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateCustomizedContest(betterproto.Message):
+    name: str = betterproto.string_field(1)
+    open_show: int = betterproto.uint32_field(2)
+    game_rule_setting: "GameMode" = betterproto.message_field(3)
+    start_time: int = betterproto.uint32_field(4)
+    end_time: int = betterproto.uint32_field(5)
+    auto_match: int = betterproto.uint32_field(6)
+    rank_rule: int = betterproto.uint32_field(7)
+    contest_setting: "ContestSetting" = betterproto.message_field(8)
+
+
+from .. import (  # noqa: E402
+    ContestSetting,
+    GameMode,
+)
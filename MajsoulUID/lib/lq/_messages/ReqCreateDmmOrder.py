@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateDmmOrder(betterproto.Message):
+    goods_id: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    client_type: int = betterproto.uint32_field(3)
+    client_version_string: str = betterproto.string_field(4)
@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateGamePlan(betterproto.Message):
+    unique_id: int = betterproto.uint32_field(1)
+    account_list: List[int] = betterproto.uint32_field(2)
+    game_start_time: int = betterproto.uint32_field(3)
+    shuffle_seats: int = betterproto.uint32_field(4)
+    ai_level: int = betterproto.uint32_field(5)
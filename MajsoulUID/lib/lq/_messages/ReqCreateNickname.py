@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateNickname(betterproto.Message):
+    nickname: str = betterproto.string_field(1)
+    advertise_str: str = betterproto.string_field(2)
+    tag: str = betterproto.string_field(3)
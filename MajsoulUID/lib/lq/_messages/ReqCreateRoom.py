@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateRoom(betterproto.Message):
+    player_count: int = betterproto.uint32_field(1)
+    mode: "GameMode" = betterproto.message_field(2)
+    public_live: bool = betterproto.bool_field(3)
+    client_version_string: str = betterproto.string_field(4)
+    pre_rule: str = betterproto.string_field(5)
+
+
+from .. import (  # noqa: E402
+    GameMode,
+)
@@ -0,0 +1,17 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateSteamOrder(betterproto.Message):
+    language: str = betterproto.string_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    client_type: int = betterproto.uint32_field(3)
+    goods_id: int = betterproto.uint32_field(4)
+    steam_id: str = betterproto.string_field(5)
+    debt_order_id: str = betterproto.string_field(6)
+    client_version_string: str = betterproto.string_field(7)
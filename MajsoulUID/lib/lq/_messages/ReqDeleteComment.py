@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqDeleteComment(betterproto.Message):
+    target_id: int = betterproto.uint32_field(1)
+    delete_list: List[int] = betterproto.uint32_field(2)
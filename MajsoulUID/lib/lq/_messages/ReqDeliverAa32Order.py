@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqDeliverAa32Order(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    nsa_id: str = betterproto.string_field(2)
+    nsa_token: str = betterproto.string_field(3)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqEmailLogin(betterproto.Message):
+    email: str = betterproto.string_field(1)
+    password: str = betterproto.string_field(2)
+    reconnect: bool = betterproto.bool_field(3)
+    device: "ClientDeviceInfo" = betterproto.message_field(4)
+    random_key: str = betterproto.string_field(5)
+    client_version: str = betterproto.string_field(6)
+    gen_access_token: bool = betterproto.bool_field(7)
+    currency_platforms: List[int] = betterproto.uint32_field(8)
+
+
+from .. import (  # noqa: E402
+    ClientDeviceInfo,
+)
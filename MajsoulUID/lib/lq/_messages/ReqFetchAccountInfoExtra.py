@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchAccountInfoExtra(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    category: int = betterproto.uint32_field(2)
+    type: int = betterproto.uint32_field(3)
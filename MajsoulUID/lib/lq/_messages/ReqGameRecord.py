@@ -0,0 +1,12 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameRecord(betterproto.Message):
+    game_uuid: str = betterproto.string_field(1)
+    client_version_string: str = betterproto.string_field(2)
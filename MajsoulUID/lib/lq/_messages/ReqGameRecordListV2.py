@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameRecordListV2(betterproto.Message):
+    tag: int = betterproto.uint32_field(1)
+    begin_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+    ranks: List[int] = betterproto.uint32_field(4)
+    modes: List[int] = betterproto.uint32_field(5)
+    max_hu_type: int = betterproto.uint32_field(6)
+    level_mode: List[int] = betterproto.uint32_field(7)
@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityBuyBuyItems(betterproto.Message):
+    goods_id: int = betterproto.uint32_field(2)
+    pos: List[int] = betterproto.uint32_field(3)
+    rotate: int = betterproto.uint32_field(4)
+    bag_id: int = betterproto.uint32_field(5)
+    price: int = betterproto.uint32_field(6)
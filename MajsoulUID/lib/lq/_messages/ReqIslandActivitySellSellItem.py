@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivitySellSellItem(betterproto.Message):
+    bag_id: int = betterproto.uint32_field(2)
+    id: int = betterproto.uint32_field(3)
+    price: int = betterproto.uint32_field(4)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityTidyBagBagData(betterproto.Message):
+    bag_id: int = betterproto.uint32_field(2)
+    items: List["ReqIslandActivityTidyBagBagDataITemData"] = betterproto.message_field(
+        3
+    )
+    drops: List[int] = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    ReqIslandActivityTidyBagBagDataITemData,
+)
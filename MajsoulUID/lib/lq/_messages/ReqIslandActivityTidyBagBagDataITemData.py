@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityTidyBagBagDataITemData(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    pos: List[int] = betterproto.uint32_field(2)
+    rotate: int = betterproto.uint32_field(3)
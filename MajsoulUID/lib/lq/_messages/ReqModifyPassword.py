@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqModifyPassword(betterproto.Message):
+    new_password: str = betterproto.string_field(1)
+    old_password: str = betterproto.string_field(2)
+    secure_token: str = betterproto.string_field(3)
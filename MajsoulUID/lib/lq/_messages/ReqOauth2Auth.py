@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqOauth2Auth(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    code: str = betterproto.string_field(2)
+    uid: str = betterproto.string_field(3)
+    client_version_string: str = betterproto.string_field(4)
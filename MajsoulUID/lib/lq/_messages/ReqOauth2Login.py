@@ -0,0 +1,28 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqOauth2Login(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    access_token: str = betterproto.string_field(2)
+    reconnect: bool = betterproto.bool_field(3)
+    device: "ClientDeviceInfo" = betterproto.message_field(4)
+    random_key: str = betterproto.string_field(5)
+    client_version: "ClientVersionInfo" = betterproto.message_field(6)
+    gen_access_token: bool = betterproto.bool_field(7)
+    currency_platforms: List[int] = betterproto.uint32_field(8)
+    version: int = betterproto.uint32_field(9)
+    client_version_string: str = betterproto.string_field(10)
+    tag: str = betterproto.string_field(11)
+
+
+from .. import (  # noqa: E402
+    ClientDeviceInfo,
+    ClientVersionInfo,
+)
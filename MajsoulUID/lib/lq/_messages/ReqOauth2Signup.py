@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqOauth2Signup(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    access_token: str = betterproto.string_field(2)
+    email: str = betterproto.string_field(3)
+    advertise_str: str = betterproto.string_field(4)
+    device: "ClientDeviceInfo" = betterproto.message_field(5)
+    client_version: "ClientVersionInfo" = betterproto.message_field(6)
+    client_version_string: str = betterproto.string_field(7)
+    tag: str = betterproto.string_field(8)
+
+
+from .. import (  # noqa: E402
+    ClientDeviceInfo,
+    ClientVersionInfo,
+)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqOpenChest(betterproto.Message):
+    chest_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    use_ticket: bool = betterproto.bool_field(3)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveVillageBuildingReward(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    building_id: int = betterproto.uint32_field(2)
+    rewards: List["RewardSlot"] = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    RewardSlot,
+)
@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqResponseCaptcha(betterproto.Message):
+    check_id: int = betterproto.uint32_field(1)
+    check_time: int = betterproto.uint32_field(2)
+    result: str = betterproto.string_field(3)
+    client_version_string: str = betterproto.string_field(4)
+    type: int = betterproto.uint32_field(5)
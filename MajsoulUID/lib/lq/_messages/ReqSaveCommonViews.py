@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSaveCommonViews(betterproto.Message):
+    views: List["ViewSlot"] = betterproto.message_field(1)
+    save_index: int = betterproto.uint32_field(2)
+    is_use: int = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    ViewSlot,
+)
@@ -0,0 +1,12 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSearchAccountByPattern(betterproto.Message):
+    search_next: bool = betterproto.bool_field(1)
+    pattern: str = betterproto.string_field(2)
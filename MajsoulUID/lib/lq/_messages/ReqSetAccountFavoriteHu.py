@@ -0,0 +1,17 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSetAccountFavoriteHu(betterproto.Message):
+    mode: int = betterproto.uint32_field(1)
+    category: int = betterproto.uint32_field(2)
+    type: int = betterproto.uint32_field(3)
+    uuid: str = betterproto.string_field(4)
+    chang: int = betterproto.uint32_field(5)
+    ju: int = betterproto.uint32_field(6)
+    ben: int = betterproto.uint32_field(7)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSetVillageWorker(betterproto.Message):
+    building_id: int = betterproto.uint32_field(1)
+    worker_pos: int = betterproto.uint32_field(2)
+    activity_id: int = betterproto.uint32_field(3)
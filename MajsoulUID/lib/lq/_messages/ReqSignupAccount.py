@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSignupAccount(betterproto.Message):
+    account: str = betterproto.string_field(1)
+    password: str = betterproto.string_field(2)
+    code: str = betterproto.string_field(3)
+    type: int = betterproto.uint32_field(4)
+    device: "ClientDeviceInfo" = betterproto.message_field(5)
+    client_version_string: str = betterproto.string_field(6)
+    tag: str = betterproto.string_field(7)
+
+
+from .. import (  # noqa: E402
+    ClientDeviceInfo,
+)
@@ -0,0 +1,12 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSolveGooglePlayOrder(betterproto.Message):
+    inapp_purchase_data: str = betterproto.string_field(2)
+    inapp_data_signature: str = betterproto.string_field(3)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSolveGooglePlayOrderV3(betterproto.Message):
+    order_id: str = betterproto.string_field(1)
+    transaction_id: str = betterproto.string_field(2)
+    token: str = betterproto.string_field(3)
+    account_id: int = betterproto.uint32_field(4)
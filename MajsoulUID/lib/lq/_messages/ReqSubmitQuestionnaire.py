@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSubmitQuestionnaire(betterproto.Message):
+    questionnaire_id: int = betterproto.uint32_field(1)
+    questionnaire_version_id: int = betterproto.uint32_field(2)
+    answers: List["ReqSubmitQuestionnaireQuestionnaireAnswer"] = (
+        betterproto.message_field(3)
+    )
+    open_time: int = betterproto.uint32_field(4)
+    finish_time: int = betterproto.uint32_field(5)
+    client: str = betterproto.string_field(6)
+
+
+from .. import (  # noqa: E402
+    ReqSubmitQuestionnaireQuestionnaireAnswer,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSubmitQuestionnaireQuestionnaireAnswer(betterproto.Message):
+    question_id: int = betterproto.uint32_field(1)
+    values: List[
+        "ReqSubmitQuestionnaireQuestionnaireAnswerQuestionnaireAnswerValue"
+    ] = betterproto.message_field(2)
+
+
+from .. import (  # noqa: E402
+    ReqSubmitQuestionnaireQuestionnaireAnswerQuestionnaireAnswerValue,
+)
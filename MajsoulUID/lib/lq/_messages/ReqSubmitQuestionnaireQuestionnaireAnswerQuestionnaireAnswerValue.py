@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqSubmitQuestionnaireQuestionnaireAnswerQuestionnaireAnswerValue(
+    betterproto.Message
+):
+    value: str = betterproto.string_field(1)
+    custom_input: str = betterproto.string_field(2)
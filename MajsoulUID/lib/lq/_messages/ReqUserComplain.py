@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ReqUserComplain(betterproto.Message):
+    target_id: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    content: str = betterproto.string_field(3)
+    game_uuid: str = betterproto.string_field(4)
+    round_info: "ReqUserComplainGameRoundInfo" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    ReqUserComplainGameRoundInfo,
+)
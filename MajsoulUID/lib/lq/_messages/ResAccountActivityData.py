@@ -0,0 +1,80 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityData(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    exchange_records: List["ExchangeRecord"] = betterproto.message_field(2)
+    task_progress_list: List["TaskProgress"] = betterproto.message_field(3)
+    accumulated_point_list: List["ActivityAccumulatedPointData"] = (
+        betterproto.message_field(4)
+    )
+    rank_data_list: List["ActivityRankPointData"] = betterproto.message_field(5)
+    flip_task_progress_list: List["TaskProgress"] = betterproto.message_field(6)
+    sign_in_data: List["ResAccountActivityDataActivitySignInData"] = (
+        betterproto.message_field(7)
+    )
+    richman_data: List["ResAccountActivityDataActivityRichmanData"] = (
+        betterproto.message_field(8)
+    )
+    period_task_progress_list: List["TaskProgress"] = betterproto.message_field(9)
+    random_task_progress_list: List["TaskProgress"] = betterproto.message_field(10)
+    chest_up_data: List["ResAccountActivityDataChestUpData"] = (
+        betterproto.message_field(11)
+    )
+    sns_data: "ResAccountActivityDataActivitySnsData" = betterproto.message_field(12)
+    mine_data: List["MineActivityData"] = betterproto.message_field(13)
+    rpg_data: List["RpgActivity"] = betterproto.message_field(14)
+    arena_data: List["ActivityArenaData"] = betterproto.message_field(15)
+    feed_data: List["FeedActivityData"] = betterproto.message_field(16)
+    segment_task_progress_list: List["SegmentTaskProgress"] = betterproto.message_field(
+        17
+    )
+    vote_records: List["VoteData"] = betterproto.message_field(18)
+    spot_data: List["ActivitySpotData"] = betterproto.message_field(19)
+    friend_gift_data: List["ActivityFriendGiftData"] = betterproto.message_field(20)
+    upgrade_data: List["ActivityUpgradeData"] = betterproto.message_field(21)
+    gacha_data: List["ActivityGachaUpdateData"] = betterproto.message_field(22)
+    simulation_data: List["ActivitySimulationData"] = betterproto.message_field(23)
+    combining_data: List["ActivityCombiningLqData"] = betterproto.message_field(24)
+    village_data: List["ActivityVillageData"] = betterproto.message_field(25)
+    festival_data: List["ActivityFestivalData"] = betterproto.message_field(26)
+    island_data: List["ActivityIslandData"] = betterproto.message_field(27)
+    amulet_data: List["ActivityAmuletData"] = betterproto.message_field(28)
+    story_data: List["ActivityStoryData"] = betterproto.message_field(29)
+
+
+from .. import (  # noqa: E402
+    ActivityAccumulatedPointData,
+    ActivityAmuletData,
+    ActivityArenaData,
+    ActivityCombiningLqData,
+    ActivityFestivalData,
+    ActivityFriendGiftData,
+    ActivityGachaUpdateData,
+    ActivityIslandData,
+    ActivityRankPointData,
+    ActivitySimulationData,
+    ActivitySpotData,
+    ActivityStoryData,
+    ActivityUpgradeData,
+    ActivityVillageData,
+    Error,
+    ExchangeRecord,
+    FeedActivityData,
+    MineActivityData,
+    ResAccountActivityDataActivityRichmanData,
+    ResAccountActivityDataActivitySignInData,
+    ResAccountActivityDataActivitySnsData,
+    ResAccountActivityDataChestUpData,
+    RpgActivity,
+    SegmentTaskProgress,
+    TaskProgress,
+    VoteData,
+)
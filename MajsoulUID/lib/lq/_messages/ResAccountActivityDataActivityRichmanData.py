@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityDataActivityRichmanData(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    location: int = betterproto.uint32_field(2)
+    finished_count: int = betterproto.uint32_field(3)
+    chest_position: int = betterproto.uint32_field(4)
+    bank_save: int = betterproto.uint32_field(5)
+    exp: int = betterproto.uint32_field(6)
+    buff: List["ResAccountActivityDataBuffData"] = betterproto.message_field(7)
+
+
+from .. import (  # noqa: E402
+    ResAccountActivityDataBuffData,
+)
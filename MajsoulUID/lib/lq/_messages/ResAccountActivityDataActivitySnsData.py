@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityDataActivitySnsData(betterproto.Message):
+    blog: List["SnsBlog"] = betterproto.message_field(1)
+    liked_id: List[int] = betterproto.uint32_field(2)
+    reply: List["SnsReply"] = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    SnsBlog,
+    SnsReply,
+)
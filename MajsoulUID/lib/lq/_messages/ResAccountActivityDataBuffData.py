@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityDataBuffData(betterproto.Message):
+    type: int = betterproto.uint32_field(1)
+    remain: int = betterproto.uint32_field(2)
+    effect: int = betterproto.uint32_field(3)
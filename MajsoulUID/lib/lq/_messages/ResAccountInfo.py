@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountInfo(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    account: "Account" = betterproto.message_field(2)
+    room: "Room" = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    Account,
+    Error,
+    Room,
+)
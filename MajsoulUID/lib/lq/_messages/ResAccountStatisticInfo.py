@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountStatisticInfo(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    statistic_data: List["AccountStatisticData"] = betterproto.message_field(2)
+    detail_data: "AccountDetailStatisticV2" = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    AccountDetailStatisticV2,
+    AccountStatisticData,
+    Error,
+)
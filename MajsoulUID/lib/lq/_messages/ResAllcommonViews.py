@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAllcommonViews(betterproto.Message):
+    views: List["ResAllcommonViewsViews"] = betterproto.message_field(1)
+    use: int = betterproto.uint32_field(2)
+    error: "Error" = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResAllcommonViewsViews,
+)
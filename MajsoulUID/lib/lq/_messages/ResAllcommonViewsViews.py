@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAllcommonViewsViews(betterproto.Message):
+    values: List["ViewSlot"] = betterproto.message_field(1)
+    index: int = betterproto.uint32_field(2)
+
+
+from .. import (  # noqa: E402
+    ViewSlot,
+)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivityBuy(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    coin: int = betterproto.uint32_field(2)
+    shop: "AmuletGameShopData" = betterproto.message_field(3)
+    stage: int = betterproto.uint32_field(4)
+    effect_list: List["AmuletEffectData"] = betterproto.message_field(5)
+    total_consumed_coin: int = betterproto.uint32_field(6)
+
+
+from .. import (  # noqa: E402
+    AmuletEffectData,
+    AmuletGameShopData,
+    Error,
+)
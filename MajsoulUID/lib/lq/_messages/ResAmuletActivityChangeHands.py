@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivityChangeHands(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    hands: List[int] = betterproto.uint32_field(2)
+    remain_change_tile_count: int = betterproto.uint32_field(3)
+    ting_list: List["AmuletActivityTingInfo"] = betterproto.message_field(4)
+    effect_list: List["AmuletEffectData"] = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    AmuletActivityTingInfo,
+    AmuletEffectData,
+    Error,
+)
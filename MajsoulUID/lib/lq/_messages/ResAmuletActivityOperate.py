@@ -0,0 +1,28 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivityOperate(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    hu_result: "AmuletHuleOperateResult" = betterproto.message_field(2)
+    gang_result: "AmuletGangOperateResult" = betterproto.message_field(3)
+    deal_result: "AmuletDealTileResult" = betterproto.message_field(4)
+    upgrade_result: "AmuletUpgradeResult" = betterproto.message_field(5)
+    upgraded: bool = betterproto.bool_field(6)
+    failed: bool = betterproto.bool_field(7)
+    game_update: "AmuletGameUpdateData" = betterproto.message_field(8)
+
+
+from .. import (  # noqa: E402
+    AmuletDealTileResult,
+    AmuletGameUpdateData,
+    AmuletGangOperateResult,
+    AmuletHuleOperateResult,
+    AmuletUpgradeResult,
+    Error,
+)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivityRefreshShop(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    shop: "AmuletGameShopData" = betterproto.message_field(2)
+    coin: int = betterproto.uint32_field(3)
+    effect_list: List["AmuletEffectData"] = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    AmuletEffectData,
+    AmuletGameShopData,
+    Error,
+)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivitySelectFreeEffect(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    game_update: "AmuletGameUpdateData" = betterproto.message_field(3)
+    remain_change_tile_count: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    AmuletGameUpdateData,
+    Error,
+)
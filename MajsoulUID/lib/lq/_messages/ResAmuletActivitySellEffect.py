@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivitySellEffect(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    coin: int = betterproto.uint32_field(2)
+    effect_list: List["AmuletEffectData"] = betterproto.message_field(3)
+    game_update: "AmuletGameUpdateData" = betterproto.message_field(4)
+    remain_change_tile_count: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    AmuletEffectData,
+    AmuletGameUpdateData,
+    Error,
+)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivityUpgrade(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    game: "AmuletGameData" = betterproto.message_field(2)
+    hook_effect: List["AmuletActivityHookEffect"] = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    AmuletActivityHookEffect,
+    AmuletGameData,
+    Error,
+)
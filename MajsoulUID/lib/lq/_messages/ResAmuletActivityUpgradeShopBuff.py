@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivityUpgradeShopBuff(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    game_update: "AmuletGameUpdateData" = betterproto.message_field(3)
+    shop_buff_list: List["AmuletEffectData"] = betterproto.message_field(4)
+    total_consumed_coin: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    AmuletEffectData,
+    AmuletGameUpdateData,
+    Error,
+)
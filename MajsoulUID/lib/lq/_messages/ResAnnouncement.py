@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAnnouncement(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    announcements: List["Announcement"] = betterproto.message_field(2)
+    sort: List[int] = betterproto.uint32_field(3)
+    read_list: List[int] = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    Announcement,
+    Error,
+)
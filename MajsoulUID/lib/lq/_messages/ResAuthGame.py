@@ -0,0 +1,25 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResAuthGame(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    players: List["PlayerGameView"] = betterproto.message_field(2)
+    seat_list: List[int] = betterproto.uint32_field(3)
+    is_game_start: bool = betterproto.bool_field(4)
+    game_config: "GameConfig" = betterproto.message_field(5)
+    ready_id_list: List[int] = betterproto.uint32_field(6)
+    robots: List["PlayerGameView"] = betterproto.message_field(7)
+
+
+from .. import (  # noqa: E402
+    Error,
+    GameConfig,
+    PlayerGameView,
+)
@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResBuyFestivalProposal(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    new_proposal: "FestivalProposalData" = betterproto.message_field(2)
+
+
+from .. import (  # noqa: E402
+    Error,
+    FestivalProposalData,
+)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResBuyFromChestShop(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    chest_id: int = betterproto.uint32_field(2)
+    consume_count: int = betterproto.uint32_field(3)
+    faith_count: int = betterproto.int32_field(4)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
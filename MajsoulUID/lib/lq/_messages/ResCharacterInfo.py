@@ -0,0 +1,27 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResCharacterInfo(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    characters: List["Character"] = betterproto.message_field(2)
+    skins: List[int] = betterproto.uint32_field(3)
+    main_character_id: int = betterproto.uint32_field(4)
+    send_gift_count: int = betterproto.uint32_field(5)
+    send_gift_limit: int = betterproto.uint32_field(6)
+    finished_endings: List[int] = betterproto.uint32_field(7)
+    rewarded_endings: List[int] = betterproto.uint32_field(8)
+    character_sort: List[int] = betterproto.uint32_field(9)
+    hidden_characters: List[int] = betterproto.uint32_field(10)
+
+
+from .. import (  # noqa: E402
+    Character,
+    Error,
+)
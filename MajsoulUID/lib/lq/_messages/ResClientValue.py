@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResClientValue(betterproto.Message):
+    error: "Error" = betterproto.message_field(3)
+    datas: List["ResClientValueValue"] = betterproto.message_field(1)
+    recharged_count: int = betterproto.uint32_field(2)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResClientValueValue,
+)
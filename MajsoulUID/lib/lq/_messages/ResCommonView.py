@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResCommonView(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    slots: List["ResCommonViewSlot"] = betterproto.message_field(2)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResCommonViewSlot,
+)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateAlipayScanOrder(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    qrcode_buffer: str = betterproto.string_field(2)
+    order_id: str = betterproto.string_field(3)
+    qr_code: str = betterproto.string_field(4)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateDmmOrder(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+    transaction_id: str = betterproto.string_field(3)
+    dmm_user_id: str = betterproto.string_field(4)
+    token: str = betterproto.string_field(5)
+    callback_url: str = betterproto.string_field(6)
+    request_time: str = betterproto.string_field(9)
+    dmm_app_id: str = betterproto.string_field(10)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
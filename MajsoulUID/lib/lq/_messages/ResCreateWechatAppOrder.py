@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateWechatAppOrder(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    call_wechat_app_param: "ResCreateWechatAppOrderCallWechatAppParam" = (
+        betterproto.message_field(2)
+    )
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResCreateWechatAppOrderCallWechatAppParam,
+)
@@ -0,0 +1,17 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateWechatAppOrderCallWechatAppParam(betterproto.Message):
+    appid: str = betterproto.string_field(1)
+    partnerid: str = betterproto.string_field(2)
+    prepayid: str = betterproto.string_field(3)
+    package: str = betterproto.string_field(4)
+    noncestr: str = betterproto.string_field(5)
+    timestamp: str = betterproto.string_field(6)
+    sign: str = betterproto.string_field(7)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResDailyTask(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    progresses: List["TaskProgress"] = betterproto.message_field(2)
+    has_refresh_count: bool = betterproto.bool_field(3)
+    max_daily_task_count: int = betterproto.uint32_field(4)
+    refresh_count: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    Error,
+    TaskProgress,
+)
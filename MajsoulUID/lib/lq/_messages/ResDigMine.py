@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResDigMine(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    map: List["MineReward"] = betterproto.message_field(2)
+    reward: List["RewardSlot"] = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    Error,
+    MineReward,
+    RewardSlot,
+)
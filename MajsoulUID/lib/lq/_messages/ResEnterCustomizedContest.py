@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResEnterCustomizedContest(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    detail_info: "CustomizedContestDetail" = betterproto.message_field(2)
+    player_report: "CustomizedContestPlayerReport" = betterproto.message_field(3)
+    is_followed: bool = betterproto.bool_field(4)
+    state: int = betterproto.uint32_field(5)
+    is_admin: bool = betterproto.bool_field(6)
+
+
+from .. import (  # noqa: E402
+    CustomizedContestDetail,
+    CustomizedContestPlayerReport,
+    Error,
+)
@@ -0,0 +1,25 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAbMatch(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    match_id: int = betterproto.uint32_field(2)
+    match_count: int = betterproto.uint32_field(3)
+    buy_in_count: int = betterproto.uint32_field(4)
+    point: int = betterproto.uint32_field(5)
+    rewarded: bool = betterproto.bool_field(6)
+    match_max_point: List["ResFetchAbMatchMatchPoint"] = betterproto.message_field(7)
+    quit: bool = betterproto.bool_field(8)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResFetchAbMatchMatchPoint,
+)
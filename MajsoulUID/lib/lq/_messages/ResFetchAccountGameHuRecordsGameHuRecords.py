@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountGameHuRecordsGameHuRecords(betterproto.Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    title_id: int = betterproto.uint32_field(4)
+    hands: List[str] = betterproto.string_field(5)
+    ming: List[str] = betterproto.string_field(6)
+    hupai: str = betterproto.string_field(7)
+    hu_fans: List[int] = betterproto.uint32_field(8)
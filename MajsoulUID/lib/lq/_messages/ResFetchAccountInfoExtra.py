@@ -0,0 +1,29 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountInfoExtra(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    recent_games: List["ResFetchAccountInfoExtraAccountInfoGameRecord"] = (
+        betterproto.message_field(2)
+    )
+    hu_type_details: List["ResFetchAccountInfoExtraGameHuTypeDetail"] = (
+        betterproto.message_field(3)
+    )
+    game_rank_details: List["ResFetchAccountInfoExtraAccountGameRankDetail"] = (
+        betterproto.message_field(4)
+    )
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResFetchAccountInfoExtraAccountGameRankDetail,
+    ResFetchAccountInfoExtraAccountInfoGameRecord,
+    ResFetchAccountInfoExtraGameHuTypeDetail,
+)
@@ -0,0 +1,26 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountInfoExtraAccountInfoGameRecord(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+    tag: int = betterproto.uint32_field(4)
+    sub_tag: int = betterproto.uint32_field(5)
+    rank: int = betterproto.uint32_field(6)
+    final_point: int = betterproto.uint32_field(7)
+    results: List["ResFetchAccountInfoExtraAccountInfoGameRecordAccountGameResult"] = (
+        betterproto.message_field(8)
+    )
+
+
+from .. import (  # noqa: E402
+    ResFetchAccountInfoExtraAccountInfoGameRecordAccountGameResult,
+)
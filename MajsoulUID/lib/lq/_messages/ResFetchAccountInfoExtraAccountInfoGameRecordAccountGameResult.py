@@ -0,0 +1,26 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountInfoExtraAccountInfoGameRecordAccountGameResult(
+    betterproto.Message
+):
+    rank: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    nickname: str = betterproto.string_field(3)
+    verified: int = betterproto.uint32_field(4)
+    grading_score: int = betterproto.int32_field(5)
+    final_point: int = betterproto.int32_field(6)
+    seat: int = betterproto.uint32_field(7)
+    level: "AccountLevel" = betterproto.message_field(8)
+    level3: "AccountLevel" = betterproto.message_field(9)
+
+
+from .. import (  # noqa: E402
+    AccountLevel,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchActivityRank(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResFetchActivityRankActivityRankItem"] = betterproto.message_field(4)
+    self: "ResFetchActivityRankActivityRankItem" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResFetchActivityRankActivityRankItem,
+)
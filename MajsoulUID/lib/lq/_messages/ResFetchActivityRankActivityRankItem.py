@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchActivityRankActivityRankItem(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    score: int = betterproto.uint64_field(2)
+    data: str = betterproto.string_field(3)
+    rank: int = betterproto.uint32_field(4)
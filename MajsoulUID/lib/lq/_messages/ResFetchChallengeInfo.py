@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchChallengeInfo(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    task_progress: List["TaskProgress"] = betterproto.message_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+    level: int = betterproto.uint32_field(4)
+    match_count: int = betterproto.uint32_field(5)
+    ticket_id: int = betterproto.uint32_field(6)
+    rewarded_season: List[int] = betterproto.uint32_field(7)
+
+
+from .. import (  # noqa: E402
+    Error,
+    TaskProgress,
+)
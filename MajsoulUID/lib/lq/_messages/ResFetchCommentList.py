@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchCommentList(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    comment_allow: int = betterproto.uint32_field(2)
+    comment_id_list: List[int] = betterproto.uint32_field(3)
+    last_read_id: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
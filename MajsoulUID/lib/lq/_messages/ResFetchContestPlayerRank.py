@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRank(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    total: int = betterproto.uint32_field(2)
+    rank: List["ResFetchContestPlayerRankSeasonRank"] = betterproto.message_field(3)
+    player_data: "ResFetchContestPlayerRankPlayerData" = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResFetchContestPlayerRankPlayerData,
+    ResFetchContestPlayerRankSeasonRank,
+)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRankContestPlayerAccountData(betterproto.Message):
+    total_game_count: int = betterproto.uint32_field(1)
+    recent_games: List[
+        "ResFetchContestPlayerRankContestPlayerAccountDataContestGameResult"
+    ] = betterproto.message_field(2)
+    highest_series_points: List[
+        "ResFetchContestPlayerRankContestPlayerAccountDataContestSeriesGameResult"
+    ] = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    ResFetchContestPlayerRankContestPlayerAccountDataContestGameResult,
+    ResFetchContestPlayerRankContestPlayerAccountDataContestSeriesGameResult,
+)
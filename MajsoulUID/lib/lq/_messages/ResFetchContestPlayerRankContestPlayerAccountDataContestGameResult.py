@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRankContestPlayerAccountDataContestGameResult(
+    betterproto.Message
+):
+    rank: int = betterproto.uint32_field(1)
+    total_point: int = betterproto.int32_field(2)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRankPlayerData(betterproto.Message):
+    rank: int = betterproto.uint32_field(1)
+    data: "ResFetchContestPlayerRankContestPlayerAccountData" = (
+        betterproto.message_field(2)
+    )
+
+
+from .. import (  # noqa: E402
+    ResFetchContestPlayerRankContestPlayerAccountData,
+)
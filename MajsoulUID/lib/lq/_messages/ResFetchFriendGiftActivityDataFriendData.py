@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchFriendGiftActivityDataFriendData(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    items: List["ResFetchFriendGiftActivityDataItemCountData"] = (
+        betterproto.message_field(2)
+    )
+    receive_count: int = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    ResFetchFriendGiftActivityDataItemCountData,
+)
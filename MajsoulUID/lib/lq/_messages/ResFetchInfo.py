@@ -0,0 +1,78 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchInfo(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    server_time: "ResServerTime" = betterproto.message_field(2)
+    server_setting: "ResServerSettings" = betterproto.message_field(3)
+    client_value: "ResClientValue" = betterproto.message_field(4)
+    friend_list: "ResFriendList" = betterproto.message_field(5)
+    friend_apply_list: "ResFriendApplyList" = betterproto.message_field(6)
+    recent_friend: "ResFetchrecentFriend" = betterproto.message_field(7)
+    mail_info: "ResMailInfo" = betterproto.message_field(8)
+    receive_coin_info: "ResReviveCoinInfo" = betterproto.message_field(9)
+    title_list: "ResTitleList" = betterproto.message_field(10)
+    bag_info: "ResBagInfo" = betterproto.message_field(11)
+    shop_info: "ResShopInfo" = betterproto.message_field(12)
+    shop_interval: "ResFetchShopInterval" = betterproto.message_field(13)
+    activity_data: "ResAccountActivityData" = betterproto.message_field(14)
+    activity_interval: "ResFetchActivityInterval" = betterproto.message_field(15)
+    activity_buff: "ResActivityBuff" = betterproto.message_field(16)
+    vip_reward: "ResVipReward" = betterproto.message_field(17)
+    month_ticket_info: "ResMonthTicketInfo" = betterproto.message_field(18)
+    achievement: "ResAchievement" = betterproto.message_field(19)
+    comment_setting: "ResCommentSetting" = betterproto.message_field(20)
+    account_settings: "ResAccountSettings" = betterproto.message_field(21)
+    mod_nickname_time: "ResModNicknameTime" = betterproto.message_field(22)
+    misc: "ResMisc" = betterproto.message_field(23)
+    announcement: "ResAnnouncement" = betterproto.message_field(24)
+    activity_list: "ResActivityList" = betterproto.message_field(26)
+    character_info: "ResCharacterInfo" = betterproto.message_field(27)
+    all_common_views: "ResAllcommonViews" = betterproto.message_field(28)
+    collected_game_record_list: "ResCollectedGameRecordList" = (
+        betterproto.message_field(29)
+    )
+    maintain_notice: "ResFetchMaintainNotice" = betterproto.message_field(30)
+    random_character: "ResRandomCharacter" = betterproto.message_field(31)
+    maintenance_info: "ResFetchServerMaintenanceInfo" = betterproto.message_field(32)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResAccountActivityData,
+    ResAccountSettings,
+    ResAchievement,
+    ResActivityBuff,
+    ResActivityList,
+    ResAllcommonViews,
+    ResAnnouncement,
+    ResBagInfo,
+    ResCharacterInfo,
+    ResClientValue,
+    ResCollectedGameRecordList,
+    ResCommentSetting,
+    ResFetchActivityInterval,
+    ResFetchMaintainNotice,
+    ResFetchServerMaintenanceInfo,
+    ResFetchShopInterval,
+    ResFetchrecentFriend,
+    ResFriendApplyList,
+    ResFriendList,
+    ResMailInfo,
+    ResMisc,
+    ResModNicknameTime,
+    ResMonthTicketInfo,
+    ResRandomCharacter,
+    ResReviveCoinInfo,
+    ResServerSettings,
+    ResServerTime,
+    ResShopInfo,
+    ResTitleList,
+    ResVipReward,
+)
@@ -0,0 +1,28 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchManagerCustomizedContest(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    name: str = betterproto.string_field(2)
+    open_show: int = betterproto.uint32_field(3)
+    game_rule_setting: "GameMode" = betterproto.message_field(4)
+    start_time: int = betterproto.uint32_field(5)
+    end_time: int = betterproto.uint32_field(6)
+    auto_match: int = betterproto.uint32_field(7)
+    rank_rule: int = betterproto.uint32_field(8)
+    check_state: int = betterproto.uint32_field(9)
+    checking_name: str = betterproto.string_field(10)
+    contest_setting: "ContestSetting" = betterproto.message_field(11)
+
+
+from .. import (  # noqa: E402
+    ContestSetting,
+    Error,
+    GameMode,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchObToken(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    token: str = betterproto.string_field(2)
+    create_time: int = betterproto.uint32_field(3)
+    delay: int = betterproto.uint32_field(4)
+    start_time: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
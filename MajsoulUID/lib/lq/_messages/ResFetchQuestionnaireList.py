@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchQuestionnaireList(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    list: List["QuestionnaireBrief"] = betterproto.message_field(2)
+    finished_list: List[int] = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    Error,
+    QuestionnaireBrief,
+)
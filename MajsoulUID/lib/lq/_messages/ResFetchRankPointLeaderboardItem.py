@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRankPointLeaderboardItem(betterproto.Message):
+    account_id: int = betterproto.uint32_field(1)
+    rank: int = betterproto.uint32_field(2)
+    view: "PlayerBaseView" = betterproto.message_field(3)
+    point: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    PlayerBaseView,
+)
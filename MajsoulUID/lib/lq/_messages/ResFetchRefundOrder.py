@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRefundOrder(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    orders: List["ResFetchRefundOrderOrderInfo"] = betterproto.message_field(2)
+    clear_deadline: int = betterproto.uint32_field(3)
+    message: List["I18NContext"] = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    Error,
+    I18NContext,
+    ResFetchRefundOrderOrderInfo,
+)
@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRefundOrderOrderInfo(betterproto.Message):
+    success_time: int = betterproto.uint32_field(1)
+    goods_id: int = betterproto.uint32_field(2)
+    cleared: int = betterproto.uint32_field(3)
+    order_id: str = betterproto.string_field(4)
@@ -0,0 +1,24 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRpgBattleHistory(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    battle_result: List["ResFetchRpgBattleHistoryBattleResult"] = (
+        betterproto.message_field(2)
+    )
+    start_state: "RpgState" = betterproto.message_field(3)
+    current_state: "RpgState" = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResFetchRpgBattleHistoryBattleResult,
+    RpgState,
+)
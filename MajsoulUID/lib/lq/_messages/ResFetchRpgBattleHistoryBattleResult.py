@@ -0,0 +1,26 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRpgBattleHistoryBattleResult(betterproto.Message):
+    uuid: str = betterproto.string_field(14)
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    target: int = betterproto.uint32_field(4)
+    damage: int = betterproto.uint32_field(5)
+    heal: int = betterproto.uint32_field(6)
+    monster_seq: int = betterproto.uint32_field(7)
+    chain_atk: int = betterproto.uint32_field(8)
+    killed: int = betterproto.uint32_field(9)
+    is_luk: int = betterproto.uint32_field(10)
+    is_dex: int = betterproto.uint32_field(11)
+    is_extra: int = betterproto.uint32_field(12)
+    reward: str = betterproto.string_field(13)
+    points: int = betterproto.uint32_field(15)
+    is_zimo: int = betterproto.uint32_field(16)
@@ -0,0 +1,27 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRpgBattleHistoryV2(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    battle_result: List["ResFetchRpgBattleHistoryV2BattleResultV2"] = (
+        betterproto.message_field(2)
+    )
+    start_state: "RpgState" = betterproto.message_field(3)
+    current_state: "RpgState" = betterproto.message_field(4)
+    recent_battle_result: List["ResFetchRpgBattleHistoryV2BattleResultV2"] = (
+        betterproto.message_field(5)
+    )
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResFetchRpgBattleHistoryV2BattleResultV2,
+    RpgState,
+)
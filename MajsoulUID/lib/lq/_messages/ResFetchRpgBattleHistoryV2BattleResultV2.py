@@ -0,0 +1,25 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRpgBattleHistoryV2BattleResultV2(betterproto.Message):
+    uuid: str = betterproto.string_field(14)
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    damage: int = betterproto.uint32_field(5)
+    monster_seq: int = betterproto.uint32_field(7)
+    killed: int = betterproto.uint32_field(9)
+    buff: List["ActivityBuffData"] = betterproto.message_field(10)
+    points: int = betterproto.uint32_field(11)
+
+
+from .. import (  # noqa: E402
+    ActivityBuffData,
+)
@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResGameEndVote(betterproto.Message):
+    success: bool = betterproto.bool_field(1)
+    vote_cd_end_time: int = betterproto.uint32_field(2)
+    error: "Error" = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResGameLiveInfo(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    left_start_seconds: int = betterproto.uint32_field(2)
+    live_head: "GameLiveHead" = betterproto.message_field(3)
+    segments: List["GameLiveSegmentUri"] = betterproto.message_field(4)
+    now_millisecond: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    Error,
+    GameLiveHead,
+    GameLiveSegmentUri,
+)
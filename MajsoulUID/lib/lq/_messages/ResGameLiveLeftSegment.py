@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResGameLiveLeftSegment(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    live_state: int = betterproto.uint32_field(2)
+    segments: List["GameLiveSegmentUri"] = betterproto.message_field(4)
+    now_millisecond: int = betterproto.uint32_field(5)
+    segment_end_millisecond: int = betterproto.uint32_field(6)
+
+
+from .. import (  # noqa: E402
+    Error,
+    GameLiveSegmentUri,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResGamePointRank(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    rank: List["ResGamePointRankRankInfo"] = betterproto.message_field(2)
+    self_rank: int = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResGamePointRankRankInfo,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResGameRecord(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    head: "RecordGame" = betterproto.message_field(3)
+    data: bytes = betterproto.bytes_field(4)
+    data_url: str = betterproto.string_field(5)
+
+
+from .. import (  # noqa: E402
+    Error,
+    RecordGame,
+)
@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResGameRecordListV2(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    iterator: str = betterproto.string_field(2)
+    iterator_expire: int = betterproto.uint32_field(3)
+    actual_begin_time: int = betterproto.uint32_field(4)
+    actual_end_time: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
@@ -0,0 +1,18 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResIdCardInfo(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    is_authed: bool = betterproto.bool_field(2)
+    country: str = betterproto.string_field(3)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
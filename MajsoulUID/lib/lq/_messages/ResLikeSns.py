@@ -0,0 +1,17 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResLikeSns(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    is_liked: int = betterproto.uint32_field(2)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
@@ -0,0 +1,29 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResLogin(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    account: "Account" = betterproto.message_field(3)
+    game_info: "GameConnectInfo" = betterproto.message_field(4)
+    has_unread_announcement: bool = betterproto.bool_field(5)
+    access_token: str = betterproto.string_field(6)
+    signup_time: int = betterproto.uint32_field(7)
+    is_id_card_authed: bool = betterproto.bool_field(8)
+    country: str = betterproto.string_field(9)
+    logined_version: List[int] = betterproto.uint32_field(10)
+    rewarded_version: List[int] = betterproto.uint32_field(11)
+
+
+from .. import (  # noqa: E402
+    Account,
+    Error,
+    GameConnectInfo,
+)
@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResLogout(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResMisc(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    recharged_list: List[int] = betterproto.uint32_field(2)
+    faiths: List["ResMiscMiscFaithData"] = betterproto.message_field(3)
+    verified_hidden: int = betterproto.uint32_field(4)
+    verified_value: int = betterproto.uint32_field(5)
+    disable_room_random_bot_char: int = betterproto.uint32_field(6)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResMiscMiscFaithData,
+)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResMoveCombiningCraft(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    pos: int = betterproto.uint32_field(2)
+    combined: int = betterproto.uint32_field(3)
+    craft_id: int = betterproto.uint32_field(4)
+    bonus: "ResMoveCombiningCraftBonusData" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResMoveCombiningCraftBonusData,
+)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResNextGameRecordList(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    next: bool = betterproto.bool_field(2)
+    entries: List["RecordListEntry"] = betterproto.message_field(3)
+    iterator_expire: int = betterproto.uint32_field(4)
+    next_end_time: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    Error,
+    RecordListEntry,
+)
@@ -0,0 +1,25 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResOpenChest(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    results: List["OpenResult"] = betterproto.message_field(2)
+    total_open_count: int = betterproto.uint32_field(3)
+    faith_count: int = betterproto.uint32_field(4)
+    chest_replace_up: List["ResOpenChestChestReplaceCountData"] = (
+        betterproto.message_field(5)
+    )
+
+
+from .. import (  # noqa: E402
+    Error,
+    OpenResult,
+    ResOpenChestChestReplaceCountData,
+)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResOpenGacha(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    result_list: List[int] = betterproto.uint32_field(2)
+    reward_items: List["ExecuteReward"] = betterproto.message_field(3)
+    sp_reward_items: List["ExecuteReward"] = betterproto.message_field(4)
+    remain_count: int = betterproto.uint32_field(5)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ExecuteReward,
+)
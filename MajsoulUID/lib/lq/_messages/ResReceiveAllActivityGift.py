@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveAllActivityGift(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    rewards: List["ExecuteReward"] = betterproto.message_field(2)
+    receive_gift: List["ResReceiveAllActivityGiftReceiveRewards"] = (
+        betterproto.message_field(3)
+    )
+
+
+from .. import (  # noqa: E402
+    Error,
+    ExecuteReward,
+    ResReceiveAllActivityGiftReceiveRewards,
+)
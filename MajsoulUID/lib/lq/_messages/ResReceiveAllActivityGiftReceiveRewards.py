@@ -0,0 +1,14 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveAllActivityGiftReceiveRewards(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    from_account_id: int = betterproto.uint32_field(2)
+    item_id: int = betterproto.uint32_field(3)
+    count: int = betterproto.uint32_field(4)
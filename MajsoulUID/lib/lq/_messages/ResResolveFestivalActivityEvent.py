@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResResolveFestivalActivityEvent(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    effected_buff: List[int] = betterproto.uint32_field(2)
+    reward_items: List["ExecuteResult"] = betterproto.message_field(4)
+    ending_id: int = betterproto.uint32_field(5)
+    level: int = betterproto.uint32_field(6)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ExecuteResult,
+)
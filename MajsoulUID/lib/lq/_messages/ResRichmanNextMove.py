@@ -0,0 +1,29 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResRichmanNextMove(betterproto.Message):
+    paths: List["ResRichmanNextMovePathData"] = betterproto.message_field(1)
+    dice: int = betterproto.uint32_field(2)
+    location: int = betterproto.uint32_field(3)
+    finished_count: int = betterproto.uint32_field(4)
+    step: int = betterproto.uint32_field(5)
+    buff: List["ResRichmanNextMoveBuffData"] = betterproto.message_field(6)
+    bank_save: int = betterproto.uint32_field(7)
+    chest_position: int = betterproto.uint32_field(8)
+    exp: int = betterproto.uint32_field(9)
+    bank_save_add: int = betterproto.uint32_field(10)
+    error: "Error" = betterproto.message_field(11)
+
+
+from .. import (  # noqa: E402
+    Error,
+    ResRichmanNextMoveBuffData,
+    ResRichmanNextMovePathData,
+)
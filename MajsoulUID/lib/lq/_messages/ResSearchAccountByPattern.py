@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResSearchAccountByPattern(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    is_finished: bool = betterproto.bool_field(2)
+    match_accounts: List[int] = betterproto.uint32_field(3)
+    decode_id: int = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    Error,
+)
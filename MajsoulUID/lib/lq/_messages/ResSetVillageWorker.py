@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResSetVillageWorker(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    building: "VillageBuildingData" = betterproto.message_field(2)
+    update_time: int = betterproto.uint32_field(3)
+
+
+from .. import (  # noqa: E402
+    Error,
+    VillageBuildingData,
+)
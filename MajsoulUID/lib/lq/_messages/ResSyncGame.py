@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ResSyncGame(betterproto.Message):
+    error: "Error" = betterproto.message_field(1)
+    is_end: bool = betterproto.bool_field(2)
+    step: int = betterproto.uint32_field(3)
+    game_restore: "GameRestore" = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    Error,
+    GameRestore,
+)
@@ -0,0 +1,17 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RollingNotice(betterproto.Message):
+    content: str = betterproto.string_field(2)
+    start_time: int = betterproto.uint32_field(3)
+    end_time: int = betterproto.uint32_field(4)
+    repeat_interval: int = betterproto.uint32_field(5)
+    repeat_time: List[int] = betterproto.uint32_field(7)
+    repeat_type: int = betterproto.uint32_field(8)
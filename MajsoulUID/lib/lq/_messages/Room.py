@@ -0,0 +1,31 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Room(betterproto.Message):
+    room_id: int = betterproto.uint32_field(1)
+    owner_id: int = betterproto.uint32_field(2)
+    mode: "GameMode" = betterproto.message_field(3)
+    max_player_count: int = betterproto.uint32_field(4)
+    persons: List["PlayerGameView"] = betterproto.message_field(5)
+    ready_list: List[int] = betterproto.uint32_field(6)
+    is_playing: bool = betterproto.bool_field(7)
+    public_live: bool = betterproto.bool_field(8)
+    robot_count: int = betterproto.uint32_field(9)
+    tournament_id: int = betterproto.uint32_field(10)
+    seq: int = betterproto.uint32_field(11)
+    pre_rule: str = betterproto.string_field(12)
+    robots: List["PlayerGameView"] = betterproto.message_field(13)
+    positions: List[int] = betterproto.uint32_field(14)
+
+
+from .. import (  # noqa: E402
+    GameMode,
+    PlayerGameView,
+)
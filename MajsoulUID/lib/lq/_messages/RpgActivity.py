@@ -0,0 +1,23 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RpgActivity(betterproto.Message):
+    activity_id: int = betterproto.uint32_field(1)
+    last_show_uuid: str = betterproto.string_field(5)
+    last_played_uuid: str = betterproto.string_field(6)
+    current_state: "RpgState" = betterproto.message_field(7)
+    last_show_state: "RpgState" = betterproto.message_field(8)
+    received_rewards: List[int] = betterproto.uint32_field(9)
+    last_show_id: int = betterproto.uint32_field(10)
+
+
+from .. import (  # noqa: E402
+    RpgState,
+)
@@ -0,0 +1,13 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class RpgState(betterproto.Message):
+    player_damaged: int = betterproto.uint32_field(1)
+    monster_damaged: int = betterproto.uint32_field(2)
+    monster_seq: int = betterproto.uint32_field(3)
@@ -0,0 +1,17 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class SegmentTaskProgress(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    counter: int = betterproto.uint32_field(2)
+    achieved: bool = betterproto.bool_field(3)
+    rewarded: bool = betterproto.bool_field(4)
+    failed: bool = betterproto.bool_field(5)
+    reward_count: int = betterproto.uint32_field(6)
+    achieved_count: int = betterproto.uint32_field(7)
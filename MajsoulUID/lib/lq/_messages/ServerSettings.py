@@ -0,0 +1,20 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ServerSettings(betterproto.Message):
+    payment_setting: "PaymentSetting" = betterproto.message_field(3)
+    payment_setting_v2: "PaymentSettingV2" = betterproto.message_field(4)
+    nickname_setting: "NicknameSetting" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    NicknameSetting,
+    PaymentSetting,
+    PaymentSettingV2,
+)
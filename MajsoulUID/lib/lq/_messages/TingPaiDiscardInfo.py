@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class TingPaiDiscardInfo(betterproto.Message):
+    tile: str = betterproto.string_field(1)
+    zhenting: bool = betterproto.bool_field(2)
+    infos: List["TingPaiInfo"] = betterproto.message_field(3)
+
+
+from .. import (  # noqa: E402
+    TingPaiInfo,
+)
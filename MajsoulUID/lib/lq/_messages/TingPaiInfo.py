@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class TingPaiInfo(betterproto.Message):
+    tile: str = betterproto.string_field(1)
+    haveyi: bool = betterproto.bool_field(2)
+    yiman: bool = betterproto.bool_field(3)
+    count: int = betterproto.uint32_field(4)
+    fu: int = betterproto.uint32_field(5)
+    biao_dora_count: int = betterproto.uint32_field(6)
+    yiman_zimo: bool = betterproto.bool_field(7)
+    count_zimo: int = betterproto.uint32_field(8)
+    fu_zimo: int = betterproto.uint32_field(9)
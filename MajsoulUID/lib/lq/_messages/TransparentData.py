@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class TransparentData(betterproto.Message):
+    method: str = betterproto.string_field(1)
+    data: bytes = betterproto.bytes_field(2)
+    session: str = betterproto.string_field(3)
+    remote: "NetworkEndpoint" = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    NetworkEndpoint,
+)
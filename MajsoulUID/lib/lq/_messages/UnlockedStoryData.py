@@ -0,0 +1,16 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class UnlockedStoryData(betterproto.Message):
+    story_id: int = betterproto.uint32_field(1)
+    finished_ending: List[int] = betterproto.uint32_field(2)
+    rewarded_ending: List[int] = betterproto.uint32_field(3)
+    finish_rewarded: int = betterproto.uint32_field(4)
+    all_finish_rewarded: int = betterproto.uint32_field(5)
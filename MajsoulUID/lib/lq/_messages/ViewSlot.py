@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ViewSlot(betterproto.Message):
+    slot: int = betterproto.uint32_field(1)
+    item_id: int = betterproto.uint32_field(2)
+    type: int = betterproto.uint32_field(3)
+    item_id_list: List[int] = betterproto.uint32_field(4)
@@ -0,0 +1,19 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class VillageBuildingData(betterproto.Message):
+    id: int = betterproto.uint32_field(1)
+    reward: List["VillageReward"] = betterproto.message_field(3)
+    workers: List[int] = betterproto.uint32_field(4)
+
+
+from .. import (  # noqa: E402
+    VillageReward,
+)
@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class VillageTargetInfo(betterproto.Message):
+    nickname: str = betterproto.string_field(1)
+    avatar: int = betterproto.uint32_field(2)
+    avatar_frame: int = betterproto.uint32_field(3)
+    title: int = betterproto.uint32_field(4)
+    verified: int = betterproto.uint32_field(5)
@@ -0,0 +1,22 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class VillageTripData(betterproto.Message):
+    start_round: int = betterproto.uint32_field(1)
+    dest_id: int = betterproto.uint32_field(2)
+    reward: List["VillageReward"] = betterproto.message_field(3)
+    level: int = betterproto.uint32_field(4)
+    info: "VillageTargetInfo" = betterproto.message_field(5)
+
+
+from .. import (  # noqa: E402
+    VillageReward,
+    VillageTargetInfo,
+)
@@ -0,0 +1,12 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class Wrapper(betterproto.Message):
+    name: str = betterproto.string_field(1)
+    data: bytes = betterproto.bytes_field(2)
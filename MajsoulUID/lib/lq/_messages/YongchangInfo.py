@@ -0,0 +1,15 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class YongchangInfo(betterproto.Message):
+    seat: int = betterproto.uint32_field(1)
+    moqie_count: int = betterproto.uint32_field(2)
+    moqie_bonus: int = betterproto.uint32_field(3)
+    shouqie_count: int = betterproto.uint32_field(4)
+    shouqie_bonus: int = betterproto.uint32_field(5)
@@ -0,0 +1,21 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+
+
+@dataclass(eq=False, repr=False)
+class ZhpShop(betterproto.Message):
+    goods: List[int] = betterproto.uint32_field(1)
+    buy_records: List["BuyRecord"] = betterproto.message_field(2)
+    free_refresh: "ZhpShopRefreshCount" = betterproto.message_field(3)
+    cost_refresh: "ZhpShopRefreshCount" = betterproto.message_field(4)
+
+
+from .. import (  # noqa: E402
+    BuyRecord,
+    ZhpShopRefreshCount,
+)
@@ -0,0 +1,13831 @@
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Optional,
+)
+
+import betterproto
+import grpclib
+from betterproto.grpc.grpclib_server import ServiceBase
+
+
+if TYPE_CHECKING:
+    import grpclib.server
+    from betterproto.grpc.grpclib_client import MetadataLike
+    from grpclib.metadata import Deadline
+
+
+class LobbyStub(betterproto.ServiceStub):
+    async def fetch_connection_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResConnectionInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchConnectionInfo",
+            req_common,
+            ResConnectionInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_queue_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchQueueInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchQueueInfo",
+            req_common,
+            ResFetchQueueInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def cancel_queue(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/cancelQueue",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def openid_check(
+        self,
+        req_openid_check: "ReqOpenidCheck",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResOauth2Check":
+        return await self._unary_unary(
+            "/lq.Lobby/openidCheck",
+            req_openid_check,
+            ResOauth2Check,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def signup(
+        self,
+        req_signup_account: "ReqSignupAccount",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSignupAccount":
+        return await self._unary_unary(
+            "/lq.Lobby/signup",
+            req_signup_account,
+            ResSignupAccount,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def login(
+        self,
+        req_login: "ReqLogin",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResLogin":
+        return await self._unary_unary(
+            "/lq.Lobby/login",
+            req_login,
+            ResLogin,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchInfo",
+            req_common,
+            ResFetchInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def login_success(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/loginSuccess",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_server_maintenance_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchServerMaintenanceInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchServerMaintenanceInfo",
+            req_common,
+            ResFetchServerMaintenanceInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def email_login(
+        self,
+        req_email_login: "ReqEmailLogin",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResLogin":
+        return await self._unary_unary(
+            "/lq.Lobby/emailLogin",
+            req_email_login,
+            ResLogin,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def oauth2_auth(
+        self,
+        req_oauth2_auth: "ReqOauth2Auth",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResOauth2Auth":
+        return await self._unary_unary(
+            "/lq.Lobby/oauth2Auth",
+            req_oauth2_auth,
+            ResOauth2Auth,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def oauth2_check(
+        self,
+        req_oauth2_check: "ReqOauth2Check",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResOauth2Check":
+        return await self._unary_unary(
+            "/lq.Lobby/oauth2Check",
+            req_oauth2_check,
+            ResOauth2Check,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def oauth2_signup(
+        self,
+        req_oauth2_signup: "ReqOauth2Signup",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResOauth2Signup":
+        return await self._unary_unary(
+            "/lq.Lobby/oauth2Signup",
+            req_oauth2_signup,
+            ResOauth2Signup,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def oauth2_login(
+        self,
+        req_oauth2_login: "ReqOauth2Login",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResLogin":
+        return await self._unary_unary(
+            "/lq.Lobby/oauth2Login",
+            req_oauth2_login,
+            ResLogin,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def dmm_pre_login(
+        self,
+        req_dmm_pre_login: "ReqDmmPreLogin",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResDmmPreLogin":
+        return await self._unary_unary(
+            "/lq.Lobby/dmmPreLogin",
+            req_dmm_pre_login,
+            ResDmmPreLogin,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_phone_verify_code(
+        self,
+        req_create_phone_verify_code: "ReqCreatePhoneVerifyCode",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/createPhoneVerifyCode",
+            req_create_phone_verify_code,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_email_verify_code(
+        self,
+        req_create_email_verify_code: "ReqCreateEmailVerifyCode",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/createEmailVerifyCode",
+            req_create_email_verify_code,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def verfify_code_for_secure(
+        self,
+        req_verify_code_for_secure: "ReqVerifyCodeForSecure",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResVerfiyCodeForSecure":
+        return await self._unary_unary(
+            "/lq.Lobby/verfifyCodeForSecure",
+            req_verify_code_for_secure,
+            ResVerfiyCodeForSecure,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def bind_phone_number(
+        self,
+        req_bind_phone_number: "ReqBindPhoneNumber",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/bindPhoneNumber",
+            req_bind_phone_number,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def unbind_phone_number(
+        self,
+        req_unbind_phone_number: "ReqUnbindPhoneNumber",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/unbindPhoneNumber",
+            req_unbind_phone_number,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_phone_login_bind(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchPhoneLoginBind":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchPhoneLoginBind",
+            req_common,
+            ResFetchPhoneLoginBind,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_phone_login_bind(
+        self,
+        req_create_phone_login_bind: "ReqCreatePhoneLoginBind",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/createPhoneLoginBind",
+            req_create_phone_login_bind,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def bind_email(
+        self,
+        req_bind_email: "ReqBindEmail",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/bindEmail",
+            req_bind_email,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def modify_password(
+        self,
+        req_modify_password: "ReqModifyPassword",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/modifyPassword",
+            req_modify_password,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def bind_account(
+        self,
+        req_bind_account: "ReqBindAccount",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/bindAccount",
+            req_bind_account,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def logout(
+        self,
+        req_logout: "ReqLogout",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResLogout":
+        return await self._unary_unary(
+            "/lq.Lobby/logout",
+            req_logout,
+            ResLogout,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def heatbeat(
+        self,
+        req_heat_beat: "ReqHeatBeat",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/heatbeat",
+            req_heat_beat,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def login_beat(
+        self,
+        req_login_beat: "ReqLoginBeat",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/loginBeat",
+            req_login_beat,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_nickname(
+        self,
+        req_create_nickname: "ReqCreateNickname",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/createNickname",
+            req_create_nickname,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def modify_nickname(
+        self,
+        req_modify_nickname: "ReqModifyNickname",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/modifyNickname",
+            req_modify_nickname,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def modify_birthday(
+        self,
+        req_modify_birthday: "ReqModifyBirthday",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/modifyBirthday",
+            req_modify_birthday,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_room(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSelfRoom":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchRoom",
+            req_common,
+            ResSelfRoom,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_gaming_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchGamingInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGamingInfo",
+            req_common,
+            ResFetchGamingInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_room(
+        self,
+        req_create_room: "ReqCreateRoom",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateRoom":
+        return await self._unary_unary(
+            "/lq.Lobby/createRoom",
+            req_create_room,
+            ResCreateRoom,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def join_room(
+        self,
+        req_join_room: "ReqJoinRoom",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResJoinRoom":
+        return await self._unary_unary(
+            "/lq.Lobby/joinRoom",
+            req_join_room,
+            ResJoinRoom,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def leave_room(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/leaveRoom",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def ready_play(
+        self,
+        req_room_ready: "ReqRoomReady",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/readyPlay",
+            req_room_ready,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def dressing_status(
+        self,
+        req_room_dressing: "ReqRoomDressing",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/dressingStatus",
+            req_room_dressing,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def start_room(
+        self,
+        req_room_start: "ReqRoomStart",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/startRoom",
+            req_room_start,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def room_kick_player(
+        self,
+        req_room_kick_player: "ReqRoomKickPlayer",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/roomKickPlayer",
+            req_room_kick_player,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def modify_room(
+        self,
+        req_modify_room: "ReqModifyRoom",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/modifyRoom",
+            req_modify_room,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def add_room_robot(
+        self,
+        req_add_room_robot: "ReqAddRoomRobot",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/addRoomRobot",
+            req_add_room_robot,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def match_game(
+        self,
+        req_join_match_queue: "ReqJoinMatchQueue",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/matchGame",
+            req_join_match_queue,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def cancel_match(
+        self,
+        req_cancel_match_queue: "ReqCancelMatchQueue",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/cancelMatch",
+            req_cancel_match_queue,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_account_info(
+        self,
+        req_account_info: "ReqAccountInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAccountInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAccountInfo",
+            req_account_info,
+            ResAccountInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def change_avatar(
+        self,
+        req_change_avatar: "ReqChangeAvatar",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/changeAvatar",
+            req_change_avatar,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_version_reward(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveVersionReward",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_account_statistic_info(
+        self,
+        req_account_statistic_info: "ReqAccountStatisticInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAccountStatisticInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAccountStatisticInfo",
+            req_account_statistic_info,
+            ResAccountStatisticInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_account_challenge_rank_info(
+        self,
+        req_account_info: "ReqAccountInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAccountChallengeRankInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAccountChallengeRankInfo",
+            req_account_info,
+            ResAccountChallengeRankInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_account_character_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAccountCharacterInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAccountCharacterInfo",
+            req_common,
+            ResAccountCharacterInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def shop_purchase(
+        self,
+        req_shop_purchase: "ReqShopPurchase",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResShopPurchase":
+        return await self._unary_unary(
+            "/lq.Lobby/shopPurchase",
+            req_shop_purchase,
+            ResShopPurchase,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_record(
+        self,
+        req_game_record: "ReqGameRecord",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGameRecord":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGameRecord",
+            req_game_record,
+            ResGameRecord,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def read_game_record(
+        self,
+        req_game_record: "ReqGameRecord",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/readGameRecord",
+            req_game_record,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_record_list(
+        self,
+        req_game_record_list: "ReqGameRecordList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGameRecordList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGameRecordList",
+            req_game_record_list,
+            ResGameRecordList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_record_list_v2(
+        self,
+        req_game_record_list_v2: "ReqGameRecordListV2",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGameRecordListV2":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGameRecordListV2",
+            req_game_record_list_v2,
+            ResGameRecordListV2,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_next_game_record_list(
+        self,
+        req_next_game_record_list: "ReqNextGameRecordList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResNextGameRecordList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchNextGameRecordList",
+            req_next_game_record_list,
+            ResNextGameRecordList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_collected_game_record_list(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCollectedGameRecordList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCollectedGameRecordList",
+            req_common,
+            ResCollectedGameRecordList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_records_detail(
+        self,
+        req_game_records_detail: "ReqGameRecordsDetail",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGameRecordsDetail":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGameRecordsDetail",
+            req_game_records_detail,
+            ResGameRecordsDetail,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_records_detail_v2(
+        self,
+        req_game_records_detail_v2: "ReqGameRecordsDetailV2",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGameRecordsDetailV2":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGameRecordsDetailV2",
+            req_game_records_detail_v2,
+            ResGameRecordsDetailV2,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def add_collected_game_record(
+        self,
+        req_add_collected_game_record: "ReqAddCollectedGameRecord",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAddCollectedGameRecord":
+        return await self._unary_unary(
+            "/lq.Lobby/addCollectedGameRecord",
+            req_add_collected_game_record,
+            ResAddCollectedGameRecord,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def remove_collected_game_record(
+        self,
+        req_remove_collected_game_record: "ReqRemoveCollectedGameRecord",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRemoveCollectedGameRecord":
+        return await self._unary_unary(
+            "/lq.Lobby/removeCollectedGameRecord",
+            req_remove_collected_game_record,
+            ResRemoveCollectedGameRecord,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def change_collected_game_record_remarks(
+        self,
+        req_change_collected_game_record_remarks: "ReqChangeCollectedGameRecordRemarks",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResChangeCollectedGameRecordRemarks":
+        return await self._unary_unary(
+            "/lq.Lobby/changeCollectedGameRecordRemarks",
+            req_change_collected_game_record_remarks,
+            ResChangeCollectedGameRecordRemarks,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_level_leaderboard(
+        self,
+        req_level_leaderboard: "ReqLevelLeaderboard",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResLevelLeaderboard":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchLevelLeaderboard",
+            req_level_leaderboard,
+            ResLevelLeaderboard,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_challenge_leaderboard(
+        self,
+        req_challange_leaderboard: "ReqChallangeLeaderboard",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResChallengeLeaderboard":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchChallengeLeaderboard",
+            req_challange_leaderboard,
+            ResChallengeLeaderboard,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_muti_challenge_level(
+        self,
+        req_muti_challenge_level: "ReqMutiChallengeLevel",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResMutiChallengeLevel":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchMutiChallengeLevel",
+            req_muti_challenge_level,
+            ResMutiChallengeLevel,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_multi_account_brief(
+        self,
+        req_multi_account_id: "ReqMultiAccountId",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResMultiAccountBrief":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchMultiAccountBrief",
+            req_multi_account_id,
+            ResMultiAccountBrief,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_friend_list(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFriendList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchFriendList",
+            req_common,
+            ResFriendList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_friend_apply_list(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFriendApplyList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchFriendApplyList",
+            req_common,
+            ResFriendApplyList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def apply_friend(
+        self,
+        req_apply_friend: "ReqApplyFriend",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/applyFriend",
+            req_apply_friend,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def handle_friend_apply(
+        self,
+        req_handle_friend_apply: "ReqHandleFriendApply",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/handleFriendApply",
+            req_handle_friend_apply,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def remove_friend(
+        self,
+        req_remove_friend: "ReqRemoveFriend",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/removeFriend",
+            req_remove_friend,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def search_account_by_id(
+        self,
+        req_search_account_by_id: "ReqSearchAccountById",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSearchAccountById":
+        return await self._unary_unary(
+            "/lq.Lobby/searchAccountById",
+            req_search_account_by_id,
+            ResSearchAccountById,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def search_account_by_pattern(
+        self,
+        req_search_account_by_pattern: "ReqSearchAccountByPattern",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSearchAccountByPattern":
+        return await self._unary_unary(
+            "/lq.Lobby/searchAccountByPattern",
+            req_search_account_by_pattern,
+            ResSearchAccountByPattern,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_account_state(
+        self,
+        req_account_list: "ReqAccountList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAccountStates":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAccountState",
+            req_account_list,
+            ResAccountStates,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_bag_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResBagInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchBagInfo",
+            req_common,
+            ResBagInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def use_bag_item(
+        self,
+        req_use_bag_item: "ReqUseBagItem",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/useBagItem",
+            req_use_bag_item,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def open_manual_item(
+        self,
+        req_open_manual_item: "ReqOpenManualItem",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/openManualItem",
+            req_open_manual_item,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def open_random_reward_item(
+        self,
+        req_open_random_reward_item: "ReqOpenRandomRewardItem",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResOpenRandomRewardItem":
+        return await self._unary_unary(
+            "/lq.Lobby/openRandomRewardItem",
+            req_open_random_reward_item,
+            ResOpenRandomRewardItem,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def open_all_reward_item(
+        self,
+        req_open_all_reward_item: "ReqOpenAllRewardItem",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResOpenAllRewardItem":
+        return await self._unary_unary(
+            "/lq.Lobby/openAllRewardItem",
+            req_open_all_reward_item,
+            ResOpenAllRewardItem,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def compose_shard(
+        self,
+        req_compose_shard: "ReqComposeShard",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/composeShard",
+            req_compose_shard,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_announcement(
+        self,
+        req_fetch_announcement: "ReqFetchAnnouncement",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAnnouncement":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAnnouncement",
+            req_fetch_announcement,
+            ResAnnouncement,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def read_announcement(
+        self,
+        req_read_announcement: "ReqReadAnnouncement",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/readAnnouncement",
+            req_read_announcement,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_mail_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResMailInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchMailInfo",
+            req_common,
+            ResMailInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def read_mail(
+        self,
+        req_read_mail: "ReqReadMail",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/readMail",
+            req_read_mail,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def delete_mail(
+        self,
+        req_delete_mail: "ReqDeleteMail",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/deleteMail",
+            req_delete_mail,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def take_attachment_from_mail(
+        self,
+        req_take_attachment: "ReqTakeAttachment",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/takeAttachmentFromMail",
+            req_take_attachment,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_achievement_reward(
+        self,
+        req_receive_achievement_reward: "ReqReceiveAchievementReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveAchievementReward":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveAchievementReward",
+            req_receive_achievement_reward,
+            ResReceiveAchievementReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_achievement_group_reward(
+        self,
+        req_receive_achievement_group_reward: "ReqReceiveAchievementGroupReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveAchievementGroupReward":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveAchievementGroupReward",
+            req_receive_achievement_group_reward,
+            ResReceiveAchievementGroupReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_achievement_rate(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchAchievementRate":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAchievementRate",
+            req_common,
+            ResFetchAchievementRate,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_achievement(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAchievement":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAchievement",
+            req_common,
+            ResAchievement,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def buy_shi_lian(
+        self,
+        req_buy_shi_lian: "ReqBuyShiLian",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/buyShiLian",
+            req_buy_shi_lian,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def match_shi_lian(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/matchShiLian",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def go_next_shi_lian(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/goNextShiLian",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def update_client_value(
+        self,
+        req_update_client_value: "ReqUpdateClientValue",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/updateClientValue",
+            req_update_client_value,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_client_value(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResClientValue":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchClientValue",
+            req_common,
+            ResClientValue,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def client_message(
+        self,
+        req_client_message: "ReqClientMessage",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/clientMessage",
+            req_client_message,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_current_match_info(
+        self,
+        req_current_match_info: "ReqCurrentMatchInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCurrentMatchInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCurrentMatchInfo",
+            req_current_match_info,
+            ResCurrentMatchInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def user_complain(
+        self,
+        req_user_complain: "ReqUserComplain",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/userComplain",
+            req_user_complain,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_revive_coin_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReviveCoinInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchReviveCoinInfo",
+            req_common,
+            ResReviveCoinInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def gain_revive_coin(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/gainReviveCoin",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_daily_task(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResDailyTask":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchDailyTask",
+            req_common,
+            ResDailyTask,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def refresh_daily_task(
+        self,
+        req_refresh_daily_task: "ReqRefreshDailyTask",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRefreshDailyTask":
+        return await self._unary_unary(
+            "/lq.Lobby/refreshDailyTask",
+            req_refresh_daily_task,
+            ResRefreshDailyTask,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def use_gift_code(
+        self,
+        req_use_gift_code: "ReqUseGiftCode",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResUseGiftCode":
+        return await self._unary_unary(
+            "/lq.Lobby/useGiftCode",
+            req_use_gift_code,
+            ResUseGiftCode,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def use_special_gift_code(
+        self,
+        req_use_gift_code: "ReqUseGiftCode",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResUseSpecialGiftCode":
+        return await self._unary_unary(
+            "/lq.Lobby/useSpecialGiftCode",
+            req_use_gift_code,
+            ResUseSpecialGiftCode,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_title_list(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResTitleList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchTitleList",
+            req_common,
+            ResTitleList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def use_title(
+        self,
+        req_use_title: "ReqUseTitle",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/useTitle",
+            req_use_title,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def send_client_message(
+        self,
+        req_send_client_message: "ReqSendClientMessage",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/sendClientMessage",
+            req_send_client_message,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_live_info(
+        self,
+        req_game_live_info: "ReqGameLiveInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGameLiveInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGameLiveInfo",
+            req_game_live_info,
+            ResGameLiveInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_live_left_segment(
+        self,
+        req_game_live_left_segment: "ReqGameLiveLeftSegment",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGameLiveLeftSegment":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGameLiveLeftSegment",
+            req_game_live_left_segment,
+            ResGameLiveLeftSegment,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_live_list(
+        self,
+        req_game_live_list: "ReqGameLiveList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGameLiveList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGameLiveList",
+            req_game_live_list,
+            ResGameLiveList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_comment_setting(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommentSetting":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCommentSetting",
+            req_common,
+            ResCommentSetting,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def update_comment_setting(
+        self,
+        req_update_comment_setting: "ReqUpdateCommentSetting",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/updateCommentSetting",
+            req_update_comment_setting,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_comment_list(
+        self,
+        req_fetch_comment_list: "ReqFetchCommentList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchCommentList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCommentList",
+            req_fetch_comment_list,
+            ResFetchCommentList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_comment_content(
+        self,
+        req_fetch_comment_content: "ReqFetchCommentContent",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchCommentContent":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCommentContent",
+            req_fetch_comment_content,
+            ResFetchCommentContent,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def leave_comment(
+        self,
+        req_leave_comment: "ReqLeaveComment",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/leaveComment",
+            req_leave_comment,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def delete_comment(
+        self,
+        req_delete_comment: "ReqDeleteComment",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/deleteComment",
+            req_delete_comment,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def update_read_comment(
+        self,
+        req_update_read_comment: "ReqUpdateReadComment",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/updateReadComment",
+            req_update_read_comment,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_rolling_notice(
+        self,
+        req_fetch_rolling_notice: "ReqFetchRollingNotice",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchRollingNotice":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchRollingNotice",
+            req_fetch_rolling_notice,
+            ResFetchRollingNotice,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_maintain_notice(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchMaintainNotice":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchMaintainNotice",
+            req_common,
+            ResFetchMaintainNotice,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_server_time(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResServerTime":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchServerTime",
+            req_common,
+            ResServerTime,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_platform_products(
+        self,
+        req_platform_billing_products: "ReqPlatformBillingProducts",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResPlatformBillingProducts":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchPlatformProducts",
+            req_platform_billing_products,
+            ResPlatformBillingProducts,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_random_character(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRandomCharacter":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchRandomCharacter",
+            req_common,
+            ResRandomCharacter,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def set_random_character(
+        self,
+        req_random_character: "ReqRandomCharacter",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/setRandomCharacter",
+            req_random_character,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def cancel_google_play_order(
+        self,
+        req_cancel_google_play_order: "ReqCancelGooglePlayOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/cancelGooglePlayOrder",
+            req_cancel_google_play_order,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def open_chest(
+        self,
+        req_open_chest: "ReqOpenChest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResOpenChest":
+        return await self._unary_unary(
+            "/lq.Lobby/openChest",
+            req_open_chest,
+            ResOpenChest,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def buy_from_chest_shop(
+        self,
+        req_buy_from_chest_shop: "ReqBuyFromChestShop",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResBuyFromChestShop":
+        return await self._unary_unary(
+            "/lq.Lobby/buyFromChestShop",
+            req_buy_from_chest_shop,
+            ResBuyFromChestShop,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_daily_sign_in_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResDailySignInInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchDailySignInInfo",
+            req_common,
+            ResDailySignInInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def do_daily_sign_in(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/doDailySignIn",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def do_activity_sign_in(
+        self,
+        req_do_activity_sign_in: "ReqDoActivitySignIn",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResDoActivitySignIn":
+        return await self._unary_unary(
+            "/lq.Lobby/doActivitySignIn",
+            req_do_activity_sign_in,
+            ResDoActivitySignIn,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_character_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCharacterInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCharacterInfo",
+            req_common,
+            ResCharacterInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def update_character_sort(
+        self,
+        req_update_character_sort: "ReqUpdateCharacterSort",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/updateCharacterSort",
+            req_update_character_sort,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def change_main_character(
+        self,
+        req_change_main_character: "ReqChangeMainCharacter",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/changeMainCharacter",
+            req_change_main_character,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def change_character_skin(
+        self,
+        req_change_character_skin: "ReqChangeCharacterSkin",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/changeCharacterSkin",
+            req_change_character_skin,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def change_character_view(
+        self,
+        req_change_character_view: "ReqChangeCharacterView",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/changeCharacterView",
+            req_change_character_view,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def set_hidden_character(
+        self,
+        req_set_hidden_character: "ReqSetHiddenCharacter",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSetHiddenCharacter":
+        return await self._unary_unary(
+            "/lq.Lobby/setHiddenCharacter",
+            req_set_hidden_character,
+            ResSetHiddenCharacter,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def send_gift_to_character(
+        self,
+        req_send_gift_to_character: "ReqSendGiftToCharacter",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSendGiftToCharacter":
+        return await self._unary_unary(
+            "/lq.Lobby/sendGiftToCharacter",
+            req_send_gift_to_character,
+            ResSendGiftToCharacter,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def sell_item(
+        self,
+        req_sell_item: "ReqSellItem",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/sellItem",
+            req_sell_item,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_common_view(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommonView":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCommonView",
+            req_common,
+            ResCommonView,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def change_common_view(
+        self,
+        req_change_common_view: "ReqChangeCommonView",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/changeCommonView",
+            req_change_common_view,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def save_common_views(
+        self,
+        req_save_common_views: "ReqSaveCommonViews",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/saveCommonViews",
+            req_save_common_views,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_common_views(
+        self,
+        req_common_views: "ReqCommonViews",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommonViews":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCommonViews",
+            req_common_views,
+            ResCommonViews,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_all_common_views(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAllcommonViews":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAllCommonViews",
+            req_common,
+            ResAllcommonViews,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def use_common_view(
+        self,
+        req_use_common_view: "ReqUseCommonView",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/useCommonView",
+            req_use_common_view,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def upgrade_character(
+        self,
+        req_upgrade_character: "ReqUpgradeCharacter",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResUpgradeCharacter":
+        return await self._unary_unary(
+            "/lq.Lobby/upgradeCharacter",
+            req_upgrade_character,
+            ResUpgradeCharacter,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def add_finished_ending(
+        self,
+        req_finished_ending: "ReqFinishedEnding",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/addFinishedEnding",
+            req_finished_ending,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_ending_reward(
+        self,
+        req_finished_ending: "ReqFinishedEnding",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveEndingReward",
+            req_finished_ending,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def game_master_command(
+        self,
+        req_gm_command: "ReqGmCommand",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/gameMasterCommand",
+            req_gm_command,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_shop_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResShopInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchShopInfo",
+            req_common,
+            ResShopInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def buy_from_shop(
+        self,
+        req_buy_from_shop: "ReqBuyFromShop",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResBuyFromShop":
+        return await self._unary_unary(
+            "/lq.Lobby/buyFromShop",
+            req_buy_from_shop,
+            ResBuyFromShop,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def buy_from_zhp(
+        self,
+        req_buy_from_zhp: "ReqBuyFromZhp",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/buyFromZHP",
+            req_buy_from_zhp,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def refresh_zhp_shop(
+        self,
+        req_resh_zhp_shop: "ReqReshZhpShop",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRefreshZhpShop":
+        return await self._unary_unary(
+            "/lq.Lobby/refreshZHPShop",
+            req_resh_zhp_shop,
+            ResRefreshZhpShop,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_month_ticket_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResMonthTicketInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchMonthTicketInfo",
+            req_common,
+            ResMonthTicketInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def pay_month_ticket(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResPayMonthTicket":
+        return await self._unary_unary(
+            "/lq.Lobby/payMonthTicket",
+            req_common,
+            ResPayMonthTicket,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def exchange_currency(
+        self,
+        req_exchange_currency: "ReqExchangeCurrency",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/exchangeCurrency",
+            req_exchange_currency,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def exchange_chest_stone(
+        self,
+        req_exchange_currency: "ReqExchangeCurrency",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/exchangeChestStone",
+            req_exchange_currency,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def exchange_diamond(
+        self,
+        req_exchange_currency: "ReqExchangeCurrency",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/exchangeDiamond",
+            req_exchange_currency,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_server_settings(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResServerSettings":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchServerSettings",
+            req_common,
+            ResServerSettings,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_account_settings(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAccountSettings":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAccountSettings",
+            req_common,
+            ResAccountSettings,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def update_account_settings(
+        self,
+        req_update_account_settings: "ReqUpdateAccountSettings",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/updateAccountSettings",
+            req_update_account_settings,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_mod_nickname_time(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResModNicknameTime":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchModNicknameTime",
+            req_common,
+            ResModNicknameTime,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_wechat_native_order(
+        self,
+        req_create_wechat_native_order: "ReqCreateWechatNativeOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateWechatNativeOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createWechatNativeOrder",
+            req_create_wechat_native_order,
+            ResCreateWechatNativeOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_wechat_app_order(
+        self,
+        req_create_wechat_app_order: "ReqCreateWechatAppOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateWechatAppOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createWechatAppOrder",
+            req_create_wechat_app_order,
+            ResCreateWechatAppOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_alipay_order(
+        self,
+        req_create_alipay_order: "ReqCreateAlipayOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateAlipayOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createAlipayOrder",
+            req_create_alipay_order,
+            ResCreateAlipayOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_alipay_scan_order(
+        self,
+        req_create_alipay_scan_order: "ReqCreateAlipayScanOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateAlipayScanOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createAlipayScanOrder",
+            req_create_alipay_scan_order,
+            ResCreateAlipayScanOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_alipay_app_order(
+        self,
+        req_create_alipay_app_order: "ReqCreateAlipayAppOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateAlipayAppOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createAlipayAppOrder",
+            req_create_alipay_app_order,
+            ResCreateAlipayAppOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_jp_credit_card_order(
+        self,
+        req_create_jp_credit_card_order: "ReqCreateJpCreditCardOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateJpCreditCardOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createJPCreditCardOrder",
+            req_create_jp_credit_card_order,
+            ResCreateJpCreditCardOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_jp_paypal_order(
+        self,
+        req_create_jp_paypal_order: "ReqCreateJpPaypalOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateJpPaypalOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createJPPaypalOrder",
+            req_create_jp_paypal_order,
+            ResCreateJpPaypalOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_jp_au_order(
+        self,
+        req_create_jp_au_order: "ReqCreateJpAuOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateJpAuOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createJPAuOrder",
+            req_create_jp_au_order,
+            ResCreateJpAuOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_jp_docomo_order(
+        self,
+        req_create_jp_docomo_order: "ReqCreateJpDocomoOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateJpDocomoOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createJPDocomoOrder",
+            req_create_jp_docomo_order,
+            ResCreateJpDocomoOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_jp_web_money_order(
+        self,
+        req_create_jp_web_money_order: "ReqCreateJpWebMoneyOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateJpWebMoneyOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createJPWebMoneyOrder",
+            req_create_jp_web_money_order,
+            ResCreateJpWebMoneyOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_jp_softbank_order(
+        self,
+        req_create_jp_softbank_order: "ReqCreateJpSoftbankOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateJpSoftbankOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createJPSoftbankOrder",
+            req_create_jp_softbank_order,
+            ResCreateJpSoftbankOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_jp_pay_pay_order(
+        self,
+        req_create_jp_pay_pay_order: "ReqCreateJpPayPayOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateJpPayPayOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createJPPayPayOrder",
+            req_create_jp_pay_pay_order,
+            ResCreateJpPayPayOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_jp_common_credit_card_order(
+        self,
+        req_fetch_jp_common_credit_card_order: "ReqFetchJpCommonCreditCardOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchJpCommonCreditCardOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchJPCommonCreditCardOrder",
+            req_fetch_jp_common_credit_card_order,
+            ResFetchJpCommonCreditCardOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_jpgmo_order(
+        self,
+        req_create_jpgmo_order: "ReqCreateJpgmoOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateJpgmoOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createJPGMOOrder",
+            req_create_jpgmo_order,
+            ResCreateJpgmoOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_en_paypal_order(
+        self,
+        req_create_en_paypal_order: "ReqCreateEnPaypalOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateEnPaypalOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createENPaypalOrder",
+            req_create_en_paypal_order,
+            ResCreateEnPaypalOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_en_master_card_order(
+        self,
+        req_create_en_master_card_order: "ReqCreateEnMasterCardOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateEnMasterCardOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createENMasterCardOrder",
+            req_create_en_master_card_order,
+            ResCreateEnMasterCardOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_en_visa_order(
+        self,
+        req_create_en_visa_order: "ReqCreateEnVisaOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateEnVisaOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createENVisaOrder",
+            req_create_en_visa_order,
+            ResCreateEnVisaOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_enjcb_order(
+        self,
+        req_create_enjcb_order: "ReqCreateEnjcbOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateEnjcbOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createENJCBOrder",
+            req_create_enjcb_order,
+            ResCreateEnjcbOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_en_alipay_order(
+        self,
+        req_create_en_alipay_order: "ReqCreateEnAlipayOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateEnAlipayOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createENAlipayOrder",
+            req_create_en_alipay_order,
+            ResCreateEnAlipayOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_kr_paypal_order(
+        self,
+        req_create_kr_paypal_order: "ReqCreateKrPaypalOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateKrPaypalOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createKRPaypalOrder",
+            req_create_kr_paypal_order,
+            ResCreateKrPaypalOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_kr_master_card_order(
+        self,
+        req_create_kr_master_card_order: "ReqCreateKrMasterCardOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateKrMasterCardOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createKRMasterCardOrder",
+            req_create_kr_master_card_order,
+            ResCreateKrMasterCardOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_kr_visa_order(
+        self,
+        req_create_kr_visa_order: "ReqCreateKrVisaOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateKrVisaOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createKRVisaOrder",
+            req_create_kr_visa_order,
+            ResCreateKrVisaOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_krjcb_order(
+        self,
+        req_create_krjcb_order: "ReqCreateKrjcbOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateKrjcbOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createKRJCBOrder",
+            req_create_krjcb_order,
+            ResCreateKrjcbOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_kr_alipay_order(
+        self,
+        req_create_kr_alipay_order: "ReqCreateKrAlipayOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateKrAlipayOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createKRAlipayOrder",
+            req_create_kr_alipay_order,
+            ResCreateKrAlipayOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_dmm_order(
+        self,
+        req_create_dmm_order: "ReqCreateDmmOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateDmmOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createDMMOrder",
+            req_create_dmm_order,
+            ResCreateDmmOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_iap_order(
+        self,
+        req_create_iap_order: "ReqCreateIapOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateIapOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createIAPOrder",
+            req_create_iap_order,
+            ResCreateIapOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_steam_order(
+        self,
+        req_create_steam_order: "ReqCreateSteamOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateSteamOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createSteamOrder",
+            req_create_steam_order,
+            ResCreateSteamOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def verify_steam_order(
+        self,
+        req_verify_steam_order: "ReqVerifySteamOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/verifySteamOrder",
+            req_verify_steam_order,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_my_card_android_order(
+        self,
+        req_create_my_card_order: "ReqCreateMyCardOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateMyCardOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createMyCardAndroidOrder",
+            req_create_my_card_order,
+            ResCreateMyCardOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_my_card_web_order(
+        self,
+        req_create_my_card_order: "ReqCreateMyCardOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateMyCardOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createMyCardWebOrder",
+            req_create_my_card_order,
+            ResCreateMyCardOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_paypal_order(
+        self,
+        req_create_paypal_order: "ReqCreatePaypalOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreatePaypalOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createPaypalOrder",
+            req_create_paypal_order,
+            ResCreatePaypalOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_xsolla_order(
+        self,
+        req_create_xsolla_order: "ReqCreateXsollaOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateXsollaOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createXsollaOrder",
+            req_create_xsolla_order,
+            ResCreateXsollaOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def verify_my_card_order(
+        self,
+        req_verify_my_card_order: "ReqVerifyMyCardOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/verifyMyCardOrder",
+            req_verify_my_card_order,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def verification_iap_order(
+        self,
+        req_verification_iap_order: "ReqVerificationIapOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResVerificationIapOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/verificationIAPOrder",
+            req_verification_iap_order,
+            ResVerificationIapOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_yostar_sdk_order(
+        self,
+        req_create_yostar_order: "ReqCreateYostarOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateYostarOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createYostarSDKOrder",
+            req_create_yostar_order,
+            ResCreateYostarOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_billing_order(
+        self,
+        req_create_billing_order: "ReqCreateBillingOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateBillingOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/createBillingOrder",
+            req_create_billing_order,
+            ResCreateBillingOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def solve_google_play_order(
+        self,
+        req_solve_google_play_order: "ReqSolveGooglePlayOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/solveGooglePlayOrder",
+            req_solve_google_play_order,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def solve_google_pay_order_v3(
+        self,
+        req_solve_google_play_order_v3: "ReqSolveGooglePlayOrderV3",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/solveGooglePayOrderV3",
+            req_solve_google_play_order_v3,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def deliver_aa32_order(
+        self,
+        req_deliver_aa32_order: "ReqDeliverAa32Order",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/deliverAA32Order",
+            req_deliver_aa32_order,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_misc(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResMisc":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchMisc",
+            req_common,
+            ResMisc,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def modify_signature(
+        self,
+        req_modify_signature: "ReqModifySignature",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/modifySignature",
+            req_modify_signature,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_id_card_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResIdCardInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchIDCardInfo",
+            req_common,
+            ResIdCardInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def update_id_card_info(
+        self,
+        req_update_id_card_info: "ReqUpdateIdCardInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/updateIDCardInfo",
+            req_update_id_card_info,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_vip_reward(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResVipReward":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchVipReward",
+            req_common,
+            ResVipReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def gain_vip_reward(
+        self,
+        req_gain_vip_reward: "ReqGainVipReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/gainVipReward",
+            req_gain_vip_reward,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_refund_order(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchRefundOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchRefundOrder",
+            req_common,
+            ResFetchRefundOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_customized_contest_list(
+        self,
+        req_fetch_customized_contest_list: "ReqFetchCustomizedContestList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchCustomizedContestList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCustomizedContestList",
+            req_fetch_customized_contest_list,
+            ResFetchCustomizedContestList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_customized_contest_auth_info(
+        self,
+        req_fetch_customized_contest_auth_info: "ReqFetchCustomizedContestAuthInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchCustomizedContestAuthInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCustomizedContestAuthInfo",
+            req_fetch_customized_contest_auth_info,
+            ResFetchCustomizedContestAuthInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def enter_customized_contest(
+        self,
+        req_enter_customized_contest: "ReqEnterCustomizedContest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResEnterCustomizedContest":
+        return await self._unary_unary(
+            "/lq.Lobby/enterCustomizedContest",
+            req_enter_customized_contest,
+            ResEnterCustomizedContest,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def leave_customized_contest(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/leaveCustomizedContest",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_customized_contest_online_info(
+        self,
+        req_fetch_customized_contest_online_info: "ReqFetchCustomizedContestOnlineInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchCustomizedContestOnlineInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCustomizedContestOnlineInfo",
+            req_fetch_customized_contest_online_info,
+            ResFetchCustomizedContestOnlineInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_customized_contest_by_contest_id(
+        self,
+        req_fetch_customized_contest_by_contest_id: "ReqFetchCustomizedContestByContestId",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchCustomizedContestByContestId":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCustomizedContestByContestId",
+            req_fetch_customized_contest_by_contest_id,
+            ResFetchCustomizedContestByContestId,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def signup_customized_contest(
+        self,
+        req_signup_customized_contest: "ReqSignupCustomizedContest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSignupCustomizedContest":
+        return await self._unary_unary(
+            "/lq.Lobby/signupCustomizedContest",
+            req_signup_customized_contest,
+            ResSignupCustomizedContest,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def start_customized_contest(
+        self,
+        req_start_customized_contest: "ReqStartCustomizedContest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/startCustomizedContest",
+            req_start_customized_contest,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def stop_customized_contest(
+        self,
+        req_stop_customized_contest: "ReqStopCustomizedContest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/stopCustomizedContest",
+            req_stop_customized_contest,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def join_customized_contest_chat_room(
+        self,
+        req_join_customized_contest_chat_room: "ReqJoinCustomizedContestChatRoom",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResJoinCustomizedContestChatRoom":
+        return await self._unary_unary(
+            "/lq.Lobby/joinCustomizedContestChatRoom",
+            req_join_customized_contest_chat_room,
+            ResJoinCustomizedContestChatRoom,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def leave_customized_contest_chat_room(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/leaveCustomizedContestChatRoom",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def say_chat_message(
+        self,
+        req_say_chat_message: "ReqSayChatMessage",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/sayChatMessage",
+            req_say_chat_message,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_customized_contest_game_records(
+        self,
+        req_fetch_customized_contest_game_records: "ReqFetchCustomizedContestGameRecords",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchCustomizedContestGameRecords":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCustomizedContestGameRecords",
+            req_fetch_customized_contest_game_records,
+            ResFetchCustomizedContestGameRecords,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_customized_contest_game_live_list(
+        self,
+        req_fetch_customized_contest_game_live_list: "ReqFetchCustomizedContestGameLiveList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchCustomizedContestGameLiveList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchCustomizedContestGameLiveList",
+            req_fetch_customized_contest_game_live_list,
+            ResFetchCustomizedContestGameLiveList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def follow_customized_contest(
+        self,
+        req_target_customized_contest: "ReqTargetCustomizedContest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/followCustomizedContest",
+            req_target_customized_contest,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def unfollow_customized_contest(
+        self,
+        req_target_customized_contest: "ReqTargetCustomizedContest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/unfollowCustomizedContest",
+            req_target_customized_contest,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_activity_list(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResActivityList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchActivityList",
+            req_common,
+            ResActivityList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_account_activity_data(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAccountActivityData":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAccountActivityData",
+            req_common,
+            ResAccountActivityData,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def exchange_activity_item(
+        self,
+        req_exchange_activity_item: "ReqExchangeActivityItem",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResExchangeActivityItem":
+        return await self._unary_unary(
+            "/lq.Lobby/exchangeActivityItem",
+            req_exchange_activity_item,
+            ResExchangeActivityItem,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def complete_activity_task(
+        self,
+        req_complete_activity_task: "ReqCompleteActivityTask",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/completeActivityTask",
+            req_complete_activity_task,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def complete_activity_task_batch(
+        self,
+        req_complete_activity_task_batch: "ReqCompleteActivityTaskBatch",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/completeActivityTaskBatch",
+            req_complete_activity_task_batch,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def complete_activity_flip_task(
+        self,
+        req_complete_activity_task: "ReqCompleteActivityTask",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/completeActivityFlipTask",
+            req_complete_activity_task,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def complete_period_activity_task(
+        self,
+        req_complete_activity_task: "ReqCompleteActivityTask",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/completePeriodActivityTask",
+            req_complete_activity_task,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def complete_period_activity_task_batch(
+        self,
+        req_complete_period_activity_task_batch: "ReqCompletePeriodActivityTaskBatch",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/completePeriodActivityTaskBatch",
+            req_complete_period_activity_task_batch,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def complete_random_activity_task(
+        self,
+        req_complete_activity_task: "ReqCompleteActivityTask",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/completeRandomActivityTask",
+            req_complete_activity_task,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def complete_random_activity_task_batch(
+        self,
+        req_complete_activity_task_batch: "ReqCompleteActivityTaskBatch",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/completeRandomActivityTaskBatch",
+            req_complete_activity_task_batch,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_activity_flip_task(
+        self,
+        req_receive_activity_flip_task: "ReqReceiveActivityFlipTask",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveActivityFlipTask":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveActivityFlipTask",
+            req_receive_activity_flip_task,
+            ResReceiveActivityFlipTask,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def complete_segment_task_reward(
+        self,
+        req_complete_segment_task_reward: "ReqCompleteSegmentTaskReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCompleteSegmentTaskReward":
+        return await self._unary_unary(
+            "/lq.Lobby/completeSegmentTaskReward",
+            req_complete_segment_task_reward,
+            ResCompleteSegmentTaskReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_activity_flip_info(
+        self,
+        req_fetch_activity_flip_info: "ReqFetchActivityFlipInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchActivityFlipInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchActivityFlipInfo",
+            req_fetch_activity_flip_info,
+            ResFetchActivityFlipInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def gain_accumulated_point_activity_reward(
+        self,
+        req_gain_accumulated_point_activity_reward: "ReqGainAccumulatedPointActivityReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/gainAccumulatedPointActivityReward",
+            req_gain_accumulated_point_activity_reward,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def gain_multi_point_activity_reward(
+        self,
+        req_gain_multi_point_activity_reward: "ReqGainMultiPointActivityReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/gainMultiPointActivityReward",
+            req_gain_multi_point_activity_reward,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_rank_point_leaderboard(
+        self,
+        req_fetch_rank_point_leaderboard: "ReqFetchRankPointLeaderboard",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchRankPointLeaderboard":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchRankPointLeaderboard",
+            req_fetch_rank_point_leaderboard,
+            ResFetchRankPointLeaderboard,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def gain_rank_point_reward(
+        self,
+        req_gain_rank_point_reward: "ReqGainRankPointReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/gainRankPointReward",
+            req_gain_rank_point_reward,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def richman_activity_next_move(
+        self,
+        req_richman_next_move: "ReqRichmanNextMove",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRichmanNextMove":
+        return await self._unary_unary(
+            "/lq.Lobby/richmanActivityNextMove",
+            req_richman_next_move,
+            ResRichmanNextMove,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def richman_acitivity_special_move(
+        self,
+        req_richman_special_move: "ReqRichmanSpecialMove",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRichmanNextMove":
+        return await self._unary_unary(
+            "/lq.Lobby/richmanAcitivitySpecialMove",
+            req_richman_special_move,
+            ResRichmanNextMove,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def richman_activity_chest_info(
+        self,
+        req_richman_chest_info: "ReqRichmanChestInfo",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRichmanChestInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/richmanActivityChestInfo",
+            req_richman_chest_info,
+            ResRichmanChestInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_game_observe_auth(
+        self,
+        req_create_game_observe_auth: "ReqCreateGameObserveAuth",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateGameObserveAuth":
+        return await self._unary_unary(
+            "/lq.Lobby/createGameObserveAuth",
+            req_create_game_observe_auth,
+            ResCreateGameObserveAuth,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def refresh_game_observe_auth(
+        self,
+        req_refresh_game_observe_auth: "ReqRefreshGameObserveAuth",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRefreshGameObserveAuth":
+        return await self._unary_unary(
+            "/lq.Lobby/refreshGameObserveAuth",
+            req_refresh_game_observe_auth,
+            ResRefreshGameObserveAuth,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_activity_buff(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResActivityBuff":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchActivityBuff",
+            req_common,
+            ResActivityBuff,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def upgrade_activity_buff(
+        self,
+        req_upgrade_activity_buff: "ReqUpgradeActivityBuff",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResActivityBuff":
+        return await self._unary_unary(
+            "/lq.Lobby/upgradeActivityBuff",
+            req_upgrade_activity_buff,
+            ResActivityBuff,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def upgrade_activity_level(
+        self,
+        req_upgrade_activity_level: "ReqUpgradeActivityLevel",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResUpgradeActivityLevel":
+        return await self._unary_unary(
+            "/lq.Lobby/upgradeActivityLevel",
+            req_upgrade_activity_level,
+            ResUpgradeActivityLevel,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_upgrade_activity_reward(
+        self,
+        req_receive_upgrade_activity_reward: "ReqReceiveUpgradeActivityReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveUpgradeActivityReward":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveUpgradeActivityReward",
+            req_receive_upgrade_activity_reward,
+            ResReceiveUpgradeActivityReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def upgrade_challenge(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResUpgradeChallenge":
+        return await self._unary_unary(
+            "/lq.Lobby/upgradeChallenge",
+            req_common,
+            ResUpgradeChallenge,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def refresh_challenge(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRefreshChallenge":
+        return await self._unary_unary(
+            "/lq.Lobby/refreshChallenge",
+            req_common,
+            ResRefreshChallenge,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_challenge_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchChallengeInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchChallengeInfo",
+            req_common,
+            ResFetchChallengeInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def force_complete_challenge_task(
+        self,
+        req_force_complete_challenge_task: "ReqForceCompleteChallengeTask",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/forceCompleteChallengeTask",
+            req_force_complete_challenge_task,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_challenge_season(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResChallengeSeasonInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchChallengeSeason",
+            req_common,
+            ResChallengeSeasonInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_challenge_rank_reward(
+        self,
+        req_receive_challenge_rank_reward: "ReqReceiveChallengeRankReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveChallengeRankReward":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveChallengeRankReward",
+            req_receive_challenge_rank_reward,
+            ResReceiveChallengeRankReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_ab_match_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchAbMatch":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchABMatchInfo",
+            req_common,
+            ResFetchAbMatch,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def buy_in_ab_match(
+        self,
+        req_buy_in_ab_match: "ReqBuyInAbMatch",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/buyInABMatch",
+            req_buy_in_ab_match,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_ab_match_reward(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveABMatchReward",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def quit_ab_match(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/quitABMatch",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def start_unified_match(
+        self,
+        req_start_unified_match: "ReqStartUnifiedMatch",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/startUnifiedMatch",
+            req_start_unified_match,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def cancel_unified_match(
+        self,
+        req_cancel_unified_match: "ReqCancelUnifiedMatch",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/cancelUnifiedMatch",
+            req_cancel_unified_match,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_point_rank(
+        self,
+        req_game_point_rank: "ReqGamePointRank",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGamePointRank":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchGamePointRank",
+            req_game_point_rank,
+            ResGamePointRank,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_self_game_point_rank(
+        self,
+        req_game_point_rank: "ReqGamePointRank",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchSelfGamePointRank":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchSelfGamePointRank",
+            req_game_point_rank,
+            ResFetchSelfGamePointRank,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def read_sns(
+        self,
+        req_read_sns: "ReqReadSns",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReadSns":
+        return await self._unary_unary(
+            "/lq.Lobby/readSNS",
+            req_read_sns,
+            ResReadSns,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def reply_sns(
+        self,
+        req_reply_sns: "ReqReplySns",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReplySns":
+        return await self._unary_unary(
+            "/lq.Lobby/replySNS",
+            req_reply_sns,
+            ResReplySns,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def like_sns(
+        self,
+        req_like_sns: "ReqLikeSns",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResLikeSns":
+        return await self._unary_unary(
+            "/lq.Lobby/likeSNS",
+            req_like_sns,
+            ResLikeSns,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def dig_mine(
+        self,
+        req_dig_mine: "ReqDigMine",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResDigMine":
+        return await self._unary_unary(
+            "/lq.Lobby/digMine",
+            req_dig_mine,
+            ResDigMine,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_last_privacy(
+        self,
+        req_fetch_last_privacy: "ReqFetchLastPrivacy",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchLastPrivacy":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchLastPrivacy",
+            req_fetch_last_privacy,
+            ResFetchLastPrivacy,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def check_privacy(
+        self,
+        req_check_privacy: "ReqCheckPrivacy",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/checkPrivacy",
+            req_check_privacy,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def response_captcha(
+        self,
+        req_response_captcha: "ReqResponseCaptcha",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/responseCaptcha",
+            req_response_captcha,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_rpg_battle_history(
+        self,
+        req_fetch_rpg_battle_history: "ReqFetchRpgBattleHistory",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchRpgBattleHistory":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchRPGBattleHistory",
+            req_fetch_rpg_battle_history,
+            ResFetchRpgBattleHistory,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_rpg_battle_history_v2(
+        self,
+        req_fetch_rpg_battle_history: "ReqFetchRpgBattleHistory",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchRpgBattleHistoryV2":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchRPGBattleHistoryV2",
+            req_fetch_rpg_battle_history,
+            ResFetchRpgBattleHistoryV2,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_rpg_rewards(
+        self,
+        req_receive_rpg_rewards: "ReqReceiveRpgRewards",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveRpgRewards":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveRPGRewards",
+            req_receive_rpg_rewards,
+            ResReceiveRpgRewards,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_rpg_reward(
+        self,
+        req_receive_rpg_reward: "ReqReceiveRpgReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveRpgRewards":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveRPGReward",
+            req_receive_rpg_reward,
+            ResReceiveRpgRewards,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def buy_arena_ticket(
+        self,
+        req_buy_arena_ticket: "ReqBuyArenaTicket",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/buyArenaTicket",
+            req_buy_arena_ticket,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def enter_arena(
+        self,
+        req_enter_arena: "ReqEnterArena",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/enterArena",
+            req_enter_arena,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_arena_reward(
+        self,
+        req_arena_reward: "ReqArenaReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResArenaReward":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveArenaReward",
+            req_arena_reward,
+            ResArenaReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_ob_token(
+        self,
+        req_fetch_ob_token: "ReqFetchObToken",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchObToken":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchOBToken",
+            req_fetch_ob_token,
+            ResFetchObToken,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_character_rewards(
+        self,
+        req_receive_character_rewards: "ReqReceiveCharacterRewards",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveCharacterRewards":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveCharacterRewards",
+            req_receive_character_rewards,
+            ResReceiveCharacterRewards,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def feed_activity_feed(
+        self,
+        req_feed_activity_feed: "ReqFeedActivityFeed",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFeedActivityFeed":
+        return await self._unary_unary(
+            "/lq.Lobby/feedActivityFeed",
+            req_feed_activity_feed,
+            ResFeedActivityFeed,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def send_activity_gift_to_friend(
+        self,
+        req_send_activity_gift_to_friend: "ReqSendActivityGiftToFriend",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSendActivityGiftToFriend":
+        return await self._unary_unary(
+            "/lq.Lobby/sendActivityGiftToFriend",
+            req_send_activity_gift_to_friend,
+            ResSendActivityGiftToFriend,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_activity_gift(
+        self,
+        req_receive_activity_gift: "ReqReceiveActivityGift",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveActivityGift",
+            req_receive_activity_gift,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_all_activity_gift(
+        self,
+        req_receive_all_activity_gift: "ReqReceiveAllActivityGift",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveAllActivityGift":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveAllActivityGift",
+            req_receive_all_activity_gift,
+            ResReceiveAllActivityGift,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_friend_gift_activity_data(
+        self,
+        req_fetch_friend_gift_activity_data: "ReqFetchFriendGiftActivityData",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchFriendGiftActivityData":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchFriendGiftActivityData",
+            req_fetch_friend_gift_activity_data,
+            ResFetchFriendGiftActivityData,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def open_pre_chest_item(
+        self,
+        req_open_pre_chest_item: "ReqOpenPreChestItem",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResOpenPreChestItem":
+        return await self._unary_unary(
+            "/lq.Lobby/openPreChestItem",
+            req_open_pre_chest_item,
+            ResOpenPreChestItem,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_vote_activity(
+        self,
+        req_fetch_vote_activity: "ReqFetchVoteActivity",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchVoteActivity":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchVoteActivity",
+            req_fetch_vote_activity,
+            ResFetchVoteActivity,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def vote_activity(
+        self,
+        req_vote_activity: "ReqVoteActivity",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResVoteActivity":
+        return await self._unary_unary(
+            "/lq.Lobby/voteActivity",
+            req_vote_activity,
+            ResVoteActivity,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def unlock_activity_spot(
+        self,
+        req_unlock_activity_spot: "ReqUnlockActivitySpot",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/unlockActivitySpot",
+            req_unlock_activity_spot,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def unlock_activity_spot_ending(
+        self,
+        req_unlock_activity_spot_ending: "ReqUnlockActivitySpotEnding",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/unlockActivitySpotEnding",
+            req_unlock_activity_spot_ending,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_activity_spot_reward(
+        self,
+        req_receive_activity_spot_reward: "ReqReceiveActivitySpotReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveActivitySpotReward":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveActivitySpotReward",
+            req_receive_activity_spot_reward,
+            ResReceiveActivitySpotReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def delete_account(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResDeleteAccount":
+        return await self._unary_unary(
+            "/lq.Lobby/deleteAccount",
+            req_common,
+            ResDeleteAccount,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def cancel_delete_account(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/cancelDeleteAccount",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def log_report(
+        self,
+        req_log_report: "ReqLogReport",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/logReport",
+            req_log_report,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def bind_oauth2(
+        self,
+        req_bind_oauth2: "ReqBindOauth2",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/bindOauth2",
+            req_bind_oauth2,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_oauth2_info(
+        self,
+        req_fetch_oauth2: "ReqFetchOauth2",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchOauth2":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchOauth2Info",
+            req_fetch_oauth2,
+            ResFetchOauth2,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def set_loading_image(
+        self,
+        req_set_loading_image: "ReqSetLoadingImage",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/setLoadingImage",
+            req_set_loading_image,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_shop_interval(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchShopInterval":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchShopInterval",
+            req_common,
+            ResFetchShopInterval,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_activity_interval(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchActivityInterval":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchActivityInterval",
+            req_common,
+            ResFetchActivityInterval,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_recent_friend(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchrecentFriend":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchRecentFriend",
+            req_common,
+            ResFetchrecentFriend,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def open_gacha(
+        self,
+        req_open_gacha: "ReqOpenGacha",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResOpenGacha":
+        return await self._unary_unary(
+            "/lq.Lobby/openGacha",
+            req_open_gacha,
+            ResOpenGacha,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def task_request(
+        self,
+        req_task_request: "ReqTaskRequest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/taskRequest",
+            req_task_request,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def simulation_activity_train(
+        self,
+        req_simulation_activity_train: "ReqSimulationActivityTrain",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSimulationActivityTrain":
+        return await self._unary_unary(
+            "/lq.Lobby/simulationActivityTrain",
+            req_simulation_activity_train,
+            ResSimulationActivityTrain,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_simulation_game_record(
+        self,
+        req_fetch_simulation_game_record: "ReqFetchSimulationGameRecord",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchSimulationGameRecord":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchSimulationGameRecord",
+            req_fetch_simulation_game_record,
+            ResFetchSimulationGameRecord,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def start_simulation_activity_game(
+        self,
+        req_start_simulation_activity_game: "ReqStartSimulationActivityGame",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResStartSimulationActivityGame":
+        return await self._unary_unary(
+            "/lq.Lobby/startSimulationActivityGame",
+            req_start_simulation_activity_game,
+            ResStartSimulationActivityGame,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_simulation_game_rank(
+        self,
+        req_fetch_simulation_game_rank: "ReqFetchSimulationGameRank",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchSimulationGameRank":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchSimulationGameRank",
+            req_fetch_simulation_game_rank,
+            ResFetchSimulationGameRank,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def generate_combining_craft(
+        self,
+        req_generate_combining_craft: "ReqGenerateCombiningCraft",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGenerateCombiningCraft":
+        return await self._unary_unary(
+            "/lq.Lobby/generateCombiningCraft",
+            req_generate_combining_craft,
+            ResGenerateCombiningCraft,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def move_combining_craft(
+        self,
+        req_move_combining_craft: "ReqMoveCombiningCraft",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResMoveCombiningCraft":
+        return await self._unary_unary(
+            "/lq.Lobby/moveCombiningCraft",
+            req_move_combining_craft,
+            ResMoveCombiningCraft,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def combining_recycle_craft(
+        self,
+        req_combining_recycle_craft: "ReqCombiningRecycleCraft",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCombiningRecycleCraft":
+        return await self._unary_unary(
+            "/lq.Lobby/combiningRecycleCraft",
+            req_combining_recycle_craft,
+            ResCombiningRecycleCraft,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def recover_combining_recycle(
+        self,
+        req_recover_combining_recycle: "ReqRecoverCombiningRecycle",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResRecoverCombiningRecycle":
+        return await self._unary_unary(
+            "/lq.Lobby/recoverCombiningRecycle",
+            req_recover_combining_recycle,
+            ResRecoverCombiningRecycle,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def finish_combining_order(
+        self,
+        req_finish_combining_order: "ReqFinishCombiningOrder",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFinishCombiningOrder":
+        return await self._unary_unary(
+            "/lq.Lobby/finishCombiningOrder",
+            req_finish_combining_order,
+            ResFinishCombiningOrder,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def upgrade_village_building(
+        self,
+        req_upgrade_village_building: "ReqUpgradeVillageBuilding",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/upgradeVillageBuilding",
+            req_upgrade_village_building,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_village_building_reward(
+        self,
+        req_receive_village_building_reward: "ReqReceiveVillageBuildingReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveVillageBuildingReward":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveVillageBuildingReward",
+            req_receive_village_building_reward,
+            ResReceiveVillageBuildingReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def start_village_trip(
+        self,
+        req_start_village_trip: "ReqStartVillageTrip",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/startVillageTrip",
+            req_start_village_trip,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def receive_village_trip_reward(
+        self,
+        req_receive_village_trip_reward: "ReqReceiveVillageTripReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResReceiveVillageTripReward":
+        return await self._unary_unary(
+            "/lq.Lobby/receiveVillageTripReward",
+            req_receive_village_trip_reward,
+            ResReceiveVillageTripReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def complete_village_task(
+        self,
+        req_complete_village_task: "ReqCompleteVillageTask",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCompleteVillageTask":
+        return await self._unary_unary(
+            "/lq.Lobby/completeVillageTask",
+            req_complete_village_task,
+            ResCompleteVillageTask,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def get_friend_village_data(
+        self,
+        req_get_friend_village_data: "ReqGetFriendVillageData",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGetFriendVillageData":
+        return await self._unary_unary(
+            "/lq.Lobby/getFriendVillageData",
+            req_get_friend_village_data,
+            ResGetFriendVillageData,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def set_village_worker(
+        self,
+        req_set_village_worker: "ReqSetVillageWorker",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSetVillageWorker":
+        return await self._unary_unary(
+            "/lq.Lobby/setVillageWorker",
+            req_set_village_worker,
+            ResSetVillageWorker,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def next_round_village(
+        self,
+        req_next_round_village: "ReqNextRoundVillage",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResNextRoundVillage":
+        return await self._unary_unary(
+            "/lq.Lobby/nextRoundVillage",
+            req_next_round_village,
+            ResNextRoundVillage,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def resolve_festival_activity_proposal(
+        self,
+        req_resolve_festival_activity_proposal: "ReqResolveFestivalActivityProposal",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResResolveFestivalActivityProposal":
+        return await self._unary_unary(
+            "/lq.Lobby/resolveFestivalActivityProposal",
+            req_resolve_festival_activity_proposal,
+            ResResolveFestivalActivityProposal,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def resolve_festival_activity_event(
+        self,
+        req_resolve_festival_activity_event: "ReqResolveFestivalActivityEvent",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResResolveFestivalActivityEvent":
+        return await self._unary_unary(
+            "/lq.Lobby/resolveFestivalActivityEvent",
+            req_resolve_festival_activity_event,
+            ResResolveFestivalActivityEvent,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def buy_festival_proposal(
+        self,
+        req_buy_festival_proposal: "ReqBuyFestivalProposal",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResBuyFestivalProposal":
+        return await self._unary_unary(
+            "/lq.Lobby/buyFestivalProposal",
+            req_buy_festival_proposal,
+            ResBuyFestivalProposal,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def island_activity_move(
+        self,
+        req_island_activity_move: "ReqIslandActivityMove",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/islandActivityMove",
+            req_island_activity_move,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def island_activity_buy(
+        self,
+        req_island_activity_buy: "ReqIslandActivityBuy",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/islandActivityBuy",
+            req_island_activity_buy,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def island_activity_sell(
+        self,
+        req_island_activity_sell: "ReqIslandActivitySell",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/islandActivitySell",
+            req_island_activity_sell,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def island_activity_tidy_bag(
+        self,
+        req_island_activity_tidy_bag: "ReqIslandActivityTidyBag",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/islandActivityTidyBag",
+            req_island_activity_tidy_bag,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def island_activity_unlock_bag_grid(
+        self,
+        req_island_activity_unlock_bag_grid: "ReqIslandActivityUnlockBagGrid",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/islandActivityUnlockBagGrid",
+            req_island_activity_unlock_bag_grid,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_customized_contest(
+        self,
+        req_create_customized_contest: "ReqCreateCustomizedContest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCreateCustomizedContest":
+        return await self._unary_unary(
+            "/lq.Lobby/createCustomizedContest",
+            req_create_customized_contest,
+            ResCreateCustomizedContest,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_manager_customized_contest_list(
+        self,
+        req_fetchmanager_customized_contest_list: "ReqFetchmanagerCustomizedContestList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchManagerCustomizedContestList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchManagerCustomizedContestList",
+            req_fetchmanager_customized_contest_list,
+            ResFetchManagerCustomizedContestList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_manager_customized_contest(
+        self,
+        req_fetch_manager_customized_contest: "ReqFetchManagerCustomizedContest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchManagerCustomizedContest":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchManagerCustomizedContest",
+            req_fetch_manager_customized_contest,
+            ResFetchManagerCustomizedContest,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def update_manager_customized_contest(
+        self,
+        req_update_manager_customized_contest: "ReqUpdateManagerCustomizedContest",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/updateManagerCustomizedContest",
+            req_update_manager_customized_contest,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_contest_player_rank(
+        self,
+        req_fetch_contest_player_rank: "ReqFetchContestPlayerRank",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchContestPlayerRank":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchContestPlayerRank",
+            req_fetch_contest_player_rank,
+            ResFetchContestPlayerRank,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_ready_player_list(
+        self,
+        req_fetch_ready_player_list: "ReqFetchReadyPlayerList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchReadyPlayerList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchReadyPlayerList",
+            req_fetch_ready_player_list,
+            ResFetchReadyPlayerList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def create_game_plan(
+        self,
+        req_create_game_plan: "ReqCreateGamePlan",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/createGamePlan",
+            req_create_game_plan,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def generate_contest_manager_login_code(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGenerateContestManagerLoginCode":
+        return await self._unary_unary(
+            "/lq.Lobby/generateContestManagerLoginCode",
+            req_common,
+            ResGenerateContestManagerLoginCode,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_start_game(
+        self,
+        req_amulet_activity_start_game: "ReqAmuletActivityStartGame",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivityStartGame":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityStartGame",
+            req_amulet_activity_start_game,
+            ResAmuletActivityStartGame,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_operate(
+        self,
+        req_amulet_activity_operate: "ReqAmuletActivityOperate",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivityOperate":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityOperate",
+            req_amulet_activity_operate,
+            ResAmuletActivityOperate,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_change_hands(
+        self,
+        req_amulet_activity_change_hands: "ReqAmuletActivityChangeHands",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivityChangeHands":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityChangeHands",
+            req_amulet_activity_change_hands,
+            ResAmuletActivityChangeHands,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_upgrade(
+        self,
+        req_amulet_activity_upgrade: "ReqAmuletActivityUpgrade",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivityUpgrade":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityUpgrade",
+            req_amulet_activity_upgrade,
+            ResAmuletActivityUpgrade,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_buy(
+        self,
+        req_amulet_activity_buy: "ReqAmuletActivityBuy",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivityBuy":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityBuy",
+            req_amulet_activity_buy,
+            ResAmuletActivityBuy,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_select_pack(
+        self,
+        req_amulet_activity_select_pack: "ReqAmuletActivitySelectPack",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivitySelectPack":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivitySelectPack",
+            req_amulet_activity_select_pack,
+            ResAmuletActivitySelectPack,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_sell_effect(
+        self,
+        req_amulet_activity_sell_effect: "ReqAmuletActivitySellEffect",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivitySellEffect":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivitySellEffect",
+            req_amulet_activity_sell_effect,
+            ResAmuletActivitySellEffect,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_effect_sort(
+        self,
+        req_amulet_activity_effect_sort: "ReqAmuletActivityEffectSort",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityEffectSort",
+            req_amulet_activity_effect_sort,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_giveup(
+        self,
+        req_amulet_activity_giveup: "ReqAmuletActivityGiveup",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityGiveup",
+            req_amulet_activity_giveup,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_refresh_shop(
+        self,
+        req_amulet_activity_refresh_shop: "ReqAmuletActivityRefreshShop",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivityRefreshShop":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityRefreshShop",
+            req_amulet_activity_refresh_shop,
+            ResAmuletActivityRefreshShop,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_select_free_effect(
+        self,
+        req_amulet_activity_select_free_effect: "ReqAmuletActivitySelectFreeEffect",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivitySelectFreeEffect":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivitySelectFreeEffect",
+            req_amulet_activity_select_free_effect,
+            ResAmuletActivitySelectFreeEffect,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_upgrade_shop_buff(
+        self,
+        req_amulet_activity_upgrade_shop_buff: "ReqAmuletActivityUpgradeShopBuff",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivityUpgradeShopBuff":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityUpgradeShopBuff",
+            req_amulet_activity_upgrade_shop_buff,
+            ResAmuletActivityUpgradeShopBuff,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_end_shopping(
+        self,
+        req_amulet_activity_end_shopping: "ReqAmuletActivityEndShopping",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivityEndShopping":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityEndShopping",
+            req_amulet_activity_end_shopping,
+            ResAmuletActivityEndShopping,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_set_skill_level(
+        self,
+        req_amulet_activity_set_skill_level: "ReqAmuletActivitySetSkillLevel",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivitySetSkillLevel",
+            req_amulet_activity_set_skill_level,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def amulet_activity_maintain_info(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAmuletActivityMaintainInfo":
+        return await self._unary_unary(
+            "/lq.Lobby/amuletActivityMaintainInfo",
+            req_common,
+            ResAmuletActivityMaintainInfo,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def story_activity_unlock(
+        self,
+        req_story_activity_unlock: "ReqStoryActivityUnlock",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/storyActivityUnlock",
+            req_story_activity_unlock,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def story_activity_unlock_ending(
+        self,
+        req_story_activity_unlock_ending: "ReqStoryActivityUnlockEnding",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/storyActivityUnlockEnding",
+            req_story_activity_unlock_ending,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def story_activity_receive_ending_reward(
+        self,
+        req_story_activity_receive_ending_reward: "ReqStoryActivityReceiveEndingReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResStoryReward":
+        return await self._unary_unary(
+            "/lq.Lobby/storyActivityReceiveEndingReward",
+            req_story_activity_receive_ending_reward,
+            ResStoryReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def story_activity_receive_finish_reward(
+        self,
+        req_story_activity_receive_finish_reward: "ReqStoryActivityReceiveFinishReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResStoryReward":
+        return await self._unary_unary(
+            "/lq.Lobby/storyActivityReceiveFinishReward",
+            req_story_activity_receive_finish_reward,
+            ResStoryReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def story_activity_receive_all_finish_reward(
+        self,
+        req_story_activity_receive_all_finish_reward: "ReqStoryActivityReceiveAllFinishReward",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResStoryReward":
+        return await self._unary_unary(
+            "/lq.Lobby/storyActivityReceiveAllFinishReward",
+            req_story_activity_receive_all_finish_reward,
+            ResStoryReward,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def story_activity_unlock_ending_and_receive(
+        self,
+        req_story_activity_unlock_ending_and_receive: "ReqStoryActivityUnlockEndingAndReceive",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResStoryActivityUnlockEndingAndReceive":
+        return await self._unary_unary(
+            "/lq.Lobby/storyActivityUnlockEndingAndReceive",
+            req_story_activity_unlock_ending_and_receive,
+            ResStoryActivityUnlockEndingAndReceive,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_activity_rank(
+        self,
+        req_fetch_activity_rank: "ReqFetchActivityRank",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchActivityRank":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchActivityRank",
+            req_fetch_activity_rank,
+            ResFetchActivityRank,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def set_verified_hidden(
+        self,
+        req_set_verified_hidden: "ReqSetVerifiedHidden",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/setVerifiedHidden",
+            req_set_verified_hidden,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_questionnaire_list(
+        self,
+        req_fetch_questionnaire_list: "ReqFetchQuestionnaireList",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchQuestionnaireList":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchQuestionnaireList",
+            req_fetch_questionnaire_list,
+            ResFetchQuestionnaireList,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_questionnaire_detail(
+        self,
+        req_fetch_questionnaire_detail: "ReqFetchQuestionnaireDetail",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchQuestionnaireDetail":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchQuestionnaireDetail",
+            req_fetch_questionnaire_detail,
+            ResFetchQuestionnaireDetail,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def submit_questionnaire(
+        self,
+        req_submit_questionnaire: "ReqSubmitQuestionnaire",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/submitQuestionnaire",
+            req_submit_questionnaire,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def set_friend_room_random_bot_char(
+        self,
+        req_set_friend_room_random_bot_char: "ReqSetFriendRoomRandomBotChar",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/setFriendRoomRandomBotChar",
+            req_set_friend_room_random_bot_char,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_account_game_hu_records(
+        self,
+        req_fetch_account_game_hu_records: "ReqFetchAccountGameHuRecords",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchAccountGameHuRecords":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAccountGameHuRecords",
+            req_fetch_account_game_hu_records,
+            ResFetchAccountGameHuRecords,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_account_info_extra(
+        self,
+        req_fetch_account_info_extra: "ReqFetchAccountInfoExtra",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResFetchAccountInfoExtra":
+        return await self._unary_unary(
+            "/lq.Lobby/fetchAccountInfoExtra",
+            req_fetch_account_info_extra,
+            ResFetchAccountInfoExtra,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def set_account_favorite_hu(
+        self,
+        req_set_account_favorite_hu: "ReqSetAccountFavoriteHu",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.Lobby/setAccountFavoriteHu",
+            req_set_account_favorite_hu,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+
+class FastTestStub(betterproto.ServiceStub):
+    async def auth_game(
+        self,
+        req_auth_game: "ReqAuthGame",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResAuthGame":
+        return await self._unary_unary(
+            "/lq.FastTest/authGame",
+            req_auth_game,
+            ResAuthGame,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def enter_game(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResEnterGame":
+        return await self._unary_unary(
+            "/lq.FastTest/enterGame",
+            req_common,
+            ResEnterGame,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def sync_game(
+        self,
+        req_sync_game: "ReqSyncGame",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResSyncGame":
+        return await self._unary_unary(
+            "/lq.FastTest/syncGame",
+            req_sync_game,
+            ResSyncGame,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def finish_sync_game(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/finishSyncGame",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def terminate_game(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/terminateGame",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def input_operation(
+        self,
+        req_self_operation: "ReqSelfOperation",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/inputOperation",
+            req_self_operation,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def input_chi_peng_gang(
+        self,
+        req_chi_peng_gang: "ReqChiPengGang",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/inputChiPengGang",
+            req_chi_peng_gang,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def confirm_new_round(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/confirmNewRound",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def broadcast_in_game(
+        self,
+        req_broadcast_in_game: "ReqBroadcastInGame",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/broadcastInGame",
+            req_broadcast_in_game,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def input_game_gm_command(
+        self,
+        req_gm_command_in_gaming: "ReqGmCommandInGaming",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/inputGameGMCommand",
+            req_gm_command_in_gaming,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def fetch_game_player_state(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGamePlayerState":
+        return await self._unary_unary(
+            "/lq.FastTest/fetchGamePlayerState",
+            req_common,
+            ResGamePlayerState,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def check_network_delay(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/checkNetworkDelay",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def clear_leaving(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/clearLeaving",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def vote_game_end(
+        self,
+        req_vote_game_end: "ReqVoteGameEnd",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResGameEndVote":
+        return await self._unary_unary(
+            "/lq.FastTest/voteGameEnd",
+            req_vote_game_end,
+            ResGameEndVote,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def auth_observe(
+        self,
+        req_auth_observe: "ReqAuthObserve",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/authObserve",
+            req_auth_observe,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def start_observe(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResStartObserve":
+        return await self._unary_unary(
+            "/lq.FastTest/startObserve",
+            req_common,
+            ResStartObserve,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+    async def stop_observe(
+        self,
+        req_common: "ReqCommon",
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional["Deadline"] = None,
+        metadata: Optional["MetadataLike"] = None
+    ) -> "ResCommon":
+        return await self._unary_unary(
+            "/lq.FastTest/stopObserve",
+            req_common,
+            ResCommon,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+
+
+class LobbyBase(ServiceBase):
+
+    async def fetch_connection_info(
+        self, req_common: "ReqCommon"
+    ) -> "ResConnectionInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_queue_info(self, req_common: "ReqCommon") -> "ResFetchQueueInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def cancel_queue(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def openid_check(
+        self, req_openid_check: "ReqOpenidCheck"
+    ) -> "ResOauth2Check":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def signup(
+        self, req_signup_account: "ReqSignupAccount"
+    ) -> "ResSignupAccount":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def login(self, req_login: "ReqLogin") -> "ResLogin":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_info(self, req_common: "ReqCommon") -> "ResFetchInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def login_success(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_server_maintenance_info(
+        self, req_common: "ReqCommon"
+    ) -> "ResFetchServerMaintenanceInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def email_login(self, req_email_login: "ReqEmailLogin") -> "ResLogin":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def oauth2_auth(self, req_oauth2_auth: "ReqOauth2Auth") -> "ResOauth2Auth":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def oauth2_check(
+        self, req_oauth2_check: "ReqOauth2Check"
+    ) -> "ResOauth2Check":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def oauth2_signup(
+        self, req_oauth2_signup: "ReqOauth2Signup"
+    ) -> "ResOauth2Signup":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def oauth2_login(self, req_oauth2_login: "ReqOauth2Login") -> "ResLogin":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def dmm_pre_login(
+        self, req_dmm_pre_login: "ReqDmmPreLogin"
+    ) -> "ResDmmPreLogin":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_phone_verify_code(
+        self, req_create_phone_verify_code: "ReqCreatePhoneVerifyCode"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_email_verify_code(
+        self, req_create_email_verify_code: "ReqCreateEmailVerifyCode"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def verfify_code_for_secure(
+        self, req_verify_code_for_secure: "ReqVerifyCodeForSecure"
+    ) -> "ResVerfiyCodeForSecure":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def bind_phone_number(
+        self, req_bind_phone_number: "ReqBindPhoneNumber"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def unbind_phone_number(
+        self, req_unbind_phone_number: "ReqUnbindPhoneNumber"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_phone_login_bind(
+        self, req_common: "ReqCommon"
+    ) -> "ResFetchPhoneLoginBind":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_phone_login_bind(
+        self, req_create_phone_login_bind: "ReqCreatePhoneLoginBind"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def bind_email(self, req_bind_email: "ReqBindEmail") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def modify_password(
+        self, req_modify_password: "ReqModifyPassword"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def bind_account(self, req_bind_account: "ReqBindAccount") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def logout(self, req_logout: "ReqLogout") -> "ResLogout":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def heatbeat(self, req_heat_beat: "ReqHeatBeat") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def login_beat(self, req_login_beat: "ReqLoginBeat") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_nickname(
+        self, req_create_nickname: "ReqCreateNickname"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def modify_nickname(
+        self, req_modify_nickname: "ReqModifyNickname"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def modify_birthday(
+        self, req_modify_birthday: "ReqModifyBirthday"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_room(self, req_common: "ReqCommon") -> "ResSelfRoom":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_gaming_info(self, req_common: "ReqCommon") -> "ResFetchGamingInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_room(self, req_create_room: "ReqCreateRoom") -> "ResCreateRoom":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def join_room(self, req_join_room: "ReqJoinRoom") -> "ResJoinRoom":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def leave_room(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def ready_play(self, req_room_ready: "ReqRoomReady") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def dressing_status(
+        self, req_room_dressing: "ReqRoomDressing"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def start_room(self, req_room_start: "ReqRoomStart") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def room_kick_player(
+        self, req_room_kick_player: "ReqRoomKickPlayer"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def modify_room(self, req_modify_room: "ReqModifyRoom") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def add_room_robot(
+        self, req_add_room_robot: "ReqAddRoomRobot"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def match_game(
+        self, req_join_match_queue: "ReqJoinMatchQueue"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def cancel_match(
+        self, req_cancel_match_queue: "ReqCancelMatchQueue"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_account_info(
+        self, req_account_info: "ReqAccountInfo"
+    ) -> "ResAccountInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def change_avatar(self, req_change_avatar: "ReqChangeAvatar") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_version_reward(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_account_statistic_info(
+        self, req_account_statistic_info: "ReqAccountStatisticInfo"
+    ) -> "ResAccountStatisticInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_account_challenge_rank_info(
+        self, req_account_info: "ReqAccountInfo"
+    ) -> "ResAccountChallengeRankInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_account_character_info(
+        self, req_common: "ReqCommon"
+    ) -> "ResAccountCharacterInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def shop_purchase(
+        self, req_shop_purchase: "ReqShopPurchase"
+    ) -> "ResShopPurchase":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_record(
+        self, req_game_record: "ReqGameRecord"
+    ) -> "ResGameRecord":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def read_game_record(self, req_game_record: "ReqGameRecord") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_record_list(
+        self, req_game_record_list: "ReqGameRecordList"
+    ) -> "ResGameRecordList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_record_list_v2(
+        self, req_game_record_list_v2: "ReqGameRecordListV2"
+    ) -> "ResGameRecordListV2":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_next_game_record_list(
+        self, req_next_game_record_list: "ReqNextGameRecordList"
+    ) -> "ResNextGameRecordList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_collected_game_record_list(
+        self, req_common: "ReqCommon"
+    ) -> "ResCollectedGameRecordList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_records_detail(
+        self, req_game_records_detail: "ReqGameRecordsDetail"
+    ) -> "ResGameRecordsDetail":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_records_detail_v2(
+        self, req_game_records_detail_v2: "ReqGameRecordsDetailV2"
+    ) -> "ResGameRecordsDetailV2":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def add_collected_game_record(
+        self, req_add_collected_game_record: "ReqAddCollectedGameRecord"
+    ) -> "ResAddCollectedGameRecord":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def remove_collected_game_record(
+        self, req_remove_collected_game_record: "ReqRemoveCollectedGameRecord"
+    ) -> "ResRemoveCollectedGameRecord":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def change_collected_game_record_remarks(
+        self,
+        req_change_collected_game_record_remarks: "ReqChangeCollectedGameRecordRemarks",
+    ) -> "ResChangeCollectedGameRecordRemarks":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_level_leaderboard(
+        self, req_level_leaderboard: "ReqLevelLeaderboard"
+    ) -> "ResLevelLeaderboard":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_challenge_leaderboard(
+        self, req_challange_leaderboard: "ReqChallangeLeaderboard"
+    ) -> "ResChallengeLeaderboard":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_muti_challenge_level(
+        self, req_muti_challenge_level: "ReqMutiChallengeLevel"
+    ) -> "ResMutiChallengeLevel":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_multi_account_brief(
+        self, req_multi_account_id: "ReqMultiAccountId"
+    ) -> "ResMultiAccountBrief":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_friend_list(self, req_common: "ReqCommon") -> "ResFriendList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_friend_apply_list(
+        self, req_common: "ReqCommon"
+    ) -> "ResFriendApplyList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def apply_friend(self, req_apply_friend: "ReqApplyFriend") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def handle_friend_apply(
+        self, req_handle_friend_apply: "ReqHandleFriendApply"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def remove_friend(self, req_remove_friend: "ReqRemoveFriend") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def search_account_by_id(
+        self, req_search_account_by_id: "ReqSearchAccountById"
+    ) -> "ResSearchAccountById":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def search_account_by_pattern(
+        self, req_search_account_by_pattern: "ReqSearchAccountByPattern"
+    ) -> "ResSearchAccountByPattern":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_account_state(
+        self, req_account_list: "ReqAccountList"
+    ) -> "ResAccountStates":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_bag_info(self, req_common: "ReqCommon") -> "ResBagInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def use_bag_item(self, req_use_bag_item: "ReqUseBagItem") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def open_manual_item(
+        self, req_open_manual_item: "ReqOpenManualItem"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def open_random_reward_item(
+        self, req_open_random_reward_item: "ReqOpenRandomRewardItem"
+    ) -> "ResOpenRandomRewardItem":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def open_all_reward_item(
+        self, req_open_all_reward_item: "ReqOpenAllRewardItem"
+    ) -> "ResOpenAllRewardItem":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def compose_shard(self, req_compose_shard: "ReqComposeShard") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_announcement(
+        self, req_fetch_announcement: "ReqFetchAnnouncement"
+    ) -> "ResAnnouncement":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def read_announcement(
+        self, req_read_announcement: "ReqReadAnnouncement"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_mail_info(self, req_common: "ReqCommon") -> "ResMailInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def read_mail(self, req_read_mail: "ReqReadMail") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def delete_mail(self, req_delete_mail: "ReqDeleteMail") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def take_attachment_from_mail(
+        self, req_take_attachment: "ReqTakeAttachment"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_achievement_reward(
+        self, req_receive_achievement_reward: "ReqReceiveAchievementReward"
+    ) -> "ResReceiveAchievementReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_achievement_group_reward(
+        self, req_receive_achievement_group_reward: "ReqReceiveAchievementGroupReward"
+    ) -> "ResReceiveAchievementGroupReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_achievement_rate(
+        self, req_common: "ReqCommon"
+    ) -> "ResFetchAchievementRate":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_achievement(self, req_common: "ReqCommon") -> "ResAchievement":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def buy_shi_lian(self, req_buy_shi_lian: "ReqBuyShiLian") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def match_shi_lian(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def go_next_shi_lian(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def update_client_value(
+        self, req_update_client_value: "ReqUpdateClientValue"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_client_value(self, req_common: "ReqCommon") -> "ResClientValue":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def client_message(
+        self, req_client_message: "ReqClientMessage"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_current_match_info(
+        self, req_current_match_info: "ReqCurrentMatchInfo"
+    ) -> "ResCurrentMatchInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def user_complain(self, req_user_complain: "ReqUserComplain") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_revive_coin_info(
+        self, req_common: "ReqCommon"
+    ) -> "ResReviveCoinInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def gain_revive_coin(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_daily_task(self, req_common: "ReqCommon") -> "ResDailyTask":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def refresh_daily_task(
+        self, req_refresh_daily_task: "ReqRefreshDailyTask"
+    ) -> "ResRefreshDailyTask":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def use_gift_code(
+        self, req_use_gift_code: "ReqUseGiftCode"
+    ) -> "ResUseGiftCode":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def use_special_gift_code(
+        self, req_use_gift_code: "ReqUseGiftCode"
+    ) -> "ResUseSpecialGiftCode":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_title_list(self, req_common: "ReqCommon") -> "ResTitleList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def use_title(self, req_use_title: "ReqUseTitle") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def send_client_message(
+        self, req_send_client_message: "ReqSendClientMessage"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_live_info(
+        self, req_game_live_info: "ReqGameLiveInfo"
+    ) -> "ResGameLiveInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_live_left_segment(
+        self, req_game_live_left_segment: "ReqGameLiveLeftSegment"
+    ) -> "ResGameLiveLeftSegment":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_live_list(
+        self, req_game_live_list: "ReqGameLiveList"
+    ) -> "ResGameLiveList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_comment_setting(
+        self, req_common: "ReqCommon"
+    ) -> "ResCommentSetting":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def update_comment_setting(
+        self, req_update_comment_setting: "ReqUpdateCommentSetting"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_comment_list(
+        self, req_fetch_comment_list: "ReqFetchCommentList"
+    ) -> "ResFetchCommentList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_comment_content(
+        self, req_fetch_comment_content: "ReqFetchCommentContent"
+    ) -> "ResFetchCommentContent":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def leave_comment(self, req_leave_comment: "ReqLeaveComment") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def delete_comment(
+        self, req_delete_comment: "ReqDeleteComment"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def update_read_comment(
+        self, req_update_read_comment: "ReqUpdateReadComment"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_rolling_notice(
+        self, req_fetch_rolling_notice: "ReqFetchRollingNotice"
+    ) -> "ResFetchRollingNotice":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_maintain_notice(
+        self, req_common: "ReqCommon"
+    ) -> "ResFetchMaintainNotice":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_server_time(self, req_common: "ReqCommon") -> "ResServerTime":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_platform_products(
+        self, req_platform_billing_products: "ReqPlatformBillingProducts"
+    ) -> "ResPlatformBillingProducts":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_random_character(
+        self, req_common: "ReqCommon"
+    ) -> "ResRandomCharacter":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def set_random_character(
+        self, req_random_character: "ReqRandomCharacter"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def cancel_google_play_order(
+        self, req_cancel_google_play_order: "ReqCancelGooglePlayOrder"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def open_chest(self, req_open_chest: "ReqOpenChest") -> "ResOpenChest":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def buy_from_chest_shop(
+        self, req_buy_from_chest_shop: "ReqBuyFromChestShop"
+    ) -> "ResBuyFromChestShop":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_daily_sign_in_info(
+        self, req_common: "ReqCommon"
+    ) -> "ResDailySignInInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def do_daily_sign_in(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def do_activity_sign_in(
+        self, req_do_activity_sign_in: "ReqDoActivitySignIn"
+    ) -> "ResDoActivitySignIn":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_character_info(self, req_common: "ReqCommon") -> "ResCharacterInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def update_character_sort(
+        self, req_update_character_sort: "ReqUpdateCharacterSort"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def change_main_character(
+        self, req_change_main_character: "ReqChangeMainCharacter"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def change_character_skin(
+        self, req_change_character_skin: "ReqChangeCharacterSkin"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def change_character_view(
+        self, req_change_character_view: "ReqChangeCharacterView"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def set_hidden_character(
+        self, req_set_hidden_character: "ReqSetHiddenCharacter"
+    ) -> "ResSetHiddenCharacter":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def send_gift_to_character(
+        self, req_send_gift_to_character: "ReqSendGiftToCharacter"
+    ) -> "ResSendGiftToCharacter":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def sell_item(self, req_sell_item: "ReqSellItem") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_common_view(self, req_common: "ReqCommon") -> "ResCommonView":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def change_common_view(
+        self, req_change_common_view: "ReqChangeCommonView"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def save_common_views(
+        self, req_save_common_views: "ReqSaveCommonViews"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_common_views(
+        self, req_common_views: "ReqCommonViews"
+    ) -> "ResCommonViews":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_all_common_views(
+        self, req_common: "ReqCommon"
+    ) -> "ResAllcommonViews":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def use_common_view(
+        self, req_use_common_view: "ReqUseCommonView"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def upgrade_character(
+        self, req_upgrade_character: "ReqUpgradeCharacter"
+    ) -> "ResUpgradeCharacter":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def add_finished_ending(
+        self, req_finished_ending: "ReqFinishedEnding"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_ending_reward(
+        self, req_finished_ending: "ReqFinishedEnding"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def game_master_command(self, req_gm_command: "ReqGmCommand") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_shop_info(self, req_common: "ReqCommon") -> "ResShopInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def buy_from_shop(
+        self, req_buy_from_shop: "ReqBuyFromShop"
+    ) -> "ResBuyFromShop":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def buy_from_zhp(self, req_buy_from_zhp: "ReqBuyFromZhp") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def refresh_zhp_shop(
+        self, req_resh_zhp_shop: "ReqReshZhpShop"
+    ) -> "ResRefreshZhpShop":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_month_ticket_info(
+        self, req_common: "ReqCommon"
+    ) -> "ResMonthTicketInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def pay_month_ticket(self, req_common: "ReqCommon") -> "ResPayMonthTicket":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def exchange_currency(
+        self, req_exchange_currency: "ReqExchangeCurrency"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def exchange_chest_stone(
+        self, req_exchange_currency: "ReqExchangeCurrency"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def exchange_diamond(
+        self, req_exchange_currency: "ReqExchangeCurrency"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_server_settings(
+        self, req_common: "ReqCommon"
+    ) -> "ResServerSettings":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_account_settings(
+        self, req_common: "ReqCommon"
+    ) -> "ResAccountSettings":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def update_account_settings(
+        self, req_update_account_settings: "ReqUpdateAccountSettings"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_mod_nickname_time(
+        self, req_common: "ReqCommon"
+    ) -> "ResModNicknameTime":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_wechat_native_order(
+        self, req_create_wechat_native_order: "ReqCreateWechatNativeOrder"
+    ) -> "ResCreateWechatNativeOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_wechat_app_order(
+        self, req_create_wechat_app_order: "ReqCreateWechatAppOrder"
+    ) -> "ResCreateWechatAppOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_alipay_order(
+        self, req_create_alipay_order: "ReqCreateAlipayOrder"
+    ) -> "ResCreateAlipayOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_alipay_scan_order(
+        self, req_create_alipay_scan_order: "ReqCreateAlipayScanOrder"
+    ) -> "ResCreateAlipayScanOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_alipay_app_order(
+        self, req_create_alipay_app_order: "ReqCreateAlipayAppOrder"
+    ) -> "ResCreateAlipayAppOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_jp_credit_card_order(
+        self, req_create_jp_credit_card_order: "ReqCreateJpCreditCardOrder"
+    ) -> "ResCreateJpCreditCardOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_jp_paypal_order(
+        self, req_create_jp_paypal_order: "ReqCreateJpPaypalOrder"
+    ) -> "ResCreateJpPaypalOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_jp_au_order(
+        self, req_create_jp_au_order: "ReqCreateJpAuOrder"
+    ) -> "ResCreateJpAuOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_jp_docomo_order(
+        self, req_create_jp_docomo_order: "ReqCreateJpDocomoOrder"
+    ) -> "ResCreateJpDocomoOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_jp_web_money_order(
+        self, req_create_jp_web_money_order: "ReqCreateJpWebMoneyOrder"
+    ) -> "ResCreateJpWebMoneyOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_jp_softbank_order(
+        self, req_create_jp_softbank_order: "ReqCreateJpSoftbankOrder"
+    ) -> "ResCreateJpSoftbankOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_jp_pay_pay_order(
+        self, req_create_jp_pay_pay_order: "ReqCreateJpPayPayOrder"
+    ) -> "ResCreateJpPayPayOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_jp_common_credit_card_order(
+        self, req_fetch_jp_common_credit_card_order: "ReqFetchJpCommonCreditCardOrder"
+    ) -> "ResFetchJpCommonCreditCardOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_jpgmo_order(
+        self, req_create_jpgmo_order: "ReqCreateJpgmoOrder"
+    ) -> "ResCreateJpgmoOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_en_paypal_order(
+        self, req_create_en_paypal_order: "ReqCreateEnPaypalOrder"
+    ) -> "ResCreateEnPaypalOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_en_master_card_order(
+        self, req_create_en_master_card_order: "ReqCreateEnMasterCardOrder"
+    ) -> "ResCreateEnMasterCardOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_en_visa_order(
+        self, req_create_en_visa_order: "ReqCreateEnVisaOrder"
+    ) -> "ResCreateEnVisaOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_enjcb_order(
+        self, req_create_enjcb_order: "ReqCreateEnjcbOrder"
+    ) -> "ResCreateEnjcbOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_en_alipay_order(
+        self, req_create_en_alipay_order: "ReqCreateEnAlipayOrder"
+    ) -> "ResCreateEnAlipayOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_kr_paypal_order(
+        self, req_create_kr_paypal_order: "ReqCreateKrPaypalOrder"
+    ) -> "ResCreateKrPaypalOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_kr_master_card_order(
+        self, req_create_kr_master_card_order: "ReqCreateKrMasterCardOrder"
+    ) -> "ResCreateKrMasterCardOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_kr_visa_order(
+        self, req_create_kr_visa_order: "ReqCreateKrVisaOrder"
+    ) -> "ResCreateKrVisaOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_krjcb_order(
+        self, req_create_krjcb_order: "ReqCreateKrjcbOrder"
+    ) -> "ResCreateKrjcbOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_kr_alipay_order(
+        self, req_create_kr_alipay_order: "ReqCreateKrAlipayOrder"
+    ) -> "ResCreateKrAlipayOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_dmm_order(
+        self, req_create_dmm_order: "ReqCreateDmmOrder"
+    ) -> "ResCreateDmmOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_iap_order(
+        self, req_create_iap_order: "ReqCreateIapOrder"
+    ) -> "ResCreateIapOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_steam_order(
+        self, req_create_steam_order: "ReqCreateSteamOrder"
+    ) -> "ResCreateSteamOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def verify_steam_order(
+        self, req_verify_steam_order: "ReqVerifySteamOrder"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_my_card_android_order(
+        self, req_create_my_card_order: "ReqCreateMyCardOrder"
+    ) -> "ResCreateMyCardOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_my_card_web_order(
+        self, req_create_my_card_order: "ReqCreateMyCardOrder"
+    ) -> "ResCreateMyCardOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_paypal_order(
+        self, req_create_paypal_order: "ReqCreatePaypalOrder"
+    ) -> "ResCreatePaypalOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_xsolla_order(
+        self, req_create_xsolla_order: "ReqCreateXsollaOrder"
+    ) -> "ResCreateXsollaOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def verify_my_card_order(
+        self, req_verify_my_card_order: "ReqVerifyMyCardOrder"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def verification_iap_order(
+        self, req_verification_iap_order: "ReqVerificationIapOrder"
+    ) -> "ResVerificationIapOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_yostar_sdk_order(
+        self, req_create_yostar_order: "ReqCreateYostarOrder"
+    ) -> "ResCreateYostarOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_billing_order(
+        self, req_create_billing_order: "ReqCreateBillingOrder"
+    ) -> "ResCreateBillingOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def solve_google_play_order(
+        self, req_solve_google_play_order: "ReqSolveGooglePlayOrder"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def solve_google_pay_order_v3(
+        self, req_solve_google_play_order_v3: "ReqSolveGooglePlayOrderV3"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def deliver_aa32_order(
+        self, req_deliver_aa32_order: "ReqDeliverAa32Order"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_misc(self, req_common: "ReqCommon") -> "ResMisc":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def modify_signature(
+        self, req_modify_signature: "ReqModifySignature"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_id_card_info(self, req_common: "ReqCommon") -> "ResIdCardInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def update_id_card_info(
+        self, req_update_id_card_info: "ReqUpdateIdCardInfo"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_vip_reward(self, req_common: "ReqCommon") -> "ResVipReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def gain_vip_reward(
+        self, req_gain_vip_reward: "ReqGainVipReward"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_refund_order(
+        self, req_common: "ReqCommon"
+    ) -> "ResFetchRefundOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_customized_contest_list(
+        self, req_fetch_customized_contest_list: "ReqFetchCustomizedContestList"
+    ) -> "ResFetchCustomizedContestList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_customized_contest_auth_info(
+        self,
+        req_fetch_customized_contest_auth_info: "ReqFetchCustomizedContestAuthInfo",
+    ) -> "ResFetchCustomizedContestAuthInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def enter_customized_contest(
+        self, req_enter_customized_contest: "ReqEnterCustomizedContest"
+    ) -> "ResEnterCustomizedContest":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def leave_customized_contest(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_customized_contest_online_info(
+        self,
+        req_fetch_customized_contest_online_info: "ReqFetchCustomizedContestOnlineInfo",
+    ) -> "ResFetchCustomizedContestOnlineInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_customized_contest_by_contest_id(
+        self,
+        req_fetch_customized_contest_by_contest_id: "ReqFetchCustomizedContestByContestId",
+    ) -> "ResFetchCustomizedContestByContestId":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def signup_customized_contest(
+        self, req_signup_customized_contest: "ReqSignupCustomizedContest"
+    ) -> "ResSignupCustomizedContest":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def start_customized_contest(
+        self, req_start_customized_contest: "ReqStartCustomizedContest"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def stop_customized_contest(
+        self, req_stop_customized_contest: "ReqStopCustomizedContest"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def join_customized_contest_chat_room(
+        self, req_join_customized_contest_chat_room: "ReqJoinCustomizedContestChatRoom"
+    ) -> "ResJoinCustomizedContestChatRoom":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def leave_customized_contest_chat_room(
+        self, req_common: "ReqCommon"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def say_chat_message(
+        self, req_say_chat_message: "ReqSayChatMessage"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_customized_contest_game_records(
+        self,
+        req_fetch_customized_contest_game_records: "ReqFetchCustomizedContestGameRecords",
+    ) -> "ResFetchCustomizedContestGameRecords":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_customized_contest_game_live_list(
+        self,
+        req_fetch_customized_contest_game_live_list: "ReqFetchCustomizedContestGameLiveList",
+    ) -> "ResFetchCustomizedContestGameLiveList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def follow_customized_contest(
+        self, req_target_customized_contest: "ReqTargetCustomizedContest"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def unfollow_customized_contest(
+        self, req_target_customized_contest: "ReqTargetCustomizedContest"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_activity_list(self, req_common: "ReqCommon") -> "ResActivityList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_account_activity_data(
+        self, req_common: "ReqCommon"
+    ) -> "ResAccountActivityData":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def exchange_activity_item(
+        self, req_exchange_activity_item: "ReqExchangeActivityItem"
+    ) -> "ResExchangeActivityItem":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def complete_activity_task(
+        self, req_complete_activity_task: "ReqCompleteActivityTask"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def complete_activity_task_batch(
+        self, req_complete_activity_task_batch: "ReqCompleteActivityTaskBatch"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def complete_activity_flip_task(
+        self, req_complete_activity_task: "ReqCompleteActivityTask"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def complete_period_activity_task(
+        self, req_complete_activity_task: "ReqCompleteActivityTask"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def complete_period_activity_task_batch(
+        self,
+        req_complete_period_activity_task_batch: "ReqCompletePeriodActivityTaskBatch",
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def complete_random_activity_task(
+        self, req_complete_activity_task: "ReqCompleteActivityTask"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def complete_random_activity_task_batch(
+        self, req_complete_activity_task_batch: "ReqCompleteActivityTaskBatch"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_activity_flip_task(
+        self, req_receive_activity_flip_task: "ReqReceiveActivityFlipTask"
+    ) -> "ResReceiveActivityFlipTask":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def complete_segment_task_reward(
+        self, req_complete_segment_task_reward: "ReqCompleteSegmentTaskReward"
+    ) -> "ResCompleteSegmentTaskReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_activity_flip_info(
+        self, req_fetch_activity_flip_info: "ReqFetchActivityFlipInfo"
+    ) -> "ResFetchActivityFlipInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def gain_accumulated_point_activity_reward(
+        self,
+        req_gain_accumulated_point_activity_reward: "ReqGainAccumulatedPointActivityReward",
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def gain_multi_point_activity_reward(
+        self, req_gain_multi_point_activity_reward: "ReqGainMultiPointActivityReward"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_rank_point_leaderboard(
+        self, req_fetch_rank_point_leaderboard: "ReqFetchRankPointLeaderboard"
+    ) -> "ResFetchRankPointLeaderboard":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def gain_rank_point_reward(
+        self, req_gain_rank_point_reward: "ReqGainRankPointReward"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def richman_activity_next_move(
+        self, req_richman_next_move: "ReqRichmanNextMove"
+    ) -> "ResRichmanNextMove":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def richman_acitivity_special_move(
+        self, req_richman_special_move: "ReqRichmanSpecialMove"
+    ) -> "ResRichmanNextMove":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def richman_activity_chest_info(
+        self, req_richman_chest_info: "ReqRichmanChestInfo"
+    ) -> "ResRichmanChestInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_game_observe_auth(
+        self, req_create_game_observe_auth: "ReqCreateGameObserveAuth"
+    ) -> "ResCreateGameObserveAuth":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def refresh_game_observe_auth(
+        self, req_refresh_game_observe_auth: "ReqRefreshGameObserveAuth"
+    ) -> "ResRefreshGameObserveAuth":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_activity_buff(self, req_common: "ReqCommon") -> "ResActivityBuff":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def upgrade_activity_buff(
+        self, req_upgrade_activity_buff: "ReqUpgradeActivityBuff"
+    ) -> "ResActivityBuff":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def upgrade_activity_level(
+        self, req_upgrade_activity_level: "ReqUpgradeActivityLevel"
+    ) -> "ResUpgradeActivityLevel":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_upgrade_activity_reward(
+        self, req_receive_upgrade_activity_reward: "ReqReceiveUpgradeActivityReward"
+    ) -> "ResReceiveUpgradeActivityReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def upgrade_challenge(self, req_common: "ReqCommon") -> "ResUpgradeChallenge":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def refresh_challenge(self, req_common: "ReqCommon") -> "ResRefreshChallenge":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_challenge_info(
+        self, req_common: "ReqCommon"
+    ) -> "ResFetchChallengeInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def force_complete_challenge_task(
+        self, req_force_complete_challenge_task: "ReqForceCompleteChallengeTask"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_challenge_season(
+        self, req_common: "ReqCommon"
+    ) -> "ResChallengeSeasonInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_challenge_rank_reward(
+        self, req_receive_challenge_rank_reward: "ReqReceiveChallengeRankReward"
+    ) -> "ResReceiveChallengeRankReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_ab_match_info(self, req_common: "ReqCommon") -> "ResFetchAbMatch":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def buy_in_ab_match(
+        self, req_buy_in_ab_match: "ReqBuyInAbMatch"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_ab_match_reward(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def quit_ab_match(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def start_unified_match(
+        self, req_start_unified_match: "ReqStartUnifiedMatch"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def cancel_unified_match(
+        self, req_cancel_unified_match: "ReqCancelUnifiedMatch"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_point_rank(
+        self, req_game_point_rank: "ReqGamePointRank"
+    ) -> "ResGamePointRank":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_self_game_point_rank(
+        self, req_game_point_rank: "ReqGamePointRank"
+    ) -> "ResFetchSelfGamePointRank":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def read_sns(self, req_read_sns: "ReqReadSns") -> "ResReadSns":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def reply_sns(self, req_reply_sns: "ReqReplySns") -> "ResReplySns":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def like_sns(self, req_like_sns: "ReqLikeSns") -> "ResLikeSns":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def dig_mine(self, req_dig_mine: "ReqDigMine") -> "ResDigMine":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_last_privacy(
+        self, req_fetch_last_privacy: "ReqFetchLastPrivacy"
+    ) -> "ResFetchLastPrivacy":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def check_privacy(self, req_check_privacy: "ReqCheckPrivacy") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def response_captcha(
+        self, req_response_captcha: "ReqResponseCaptcha"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_rpg_battle_history(
+        self, req_fetch_rpg_battle_history: "ReqFetchRpgBattleHistory"
+    ) -> "ResFetchRpgBattleHistory":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_rpg_battle_history_v2(
+        self, req_fetch_rpg_battle_history: "ReqFetchRpgBattleHistory"
+    ) -> "ResFetchRpgBattleHistoryV2":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_rpg_rewards(
+        self, req_receive_rpg_rewards: "ReqReceiveRpgRewards"
+    ) -> "ResReceiveRpgRewards":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_rpg_reward(
+        self, req_receive_rpg_reward: "ReqReceiveRpgReward"
+    ) -> "ResReceiveRpgRewards":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def buy_arena_ticket(
+        self, req_buy_arena_ticket: "ReqBuyArenaTicket"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def enter_arena(self, req_enter_arena: "ReqEnterArena") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_arena_reward(
+        self, req_arena_reward: "ReqArenaReward"
+    ) -> "ResArenaReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_ob_token(
+        self, req_fetch_ob_token: "ReqFetchObToken"
+    ) -> "ResFetchObToken":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_character_rewards(
+        self, req_receive_character_rewards: "ReqReceiveCharacterRewards"
+    ) -> "ResReceiveCharacterRewards":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def feed_activity_feed(
+        self, req_feed_activity_feed: "ReqFeedActivityFeed"
+    ) -> "ResFeedActivityFeed":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def send_activity_gift_to_friend(
+        self, req_send_activity_gift_to_friend: "ReqSendActivityGiftToFriend"
+    ) -> "ResSendActivityGiftToFriend":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_activity_gift(
+        self, req_receive_activity_gift: "ReqReceiveActivityGift"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_all_activity_gift(
+        self, req_receive_all_activity_gift: "ReqReceiveAllActivityGift"
+    ) -> "ResReceiveAllActivityGift":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_friend_gift_activity_data(
+        self, req_fetch_friend_gift_activity_data: "ReqFetchFriendGiftActivityData"
+    ) -> "ResFetchFriendGiftActivityData":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def open_pre_chest_item(
+        self, req_open_pre_chest_item: "ReqOpenPreChestItem"
+    ) -> "ResOpenPreChestItem":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_vote_activity(
+        self, req_fetch_vote_activity: "ReqFetchVoteActivity"
+    ) -> "ResFetchVoteActivity":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def vote_activity(
+        self, req_vote_activity: "ReqVoteActivity"
+    ) -> "ResVoteActivity":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def unlock_activity_spot(
+        self, req_unlock_activity_spot: "ReqUnlockActivitySpot"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def unlock_activity_spot_ending(
+        self, req_unlock_activity_spot_ending: "ReqUnlockActivitySpotEnding"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_activity_spot_reward(
+        self, req_receive_activity_spot_reward: "ReqReceiveActivitySpotReward"
+    ) -> "ResReceiveActivitySpotReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def delete_account(self, req_common: "ReqCommon") -> "ResDeleteAccount":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def cancel_delete_account(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def log_report(self, req_log_report: "ReqLogReport") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def bind_oauth2(self, req_bind_oauth2: "ReqBindOauth2") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_oauth2_info(
+        self, req_fetch_oauth2: "ReqFetchOauth2"
+    ) -> "ResFetchOauth2":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def set_loading_image(
+        self, req_set_loading_image: "ReqSetLoadingImage"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_shop_interval(
+        self, req_common: "ReqCommon"
+    ) -> "ResFetchShopInterval":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_activity_interval(
+        self, req_common: "ReqCommon"
+    ) -> "ResFetchActivityInterval":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_recent_friend(
+        self, req_common: "ReqCommon"
+    ) -> "ResFetchrecentFriend":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def open_gacha(self, req_open_gacha: "ReqOpenGacha") -> "ResOpenGacha":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def task_request(self, req_task_request: "ReqTaskRequest") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def simulation_activity_train(
+        self, req_simulation_activity_train: "ReqSimulationActivityTrain"
+    ) -> "ResSimulationActivityTrain":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_simulation_game_record(
+        self, req_fetch_simulation_game_record: "ReqFetchSimulationGameRecord"
+    ) -> "ResFetchSimulationGameRecord":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def start_simulation_activity_game(
+        self, req_start_simulation_activity_game: "ReqStartSimulationActivityGame"
+    ) -> "ResStartSimulationActivityGame":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_simulation_game_rank(
+        self, req_fetch_simulation_game_rank: "ReqFetchSimulationGameRank"
+    ) -> "ResFetchSimulationGameRank":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def generate_combining_craft(
+        self, req_generate_combining_craft: "ReqGenerateCombiningCraft"
+    ) -> "ResGenerateCombiningCraft":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def move_combining_craft(
+        self, req_move_combining_craft: "ReqMoveCombiningCraft"
+    ) -> "ResMoveCombiningCraft":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def combining_recycle_craft(
+        self, req_combining_recycle_craft: "ReqCombiningRecycleCraft"
+    ) -> "ResCombiningRecycleCraft":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def recover_combining_recycle(
+        self, req_recover_combining_recycle: "ReqRecoverCombiningRecycle"
+    ) -> "ResRecoverCombiningRecycle":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def finish_combining_order(
+        self, req_finish_combining_order: "ReqFinishCombiningOrder"
+    ) -> "ResFinishCombiningOrder":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def upgrade_village_building(
+        self, req_upgrade_village_building: "ReqUpgradeVillageBuilding"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_village_building_reward(
+        self, req_receive_village_building_reward: "ReqReceiveVillageBuildingReward"
+    ) -> "ResReceiveVillageBuildingReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def start_village_trip(
+        self, req_start_village_trip: "ReqStartVillageTrip"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def receive_village_trip_reward(
+        self, req_receive_village_trip_reward: "ReqReceiveVillageTripReward"
+    ) -> "ResReceiveVillageTripReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def complete_village_task(
+        self, req_complete_village_task: "ReqCompleteVillageTask"
+    ) -> "ResCompleteVillageTask":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def get_friend_village_data(
+        self, req_get_friend_village_data: "ReqGetFriendVillageData"
+    ) -> "ResGetFriendVillageData":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def set_village_worker(
+        self, req_set_village_worker: "ReqSetVillageWorker"
+    ) -> "ResSetVillageWorker":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def next_round_village(
+        self, req_next_round_village: "ReqNextRoundVillage"
+    ) -> "ResNextRoundVillage":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def resolve_festival_activity_proposal(
+        self,
+        req_resolve_festival_activity_proposal: "ReqResolveFestivalActivityProposal",
+    ) -> "ResResolveFestivalActivityProposal":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def resolve_festival_activity_event(
+        self, req_resolve_festival_activity_event: "ReqResolveFestivalActivityEvent"
+    ) -> "ResResolveFestivalActivityEvent":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def buy_festival_proposal(
+        self, req_buy_festival_proposal: "ReqBuyFestivalProposal"
+    ) -> "ResBuyFestivalProposal":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def island_activity_move(
+        self, req_island_activity_move: "ReqIslandActivityMove"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def island_activity_buy(
+        self, req_island_activity_buy: "ReqIslandActivityBuy"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def island_activity_sell(
+        self, req_island_activity_sell: "ReqIslandActivitySell"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def island_activity_tidy_bag(
+        self, req_island_activity_tidy_bag: "ReqIslandActivityTidyBag"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def island_activity_unlock_bag_grid(
+        self, req_island_activity_unlock_bag_grid: "ReqIslandActivityUnlockBagGrid"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_customized_contest(
+        self, req_create_customized_contest: "ReqCreateCustomizedContest"
+    ) -> "ResCreateCustomizedContest":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_manager_customized_contest_list(
+        self,
+        req_fetchmanager_customized_contest_list: "ReqFetchmanagerCustomizedContestList",
+    ) -> "ResFetchManagerCustomizedContestList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_manager_customized_contest(
+        self, req_fetch_manager_customized_contest: "ReqFetchManagerCustomizedContest"
+    ) -> "ResFetchManagerCustomizedContest":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def update_manager_customized_contest(
+        self, req_update_manager_customized_contest: "ReqUpdateManagerCustomizedContest"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_contest_player_rank(
+        self, req_fetch_contest_player_rank: "ReqFetchContestPlayerRank"
+    ) -> "ResFetchContestPlayerRank":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_ready_player_list(
+        self, req_fetch_ready_player_list: "ReqFetchReadyPlayerList"
+    ) -> "ResFetchReadyPlayerList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def create_game_plan(
+        self, req_create_game_plan: "ReqCreateGamePlan"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def generate_contest_manager_login_code(
+        self, req_common: "ReqCommon"
+    ) -> "ResGenerateContestManagerLoginCode":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_start_game(
+        self, req_amulet_activity_start_game: "ReqAmuletActivityStartGame"
+    ) -> "ResAmuletActivityStartGame":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_operate(
+        self, req_amulet_activity_operate: "ReqAmuletActivityOperate"
+    ) -> "ResAmuletActivityOperate":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_change_hands(
+        self, req_amulet_activity_change_hands: "ReqAmuletActivityChangeHands"
+    ) -> "ResAmuletActivityChangeHands":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_upgrade(
+        self, req_amulet_activity_upgrade: "ReqAmuletActivityUpgrade"
+    ) -> "ResAmuletActivityUpgrade":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_buy(
+        self, req_amulet_activity_buy: "ReqAmuletActivityBuy"
+    ) -> "ResAmuletActivityBuy":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_select_pack(
+        self, req_amulet_activity_select_pack: "ReqAmuletActivitySelectPack"
+    ) -> "ResAmuletActivitySelectPack":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_sell_effect(
+        self, req_amulet_activity_sell_effect: "ReqAmuletActivitySellEffect"
+    ) -> "ResAmuletActivitySellEffect":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_effect_sort(
+        self, req_amulet_activity_effect_sort: "ReqAmuletActivityEffectSort"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_giveup(
+        self, req_amulet_activity_giveup: "ReqAmuletActivityGiveup"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_refresh_shop(
+        self, req_amulet_activity_refresh_shop: "ReqAmuletActivityRefreshShop"
+    ) -> "ResAmuletActivityRefreshShop":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_select_free_effect(
+        self,
+        req_amulet_activity_select_free_effect: "ReqAmuletActivitySelectFreeEffect",
+    ) -> "ResAmuletActivitySelectFreeEffect":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_upgrade_shop_buff(
+        self, req_amulet_activity_upgrade_shop_buff: "ReqAmuletActivityUpgradeShopBuff"
+    ) -> "ResAmuletActivityUpgradeShopBuff":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_end_shopping(
+        self, req_amulet_activity_end_shopping: "ReqAmuletActivityEndShopping"
+    ) -> "ResAmuletActivityEndShopping":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_set_skill_level(
+        self, req_amulet_activity_set_skill_level: "ReqAmuletActivitySetSkillLevel"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def amulet_activity_maintain_info(
+        self, req_common: "ReqCommon"
+    ) -> "ResAmuletActivityMaintainInfo":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def story_activity_unlock(
+        self, req_story_activity_unlock: "ReqStoryActivityUnlock"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def story_activity_unlock_ending(
+        self, req_story_activity_unlock_ending: "ReqStoryActivityUnlockEnding"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def story_activity_receive_ending_reward(
+        self,
+        req_story_activity_receive_ending_reward: "ReqStoryActivityReceiveEndingReward",
+    ) -> "ResStoryReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def story_activity_receive_finish_reward(
+        self,
+        req_story_activity_receive_finish_reward: "ReqStoryActivityReceiveFinishReward",
+    ) -> "ResStoryReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def story_activity_receive_all_finish_reward(
+        self,
+        req_story_activity_receive_all_finish_reward: "ReqStoryActivityReceiveAllFinishReward",
+    ) -> "ResStoryReward":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def story_activity_unlock_ending_and_receive(
+        self,
+        req_story_activity_unlock_ending_and_receive: "ReqStoryActivityUnlockEndingAndReceive",
+    ) -> "ResStoryActivityUnlockEndingAndReceive":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_activity_rank(
+        self, req_fetch_activity_rank: "ReqFetchActivityRank"
+    ) -> "ResFetchActivityRank":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def set_verified_hidden(
+        self, req_set_verified_hidden: "ReqSetVerifiedHidden"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_questionnaire_list(
+        self, req_fetch_questionnaire_list: "ReqFetchQuestionnaireList"
+    ) -> "ResFetchQuestionnaireList":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_questionnaire_detail(
+        self, req_fetch_questionnaire_detail: "ReqFetchQuestionnaireDetail"
+    ) -> "ResFetchQuestionnaireDetail":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def submit_questionnaire(
+        self, req_submit_questionnaire: "ReqSubmitQuestionnaire"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def set_friend_room_random_bot_char(
+        self, req_set_friend_room_random_bot_char: "ReqSetFriendRoomRandomBotChar"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_account_game_hu_records(
+        self, req_fetch_account_game_hu_records: "ReqFetchAccountGameHuRecords"
+    ) -> "ResFetchAccountGameHuRecords":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_account_info_extra(
+        self, req_fetch_account_info_extra: "ReqFetchAccountInfoExtra"
+    ) -> "ResFetchAccountInfoExtra":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def set_account_favorite_hu(
+        self, req_set_account_favorite_hu: "ReqSetAccountFavoriteHu"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def __rpc_fetch_connection_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResConnectionInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_connection_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_queue_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchQueueInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_queue_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_cancel_queue(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.cancel_queue(request)
+        await stream.send_message(response)
+
+    async def __rpc_openid_check(
+        self, stream: "grpclib.server.Stream[ReqOpenidCheck, ResOauth2Check]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.openid_check(request)
+        await stream.send_message(response)
+
+    async def __rpc_signup(
+        self, stream: "grpclib.server.Stream[ReqSignupAccount, ResSignupAccount]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.signup(request)
+        await stream.send_message(response)
+
+    async def __rpc_login(
+        self, stream: "grpclib.server.Stream[ReqLogin, ResLogin]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.login(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_login_success(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.login_success(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_server_maintenance_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchServerMaintenanceInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_server_maintenance_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_email_login(
+        self, stream: "grpclib.server.Stream[ReqEmailLogin, ResLogin]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.email_login(request)
+        await stream.send_message(response)
+
+    async def __rpc_oauth2_auth(
+        self, stream: "grpclib.server.Stream[ReqOauth2Auth, ResOauth2Auth]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.oauth2_auth(request)
+        await stream.send_message(response)
+
+    async def __rpc_oauth2_check(
+        self, stream: "grpclib.server.Stream[ReqOauth2Check, ResOauth2Check]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.oauth2_check(request)
+        await stream.send_message(response)
+
+    async def __rpc_oauth2_signup(
+        self, stream: "grpclib.server.Stream[ReqOauth2Signup, ResOauth2Signup]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.oauth2_signup(request)
+        await stream.send_message(response)
+
+    async def __rpc_oauth2_login(
+        self, stream: "grpclib.server.Stream[ReqOauth2Login, ResLogin]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.oauth2_login(request)
+        await stream.send_message(response)
+
+    async def __rpc_dmm_pre_login(
+        self, stream: "grpclib.server.Stream[ReqDmmPreLogin, ResDmmPreLogin]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.dmm_pre_login(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_phone_verify_code(
+        self, stream: "grpclib.server.Stream[ReqCreatePhoneVerifyCode, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_phone_verify_code(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_email_verify_code(
+        self, stream: "grpclib.server.Stream[ReqCreateEmailVerifyCode, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_email_verify_code(request)
+        await stream.send_message(response)
+
+    async def __rpc_verfify_code_for_secure(
+        self,
+        stream: "grpclib.server.Stream[ReqVerifyCodeForSecure, ResVerfiyCodeForSecure]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.verfify_code_for_secure(request)
+        await stream.send_message(response)
+
+    async def __rpc_bind_phone_number(
+        self, stream: "grpclib.server.Stream[ReqBindPhoneNumber, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.bind_phone_number(request)
+        await stream.send_message(response)
+
+    async def __rpc_unbind_phone_number(
+        self, stream: "grpclib.server.Stream[ReqUnbindPhoneNumber, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.unbind_phone_number(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_phone_login_bind(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchPhoneLoginBind]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_phone_login_bind(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_phone_login_bind(
+        self, stream: "grpclib.server.Stream[ReqCreatePhoneLoginBind, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_phone_login_bind(request)
+        await stream.send_message(response)
+
+    async def __rpc_bind_email(
+        self, stream: "grpclib.server.Stream[ReqBindEmail, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.bind_email(request)
+        await stream.send_message(response)
+
+    async def __rpc_modify_password(
+        self, stream: "grpclib.server.Stream[ReqModifyPassword, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.modify_password(request)
+        await stream.send_message(response)
+
+    async def __rpc_bind_account(
+        self, stream: "grpclib.server.Stream[ReqBindAccount, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.bind_account(request)
+        await stream.send_message(response)
+
+    async def __rpc_logout(
+        self, stream: "grpclib.server.Stream[ReqLogout, ResLogout]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.logout(request)
+        await stream.send_message(response)
+
+    async def __rpc_heatbeat(
+        self, stream: "grpclib.server.Stream[ReqHeatBeat, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.heatbeat(request)
+        await stream.send_message(response)
+
+    async def __rpc_login_beat(
+        self, stream: "grpclib.server.Stream[ReqLoginBeat, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.login_beat(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_nickname(
+        self, stream: "grpclib.server.Stream[ReqCreateNickname, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_nickname(request)
+        await stream.send_message(response)
+
+    async def __rpc_modify_nickname(
+        self, stream: "grpclib.server.Stream[ReqModifyNickname, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.modify_nickname(request)
+        await stream.send_message(response)
+
+    async def __rpc_modify_birthday(
+        self, stream: "grpclib.server.Stream[ReqModifyBirthday, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.modify_birthday(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_room(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResSelfRoom]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_room(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_gaming_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchGamingInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_gaming_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_room(
+        self, stream: "grpclib.server.Stream[ReqCreateRoom, ResCreateRoom]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_room(request)
+        await stream.send_message(response)
+
+    async def __rpc_join_room(
+        self, stream: "grpclib.server.Stream[ReqJoinRoom, ResJoinRoom]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.join_room(request)
+        await stream.send_message(response)
+
+    async def __rpc_leave_room(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.leave_room(request)
+        await stream.send_message(response)
+
+    async def __rpc_ready_play(
+        self, stream: "grpclib.server.Stream[ReqRoomReady, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.ready_play(request)
+        await stream.send_message(response)
+
+    async def __rpc_dressing_status(
+        self, stream: "grpclib.server.Stream[ReqRoomDressing, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.dressing_status(request)
+        await stream.send_message(response)
+
+    async def __rpc_start_room(
+        self, stream: "grpclib.server.Stream[ReqRoomStart, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.start_room(request)
+        await stream.send_message(response)
+
+    async def __rpc_room_kick_player(
+        self, stream: "grpclib.server.Stream[ReqRoomKickPlayer, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.room_kick_player(request)
+        await stream.send_message(response)
+
+    async def __rpc_modify_room(
+        self, stream: "grpclib.server.Stream[ReqModifyRoom, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.modify_room(request)
+        await stream.send_message(response)
+
+    async def __rpc_add_room_robot(
+        self, stream: "grpclib.server.Stream[ReqAddRoomRobot, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.add_room_robot(request)
+        await stream.send_message(response)
+
+    async def __rpc_match_game(
+        self, stream: "grpclib.server.Stream[ReqJoinMatchQueue, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.match_game(request)
+        await stream.send_message(response)
+
+    async def __rpc_cancel_match(
+        self, stream: "grpclib.server.Stream[ReqCancelMatchQueue, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.cancel_match(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_account_info(
+        self, stream: "grpclib.server.Stream[ReqAccountInfo, ResAccountInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_account_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_change_avatar(
+        self, stream: "grpclib.server.Stream[ReqChangeAvatar, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.change_avatar(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_version_reward(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_version_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_account_statistic_info(
+        self,
+        stream: "grpclib.server.Stream[ReqAccountStatisticInfo, ResAccountStatisticInfo]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_account_statistic_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_account_challenge_rank_info(
+        self,
+        stream: "grpclib.server.Stream[ReqAccountInfo, ResAccountChallengeRankInfo]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_account_challenge_rank_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_account_character_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResAccountCharacterInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_account_character_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_shop_purchase(
+        self, stream: "grpclib.server.Stream[ReqShopPurchase, ResShopPurchase]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.shop_purchase(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_record(
+        self, stream: "grpclib.server.Stream[ReqGameRecord, ResGameRecord]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_record(request)
+        await stream.send_message(response)
+
+    async def __rpc_read_game_record(
+        self, stream: "grpclib.server.Stream[ReqGameRecord, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.read_game_record(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_record_list(
+        self, stream: "grpclib.server.Stream[ReqGameRecordList, ResGameRecordList]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_record_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_record_list_v2(
+        self, stream: "grpclib.server.Stream[ReqGameRecordListV2, ResGameRecordListV2]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_record_list_v2(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_next_game_record_list(
+        self,
+        stream: "grpclib.server.Stream[ReqNextGameRecordList, ResNextGameRecordList]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_next_game_record_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_collected_game_record_list(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCollectedGameRecordList]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_collected_game_record_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_records_detail(
+        self,
+        stream: "grpclib.server.Stream[ReqGameRecordsDetail, ResGameRecordsDetail]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_records_detail(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_records_detail_v2(
+        self,
+        stream: "grpclib.server.Stream[ReqGameRecordsDetailV2, ResGameRecordsDetailV2]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_records_detail_v2(request)
+        await stream.send_message(response)
+
+    async def __rpc_add_collected_game_record(
+        self,
+        stream: "grpclib.server.Stream[ReqAddCollectedGameRecord, ResAddCollectedGameRecord]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.add_collected_game_record(request)
+        await stream.send_message(response)
+
+    async def __rpc_remove_collected_game_record(
+        self,
+        stream: "grpclib.server.Stream[ReqRemoveCollectedGameRecord, ResRemoveCollectedGameRecord]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.remove_collected_game_record(request)
+        await stream.send_message(response)
+
+    async def __rpc_change_collected_game_record_remarks(
+        self,
+        stream: "grpclib.server.Stream[ReqChangeCollectedGameRecordRemarks, ResChangeCollectedGameRecordRemarks]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.change_collected_game_record_remarks(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_level_leaderboard(
+        self, stream: "grpclib.server.Stream[ReqLevelLeaderboard, ResLevelLeaderboard]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_level_leaderboard(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_challenge_leaderboard(
+        self,
+        stream: "grpclib.server.Stream[ReqChallangeLeaderboard, ResChallengeLeaderboard]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_challenge_leaderboard(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_muti_challenge_level(
+        self,
+        stream: "grpclib.server.Stream[ReqMutiChallengeLevel, ResMutiChallengeLevel]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_muti_challenge_level(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_multi_account_brief(
+        self, stream: "grpclib.server.Stream[ReqMultiAccountId, ResMultiAccountBrief]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_multi_account_brief(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_friend_list(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFriendList]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_friend_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_friend_apply_list(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFriendApplyList]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_friend_apply_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_apply_friend(
+        self, stream: "grpclib.server.Stream[ReqApplyFriend, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.apply_friend(request)
+        await stream.send_message(response)
+
+    async def __rpc_handle_friend_apply(
+        self, stream: "grpclib.server.Stream[ReqHandleFriendApply, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.handle_friend_apply(request)
+        await stream.send_message(response)
+
+    async def __rpc_remove_friend(
+        self, stream: "grpclib.server.Stream[ReqRemoveFriend, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.remove_friend(request)
+        await stream.send_message(response)
+
+    async def __rpc_search_account_by_id(
+        self,
+        stream: "grpclib.server.Stream[ReqSearchAccountById, ResSearchAccountById]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.search_account_by_id(request)
+        await stream.send_message(response)
+
+    async def __rpc_search_account_by_pattern(
+        self,
+        stream: "grpclib.server.Stream[ReqSearchAccountByPattern, ResSearchAccountByPattern]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.search_account_by_pattern(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_account_state(
+        self, stream: "grpclib.server.Stream[ReqAccountList, ResAccountStates]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_account_state(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_bag_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResBagInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_bag_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_use_bag_item(
+        self, stream: "grpclib.server.Stream[ReqUseBagItem, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.use_bag_item(request)
+        await stream.send_message(response)
+
+    async def __rpc_open_manual_item(
+        self, stream: "grpclib.server.Stream[ReqOpenManualItem, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.open_manual_item(request)
+        await stream.send_message(response)
+
+    async def __rpc_open_random_reward_item(
+        self,
+        stream: "grpclib.server.Stream[ReqOpenRandomRewardItem, ResOpenRandomRewardItem]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.open_random_reward_item(request)
+        await stream.send_message(response)
+
+    async def __rpc_open_all_reward_item(
+        self,
+        stream: "grpclib.server.Stream[ReqOpenAllRewardItem, ResOpenAllRewardItem]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.open_all_reward_item(request)
+        await stream.send_message(response)
+
+    async def __rpc_compose_shard(
+        self, stream: "grpclib.server.Stream[ReqComposeShard, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.compose_shard(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_announcement(
+        self, stream: "grpclib.server.Stream[ReqFetchAnnouncement, ResAnnouncement]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_announcement(request)
+        await stream.send_message(response)
+
+    async def __rpc_read_announcement(
+        self, stream: "grpclib.server.Stream[ReqReadAnnouncement, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.read_announcement(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_mail_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResMailInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_mail_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_read_mail(
+        self, stream: "grpclib.server.Stream[ReqReadMail, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.read_mail(request)
+        await stream.send_message(response)
+
+    async def __rpc_delete_mail(
+        self, stream: "grpclib.server.Stream[ReqDeleteMail, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.delete_mail(request)
+        await stream.send_message(response)
+
+    async def __rpc_take_attachment_from_mail(
+        self, stream: "grpclib.server.Stream[ReqTakeAttachment, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.take_attachment_from_mail(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_achievement_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveAchievementReward, ResReceiveAchievementReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_achievement_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_achievement_group_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveAchievementGroupReward, ResReceiveAchievementGroupReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_achievement_group_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_achievement_rate(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchAchievementRate]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_achievement_rate(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_achievement(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResAchievement]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_achievement(request)
+        await stream.send_message(response)
+
+    async def __rpc_buy_shi_lian(
+        self, stream: "grpclib.server.Stream[ReqBuyShiLian, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.buy_shi_lian(request)
+        await stream.send_message(response)
+
+    async def __rpc_match_shi_lian(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.match_shi_lian(request)
+        await stream.send_message(response)
+
+    async def __rpc_go_next_shi_lian(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.go_next_shi_lian(request)
+        await stream.send_message(response)
+
+    async def __rpc_update_client_value(
+        self, stream: "grpclib.server.Stream[ReqUpdateClientValue, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.update_client_value(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_client_value(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResClientValue]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_client_value(request)
+        await stream.send_message(response)
+
+    async def __rpc_client_message(
+        self, stream: "grpclib.server.Stream[ReqClientMessage, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.client_message(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_current_match_info(
+        self, stream: "grpclib.server.Stream[ReqCurrentMatchInfo, ResCurrentMatchInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_current_match_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_user_complain(
+        self, stream: "grpclib.server.Stream[ReqUserComplain, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.user_complain(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_revive_coin_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResReviveCoinInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_revive_coin_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_gain_revive_coin(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.gain_revive_coin(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_daily_task(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResDailyTask]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_daily_task(request)
+        await stream.send_message(response)
+
+    async def __rpc_refresh_daily_task(
+        self, stream: "grpclib.server.Stream[ReqRefreshDailyTask, ResRefreshDailyTask]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.refresh_daily_task(request)
+        await stream.send_message(response)
+
+    async def __rpc_use_gift_code(
+        self, stream: "grpclib.server.Stream[ReqUseGiftCode, ResUseGiftCode]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.use_gift_code(request)
+        await stream.send_message(response)
+
+    async def __rpc_use_special_gift_code(
+        self, stream: "grpclib.server.Stream[ReqUseGiftCode, ResUseSpecialGiftCode]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.use_special_gift_code(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_title_list(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResTitleList]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_title_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_use_title(
+        self, stream: "grpclib.server.Stream[ReqUseTitle, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.use_title(request)
+        await stream.send_message(response)
+
+    async def __rpc_send_client_message(
+        self, stream: "grpclib.server.Stream[ReqSendClientMessage, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.send_client_message(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_live_info(
+        self, stream: "grpclib.server.Stream[ReqGameLiveInfo, ResGameLiveInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_live_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_live_left_segment(
+        self,
+        stream: "grpclib.server.Stream[ReqGameLiveLeftSegment, ResGameLiveLeftSegment]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_live_left_segment(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_live_list(
+        self, stream: "grpclib.server.Stream[ReqGameLiveList, ResGameLiveList]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_live_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_comment_setting(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommentSetting]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_comment_setting(request)
+        await stream.send_message(response)
+
+    async def __rpc_update_comment_setting(
+        self, stream: "grpclib.server.Stream[ReqUpdateCommentSetting, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.update_comment_setting(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_comment_list(
+        self, stream: "grpclib.server.Stream[ReqFetchCommentList, ResFetchCommentList]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_comment_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_comment_content(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchCommentContent, ResFetchCommentContent]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_comment_content(request)
+        await stream.send_message(response)
+
+    async def __rpc_leave_comment(
+        self, stream: "grpclib.server.Stream[ReqLeaveComment, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.leave_comment(request)
+        await stream.send_message(response)
+
+    async def __rpc_delete_comment(
+        self, stream: "grpclib.server.Stream[ReqDeleteComment, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.delete_comment(request)
+        await stream.send_message(response)
+
+    async def __rpc_update_read_comment(
+        self, stream: "grpclib.server.Stream[ReqUpdateReadComment, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.update_read_comment(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_rolling_notice(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchRollingNotice, ResFetchRollingNotice]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_rolling_notice(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_maintain_notice(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchMaintainNotice]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_maintain_notice(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_server_time(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResServerTime]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_server_time(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_platform_products(
+        self,
+        stream: "grpclib.server.Stream[ReqPlatformBillingProducts, ResPlatformBillingProducts]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_platform_products(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_random_character(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResRandomCharacter]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_random_character(request)
+        await stream.send_message(response)
+
+    async def __rpc_set_random_character(
+        self, stream: "grpclib.server.Stream[ReqRandomCharacter, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.set_random_character(request)
+        await stream.send_message(response)
+
+    async def __rpc_cancel_google_play_order(
+        self, stream: "grpclib.server.Stream[ReqCancelGooglePlayOrder, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.cancel_google_play_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_open_chest(
+        self, stream: "grpclib.server.Stream[ReqOpenChest, ResOpenChest]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.open_chest(request)
+        await stream.send_message(response)
+
+    async def __rpc_buy_from_chest_shop(
+        self, stream: "grpclib.server.Stream[ReqBuyFromChestShop, ResBuyFromChestShop]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.buy_from_chest_shop(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_daily_sign_in_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResDailySignInInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_daily_sign_in_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_do_daily_sign_in(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.do_daily_sign_in(request)
+        await stream.send_message(response)
+
+    async def __rpc_do_activity_sign_in(
+        self, stream: "grpclib.server.Stream[ReqDoActivitySignIn, ResDoActivitySignIn]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.do_activity_sign_in(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_character_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCharacterInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_character_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_update_character_sort(
+        self, stream: "grpclib.server.Stream[ReqUpdateCharacterSort, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.update_character_sort(request)
+        await stream.send_message(response)
+
+    async def __rpc_change_main_character(
+        self, stream: "grpclib.server.Stream[ReqChangeMainCharacter, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.change_main_character(request)
+        await stream.send_message(response)
+
+    async def __rpc_change_character_skin(
+        self, stream: "grpclib.server.Stream[ReqChangeCharacterSkin, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.change_character_skin(request)
+        await stream.send_message(response)
+
+    async def __rpc_change_character_view(
+        self, stream: "grpclib.server.Stream[ReqChangeCharacterView, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.change_character_view(request)
+        await stream.send_message(response)
+
+    async def __rpc_set_hidden_character(
+        self,
+        stream: "grpclib.server.Stream[ReqSetHiddenCharacter, ResSetHiddenCharacter]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.set_hidden_character(request)
+        await stream.send_message(response)
+
+    async def __rpc_send_gift_to_character(
+        self,
+        stream: "grpclib.server.Stream[ReqSendGiftToCharacter, ResSendGiftToCharacter]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.send_gift_to_character(request)
+        await stream.send_message(response)
+
+    async def __rpc_sell_item(
+        self, stream: "grpclib.server.Stream[ReqSellItem, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.sell_item(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_common_view(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommonView]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_common_view(request)
+        await stream.send_message(response)
+
+    async def __rpc_change_common_view(
+        self, stream: "grpclib.server.Stream[ReqChangeCommonView, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.change_common_view(request)
+        await stream.send_message(response)
+
+    async def __rpc_save_common_views(
+        self, stream: "grpclib.server.Stream[ReqSaveCommonViews, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.save_common_views(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_common_views(
+        self, stream: "grpclib.server.Stream[ReqCommonViews, ResCommonViews]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_common_views(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_all_common_views(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResAllcommonViews]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_all_common_views(request)
+        await stream.send_message(response)
+
+    async def __rpc_use_common_view(
+        self, stream: "grpclib.server.Stream[ReqUseCommonView, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.use_common_view(request)
+        await stream.send_message(response)
+
+    async def __rpc_upgrade_character(
+        self, stream: "grpclib.server.Stream[ReqUpgradeCharacter, ResUpgradeCharacter]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.upgrade_character(request)
+        await stream.send_message(response)
+
+    async def __rpc_add_finished_ending(
+        self, stream: "grpclib.server.Stream[ReqFinishedEnding, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.add_finished_ending(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_ending_reward(
+        self, stream: "grpclib.server.Stream[ReqFinishedEnding, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_ending_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_game_master_command(
+        self, stream: "grpclib.server.Stream[ReqGmCommand, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.game_master_command(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_shop_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResShopInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_shop_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_buy_from_shop(
+        self, stream: "grpclib.server.Stream[ReqBuyFromShop, ResBuyFromShop]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.buy_from_shop(request)
+        await stream.send_message(response)
+
+    async def __rpc_buy_from_zhp(
+        self, stream: "grpclib.server.Stream[ReqBuyFromZhp, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.buy_from_zhp(request)
+        await stream.send_message(response)
+
+    async def __rpc_refresh_zhp_shop(
+        self, stream: "grpclib.server.Stream[ReqReshZhpShop, ResRefreshZhpShop]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.refresh_zhp_shop(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_month_ticket_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResMonthTicketInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_month_ticket_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_pay_month_ticket(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResPayMonthTicket]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.pay_month_ticket(request)
+        await stream.send_message(response)
+
+    async def __rpc_exchange_currency(
+        self, stream: "grpclib.server.Stream[ReqExchangeCurrency, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.exchange_currency(request)
+        await stream.send_message(response)
+
+    async def __rpc_exchange_chest_stone(
+        self, stream: "grpclib.server.Stream[ReqExchangeCurrency, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.exchange_chest_stone(request)
+        await stream.send_message(response)
+
+    async def __rpc_exchange_diamond(
+        self, stream: "grpclib.server.Stream[ReqExchangeCurrency, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.exchange_diamond(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_server_settings(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResServerSettings]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_server_settings(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_account_settings(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResAccountSettings]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_account_settings(request)
+        await stream.send_message(response)
+
+    async def __rpc_update_account_settings(
+        self, stream: "grpclib.server.Stream[ReqUpdateAccountSettings, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.update_account_settings(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_mod_nickname_time(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResModNicknameTime]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_mod_nickname_time(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_wechat_native_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateWechatNativeOrder, ResCreateWechatNativeOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_wechat_native_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_wechat_app_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateWechatAppOrder, ResCreateWechatAppOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_wechat_app_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_alipay_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateAlipayOrder, ResCreateAlipayOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_alipay_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_alipay_scan_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateAlipayScanOrder, ResCreateAlipayScanOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_alipay_scan_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_alipay_app_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateAlipayAppOrder, ResCreateAlipayAppOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_alipay_app_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_jp_credit_card_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateJpCreditCardOrder, ResCreateJpCreditCardOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_jp_credit_card_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_jp_paypal_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateJpPaypalOrder, ResCreateJpPaypalOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_jp_paypal_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_jp_au_order(
+        self, stream: "grpclib.server.Stream[ReqCreateJpAuOrder, ResCreateJpAuOrder]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_jp_au_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_jp_docomo_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateJpDocomoOrder, ResCreateJpDocomoOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_jp_docomo_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_jp_web_money_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateJpWebMoneyOrder, ResCreateJpWebMoneyOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_jp_web_money_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_jp_softbank_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateJpSoftbankOrder, ResCreateJpSoftbankOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_jp_softbank_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_jp_pay_pay_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateJpPayPayOrder, ResCreateJpPayPayOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_jp_pay_pay_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_jp_common_credit_card_order(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchJpCommonCreditCardOrder, ResFetchJpCommonCreditCardOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_jp_common_credit_card_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_jpgmo_order(
+        self, stream: "grpclib.server.Stream[ReqCreateJpgmoOrder, ResCreateJpgmoOrder]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_jpgmo_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_en_paypal_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateEnPaypalOrder, ResCreateEnPaypalOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_en_paypal_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_en_master_card_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateEnMasterCardOrder, ResCreateEnMasterCardOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_en_master_card_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_en_visa_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateEnVisaOrder, ResCreateEnVisaOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_en_visa_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_enjcb_order(
+        self, stream: "grpclib.server.Stream[ReqCreateEnjcbOrder, ResCreateEnjcbOrder]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_enjcb_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_en_alipay_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateEnAlipayOrder, ResCreateEnAlipayOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_en_alipay_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_kr_paypal_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateKrPaypalOrder, ResCreateKrPaypalOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_kr_paypal_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_kr_master_card_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateKrMasterCardOrder, ResCreateKrMasterCardOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_kr_master_card_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_kr_visa_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateKrVisaOrder, ResCreateKrVisaOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_kr_visa_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_krjcb_order(
+        self, stream: "grpclib.server.Stream[ReqCreateKrjcbOrder, ResCreateKrjcbOrder]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_krjcb_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_kr_alipay_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateKrAlipayOrder, ResCreateKrAlipayOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_kr_alipay_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_dmm_order(
+        self, stream: "grpclib.server.Stream[ReqCreateDmmOrder, ResCreateDmmOrder]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_dmm_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_iap_order(
+        self, stream: "grpclib.server.Stream[ReqCreateIapOrder, ResCreateIapOrder]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_iap_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_steam_order(
+        self, stream: "grpclib.server.Stream[ReqCreateSteamOrder, ResCreateSteamOrder]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_steam_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_verify_steam_order(
+        self, stream: "grpclib.server.Stream[ReqVerifySteamOrder, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.verify_steam_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_my_card_android_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateMyCardOrder, ResCreateMyCardOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_my_card_android_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_my_card_web_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateMyCardOrder, ResCreateMyCardOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_my_card_web_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_paypal_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreatePaypalOrder, ResCreatePaypalOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_paypal_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_xsolla_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateXsollaOrder, ResCreateXsollaOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_xsolla_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_verify_my_card_order(
+        self, stream: "grpclib.server.Stream[ReqVerifyMyCardOrder, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.verify_my_card_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_verification_iap_order(
+        self,
+        stream: "grpclib.server.Stream[ReqVerificationIapOrder, ResVerificationIapOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.verification_iap_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_yostar_sdk_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateYostarOrder, ResCreateYostarOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_yostar_sdk_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_billing_order(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateBillingOrder, ResCreateBillingOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_billing_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_solve_google_play_order(
+        self, stream: "grpclib.server.Stream[ReqSolveGooglePlayOrder, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.solve_google_play_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_solve_google_pay_order_v3(
+        self, stream: "grpclib.server.Stream[ReqSolveGooglePlayOrderV3, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.solve_google_pay_order_v3(request)
+        await stream.send_message(response)
+
+    async def __rpc_deliver_aa32_order(
+        self, stream: "grpclib.server.Stream[ReqDeliverAa32Order, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.deliver_aa32_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_misc(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResMisc]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_misc(request)
+        await stream.send_message(response)
+
+    async def __rpc_modify_signature(
+        self, stream: "grpclib.server.Stream[ReqModifySignature, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.modify_signature(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_id_card_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResIdCardInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_id_card_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_update_id_card_info(
+        self, stream: "grpclib.server.Stream[ReqUpdateIdCardInfo, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.update_id_card_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_vip_reward(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResVipReward]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_vip_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_gain_vip_reward(
+        self, stream: "grpclib.server.Stream[ReqGainVipReward, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.gain_vip_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_refund_order(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchRefundOrder]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_refund_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_customized_contest_list(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchCustomizedContestList, ResFetchCustomizedContestList]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_customized_contest_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_customized_contest_auth_info(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchCustomizedContestAuthInfo, ResFetchCustomizedContestAuthInfo]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_customized_contest_auth_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_enter_customized_contest(
+        self,
+        stream: "grpclib.server.Stream[ReqEnterCustomizedContest, ResEnterCustomizedContest]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.enter_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_leave_customized_contest(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.leave_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_customized_contest_online_info(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchCustomizedContestOnlineInfo, ResFetchCustomizedContestOnlineInfo]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_customized_contest_online_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_customized_contest_by_contest_id(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchCustomizedContestByContestId, ResFetchCustomizedContestByContestId]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_customized_contest_by_contest_id(request)
+        await stream.send_message(response)
+
+    async def __rpc_signup_customized_contest(
+        self,
+        stream: "grpclib.server.Stream[ReqSignupCustomizedContest, ResSignupCustomizedContest]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.signup_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_start_customized_contest(
+        self, stream: "grpclib.server.Stream[ReqStartCustomizedContest, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.start_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_stop_customized_contest(
+        self, stream: "grpclib.server.Stream[ReqStopCustomizedContest, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.stop_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_join_customized_contest_chat_room(
+        self,
+        stream: "grpclib.server.Stream[ReqJoinCustomizedContestChatRoom, ResJoinCustomizedContestChatRoom]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.join_customized_contest_chat_room(request)
+        await stream.send_message(response)
+
+    async def __rpc_leave_customized_contest_chat_room(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.leave_customized_contest_chat_room(request)
+        await stream.send_message(response)
+
+    async def __rpc_say_chat_message(
+        self, stream: "grpclib.server.Stream[ReqSayChatMessage, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.say_chat_message(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_customized_contest_game_records(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchCustomizedContestGameRecords, ResFetchCustomizedContestGameRecords]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_customized_contest_game_records(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_customized_contest_game_live_list(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchCustomizedContestGameLiveList, ResFetchCustomizedContestGameLiveList]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_customized_contest_game_live_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_follow_customized_contest(
+        self, stream: "grpclib.server.Stream[ReqTargetCustomizedContest, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.follow_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_unfollow_customized_contest(
+        self, stream: "grpclib.server.Stream[ReqTargetCustomizedContest, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.unfollow_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_activity_list(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResActivityList]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_activity_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_account_activity_data(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResAccountActivityData]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_account_activity_data(request)
+        await stream.send_message(response)
+
+    async def __rpc_exchange_activity_item(
+        self,
+        stream: "grpclib.server.Stream[ReqExchangeActivityItem, ResExchangeActivityItem]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.exchange_activity_item(request)
+        await stream.send_message(response)
+
+    async def __rpc_complete_activity_task(
+        self, stream: "grpclib.server.Stream[ReqCompleteActivityTask, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.complete_activity_task(request)
+        await stream.send_message(response)
+
+    async def __rpc_complete_activity_task_batch(
+        self, stream: "grpclib.server.Stream[ReqCompleteActivityTaskBatch, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.complete_activity_task_batch(request)
+        await stream.send_message(response)
+
+    async def __rpc_complete_activity_flip_task(
+        self, stream: "grpclib.server.Stream[ReqCompleteActivityTask, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.complete_activity_flip_task(request)
+        await stream.send_message(response)
+
+    async def __rpc_complete_period_activity_task(
+        self, stream: "grpclib.server.Stream[ReqCompleteActivityTask, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.complete_period_activity_task(request)
+        await stream.send_message(response)
+
+    async def __rpc_complete_period_activity_task_batch(
+        self,
+        stream: "grpclib.server.Stream[ReqCompletePeriodActivityTaskBatch, ResCommon]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.complete_period_activity_task_batch(request)
+        await stream.send_message(response)
+
+    async def __rpc_complete_random_activity_task(
+        self, stream: "grpclib.server.Stream[ReqCompleteActivityTask, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.complete_random_activity_task(request)
+        await stream.send_message(response)
+
+    async def __rpc_complete_random_activity_task_batch(
+        self, stream: "grpclib.server.Stream[ReqCompleteActivityTaskBatch, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.complete_random_activity_task_batch(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_activity_flip_task(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveActivityFlipTask, ResReceiveActivityFlipTask]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_activity_flip_task(request)
+        await stream.send_message(response)
+
+    async def __rpc_complete_segment_task_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqCompleteSegmentTaskReward, ResCompleteSegmentTaskReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.complete_segment_task_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_activity_flip_info(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchActivityFlipInfo, ResFetchActivityFlipInfo]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_activity_flip_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_gain_accumulated_point_activity_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqGainAccumulatedPointActivityReward, ResCommon]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.gain_accumulated_point_activity_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_gain_multi_point_activity_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqGainMultiPointActivityReward, ResCommon]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.gain_multi_point_activity_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_rank_point_leaderboard(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchRankPointLeaderboard, ResFetchRankPointLeaderboard]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_rank_point_leaderboard(request)
+        await stream.send_message(response)
+
+    async def __rpc_gain_rank_point_reward(
+        self, stream: "grpclib.server.Stream[ReqGainRankPointReward, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.gain_rank_point_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_richman_activity_next_move(
+        self, stream: "grpclib.server.Stream[ReqRichmanNextMove, ResRichmanNextMove]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.richman_activity_next_move(request)
+        await stream.send_message(response)
+
+    async def __rpc_richman_acitivity_special_move(
+        self, stream: "grpclib.server.Stream[ReqRichmanSpecialMove, ResRichmanNextMove]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.richman_acitivity_special_move(request)
+        await stream.send_message(response)
+
+    async def __rpc_richman_activity_chest_info(
+        self, stream: "grpclib.server.Stream[ReqRichmanChestInfo, ResRichmanChestInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.richman_activity_chest_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_game_observe_auth(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateGameObserveAuth, ResCreateGameObserveAuth]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_game_observe_auth(request)
+        await stream.send_message(response)
+
+    async def __rpc_refresh_game_observe_auth(
+        self,
+        stream: "grpclib.server.Stream[ReqRefreshGameObserveAuth, ResRefreshGameObserveAuth]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.refresh_game_observe_auth(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_activity_buff(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResActivityBuff]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_activity_buff(request)
+        await stream.send_message(response)
+
+    async def __rpc_upgrade_activity_buff(
+        self, stream: "grpclib.server.Stream[ReqUpgradeActivityBuff, ResActivityBuff]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.upgrade_activity_buff(request)
+        await stream.send_message(response)
+
+    async def __rpc_upgrade_activity_level(
+        self,
+        stream: "grpclib.server.Stream[ReqUpgradeActivityLevel, ResUpgradeActivityLevel]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.upgrade_activity_level(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_upgrade_activity_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveUpgradeActivityReward, ResReceiveUpgradeActivityReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_upgrade_activity_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_upgrade_challenge(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResUpgradeChallenge]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.upgrade_challenge(request)
+        await stream.send_message(response)
+
+    async def __rpc_refresh_challenge(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResRefreshChallenge]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.refresh_challenge(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_challenge_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchChallengeInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_challenge_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_force_complete_challenge_task(
+        self, stream: "grpclib.server.Stream[ReqForceCompleteChallengeTask, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.force_complete_challenge_task(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_challenge_season(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResChallengeSeasonInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_challenge_season(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_challenge_rank_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveChallengeRankReward, ResReceiveChallengeRankReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_challenge_rank_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_ab_match_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchAbMatch]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_ab_match_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_buy_in_ab_match(
+        self, stream: "grpclib.server.Stream[ReqBuyInAbMatch, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.buy_in_ab_match(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_ab_match_reward(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_ab_match_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_quit_ab_match(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.quit_ab_match(request)
+        await stream.send_message(response)
+
+    async def __rpc_start_unified_match(
+        self, stream: "grpclib.server.Stream[ReqStartUnifiedMatch, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.start_unified_match(request)
+        await stream.send_message(response)
+
+    async def __rpc_cancel_unified_match(
+        self, stream: "grpclib.server.Stream[ReqCancelUnifiedMatch, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.cancel_unified_match(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_point_rank(
+        self, stream: "grpclib.server.Stream[ReqGamePointRank, ResGamePointRank]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_point_rank(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_self_game_point_rank(
+        self,
+        stream: "grpclib.server.Stream[ReqGamePointRank, ResFetchSelfGamePointRank]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_self_game_point_rank(request)
+        await stream.send_message(response)
+
+    async def __rpc_read_sns(
+        self, stream: "grpclib.server.Stream[ReqReadSns, ResReadSns]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.read_sns(request)
+        await stream.send_message(response)
+
+    async def __rpc_reply_sns(
+        self, stream: "grpclib.server.Stream[ReqReplySns, ResReplySns]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.reply_sns(request)
+        await stream.send_message(response)
+
+    async def __rpc_like_sns(
+        self, stream: "grpclib.server.Stream[ReqLikeSns, ResLikeSns]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.like_sns(request)
+        await stream.send_message(response)
+
+    async def __rpc_dig_mine(
+        self, stream: "grpclib.server.Stream[ReqDigMine, ResDigMine]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.dig_mine(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_last_privacy(
+        self, stream: "grpclib.server.Stream[ReqFetchLastPrivacy, ResFetchLastPrivacy]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_last_privacy(request)
+        await stream.send_message(response)
+
+    async def __rpc_check_privacy(
+        self, stream: "grpclib.server.Stream[ReqCheckPrivacy, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.check_privacy(request)
+        await stream.send_message(response)
+
+    async def __rpc_response_captcha(
+        self, stream: "grpclib.server.Stream[ReqResponseCaptcha, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.response_captcha(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_rpg_battle_history(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchRpgBattleHistory, ResFetchRpgBattleHistory]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_rpg_battle_history(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_rpg_battle_history_v2(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchRpgBattleHistory, ResFetchRpgBattleHistoryV2]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_rpg_battle_history_v2(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_rpg_rewards(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveRpgRewards, ResReceiveRpgRewards]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_rpg_rewards(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_rpg_reward(
+        self, stream: "grpclib.server.Stream[ReqReceiveRpgReward, ResReceiveRpgRewards]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_rpg_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_buy_arena_ticket(
+        self, stream: "grpclib.server.Stream[ReqBuyArenaTicket, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.buy_arena_ticket(request)
+        await stream.send_message(response)
+
+    async def __rpc_enter_arena(
+        self, stream: "grpclib.server.Stream[ReqEnterArena, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.enter_arena(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_arena_reward(
+        self, stream: "grpclib.server.Stream[ReqArenaReward, ResArenaReward]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_arena_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_ob_token(
+        self, stream: "grpclib.server.Stream[ReqFetchObToken, ResFetchObToken]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_ob_token(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_character_rewards(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveCharacterRewards, ResReceiveCharacterRewards]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_character_rewards(request)
+        await stream.send_message(response)
+
+    async def __rpc_feed_activity_feed(
+        self, stream: "grpclib.server.Stream[ReqFeedActivityFeed, ResFeedActivityFeed]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.feed_activity_feed(request)
+        await stream.send_message(response)
+
+    async def __rpc_send_activity_gift_to_friend(
+        self,
+        stream: "grpclib.server.Stream[ReqSendActivityGiftToFriend, ResSendActivityGiftToFriend]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.send_activity_gift_to_friend(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_activity_gift(
+        self, stream: "grpclib.server.Stream[ReqReceiveActivityGift, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_activity_gift(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_all_activity_gift(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveAllActivityGift, ResReceiveAllActivityGift]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_all_activity_gift(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_friend_gift_activity_data(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchFriendGiftActivityData, ResFetchFriendGiftActivityData]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_friend_gift_activity_data(request)
+        await stream.send_message(response)
+
+    async def __rpc_open_pre_chest_item(
+        self, stream: "grpclib.server.Stream[ReqOpenPreChestItem, ResOpenPreChestItem]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.open_pre_chest_item(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_vote_activity(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchVoteActivity, ResFetchVoteActivity]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_vote_activity(request)
+        await stream.send_message(response)
+
+    async def __rpc_vote_activity(
+        self, stream: "grpclib.server.Stream[ReqVoteActivity, ResVoteActivity]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.vote_activity(request)
+        await stream.send_message(response)
+
+    async def __rpc_unlock_activity_spot(
+        self, stream: "grpclib.server.Stream[ReqUnlockActivitySpot, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.unlock_activity_spot(request)
+        await stream.send_message(response)
+
+    async def __rpc_unlock_activity_spot_ending(
+        self, stream: "grpclib.server.Stream[ReqUnlockActivitySpotEnding, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.unlock_activity_spot_ending(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_activity_spot_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveActivitySpotReward, ResReceiveActivitySpotReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_activity_spot_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_delete_account(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResDeleteAccount]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.delete_account(request)
+        await stream.send_message(response)
+
+    async def __rpc_cancel_delete_account(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.cancel_delete_account(request)
+        await stream.send_message(response)
+
+    async def __rpc_log_report(
+        self, stream: "grpclib.server.Stream[ReqLogReport, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.log_report(request)
+        await stream.send_message(response)
+
+    async def __rpc_bind_oauth2(
+        self, stream: "grpclib.server.Stream[ReqBindOauth2, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.bind_oauth2(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_oauth2_info(
+        self, stream: "grpclib.server.Stream[ReqFetchOauth2, ResFetchOauth2]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_oauth2_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_set_loading_image(
+        self, stream: "grpclib.server.Stream[ReqSetLoadingImage, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.set_loading_image(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_shop_interval(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchShopInterval]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_shop_interval(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_activity_interval(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchActivityInterval]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_activity_interval(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_recent_friend(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResFetchrecentFriend]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_recent_friend(request)
+        await stream.send_message(response)
+
+    async def __rpc_open_gacha(
+        self, stream: "grpclib.server.Stream[ReqOpenGacha, ResOpenGacha]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.open_gacha(request)
+        await stream.send_message(response)
+
+    async def __rpc_task_request(
+        self, stream: "grpclib.server.Stream[ReqTaskRequest, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.task_request(request)
+        await stream.send_message(response)
+
+    async def __rpc_simulation_activity_train(
+        self,
+        stream: "grpclib.server.Stream[ReqSimulationActivityTrain, ResSimulationActivityTrain]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.simulation_activity_train(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_simulation_game_record(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchSimulationGameRecord, ResFetchSimulationGameRecord]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_simulation_game_record(request)
+        await stream.send_message(response)
+
+    async def __rpc_start_simulation_activity_game(
+        self,
+        stream: "grpclib.server.Stream[ReqStartSimulationActivityGame, ResStartSimulationActivityGame]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.start_simulation_activity_game(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_simulation_game_rank(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchSimulationGameRank, ResFetchSimulationGameRank]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_simulation_game_rank(request)
+        await stream.send_message(response)
+
+    async def __rpc_generate_combining_craft(
+        self,
+        stream: "grpclib.server.Stream[ReqGenerateCombiningCraft, ResGenerateCombiningCraft]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.generate_combining_craft(request)
+        await stream.send_message(response)
+
+    async def __rpc_move_combining_craft(
+        self,
+        stream: "grpclib.server.Stream[ReqMoveCombiningCraft, ResMoveCombiningCraft]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.move_combining_craft(request)
+        await stream.send_message(response)
+
+    async def __rpc_combining_recycle_craft(
+        self,
+        stream: "grpclib.server.Stream[ReqCombiningRecycleCraft, ResCombiningRecycleCraft]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.combining_recycle_craft(request)
+        await stream.send_message(response)
+
+    async def __rpc_recover_combining_recycle(
+        self,
+        stream: "grpclib.server.Stream[ReqRecoverCombiningRecycle, ResRecoverCombiningRecycle]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.recover_combining_recycle(request)
+        await stream.send_message(response)
+
+    async def __rpc_finish_combining_order(
+        self,
+        stream: "grpclib.server.Stream[ReqFinishCombiningOrder, ResFinishCombiningOrder]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.finish_combining_order(request)
+        await stream.send_message(response)
+
+    async def __rpc_upgrade_village_building(
+        self, stream: "grpclib.server.Stream[ReqUpgradeVillageBuilding, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.upgrade_village_building(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_village_building_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveVillageBuildingReward, ResReceiveVillageBuildingReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_village_building_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_start_village_trip(
+        self, stream: "grpclib.server.Stream[ReqStartVillageTrip, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.start_village_trip(request)
+        await stream.send_message(response)
+
+    async def __rpc_receive_village_trip_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqReceiveVillageTripReward, ResReceiveVillageTripReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.receive_village_trip_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_complete_village_task(
+        self,
+        stream: "grpclib.server.Stream[ReqCompleteVillageTask, ResCompleteVillageTask]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.complete_village_task(request)
+        await stream.send_message(response)
+
+    async def __rpc_get_friend_village_data(
+        self,
+        stream: "grpclib.server.Stream[ReqGetFriendVillageData, ResGetFriendVillageData]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.get_friend_village_data(request)
+        await stream.send_message(response)
+
+    async def __rpc_set_village_worker(
+        self, stream: "grpclib.server.Stream[ReqSetVillageWorker, ResSetVillageWorker]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.set_village_worker(request)
+        await stream.send_message(response)
+
+    async def __rpc_next_round_village(
+        self, stream: "grpclib.server.Stream[ReqNextRoundVillage, ResNextRoundVillage]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.next_round_village(request)
+        await stream.send_message(response)
+
+    async def __rpc_resolve_festival_activity_proposal(
+        self,
+        stream: "grpclib.server.Stream[ReqResolveFestivalActivityProposal, ResResolveFestivalActivityProposal]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.resolve_festival_activity_proposal(request)
+        await stream.send_message(response)
+
+    async def __rpc_resolve_festival_activity_event(
+        self,
+        stream: "grpclib.server.Stream[ReqResolveFestivalActivityEvent, ResResolveFestivalActivityEvent]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.resolve_festival_activity_event(request)
+        await stream.send_message(response)
+
+    async def __rpc_buy_festival_proposal(
+        self,
+        stream: "grpclib.server.Stream[ReqBuyFestivalProposal, ResBuyFestivalProposal]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.buy_festival_proposal(request)
+        await stream.send_message(response)
+
+    async def __rpc_island_activity_move(
+        self, stream: "grpclib.server.Stream[ReqIslandActivityMove, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.island_activity_move(request)
+        await stream.send_message(response)
+
+    async def __rpc_island_activity_buy(
+        self, stream: "grpclib.server.Stream[ReqIslandActivityBuy, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.island_activity_buy(request)
+        await stream.send_message(response)
+
+    async def __rpc_island_activity_sell(
+        self, stream: "grpclib.server.Stream[ReqIslandActivitySell, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.island_activity_sell(request)
+        await stream.send_message(response)
+
+    async def __rpc_island_activity_tidy_bag(
+        self, stream: "grpclib.server.Stream[ReqIslandActivityTidyBag, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.island_activity_tidy_bag(request)
+        await stream.send_message(response)
+
+    async def __rpc_island_activity_unlock_bag_grid(
+        self, stream: "grpclib.server.Stream[ReqIslandActivityUnlockBagGrid, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.island_activity_unlock_bag_grid(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_customized_contest(
+        self,
+        stream: "grpclib.server.Stream[ReqCreateCustomizedContest, ResCreateCustomizedContest]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_manager_customized_contest_list(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchmanagerCustomizedContestList, ResFetchManagerCustomizedContestList]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_manager_customized_contest_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_manager_customized_contest(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchManagerCustomizedContest, ResFetchManagerCustomizedContest]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_manager_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_update_manager_customized_contest(
+        self,
+        stream: "grpclib.server.Stream[ReqUpdateManagerCustomizedContest, ResCommon]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.update_manager_customized_contest(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_contest_player_rank(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchContestPlayerRank, ResFetchContestPlayerRank]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_contest_player_rank(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_ready_player_list(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchReadyPlayerList, ResFetchReadyPlayerList]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_ready_player_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_create_game_plan(
+        self, stream: "grpclib.server.Stream[ReqCreateGamePlan, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.create_game_plan(request)
+        await stream.send_message(response)
+
+    async def __rpc_generate_contest_manager_login_code(
+        self,
+        stream: "grpclib.server.Stream[ReqCommon, ResGenerateContestManagerLoginCode]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.generate_contest_manager_login_code(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_start_game(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivityStartGame, ResAmuletActivityStartGame]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_start_game(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_operate(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivityOperate, ResAmuletActivityOperate]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_operate(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_change_hands(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivityChangeHands, ResAmuletActivityChangeHands]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_change_hands(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_upgrade(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivityUpgrade, ResAmuletActivityUpgrade]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_upgrade(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_buy(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivityBuy, ResAmuletActivityBuy]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_buy(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_select_pack(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivitySelectPack, ResAmuletActivitySelectPack]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_select_pack(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_sell_effect(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivitySellEffect, ResAmuletActivitySellEffect]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_sell_effect(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_effect_sort(
+        self, stream: "grpclib.server.Stream[ReqAmuletActivityEffectSort, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_effect_sort(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_giveup(
+        self, stream: "grpclib.server.Stream[ReqAmuletActivityGiveup, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_giveup(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_refresh_shop(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivityRefreshShop, ResAmuletActivityRefreshShop]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_refresh_shop(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_select_free_effect(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivitySelectFreeEffect, ResAmuletActivitySelectFreeEffect]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_select_free_effect(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_upgrade_shop_buff(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivityUpgradeShopBuff, ResAmuletActivityUpgradeShopBuff]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_upgrade_shop_buff(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_end_shopping(
+        self,
+        stream: "grpclib.server.Stream[ReqAmuletActivityEndShopping, ResAmuletActivityEndShopping]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_end_shopping(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_set_skill_level(
+        self, stream: "grpclib.server.Stream[ReqAmuletActivitySetSkillLevel, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_set_skill_level(request)
+        await stream.send_message(response)
+
+    async def __rpc_amulet_activity_maintain_info(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResAmuletActivityMaintainInfo]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.amulet_activity_maintain_info(request)
+        await stream.send_message(response)
+
+    async def __rpc_story_activity_unlock(
+        self, stream: "grpclib.server.Stream[ReqStoryActivityUnlock, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.story_activity_unlock(request)
+        await stream.send_message(response)
+
+    async def __rpc_story_activity_unlock_ending(
+        self, stream: "grpclib.server.Stream[ReqStoryActivityUnlockEnding, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.story_activity_unlock_ending(request)
+        await stream.send_message(response)
+
+    async def __rpc_story_activity_receive_ending_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqStoryActivityReceiveEndingReward, ResStoryReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.story_activity_receive_ending_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_story_activity_receive_finish_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqStoryActivityReceiveFinishReward, ResStoryReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.story_activity_receive_finish_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_story_activity_receive_all_finish_reward(
+        self,
+        stream: "grpclib.server.Stream[ReqStoryActivityReceiveAllFinishReward, ResStoryReward]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.story_activity_receive_all_finish_reward(request)
+        await stream.send_message(response)
+
+    async def __rpc_story_activity_unlock_ending_and_receive(
+        self,
+        stream: "grpclib.server.Stream[ReqStoryActivityUnlockEndingAndReceive, ResStoryActivityUnlockEndingAndReceive]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.story_activity_unlock_ending_and_receive(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_activity_rank(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchActivityRank, ResFetchActivityRank]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_activity_rank(request)
+        await stream.send_message(response)
+
+    async def __rpc_set_verified_hidden(
+        self, stream: "grpclib.server.Stream[ReqSetVerifiedHidden, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.set_verified_hidden(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_questionnaire_list(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchQuestionnaireList, ResFetchQuestionnaireList]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_questionnaire_list(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_questionnaire_detail(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchQuestionnaireDetail, ResFetchQuestionnaireDetail]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_questionnaire_detail(request)
+        await stream.send_message(response)
+
+    async def __rpc_submit_questionnaire(
+        self, stream: "grpclib.server.Stream[ReqSubmitQuestionnaire, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.submit_questionnaire(request)
+        await stream.send_message(response)
+
+    async def __rpc_set_friend_room_random_bot_char(
+        self, stream: "grpclib.server.Stream[ReqSetFriendRoomRandomBotChar, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.set_friend_room_random_bot_char(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_account_game_hu_records(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchAccountGameHuRecords, ResFetchAccountGameHuRecords]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_account_game_hu_records(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_account_info_extra(
+        self,
+        stream: "grpclib.server.Stream[ReqFetchAccountInfoExtra, ResFetchAccountInfoExtra]",
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_account_info_extra(request)
+        await stream.send_message(response)
+
+    async def __rpc_set_account_favorite_hu(
+        self, stream: "grpclib.server.Stream[ReqSetAccountFavoriteHu, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.set_account_favorite_hu(request)
+        await stream.send_message(response)
+
+    def __mapping__(self) -> Dict[str, grpclib.const.Handler]:
+        return {
+            "/lq.Lobby/fetchConnectionInfo": grpclib.const.Handler(
+                self.__rpc_fetch_connection_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResConnectionInfo,
+            ),
+            "/lq.Lobby/fetchQueueInfo": grpclib.const.Handler(
+                self.__rpc_fetch_queue_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchQueueInfo,
+            ),
+            "/lq.Lobby/cancelQueue": grpclib.const.Handler(
+                self.__rpc_cancel_queue,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/openidCheck": grpclib.const.Handler(
+                self.__rpc_openid_check,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOpenidCheck,
+                ResOauth2Check,
+            ),
+            "/lq.Lobby/signup": grpclib.const.Handler(
+                self.__rpc_signup,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSignupAccount,
+                ResSignupAccount,
+            ),
+            "/lq.Lobby/login": grpclib.const.Handler(
+                self.__rpc_login,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqLogin,
+                ResLogin,
+            ),
+            "/lq.Lobby/fetchInfo": grpclib.const.Handler(
+                self.__rpc_fetch_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchInfo,
+            ),
+            "/lq.Lobby/loginSuccess": grpclib.const.Handler(
+                self.__rpc_login_success,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchServerMaintenanceInfo": grpclib.const.Handler(
+                self.__rpc_fetch_server_maintenance_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchServerMaintenanceInfo,
+            ),
+            "/lq.Lobby/emailLogin": grpclib.const.Handler(
+                self.__rpc_email_login,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqEmailLogin,
+                ResLogin,
+            ),
+            "/lq.Lobby/oauth2Auth": grpclib.const.Handler(
+                self.__rpc_oauth2_auth,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOauth2Auth,
+                ResOauth2Auth,
+            ),
+            "/lq.Lobby/oauth2Check": grpclib.const.Handler(
+                self.__rpc_oauth2_check,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOauth2Check,
+                ResOauth2Check,
+            ),
+            "/lq.Lobby/oauth2Signup": grpclib.const.Handler(
+                self.__rpc_oauth2_signup,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOauth2Signup,
+                ResOauth2Signup,
+            ),
+            "/lq.Lobby/oauth2Login": grpclib.const.Handler(
+                self.__rpc_oauth2_login,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOauth2Login,
+                ResLogin,
+            ),
+            "/lq.Lobby/dmmPreLogin": grpclib.const.Handler(
+                self.__rpc_dmm_pre_login,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqDmmPreLogin,
+                ResDmmPreLogin,
+            ),
+            "/lq.Lobby/createPhoneVerifyCode": grpclib.const.Handler(
+                self.__rpc_create_phone_verify_code,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreatePhoneVerifyCode,
+                ResCommon,
+            ),
+            "/lq.Lobby/createEmailVerifyCode": grpclib.const.Handler(
+                self.__rpc_create_email_verify_code,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateEmailVerifyCode,
+                ResCommon,
+            ),
+            "/lq.Lobby/verfifyCodeForSecure": grpclib.const.Handler(
+                self.__rpc_verfify_code_for_secure,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqVerifyCodeForSecure,
+                ResVerfiyCodeForSecure,
+            ),
+            "/lq.Lobby/bindPhoneNumber": grpclib.const.Handler(
+                self.__rpc_bind_phone_number,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBindPhoneNumber,
+                ResCommon,
+            ),
+            "/lq.Lobby/unbindPhoneNumber": grpclib.const.Handler(
+                self.__rpc_unbind_phone_number,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUnbindPhoneNumber,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchPhoneLoginBind": grpclib.const.Handler(
+                self.__rpc_fetch_phone_login_bind,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchPhoneLoginBind,
+            ),
+            "/lq.Lobby/createPhoneLoginBind": grpclib.const.Handler(
+                self.__rpc_create_phone_login_bind,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreatePhoneLoginBind,
+                ResCommon,
+            ),
+            "/lq.Lobby/bindEmail": grpclib.const.Handler(
+                self.__rpc_bind_email,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBindEmail,
+                ResCommon,
+            ),
+            "/lq.Lobby/modifyPassword": grpclib.const.Handler(
+                self.__rpc_modify_password,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqModifyPassword,
+                ResCommon,
+            ),
+            "/lq.Lobby/bindAccount": grpclib.const.Handler(
+                self.__rpc_bind_account,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBindAccount,
+                ResCommon,
+            ),
+            "/lq.Lobby/logout": grpclib.const.Handler(
+                self.__rpc_logout,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqLogout,
+                ResLogout,
+            ),
+            "/lq.Lobby/heatbeat": grpclib.const.Handler(
+                self.__rpc_heatbeat,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqHeatBeat,
+                ResCommon,
+            ),
+            "/lq.Lobby/loginBeat": grpclib.const.Handler(
+                self.__rpc_login_beat,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqLoginBeat,
+                ResCommon,
+            ),
+            "/lq.Lobby/createNickname": grpclib.const.Handler(
+                self.__rpc_create_nickname,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateNickname,
+                ResCommon,
+            ),
+            "/lq.Lobby/modifyNickname": grpclib.const.Handler(
+                self.__rpc_modify_nickname,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqModifyNickname,
+                ResCommon,
+            ),
+            "/lq.Lobby/modifyBirthday": grpclib.const.Handler(
+                self.__rpc_modify_birthday,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqModifyBirthday,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchRoom": grpclib.const.Handler(
+                self.__rpc_fetch_room,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResSelfRoom,
+            ),
+            "/lq.Lobby/fetchGamingInfo": grpclib.const.Handler(
+                self.__rpc_fetch_gaming_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchGamingInfo,
+            ),
+            "/lq.Lobby/createRoom": grpclib.const.Handler(
+                self.__rpc_create_room,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateRoom,
+                ResCreateRoom,
+            ),
+            "/lq.Lobby/joinRoom": grpclib.const.Handler(
+                self.__rpc_join_room,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqJoinRoom,
+                ResJoinRoom,
+            ),
+            "/lq.Lobby/leaveRoom": grpclib.const.Handler(
+                self.__rpc_leave_room,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/readyPlay": grpclib.const.Handler(
+                self.__rpc_ready_play,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRoomReady,
+                ResCommon,
+            ),
+            "/lq.Lobby/dressingStatus": grpclib.const.Handler(
+                self.__rpc_dressing_status,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRoomDressing,
+                ResCommon,
+            ),
+            "/lq.Lobby/startRoom": grpclib.const.Handler(
+                self.__rpc_start_room,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRoomStart,
+                ResCommon,
+            ),
+            "/lq.Lobby/roomKickPlayer": grpclib.const.Handler(
+                self.__rpc_room_kick_player,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRoomKickPlayer,
+                ResCommon,
+            ),
+            "/lq.Lobby/modifyRoom": grpclib.const.Handler(
+                self.__rpc_modify_room,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqModifyRoom,
+                ResCommon,
+            ),
+            "/lq.Lobby/addRoomRobot": grpclib.const.Handler(
+                self.__rpc_add_room_robot,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAddRoomRobot,
+                ResCommon,
+            ),
+            "/lq.Lobby/matchGame": grpclib.const.Handler(
+                self.__rpc_match_game,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqJoinMatchQueue,
+                ResCommon,
+            ),
+            "/lq.Lobby/cancelMatch": grpclib.const.Handler(
+                self.__rpc_cancel_match,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCancelMatchQueue,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchAccountInfo": grpclib.const.Handler(
+                self.__rpc_fetch_account_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAccountInfo,
+                ResAccountInfo,
+            ),
+            "/lq.Lobby/changeAvatar": grpclib.const.Handler(
+                self.__rpc_change_avatar,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqChangeAvatar,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveVersionReward": grpclib.const.Handler(
+                self.__rpc_receive_version_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchAccountStatisticInfo": grpclib.const.Handler(
+                self.__rpc_fetch_account_statistic_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAccountStatisticInfo,
+                ResAccountStatisticInfo,
+            ),
+            "/lq.Lobby/fetchAccountChallengeRankInfo": grpclib.const.Handler(
+                self.__rpc_fetch_account_challenge_rank_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAccountInfo,
+                ResAccountChallengeRankInfo,
+            ),
+            "/lq.Lobby/fetchAccountCharacterInfo": grpclib.const.Handler(
+                self.__rpc_fetch_account_character_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResAccountCharacterInfo,
+            ),
+            "/lq.Lobby/shopPurchase": grpclib.const.Handler(
+                self.__rpc_shop_purchase,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqShopPurchase,
+                ResShopPurchase,
+            ),
+            "/lq.Lobby/fetchGameRecord": grpclib.const.Handler(
+                self.__rpc_fetch_game_record,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGameRecord,
+                ResGameRecord,
+            ),
+            "/lq.Lobby/readGameRecord": grpclib.const.Handler(
+                self.__rpc_read_game_record,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGameRecord,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchGameRecordList": grpclib.const.Handler(
+                self.__rpc_fetch_game_record_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGameRecordList,
+                ResGameRecordList,
+            ),
+            "/lq.Lobby/fetchGameRecordListV2": grpclib.const.Handler(
+                self.__rpc_fetch_game_record_list_v2,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGameRecordListV2,
+                ResGameRecordListV2,
+            ),
+            "/lq.Lobby/fetchNextGameRecordList": grpclib.const.Handler(
+                self.__rpc_fetch_next_game_record_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqNextGameRecordList,
+                ResNextGameRecordList,
+            ),
+            "/lq.Lobby/fetchCollectedGameRecordList": grpclib.const.Handler(
+                self.__rpc_fetch_collected_game_record_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCollectedGameRecordList,
+            ),
+            "/lq.Lobby/fetchGameRecordsDetail": grpclib.const.Handler(
+                self.__rpc_fetch_game_records_detail,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGameRecordsDetail,
+                ResGameRecordsDetail,
+            ),
+            "/lq.Lobby/fetchGameRecordsDetailV2": grpclib.const.Handler(
+                self.__rpc_fetch_game_records_detail_v2,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGameRecordsDetailV2,
+                ResGameRecordsDetailV2,
+            ),
+            "/lq.Lobby/addCollectedGameRecord": grpclib.const.Handler(
+                self.__rpc_add_collected_game_record,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAddCollectedGameRecord,
+                ResAddCollectedGameRecord,
+            ),
+            "/lq.Lobby/removeCollectedGameRecord": grpclib.const.Handler(
+                self.__rpc_remove_collected_game_record,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRemoveCollectedGameRecord,
+                ResRemoveCollectedGameRecord,
+            ),
+            "/lq.Lobby/changeCollectedGameRecordRemarks": grpclib.const.Handler(
+                self.__rpc_change_collected_game_record_remarks,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqChangeCollectedGameRecordRemarks,
+                ResChangeCollectedGameRecordRemarks,
+            ),
+            "/lq.Lobby/fetchLevelLeaderboard": grpclib.const.Handler(
+                self.__rpc_fetch_level_leaderboard,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqLevelLeaderboard,
+                ResLevelLeaderboard,
+            ),
+            "/lq.Lobby/fetchChallengeLeaderboard": grpclib.const.Handler(
+                self.__rpc_fetch_challenge_leaderboard,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqChallangeLeaderboard,
+                ResChallengeLeaderboard,
+            ),
+            "/lq.Lobby/fetchMutiChallengeLevel": grpclib.const.Handler(
+                self.__rpc_fetch_muti_challenge_level,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqMutiChallengeLevel,
+                ResMutiChallengeLevel,
+            ),
+            "/lq.Lobby/fetchMultiAccountBrief": grpclib.const.Handler(
+                self.__rpc_fetch_multi_account_brief,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqMultiAccountId,
+                ResMultiAccountBrief,
+            ),
+            "/lq.Lobby/fetchFriendList": grpclib.const.Handler(
+                self.__rpc_fetch_friend_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFriendList,
+            ),
+            "/lq.Lobby/fetchFriendApplyList": grpclib.const.Handler(
+                self.__rpc_fetch_friend_apply_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFriendApplyList,
+            ),
+            "/lq.Lobby/applyFriend": grpclib.const.Handler(
+                self.__rpc_apply_friend,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqApplyFriend,
+                ResCommon,
+            ),
+            "/lq.Lobby/handleFriendApply": grpclib.const.Handler(
+                self.__rpc_handle_friend_apply,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqHandleFriendApply,
+                ResCommon,
+            ),
+            "/lq.Lobby/removeFriend": grpclib.const.Handler(
+                self.__rpc_remove_friend,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRemoveFriend,
+                ResCommon,
+            ),
+            "/lq.Lobby/searchAccountById": grpclib.const.Handler(
+                self.__rpc_search_account_by_id,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSearchAccountById,
+                ResSearchAccountById,
+            ),
+            "/lq.Lobby/searchAccountByPattern": grpclib.const.Handler(
+                self.__rpc_search_account_by_pattern,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSearchAccountByPattern,
+                ResSearchAccountByPattern,
+            ),
+            "/lq.Lobby/fetchAccountState": grpclib.const.Handler(
+                self.__rpc_fetch_account_state,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAccountList,
+                ResAccountStates,
+            ),
+            "/lq.Lobby/fetchBagInfo": grpclib.const.Handler(
+                self.__rpc_fetch_bag_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResBagInfo,
+            ),
+            "/lq.Lobby/useBagItem": grpclib.const.Handler(
+                self.__rpc_use_bag_item,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUseBagItem,
+                ResCommon,
+            ),
+            "/lq.Lobby/openManualItem": grpclib.const.Handler(
+                self.__rpc_open_manual_item,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOpenManualItem,
+                ResCommon,
+            ),
+            "/lq.Lobby/openRandomRewardItem": grpclib.const.Handler(
+                self.__rpc_open_random_reward_item,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOpenRandomRewardItem,
+                ResOpenRandomRewardItem,
+            ),
+            "/lq.Lobby/openAllRewardItem": grpclib.const.Handler(
+                self.__rpc_open_all_reward_item,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOpenAllRewardItem,
+                ResOpenAllRewardItem,
+            ),
+            "/lq.Lobby/composeShard": grpclib.const.Handler(
+                self.__rpc_compose_shard,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqComposeShard,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchAnnouncement": grpclib.const.Handler(
+                self.__rpc_fetch_announcement,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchAnnouncement,
+                ResAnnouncement,
+            ),
+            "/lq.Lobby/readAnnouncement": grpclib.const.Handler(
+                self.__rpc_read_announcement,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReadAnnouncement,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchMailInfo": grpclib.const.Handler(
+                self.__rpc_fetch_mail_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResMailInfo,
+            ),
+            "/lq.Lobby/readMail": grpclib.const.Handler(
+                self.__rpc_read_mail,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReadMail,
+                ResCommon,
+            ),
+            "/lq.Lobby/deleteMail": grpclib.const.Handler(
+                self.__rpc_delete_mail,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqDeleteMail,
+                ResCommon,
+            ),
+            "/lq.Lobby/takeAttachmentFromMail": grpclib.const.Handler(
+                self.__rpc_take_attachment_from_mail,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqTakeAttachment,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveAchievementReward": grpclib.const.Handler(
+                self.__rpc_receive_achievement_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveAchievementReward,
+                ResReceiveAchievementReward,
+            ),
+            "/lq.Lobby/receiveAchievementGroupReward": grpclib.const.Handler(
+                self.__rpc_receive_achievement_group_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveAchievementGroupReward,
+                ResReceiveAchievementGroupReward,
+            ),
+            "/lq.Lobby/fetchAchievementRate": grpclib.const.Handler(
+                self.__rpc_fetch_achievement_rate,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchAchievementRate,
+            ),
+            "/lq.Lobby/fetchAchievement": grpclib.const.Handler(
+                self.__rpc_fetch_achievement,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResAchievement,
+            ),
+            "/lq.Lobby/buyShiLian": grpclib.const.Handler(
+                self.__rpc_buy_shi_lian,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBuyShiLian,
+                ResCommon,
+            ),
+            "/lq.Lobby/matchShiLian": grpclib.const.Handler(
+                self.__rpc_match_shi_lian,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/goNextShiLian": grpclib.const.Handler(
+                self.__rpc_go_next_shi_lian,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/updateClientValue": grpclib.const.Handler(
+                self.__rpc_update_client_value,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpdateClientValue,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchClientValue": grpclib.const.Handler(
+                self.__rpc_fetch_client_value,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResClientValue,
+            ),
+            "/lq.Lobby/clientMessage": grpclib.const.Handler(
+                self.__rpc_client_message,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqClientMessage,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchCurrentMatchInfo": grpclib.const.Handler(
+                self.__rpc_fetch_current_match_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCurrentMatchInfo,
+                ResCurrentMatchInfo,
+            ),
+            "/lq.Lobby/userComplain": grpclib.const.Handler(
+                self.__rpc_user_complain,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUserComplain,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchReviveCoinInfo": grpclib.const.Handler(
+                self.__rpc_fetch_revive_coin_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResReviveCoinInfo,
+            ),
+            "/lq.Lobby/gainReviveCoin": grpclib.const.Handler(
+                self.__rpc_gain_revive_coin,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchDailyTask": grpclib.const.Handler(
+                self.__rpc_fetch_daily_task,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResDailyTask,
+            ),
+            "/lq.Lobby/refreshDailyTask": grpclib.const.Handler(
+                self.__rpc_refresh_daily_task,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRefreshDailyTask,
+                ResRefreshDailyTask,
+            ),
+            "/lq.Lobby/useGiftCode": grpclib.const.Handler(
+                self.__rpc_use_gift_code,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUseGiftCode,
+                ResUseGiftCode,
+            ),
+            "/lq.Lobby/useSpecialGiftCode": grpclib.const.Handler(
+                self.__rpc_use_special_gift_code,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUseGiftCode,
+                ResUseSpecialGiftCode,
+            ),
+            "/lq.Lobby/fetchTitleList": grpclib.const.Handler(
+                self.__rpc_fetch_title_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResTitleList,
+            ),
+            "/lq.Lobby/useTitle": grpclib.const.Handler(
+                self.__rpc_use_title,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUseTitle,
+                ResCommon,
+            ),
+            "/lq.Lobby/sendClientMessage": grpclib.const.Handler(
+                self.__rpc_send_client_message,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSendClientMessage,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchGameLiveInfo": grpclib.const.Handler(
+                self.__rpc_fetch_game_live_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGameLiveInfo,
+                ResGameLiveInfo,
+            ),
+            "/lq.Lobby/fetchGameLiveLeftSegment": grpclib.const.Handler(
+                self.__rpc_fetch_game_live_left_segment,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGameLiveLeftSegment,
+                ResGameLiveLeftSegment,
+            ),
+            "/lq.Lobby/fetchGameLiveList": grpclib.const.Handler(
+                self.__rpc_fetch_game_live_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGameLiveList,
+                ResGameLiveList,
+            ),
+            "/lq.Lobby/fetchCommentSetting": grpclib.const.Handler(
+                self.__rpc_fetch_comment_setting,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommentSetting,
+            ),
+            "/lq.Lobby/updateCommentSetting": grpclib.const.Handler(
+                self.__rpc_update_comment_setting,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpdateCommentSetting,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchCommentList": grpclib.const.Handler(
+                self.__rpc_fetch_comment_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchCommentList,
+                ResFetchCommentList,
+            ),
+            "/lq.Lobby/fetchCommentContent": grpclib.const.Handler(
+                self.__rpc_fetch_comment_content,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchCommentContent,
+                ResFetchCommentContent,
+            ),
+            "/lq.Lobby/leaveComment": grpclib.const.Handler(
+                self.__rpc_leave_comment,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqLeaveComment,
+                ResCommon,
+            ),
+            "/lq.Lobby/deleteComment": grpclib.const.Handler(
+                self.__rpc_delete_comment,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqDeleteComment,
+                ResCommon,
+            ),
+            "/lq.Lobby/updateReadComment": grpclib.const.Handler(
+                self.__rpc_update_read_comment,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpdateReadComment,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchRollingNotice": grpclib.const.Handler(
+                self.__rpc_fetch_rolling_notice,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchRollingNotice,
+                ResFetchRollingNotice,
+            ),
+            "/lq.Lobby/fetchMaintainNotice": grpclib.const.Handler(
+                self.__rpc_fetch_maintain_notice,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchMaintainNotice,
+            ),
+            "/lq.Lobby/fetchServerTime": grpclib.const.Handler(
+                self.__rpc_fetch_server_time,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResServerTime,
+            ),
+            "/lq.Lobby/fetchPlatformProducts": grpclib.const.Handler(
+                self.__rpc_fetch_platform_products,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqPlatformBillingProducts,
+                ResPlatformBillingProducts,
+            ),
+            "/lq.Lobby/fetchRandomCharacter": grpclib.const.Handler(
+                self.__rpc_fetch_random_character,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResRandomCharacter,
+            ),
+            "/lq.Lobby/setRandomCharacter": grpclib.const.Handler(
+                self.__rpc_set_random_character,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRandomCharacter,
+                ResCommon,
+            ),
+            "/lq.Lobby/cancelGooglePlayOrder": grpclib.const.Handler(
+                self.__rpc_cancel_google_play_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCancelGooglePlayOrder,
+                ResCommon,
+            ),
+            "/lq.Lobby/openChest": grpclib.const.Handler(
+                self.__rpc_open_chest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOpenChest,
+                ResOpenChest,
+            ),
+            "/lq.Lobby/buyFromChestShop": grpclib.const.Handler(
+                self.__rpc_buy_from_chest_shop,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBuyFromChestShop,
+                ResBuyFromChestShop,
+            ),
+            "/lq.Lobby/fetchDailySignInInfo": grpclib.const.Handler(
+                self.__rpc_fetch_daily_sign_in_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResDailySignInInfo,
+            ),
+            "/lq.Lobby/doDailySignIn": grpclib.const.Handler(
+                self.__rpc_do_daily_sign_in,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/doActivitySignIn": grpclib.const.Handler(
+                self.__rpc_do_activity_sign_in,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqDoActivitySignIn,
+                ResDoActivitySignIn,
+            ),
+            "/lq.Lobby/fetchCharacterInfo": grpclib.const.Handler(
+                self.__rpc_fetch_character_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCharacterInfo,
+            ),
+            "/lq.Lobby/updateCharacterSort": grpclib.const.Handler(
+                self.__rpc_update_character_sort,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpdateCharacterSort,
+                ResCommon,
+            ),
+            "/lq.Lobby/changeMainCharacter": grpclib.const.Handler(
+                self.__rpc_change_main_character,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqChangeMainCharacter,
+                ResCommon,
+            ),
+            "/lq.Lobby/changeCharacterSkin": grpclib.const.Handler(
+                self.__rpc_change_character_skin,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqChangeCharacterSkin,
+                ResCommon,
+            ),
+            "/lq.Lobby/changeCharacterView": grpclib.const.Handler(
+                self.__rpc_change_character_view,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqChangeCharacterView,
+                ResCommon,
+            ),
+            "/lq.Lobby/setHiddenCharacter": grpclib.const.Handler(
+                self.__rpc_set_hidden_character,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSetHiddenCharacter,
+                ResSetHiddenCharacter,
+            ),
+            "/lq.Lobby/sendGiftToCharacter": grpclib.const.Handler(
+                self.__rpc_send_gift_to_character,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSendGiftToCharacter,
+                ResSendGiftToCharacter,
+            ),
+            "/lq.Lobby/sellItem": grpclib.const.Handler(
+                self.__rpc_sell_item,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSellItem,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchCommonView": grpclib.const.Handler(
+                self.__rpc_fetch_common_view,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommonView,
+            ),
+            "/lq.Lobby/changeCommonView": grpclib.const.Handler(
+                self.__rpc_change_common_view,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqChangeCommonView,
+                ResCommon,
+            ),
+            "/lq.Lobby/saveCommonViews": grpclib.const.Handler(
+                self.__rpc_save_common_views,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSaveCommonViews,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchCommonViews": grpclib.const.Handler(
+                self.__rpc_fetch_common_views,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommonViews,
+                ResCommonViews,
+            ),
+            "/lq.Lobby/fetchAllCommonViews": grpclib.const.Handler(
+                self.__rpc_fetch_all_common_views,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResAllcommonViews,
+            ),
+            "/lq.Lobby/useCommonView": grpclib.const.Handler(
+                self.__rpc_use_common_view,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUseCommonView,
+                ResCommon,
+            ),
+            "/lq.Lobby/upgradeCharacter": grpclib.const.Handler(
+                self.__rpc_upgrade_character,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpgradeCharacter,
+                ResUpgradeCharacter,
+            ),
+            "/lq.Lobby/addFinishedEnding": grpclib.const.Handler(
+                self.__rpc_add_finished_ending,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFinishedEnding,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveEndingReward": grpclib.const.Handler(
+                self.__rpc_receive_ending_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFinishedEnding,
+                ResCommon,
+            ),
+            "/lq.Lobby/gameMasterCommand": grpclib.const.Handler(
+                self.__rpc_game_master_command,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGmCommand,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchShopInfo": grpclib.const.Handler(
+                self.__rpc_fetch_shop_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResShopInfo,
+            ),
+            "/lq.Lobby/buyFromShop": grpclib.const.Handler(
+                self.__rpc_buy_from_shop,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBuyFromShop,
+                ResBuyFromShop,
+            ),
+            "/lq.Lobby/buyFromZHP": grpclib.const.Handler(
+                self.__rpc_buy_from_zhp,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBuyFromZhp,
+                ResCommon,
+            ),
+            "/lq.Lobby/refreshZHPShop": grpclib.const.Handler(
+                self.__rpc_refresh_zhp_shop,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReshZhpShop,
+                ResRefreshZhpShop,
+            ),
+            "/lq.Lobby/fetchMonthTicketInfo": grpclib.const.Handler(
+                self.__rpc_fetch_month_ticket_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResMonthTicketInfo,
+            ),
+            "/lq.Lobby/payMonthTicket": grpclib.const.Handler(
+                self.__rpc_pay_month_ticket,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResPayMonthTicket,
+            ),
+            "/lq.Lobby/exchangeCurrency": grpclib.const.Handler(
+                self.__rpc_exchange_currency,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqExchangeCurrency,
+                ResCommon,
+            ),
+            "/lq.Lobby/exchangeChestStone": grpclib.const.Handler(
+                self.__rpc_exchange_chest_stone,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqExchangeCurrency,
+                ResCommon,
+            ),
+            "/lq.Lobby/exchangeDiamond": grpclib.const.Handler(
+                self.__rpc_exchange_diamond,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqExchangeCurrency,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchServerSettings": grpclib.const.Handler(
+                self.__rpc_fetch_server_settings,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResServerSettings,
+            ),
+            "/lq.Lobby/fetchAccountSettings": grpclib.const.Handler(
+                self.__rpc_fetch_account_settings,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResAccountSettings,
+            ),
+            "/lq.Lobby/updateAccountSettings": grpclib.const.Handler(
+                self.__rpc_update_account_settings,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpdateAccountSettings,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchModNicknameTime": grpclib.const.Handler(
+                self.__rpc_fetch_mod_nickname_time,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResModNicknameTime,
+            ),
+            "/lq.Lobby/createWechatNativeOrder": grpclib.const.Handler(
+                self.__rpc_create_wechat_native_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateWechatNativeOrder,
+                ResCreateWechatNativeOrder,
+            ),
+            "/lq.Lobby/createWechatAppOrder": grpclib.const.Handler(
+                self.__rpc_create_wechat_app_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateWechatAppOrder,
+                ResCreateWechatAppOrder,
+            ),
+            "/lq.Lobby/createAlipayOrder": grpclib.const.Handler(
+                self.__rpc_create_alipay_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateAlipayOrder,
+                ResCreateAlipayOrder,
+            ),
+            "/lq.Lobby/createAlipayScanOrder": grpclib.const.Handler(
+                self.__rpc_create_alipay_scan_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateAlipayScanOrder,
+                ResCreateAlipayScanOrder,
+            ),
+            "/lq.Lobby/createAlipayAppOrder": grpclib.const.Handler(
+                self.__rpc_create_alipay_app_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateAlipayAppOrder,
+                ResCreateAlipayAppOrder,
+            ),
+            "/lq.Lobby/createJPCreditCardOrder": grpclib.const.Handler(
+                self.__rpc_create_jp_credit_card_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateJpCreditCardOrder,
+                ResCreateJpCreditCardOrder,
+            ),
+            "/lq.Lobby/createJPPaypalOrder": grpclib.const.Handler(
+                self.__rpc_create_jp_paypal_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateJpPaypalOrder,
+                ResCreateJpPaypalOrder,
+            ),
+            "/lq.Lobby/createJPAuOrder": grpclib.const.Handler(
+                self.__rpc_create_jp_au_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateJpAuOrder,
+                ResCreateJpAuOrder,
+            ),
+            "/lq.Lobby/createJPDocomoOrder": grpclib.const.Handler(
+                self.__rpc_create_jp_docomo_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateJpDocomoOrder,
+                ResCreateJpDocomoOrder,
+            ),
+            "/lq.Lobby/createJPWebMoneyOrder": grpclib.const.Handler(
+                self.__rpc_create_jp_web_money_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateJpWebMoneyOrder,
+                ResCreateJpWebMoneyOrder,
+            ),
+            "/lq.Lobby/createJPSoftbankOrder": grpclib.const.Handler(
+                self.__rpc_create_jp_softbank_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateJpSoftbankOrder,
+                ResCreateJpSoftbankOrder,
+            ),
+            "/lq.Lobby/createJPPayPayOrder": grpclib.const.Handler(
+                self.__rpc_create_jp_pay_pay_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateJpPayPayOrder,
+                ResCreateJpPayPayOrder,
+            ),
+            "/lq.Lobby/fetchJPCommonCreditCardOrder": grpclib.const.Handler(
+                self.__rpc_fetch_jp_common_credit_card_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchJpCommonCreditCardOrder,
+                ResFetchJpCommonCreditCardOrder,
+            ),
+            "/lq.Lobby/createJPGMOOrder": grpclib.const.Handler(
+                self.__rpc_create_jpgmo_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateJpgmoOrder,
+                ResCreateJpgmoOrder,
+            ),
+            "/lq.Lobby/createENPaypalOrder": grpclib.const.Handler(
+                self.__rpc_create_en_paypal_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateEnPaypalOrder,
+                ResCreateEnPaypalOrder,
+            ),
+            "/lq.Lobby/createENMasterCardOrder": grpclib.const.Handler(
+                self.__rpc_create_en_master_card_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateEnMasterCardOrder,
+                ResCreateEnMasterCardOrder,
+            ),
+            "/lq.Lobby/createENVisaOrder": grpclib.const.Handler(
+                self.__rpc_create_en_visa_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateEnVisaOrder,
+                ResCreateEnVisaOrder,
+            ),
+            "/lq.Lobby/createENJCBOrder": grpclib.const.Handler(
+                self.__rpc_create_enjcb_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateEnjcbOrder,
+                ResCreateEnjcbOrder,
+            ),
+            "/lq.Lobby/createENAlipayOrder": grpclib.const.Handler(
+                self.__rpc_create_en_alipay_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateEnAlipayOrder,
+                ResCreateEnAlipayOrder,
+            ),
+            "/lq.Lobby/createKRPaypalOrder": grpclib.const.Handler(
+                self.__rpc_create_kr_paypal_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateKrPaypalOrder,
+                ResCreateKrPaypalOrder,
+            ),
+            "/lq.Lobby/createKRMasterCardOrder": grpclib.const.Handler(
+                self.__rpc_create_kr_master_card_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateKrMasterCardOrder,
+                ResCreateKrMasterCardOrder,
+            ),
+            "/lq.Lobby/createKRVisaOrder": grpclib.const.Handler(
+                self.__rpc_create_kr_visa_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateKrVisaOrder,
+                ResCreateKrVisaOrder,
+            ),
+            "/lq.Lobby/createKRJCBOrder": grpclib.const.Handler(
+                self.__rpc_create_krjcb_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateKrjcbOrder,
+                ResCreateKrjcbOrder,
+            ),
+            "/lq.Lobby/createKRAlipayOrder": grpclib.const.Handler(
+                self.__rpc_create_kr_alipay_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateKrAlipayOrder,
+                ResCreateKrAlipayOrder,
+            ),
+            "/lq.Lobby/createDMMOrder": grpclib.const.Handler(
+                self.__rpc_create_dmm_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateDmmOrder,
+                ResCreateDmmOrder,
+            ),
+            "/lq.Lobby/createIAPOrder": grpclib.const.Handler(
+                self.__rpc_create_iap_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateIapOrder,
+                ResCreateIapOrder,
+            ),
+            "/lq.Lobby/createSteamOrder": grpclib.const.Handler(
+                self.__rpc_create_steam_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateSteamOrder,
+                ResCreateSteamOrder,
+            ),
+            "/lq.Lobby/verifySteamOrder": grpclib.const.Handler(
+                self.__rpc_verify_steam_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqVerifySteamOrder,
+                ResCommon,
+            ),
+            "/lq.Lobby/createMyCardAndroidOrder": grpclib.const.Handler(
+                self.__rpc_create_my_card_android_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateMyCardOrder,
+                ResCreateMyCardOrder,
+            ),
+            "/lq.Lobby/createMyCardWebOrder": grpclib.const.Handler(
+                self.__rpc_create_my_card_web_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateMyCardOrder,
+                ResCreateMyCardOrder,
+            ),
+            "/lq.Lobby/createPaypalOrder": grpclib.const.Handler(
+                self.__rpc_create_paypal_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreatePaypalOrder,
+                ResCreatePaypalOrder,
+            ),
+            "/lq.Lobby/createXsollaOrder": grpclib.const.Handler(
+                self.__rpc_create_xsolla_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateXsollaOrder,
+                ResCreateXsollaOrder,
+            ),
+            "/lq.Lobby/verifyMyCardOrder": grpclib.const.Handler(
+                self.__rpc_verify_my_card_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqVerifyMyCardOrder,
+                ResCommon,
+            ),
+            "/lq.Lobby/verificationIAPOrder": grpclib.const.Handler(
+                self.__rpc_verification_iap_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqVerificationIapOrder,
+                ResVerificationIapOrder,
+            ),
+            "/lq.Lobby/createYostarSDKOrder": grpclib.const.Handler(
+                self.__rpc_create_yostar_sdk_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateYostarOrder,
+                ResCreateYostarOrder,
+            ),
+            "/lq.Lobby/createBillingOrder": grpclib.const.Handler(
+                self.__rpc_create_billing_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateBillingOrder,
+                ResCreateBillingOrder,
+            ),
+            "/lq.Lobby/solveGooglePlayOrder": grpclib.const.Handler(
+                self.__rpc_solve_google_play_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSolveGooglePlayOrder,
+                ResCommon,
+            ),
+            "/lq.Lobby/solveGooglePayOrderV3": grpclib.const.Handler(
+                self.__rpc_solve_google_pay_order_v3,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSolveGooglePlayOrderV3,
+                ResCommon,
+            ),
+            "/lq.Lobby/deliverAA32Order": grpclib.const.Handler(
+                self.__rpc_deliver_aa32_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqDeliverAa32Order,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchMisc": grpclib.const.Handler(
+                self.__rpc_fetch_misc,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResMisc,
+            ),
+            "/lq.Lobby/modifySignature": grpclib.const.Handler(
+                self.__rpc_modify_signature,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqModifySignature,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchIDCardInfo": grpclib.const.Handler(
+                self.__rpc_fetch_id_card_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResIdCardInfo,
+            ),
+            "/lq.Lobby/updateIDCardInfo": grpclib.const.Handler(
+                self.__rpc_update_id_card_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpdateIdCardInfo,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchVipReward": grpclib.const.Handler(
+                self.__rpc_fetch_vip_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResVipReward,
+            ),
+            "/lq.Lobby/gainVipReward": grpclib.const.Handler(
+                self.__rpc_gain_vip_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGainVipReward,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchRefundOrder": grpclib.const.Handler(
+                self.__rpc_fetch_refund_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchRefundOrder,
+            ),
+            "/lq.Lobby/fetchCustomizedContestList": grpclib.const.Handler(
+                self.__rpc_fetch_customized_contest_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchCustomizedContestList,
+                ResFetchCustomizedContestList,
+            ),
+            "/lq.Lobby/fetchCustomizedContestAuthInfo": grpclib.const.Handler(
+                self.__rpc_fetch_customized_contest_auth_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchCustomizedContestAuthInfo,
+                ResFetchCustomizedContestAuthInfo,
+            ),
+            "/lq.Lobby/enterCustomizedContest": grpclib.const.Handler(
+                self.__rpc_enter_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqEnterCustomizedContest,
+                ResEnterCustomizedContest,
+            ),
+            "/lq.Lobby/leaveCustomizedContest": grpclib.const.Handler(
+                self.__rpc_leave_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchCustomizedContestOnlineInfo": grpclib.const.Handler(
+                self.__rpc_fetch_customized_contest_online_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchCustomizedContestOnlineInfo,
+                ResFetchCustomizedContestOnlineInfo,
+            ),
+            "/lq.Lobby/fetchCustomizedContestByContestId": grpclib.const.Handler(
+                self.__rpc_fetch_customized_contest_by_contest_id,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchCustomizedContestByContestId,
+                ResFetchCustomizedContestByContestId,
+            ),
+            "/lq.Lobby/signupCustomizedContest": grpclib.const.Handler(
+                self.__rpc_signup_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSignupCustomizedContest,
+                ResSignupCustomizedContest,
+            ),
+            "/lq.Lobby/startCustomizedContest": grpclib.const.Handler(
+                self.__rpc_start_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStartCustomizedContest,
+                ResCommon,
+            ),
+            "/lq.Lobby/stopCustomizedContest": grpclib.const.Handler(
+                self.__rpc_stop_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStopCustomizedContest,
+                ResCommon,
+            ),
+            "/lq.Lobby/joinCustomizedContestChatRoom": grpclib.const.Handler(
+                self.__rpc_join_customized_contest_chat_room,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqJoinCustomizedContestChatRoom,
+                ResJoinCustomizedContestChatRoom,
+            ),
+            "/lq.Lobby/leaveCustomizedContestChatRoom": grpclib.const.Handler(
+                self.__rpc_leave_customized_contest_chat_room,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/sayChatMessage": grpclib.const.Handler(
+                self.__rpc_say_chat_message,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSayChatMessage,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchCustomizedContestGameRecords": grpclib.const.Handler(
+                self.__rpc_fetch_customized_contest_game_records,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchCustomizedContestGameRecords,
+                ResFetchCustomizedContestGameRecords,
+            ),
+            "/lq.Lobby/fetchCustomizedContestGameLiveList": grpclib.const.Handler(
+                self.__rpc_fetch_customized_contest_game_live_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchCustomizedContestGameLiveList,
+                ResFetchCustomizedContestGameLiveList,
+            ),
+            "/lq.Lobby/followCustomizedContest": grpclib.const.Handler(
+                self.__rpc_follow_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqTargetCustomizedContest,
+                ResCommon,
+            ),
+            "/lq.Lobby/unfollowCustomizedContest": grpclib.const.Handler(
+                self.__rpc_unfollow_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqTargetCustomizedContest,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchActivityList": grpclib.const.Handler(
+                self.__rpc_fetch_activity_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResActivityList,
+            ),
+            "/lq.Lobby/fetchAccountActivityData": grpclib.const.Handler(
+                self.__rpc_fetch_account_activity_data,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResAccountActivityData,
+            ),
+            "/lq.Lobby/exchangeActivityItem": grpclib.const.Handler(
+                self.__rpc_exchange_activity_item,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqExchangeActivityItem,
+                ResExchangeActivityItem,
+            ),
+            "/lq.Lobby/completeActivityTask": grpclib.const.Handler(
+                self.__rpc_complete_activity_task,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCompleteActivityTask,
+                ResCommon,
+            ),
+            "/lq.Lobby/completeActivityTaskBatch": grpclib.const.Handler(
+                self.__rpc_complete_activity_task_batch,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCompleteActivityTaskBatch,
+                ResCommon,
+            ),
+            "/lq.Lobby/completeActivityFlipTask": grpclib.const.Handler(
+                self.__rpc_complete_activity_flip_task,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCompleteActivityTask,
+                ResCommon,
+            ),
+            "/lq.Lobby/completePeriodActivityTask": grpclib.const.Handler(
+                self.__rpc_complete_period_activity_task,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCompleteActivityTask,
+                ResCommon,
+            ),
+            "/lq.Lobby/completePeriodActivityTaskBatch": grpclib.const.Handler(
+                self.__rpc_complete_period_activity_task_batch,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCompletePeriodActivityTaskBatch,
+                ResCommon,
+            ),
+            "/lq.Lobby/completeRandomActivityTask": grpclib.const.Handler(
+                self.__rpc_complete_random_activity_task,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCompleteActivityTask,
+                ResCommon,
+            ),
+            "/lq.Lobby/completeRandomActivityTaskBatch": grpclib.const.Handler(
+                self.__rpc_complete_random_activity_task_batch,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCompleteActivityTaskBatch,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveActivityFlipTask": grpclib.const.Handler(
+                self.__rpc_receive_activity_flip_task,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveActivityFlipTask,
+                ResReceiveActivityFlipTask,
+            ),
+            "/lq.Lobby/completeSegmentTaskReward": grpclib.const.Handler(
+                self.__rpc_complete_segment_task_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCompleteSegmentTaskReward,
+                ResCompleteSegmentTaskReward,
+            ),
+            "/lq.Lobby/fetchActivityFlipInfo": grpclib.const.Handler(
+                self.__rpc_fetch_activity_flip_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchActivityFlipInfo,
+                ResFetchActivityFlipInfo,
+            ),
+            "/lq.Lobby/gainAccumulatedPointActivityReward": grpclib.const.Handler(
+                self.__rpc_gain_accumulated_point_activity_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGainAccumulatedPointActivityReward,
+                ResCommon,
+            ),
+            "/lq.Lobby/gainMultiPointActivityReward": grpclib.const.Handler(
+                self.__rpc_gain_multi_point_activity_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGainMultiPointActivityReward,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchRankPointLeaderboard": grpclib.const.Handler(
+                self.__rpc_fetch_rank_point_leaderboard,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchRankPointLeaderboard,
+                ResFetchRankPointLeaderboard,
+            ),
+            "/lq.Lobby/gainRankPointReward": grpclib.const.Handler(
+                self.__rpc_gain_rank_point_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGainRankPointReward,
+                ResCommon,
+            ),
+            "/lq.Lobby/richmanActivityNextMove": grpclib.const.Handler(
+                self.__rpc_richman_activity_next_move,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRichmanNextMove,
+                ResRichmanNextMove,
+            ),
+            "/lq.Lobby/richmanAcitivitySpecialMove": grpclib.const.Handler(
+                self.__rpc_richman_acitivity_special_move,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRichmanSpecialMove,
+                ResRichmanNextMove,
+            ),
+            "/lq.Lobby/richmanActivityChestInfo": grpclib.const.Handler(
+                self.__rpc_richman_activity_chest_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRichmanChestInfo,
+                ResRichmanChestInfo,
+            ),
+            "/lq.Lobby/createGameObserveAuth": grpclib.const.Handler(
+                self.__rpc_create_game_observe_auth,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateGameObserveAuth,
+                ResCreateGameObserveAuth,
+            ),
+            "/lq.Lobby/refreshGameObserveAuth": grpclib.const.Handler(
+                self.__rpc_refresh_game_observe_auth,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRefreshGameObserveAuth,
+                ResRefreshGameObserveAuth,
+            ),
+            "/lq.Lobby/fetchActivityBuff": grpclib.const.Handler(
+                self.__rpc_fetch_activity_buff,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResActivityBuff,
+            ),
+            "/lq.Lobby/upgradeActivityBuff": grpclib.const.Handler(
+                self.__rpc_upgrade_activity_buff,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpgradeActivityBuff,
+                ResActivityBuff,
+            ),
+            "/lq.Lobby/upgradeActivityLevel": grpclib.const.Handler(
+                self.__rpc_upgrade_activity_level,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpgradeActivityLevel,
+                ResUpgradeActivityLevel,
+            ),
+            "/lq.Lobby/receiveUpgradeActivityReward": grpclib.const.Handler(
+                self.__rpc_receive_upgrade_activity_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveUpgradeActivityReward,
+                ResReceiveUpgradeActivityReward,
+            ),
+            "/lq.Lobby/upgradeChallenge": grpclib.const.Handler(
+                self.__rpc_upgrade_challenge,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResUpgradeChallenge,
+            ),
+            "/lq.Lobby/refreshChallenge": grpclib.const.Handler(
+                self.__rpc_refresh_challenge,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResRefreshChallenge,
+            ),
+            "/lq.Lobby/fetchChallengeInfo": grpclib.const.Handler(
+                self.__rpc_fetch_challenge_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchChallengeInfo,
+            ),
+            "/lq.Lobby/forceCompleteChallengeTask": grpclib.const.Handler(
+                self.__rpc_force_complete_challenge_task,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqForceCompleteChallengeTask,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchChallengeSeason": grpclib.const.Handler(
+                self.__rpc_fetch_challenge_season,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResChallengeSeasonInfo,
+            ),
+            "/lq.Lobby/receiveChallengeRankReward": grpclib.const.Handler(
+                self.__rpc_receive_challenge_rank_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveChallengeRankReward,
+                ResReceiveChallengeRankReward,
+            ),
+            "/lq.Lobby/fetchABMatchInfo": grpclib.const.Handler(
+                self.__rpc_fetch_ab_match_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchAbMatch,
+            ),
+            "/lq.Lobby/buyInABMatch": grpclib.const.Handler(
+                self.__rpc_buy_in_ab_match,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBuyInAbMatch,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveABMatchReward": grpclib.const.Handler(
+                self.__rpc_receive_ab_match_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/quitABMatch": grpclib.const.Handler(
+                self.__rpc_quit_ab_match,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/startUnifiedMatch": grpclib.const.Handler(
+                self.__rpc_start_unified_match,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStartUnifiedMatch,
+                ResCommon,
+            ),
+            "/lq.Lobby/cancelUnifiedMatch": grpclib.const.Handler(
+                self.__rpc_cancel_unified_match,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCancelUnifiedMatch,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchGamePointRank": grpclib.const.Handler(
+                self.__rpc_fetch_game_point_rank,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGamePointRank,
+                ResGamePointRank,
+            ),
+            "/lq.Lobby/fetchSelfGamePointRank": grpclib.const.Handler(
+                self.__rpc_fetch_self_game_point_rank,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGamePointRank,
+                ResFetchSelfGamePointRank,
+            ),
+            "/lq.Lobby/readSNS": grpclib.const.Handler(
+                self.__rpc_read_sns,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReadSns,
+                ResReadSns,
+            ),
+            "/lq.Lobby/replySNS": grpclib.const.Handler(
+                self.__rpc_reply_sns,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReplySns,
+                ResReplySns,
+            ),
+            "/lq.Lobby/likeSNS": grpclib.const.Handler(
+                self.__rpc_like_sns,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqLikeSns,
+                ResLikeSns,
+            ),
+            "/lq.Lobby/digMine": grpclib.const.Handler(
+                self.__rpc_dig_mine,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqDigMine,
+                ResDigMine,
+            ),
+            "/lq.Lobby/fetchLastPrivacy": grpclib.const.Handler(
+                self.__rpc_fetch_last_privacy,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchLastPrivacy,
+                ResFetchLastPrivacy,
+            ),
+            "/lq.Lobby/checkPrivacy": grpclib.const.Handler(
+                self.__rpc_check_privacy,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCheckPrivacy,
+                ResCommon,
+            ),
+            "/lq.Lobby/responseCaptcha": grpclib.const.Handler(
+                self.__rpc_response_captcha,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqResponseCaptcha,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchRPGBattleHistory": grpclib.const.Handler(
+                self.__rpc_fetch_rpg_battle_history,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchRpgBattleHistory,
+                ResFetchRpgBattleHistory,
+            ),
+            "/lq.Lobby/fetchRPGBattleHistoryV2": grpclib.const.Handler(
+                self.__rpc_fetch_rpg_battle_history_v2,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchRpgBattleHistory,
+                ResFetchRpgBattleHistoryV2,
+            ),
+            "/lq.Lobby/receiveRPGRewards": grpclib.const.Handler(
+                self.__rpc_receive_rpg_rewards,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveRpgRewards,
+                ResReceiveRpgRewards,
+            ),
+            "/lq.Lobby/receiveRPGReward": grpclib.const.Handler(
+                self.__rpc_receive_rpg_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveRpgReward,
+                ResReceiveRpgRewards,
+            ),
+            "/lq.Lobby/buyArenaTicket": grpclib.const.Handler(
+                self.__rpc_buy_arena_ticket,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBuyArenaTicket,
+                ResCommon,
+            ),
+            "/lq.Lobby/enterArena": grpclib.const.Handler(
+                self.__rpc_enter_arena,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqEnterArena,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveArenaReward": grpclib.const.Handler(
+                self.__rpc_receive_arena_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqArenaReward,
+                ResArenaReward,
+            ),
+            "/lq.Lobby/fetchOBToken": grpclib.const.Handler(
+                self.__rpc_fetch_ob_token,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchObToken,
+                ResFetchObToken,
+            ),
+            "/lq.Lobby/receiveCharacterRewards": grpclib.const.Handler(
+                self.__rpc_receive_character_rewards,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveCharacterRewards,
+                ResReceiveCharacterRewards,
+            ),
+            "/lq.Lobby/feedActivityFeed": grpclib.const.Handler(
+                self.__rpc_feed_activity_feed,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFeedActivityFeed,
+                ResFeedActivityFeed,
+            ),
+            "/lq.Lobby/sendActivityGiftToFriend": grpclib.const.Handler(
+                self.__rpc_send_activity_gift_to_friend,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSendActivityGiftToFriend,
+                ResSendActivityGiftToFriend,
+            ),
+            "/lq.Lobby/receiveActivityGift": grpclib.const.Handler(
+                self.__rpc_receive_activity_gift,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveActivityGift,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveAllActivityGift": grpclib.const.Handler(
+                self.__rpc_receive_all_activity_gift,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveAllActivityGift,
+                ResReceiveAllActivityGift,
+            ),
+            "/lq.Lobby/fetchFriendGiftActivityData": grpclib.const.Handler(
+                self.__rpc_fetch_friend_gift_activity_data,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchFriendGiftActivityData,
+                ResFetchFriendGiftActivityData,
+            ),
+            "/lq.Lobby/openPreChestItem": grpclib.const.Handler(
+                self.__rpc_open_pre_chest_item,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOpenPreChestItem,
+                ResOpenPreChestItem,
+            ),
+            "/lq.Lobby/fetchVoteActivity": grpclib.const.Handler(
+                self.__rpc_fetch_vote_activity,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchVoteActivity,
+                ResFetchVoteActivity,
+            ),
+            "/lq.Lobby/voteActivity": grpclib.const.Handler(
+                self.__rpc_vote_activity,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqVoteActivity,
+                ResVoteActivity,
+            ),
+            "/lq.Lobby/unlockActivitySpot": grpclib.const.Handler(
+                self.__rpc_unlock_activity_spot,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUnlockActivitySpot,
+                ResCommon,
+            ),
+            "/lq.Lobby/unlockActivitySpotEnding": grpclib.const.Handler(
+                self.__rpc_unlock_activity_spot_ending,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUnlockActivitySpotEnding,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveActivitySpotReward": grpclib.const.Handler(
+                self.__rpc_receive_activity_spot_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveActivitySpotReward,
+                ResReceiveActivitySpotReward,
+            ),
+            "/lq.Lobby/deleteAccount": grpclib.const.Handler(
+                self.__rpc_delete_account,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResDeleteAccount,
+            ),
+            "/lq.Lobby/cancelDeleteAccount": grpclib.const.Handler(
+                self.__rpc_cancel_delete_account,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.Lobby/logReport": grpclib.const.Handler(
+                self.__rpc_log_report,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqLogReport,
+                ResCommon,
+            ),
+            "/lq.Lobby/bindOauth2": grpclib.const.Handler(
+                self.__rpc_bind_oauth2,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBindOauth2,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchOauth2Info": grpclib.const.Handler(
+                self.__rpc_fetch_oauth2_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchOauth2,
+                ResFetchOauth2,
+            ),
+            "/lq.Lobby/setLoadingImage": grpclib.const.Handler(
+                self.__rpc_set_loading_image,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSetLoadingImage,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchShopInterval": grpclib.const.Handler(
+                self.__rpc_fetch_shop_interval,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchShopInterval,
+            ),
+            "/lq.Lobby/fetchActivityInterval": grpclib.const.Handler(
+                self.__rpc_fetch_activity_interval,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchActivityInterval,
+            ),
+            "/lq.Lobby/fetchRecentFriend": grpclib.const.Handler(
+                self.__rpc_fetch_recent_friend,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResFetchrecentFriend,
+            ),
+            "/lq.Lobby/openGacha": grpclib.const.Handler(
+                self.__rpc_open_gacha,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqOpenGacha,
+                ResOpenGacha,
+            ),
+            "/lq.Lobby/taskRequest": grpclib.const.Handler(
+                self.__rpc_task_request,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqTaskRequest,
+                ResCommon,
+            ),
+            "/lq.Lobby/simulationActivityTrain": grpclib.const.Handler(
+                self.__rpc_simulation_activity_train,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSimulationActivityTrain,
+                ResSimulationActivityTrain,
+            ),
+            "/lq.Lobby/fetchSimulationGameRecord": grpclib.const.Handler(
+                self.__rpc_fetch_simulation_game_record,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchSimulationGameRecord,
+                ResFetchSimulationGameRecord,
+            ),
+            "/lq.Lobby/startSimulationActivityGame": grpclib.const.Handler(
+                self.__rpc_start_simulation_activity_game,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStartSimulationActivityGame,
+                ResStartSimulationActivityGame,
+            ),
+            "/lq.Lobby/fetchSimulationGameRank": grpclib.const.Handler(
+                self.__rpc_fetch_simulation_game_rank,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchSimulationGameRank,
+                ResFetchSimulationGameRank,
+            ),
+            "/lq.Lobby/generateCombiningCraft": grpclib.const.Handler(
+                self.__rpc_generate_combining_craft,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGenerateCombiningCraft,
+                ResGenerateCombiningCraft,
+            ),
+            "/lq.Lobby/moveCombiningCraft": grpclib.const.Handler(
+                self.__rpc_move_combining_craft,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqMoveCombiningCraft,
+                ResMoveCombiningCraft,
+            ),
+            "/lq.Lobby/combiningRecycleCraft": grpclib.const.Handler(
+                self.__rpc_combining_recycle_craft,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCombiningRecycleCraft,
+                ResCombiningRecycleCraft,
+            ),
+            "/lq.Lobby/recoverCombiningRecycle": grpclib.const.Handler(
+                self.__rpc_recover_combining_recycle,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqRecoverCombiningRecycle,
+                ResRecoverCombiningRecycle,
+            ),
+            "/lq.Lobby/finishCombiningOrder": grpclib.const.Handler(
+                self.__rpc_finish_combining_order,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFinishCombiningOrder,
+                ResFinishCombiningOrder,
+            ),
+            "/lq.Lobby/upgradeVillageBuilding": grpclib.const.Handler(
+                self.__rpc_upgrade_village_building,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpgradeVillageBuilding,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveVillageBuildingReward": grpclib.const.Handler(
+                self.__rpc_receive_village_building_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveVillageBuildingReward,
+                ResReceiveVillageBuildingReward,
+            ),
+            "/lq.Lobby/startVillageTrip": grpclib.const.Handler(
+                self.__rpc_start_village_trip,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStartVillageTrip,
+                ResCommon,
+            ),
+            "/lq.Lobby/receiveVillageTripReward": grpclib.const.Handler(
+                self.__rpc_receive_village_trip_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqReceiveVillageTripReward,
+                ResReceiveVillageTripReward,
+            ),
+            "/lq.Lobby/completeVillageTask": grpclib.const.Handler(
+                self.__rpc_complete_village_task,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCompleteVillageTask,
+                ResCompleteVillageTask,
+            ),
+            "/lq.Lobby/getFriendVillageData": grpclib.const.Handler(
+                self.__rpc_get_friend_village_data,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGetFriendVillageData,
+                ResGetFriendVillageData,
+            ),
+            "/lq.Lobby/setVillageWorker": grpclib.const.Handler(
+                self.__rpc_set_village_worker,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSetVillageWorker,
+                ResSetVillageWorker,
+            ),
+            "/lq.Lobby/nextRoundVillage": grpclib.const.Handler(
+                self.__rpc_next_round_village,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqNextRoundVillage,
+                ResNextRoundVillage,
+            ),
+            "/lq.Lobby/resolveFestivalActivityProposal": grpclib.const.Handler(
+                self.__rpc_resolve_festival_activity_proposal,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqResolveFestivalActivityProposal,
+                ResResolveFestivalActivityProposal,
+            ),
+            "/lq.Lobby/resolveFestivalActivityEvent": grpclib.const.Handler(
+                self.__rpc_resolve_festival_activity_event,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqResolveFestivalActivityEvent,
+                ResResolveFestivalActivityEvent,
+            ),
+            "/lq.Lobby/buyFestivalProposal": grpclib.const.Handler(
+                self.__rpc_buy_festival_proposal,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBuyFestivalProposal,
+                ResBuyFestivalProposal,
+            ),
+            "/lq.Lobby/islandActivityMove": grpclib.const.Handler(
+                self.__rpc_island_activity_move,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqIslandActivityMove,
+                ResCommon,
+            ),
+            "/lq.Lobby/islandActivityBuy": grpclib.const.Handler(
+                self.__rpc_island_activity_buy,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqIslandActivityBuy,
+                ResCommon,
+            ),
+            "/lq.Lobby/islandActivitySell": grpclib.const.Handler(
+                self.__rpc_island_activity_sell,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqIslandActivitySell,
+                ResCommon,
+            ),
+            "/lq.Lobby/islandActivityTidyBag": grpclib.const.Handler(
+                self.__rpc_island_activity_tidy_bag,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqIslandActivityTidyBag,
+                ResCommon,
+            ),
+            "/lq.Lobby/islandActivityUnlockBagGrid": grpclib.const.Handler(
+                self.__rpc_island_activity_unlock_bag_grid,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqIslandActivityUnlockBagGrid,
+                ResCommon,
+            ),
+            "/lq.Lobby/createCustomizedContest": grpclib.const.Handler(
+                self.__rpc_create_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateCustomizedContest,
+                ResCreateCustomizedContest,
+            ),
+            "/lq.Lobby/fetchManagerCustomizedContestList": grpclib.const.Handler(
+                self.__rpc_fetch_manager_customized_contest_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchmanagerCustomizedContestList,
+                ResFetchManagerCustomizedContestList,
+            ),
+            "/lq.Lobby/fetchManagerCustomizedContest": grpclib.const.Handler(
+                self.__rpc_fetch_manager_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchManagerCustomizedContest,
+                ResFetchManagerCustomizedContest,
+            ),
+            "/lq.Lobby/updateManagerCustomizedContest": grpclib.const.Handler(
+                self.__rpc_update_manager_customized_contest,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqUpdateManagerCustomizedContest,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchContestPlayerRank": grpclib.const.Handler(
+                self.__rpc_fetch_contest_player_rank,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchContestPlayerRank,
+                ResFetchContestPlayerRank,
+            ),
+            "/lq.Lobby/fetchReadyPlayerList": grpclib.const.Handler(
+                self.__rpc_fetch_ready_player_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchReadyPlayerList,
+                ResFetchReadyPlayerList,
+            ),
+            "/lq.Lobby/createGamePlan": grpclib.const.Handler(
+                self.__rpc_create_game_plan,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCreateGamePlan,
+                ResCommon,
+            ),
+            "/lq.Lobby/generateContestManagerLoginCode": grpclib.const.Handler(
+                self.__rpc_generate_contest_manager_login_code,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResGenerateContestManagerLoginCode,
+            ),
+            "/lq.Lobby/amuletActivityStartGame": grpclib.const.Handler(
+                self.__rpc_amulet_activity_start_game,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityStartGame,
+                ResAmuletActivityStartGame,
+            ),
+            "/lq.Lobby/amuletActivityOperate": grpclib.const.Handler(
+                self.__rpc_amulet_activity_operate,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityOperate,
+                ResAmuletActivityOperate,
+            ),
+            "/lq.Lobby/amuletActivityChangeHands": grpclib.const.Handler(
+                self.__rpc_amulet_activity_change_hands,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityChangeHands,
+                ResAmuletActivityChangeHands,
+            ),
+            "/lq.Lobby/amuletActivityUpgrade": grpclib.const.Handler(
+                self.__rpc_amulet_activity_upgrade,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityUpgrade,
+                ResAmuletActivityUpgrade,
+            ),
+            "/lq.Lobby/amuletActivityBuy": grpclib.const.Handler(
+                self.__rpc_amulet_activity_buy,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityBuy,
+                ResAmuletActivityBuy,
+            ),
+            "/lq.Lobby/amuletActivitySelectPack": grpclib.const.Handler(
+                self.__rpc_amulet_activity_select_pack,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivitySelectPack,
+                ResAmuletActivitySelectPack,
+            ),
+            "/lq.Lobby/amuletActivitySellEffect": grpclib.const.Handler(
+                self.__rpc_amulet_activity_sell_effect,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivitySellEffect,
+                ResAmuletActivitySellEffect,
+            ),
+            "/lq.Lobby/amuletActivityEffectSort": grpclib.const.Handler(
+                self.__rpc_amulet_activity_effect_sort,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityEffectSort,
+                ResCommon,
+            ),
+            "/lq.Lobby/amuletActivityGiveup": grpclib.const.Handler(
+                self.__rpc_amulet_activity_giveup,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityGiveup,
+                ResCommon,
+            ),
+            "/lq.Lobby/amuletActivityRefreshShop": grpclib.const.Handler(
+                self.__rpc_amulet_activity_refresh_shop,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityRefreshShop,
+                ResAmuletActivityRefreshShop,
+            ),
+            "/lq.Lobby/amuletActivitySelectFreeEffect": grpclib.const.Handler(
+                self.__rpc_amulet_activity_select_free_effect,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivitySelectFreeEffect,
+                ResAmuletActivitySelectFreeEffect,
+            ),
+            "/lq.Lobby/amuletActivityUpgradeShopBuff": grpclib.const.Handler(
+                self.__rpc_amulet_activity_upgrade_shop_buff,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityUpgradeShopBuff,
+                ResAmuletActivityUpgradeShopBuff,
+            ),
+            "/lq.Lobby/amuletActivityEndShopping": grpclib.const.Handler(
+                self.__rpc_amulet_activity_end_shopping,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivityEndShopping,
+                ResAmuletActivityEndShopping,
+            ),
+            "/lq.Lobby/amuletActivitySetSkillLevel": grpclib.const.Handler(
+                self.__rpc_amulet_activity_set_skill_level,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAmuletActivitySetSkillLevel,
+                ResCommon,
+            ),
+            "/lq.Lobby/amuletActivityMaintainInfo": grpclib.const.Handler(
+                self.__rpc_amulet_activity_maintain_info,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResAmuletActivityMaintainInfo,
+            ),
+            "/lq.Lobby/storyActivityUnlock": grpclib.const.Handler(
+                self.__rpc_story_activity_unlock,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStoryActivityUnlock,
+                ResCommon,
+            ),
+            "/lq.Lobby/storyActivityUnlockEnding": grpclib.const.Handler(
+                self.__rpc_story_activity_unlock_ending,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStoryActivityUnlockEnding,
+                ResCommon,
+            ),
+            "/lq.Lobby/storyActivityReceiveEndingReward": grpclib.const.Handler(
+                self.__rpc_story_activity_receive_ending_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStoryActivityReceiveEndingReward,
+                ResStoryReward,
+            ),
+            "/lq.Lobby/storyActivityReceiveFinishReward": grpclib.const.Handler(
+                self.__rpc_story_activity_receive_finish_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStoryActivityReceiveFinishReward,
+                ResStoryReward,
+            ),
+            "/lq.Lobby/storyActivityReceiveAllFinishReward": grpclib.const.Handler(
+                self.__rpc_story_activity_receive_all_finish_reward,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStoryActivityReceiveAllFinishReward,
+                ResStoryReward,
+            ),
+            "/lq.Lobby/storyActivityUnlockEndingAndReceive": grpclib.const.Handler(
+                self.__rpc_story_activity_unlock_ending_and_receive,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqStoryActivityUnlockEndingAndReceive,
+                ResStoryActivityUnlockEndingAndReceive,
+            ),
+            "/lq.Lobby/fetchActivityRank": grpclib.const.Handler(
+                self.__rpc_fetch_activity_rank,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchActivityRank,
+                ResFetchActivityRank,
+            ),
+            "/lq.Lobby/setVerifiedHidden": grpclib.const.Handler(
+                self.__rpc_set_verified_hidden,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSetVerifiedHidden,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchQuestionnaireList": grpclib.const.Handler(
+                self.__rpc_fetch_questionnaire_list,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchQuestionnaireList,
+                ResFetchQuestionnaireList,
+            ),
+            "/lq.Lobby/fetchQuestionnaireDetail": grpclib.const.Handler(
+                self.__rpc_fetch_questionnaire_detail,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchQuestionnaireDetail,
+                ResFetchQuestionnaireDetail,
+            ),
+            "/lq.Lobby/submitQuestionnaire": grpclib.const.Handler(
+                self.__rpc_submit_questionnaire,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSubmitQuestionnaire,
+                ResCommon,
+            ),
+            "/lq.Lobby/setFriendRoomRandomBotChar": grpclib.const.Handler(
+                self.__rpc_set_friend_room_random_bot_char,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSetFriendRoomRandomBotChar,
+                ResCommon,
+            ),
+            "/lq.Lobby/fetchAccountGameHuRecords": grpclib.const.Handler(
+                self.__rpc_fetch_account_game_hu_records,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchAccountGameHuRecords,
+                ResFetchAccountGameHuRecords,
+            ),
+            "/lq.Lobby/fetchAccountInfoExtra": grpclib.const.Handler(
+                self.__rpc_fetch_account_info_extra,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqFetchAccountInfoExtra,
+                ResFetchAccountInfoExtra,
+            ),
+            "/lq.Lobby/setAccountFavoriteHu": grpclib.const.Handler(
+                self.__rpc_set_account_favorite_hu,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSetAccountFavoriteHu,
+                ResCommon,
+            ),
+        }
+
+
+class FastTestBase(ServiceBase):
+
+    async def auth_game(self, req_auth_game: "ReqAuthGame") -> "ResAuthGame":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def enter_game(self, req_common: "ReqCommon") -> "ResEnterGame":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def sync_game(self, req_sync_game: "ReqSyncGame") -> "ResSyncGame":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def finish_sync_game(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def terminate_game(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def input_operation(
+        self, req_self_operation: "ReqSelfOperation"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def input_chi_peng_gang(
+        self, req_chi_peng_gang: "ReqChiPengGang"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def confirm_new_round(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def broadcast_in_game(
+        self, req_broadcast_in_game: "ReqBroadcastInGame"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def input_game_gm_command(
+        self, req_gm_command_in_gaming: "ReqGmCommandInGaming"
+    ) -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def fetch_game_player_state(
+        self, req_common: "ReqCommon"
+    ) -> "ResGamePlayerState":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def check_network_delay(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def clear_leaving(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def vote_game_end(
+        self, req_vote_game_end: "ReqVoteGameEnd"
+    ) -> "ResGameEndVote":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def auth_observe(self, req_auth_observe: "ReqAuthObserve") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def start_observe(self, req_common: "ReqCommon") -> "ResStartObserve":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def stop_observe(self, req_common: "ReqCommon") -> "ResCommon":
+        raise grpclib.GRPCError(grpclib.const.Status.UNIMPLEMENTED)
+
+    async def __rpc_auth_game(
+        self, stream: "grpclib.server.Stream[ReqAuthGame, ResAuthGame]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.auth_game(request)
+        await stream.send_message(response)
+
+    async def __rpc_enter_game(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResEnterGame]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.enter_game(request)
+        await stream.send_message(response)
+
+    async def __rpc_sync_game(
+        self, stream: "grpclib.server.Stream[ReqSyncGame, ResSyncGame]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.sync_game(request)
+        await stream.send_message(response)
+
+    async def __rpc_finish_sync_game(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.finish_sync_game(request)
+        await stream.send_message(response)
+
+    async def __rpc_terminate_game(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.terminate_game(request)
+        await stream.send_message(response)
+
+    async def __rpc_input_operation(
+        self, stream: "grpclib.server.Stream[ReqSelfOperation, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.input_operation(request)
+        await stream.send_message(response)
+
+    async def __rpc_input_chi_peng_gang(
+        self, stream: "grpclib.server.Stream[ReqChiPengGang, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.input_chi_peng_gang(request)
+        await stream.send_message(response)
+
+    async def __rpc_confirm_new_round(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.confirm_new_round(request)
+        await stream.send_message(response)
+
+    async def __rpc_broadcast_in_game(
+        self, stream: "grpclib.server.Stream[ReqBroadcastInGame, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.broadcast_in_game(request)
+        await stream.send_message(response)
+
+    async def __rpc_input_game_gm_command(
+        self, stream: "grpclib.server.Stream[ReqGmCommandInGaming, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.input_game_gm_command(request)
+        await stream.send_message(response)
+
+    async def __rpc_fetch_game_player_state(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResGamePlayerState]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.fetch_game_player_state(request)
+        await stream.send_message(response)
+
+    async def __rpc_check_network_delay(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.check_network_delay(request)
+        await stream.send_message(response)
+
+    async def __rpc_clear_leaving(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.clear_leaving(request)
+        await stream.send_message(response)
+
+    async def __rpc_vote_game_end(
+        self, stream: "grpclib.server.Stream[ReqVoteGameEnd, ResGameEndVote]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.vote_game_end(request)
+        await stream.send_message(response)
+
+    async def __rpc_auth_observe(
+        self, stream: "grpclib.server.Stream[ReqAuthObserve, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.auth_observe(request)
+        await stream.send_message(response)
+
+    async def __rpc_start_observe(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResStartObserve]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.start_observe(request)
+        await stream.send_message(response)
+
+    async def __rpc_stop_observe(
+        self, stream: "grpclib.server.Stream[ReqCommon, ResCommon]"
+    ) -> None:
+        request = await stream.recv_message()
+        response = await self.stop_observe(request)
+        await stream.send_message(response)
+
+    def __mapping__(self) -> Dict[str, grpclib.const.Handler]:
+        return {
+            "/lq.FastTest/authGame": grpclib.const.Handler(
+                self.__rpc_auth_game,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAuthGame,
+                ResAuthGame,
+            ),
+            "/lq.FastTest/enterGame": grpclib.const.Handler(
+                self.__rpc_enter_game,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResEnterGame,
+            ),
+            "/lq.FastTest/syncGame": grpclib.const.Handler(
+                self.__rpc_sync_game,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSyncGame,
+                ResSyncGame,
+            ),
+            "/lq.FastTest/finishSyncGame": grpclib.const.Handler(
+                self.__rpc_finish_sync_game,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.FastTest/terminateGame": grpclib.const.Handler(
+                self.__rpc_terminate_game,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.FastTest/inputOperation": grpclib.const.Handler(
+                self.__rpc_input_operation,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqSelfOperation,
+                ResCommon,
+            ),
+            "/lq.FastTest/inputChiPengGang": grpclib.const.Handler(
+                self.__rpc_input_chi_peng_gang,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqChiPengGang,
+                ResCommon,
+            ),
+            "/lq.FastTest/confirmNewRound": grpclib.const.Handler(
+                self.__rpc_confirm_new_round,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.FastTest/broadcastInGame": grpclib.const.Handler(
+                self.__rpc_broadcast_in_game,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqBroadcastInGame,
+                ResCommon,
+            ),
+            "/lq.FastTest/inputGameGMCommand": grpclib.const.Handler(
+                self.__rpc_input_game_gm_command,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqGmCommandInGaming,
+                ResCommon,
+            ),
+            "/lq.FastTest/fetchGamePlayerState": grpclib.const.Handler(
+                self.__rpc_fetch_game_player_state,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResGamePlayerState,
+            ),
+            "/lq.FastTest/checkNetworkDelay": grpclib.const.Handler(
+                self.__rpc_check_network_delay,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.FastTest/clearLeaving": grpclib.const.Handler(
+                self.__rpc_clear_leaving,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+            "/lq.FastTest/voteGameEnd": grpclib.const.Handler(
+                self.__rpc_vote_game_end,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqVoteGameEnd,
+                ResGameEndVote,
+            ),
+            "/lq.FastTest/authObserve": grpclib.const.Handler(
+                self.__rpc_auth_observe,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqAuthObserve,
+                ResCommon,
+            ),
+            "/lq.FastTest/startObserve": grpclib.const.Handler(
+                self.__rpc_start_observe,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResStartObserve,
+            ),
+            "/lq.FastTest/stopObserve": grpclib.const.Handler(
+                self.__rpc_stop_observe,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ReqCommon,
+                ResCommon,
+            ),
+        }
+
+
+from . import (  # noqa: E402
+    ReqAccountInfo,
+    ReqAccountList,
+    ReqAccountStatisticInfo,
+    ReqAddCollectedGameRecord,
+    ReqAddRoomRobot,
+    ReqAmuletActivityBuy,
+    ReqAmuletActivityChangeHands,
+    ReqAmuletActivityEffectSort,
+    ReqAmuletActivityEndShopping,
+    ReqAmuletActivityGiveup,
+    ReqAmuletActivityOperate,
+    ReqAmuletActivityRefreshShop,
+    ReqAmuletActivitySelectFreeEffect,
+    ReqAmuletActivitySelectPack,
+    ReqAmuletActivitySellEffect,
+    ReqAmuletActivitySetSkillLevel,
+    ReqAmuletActivityStartGame,
+    ReqAmuletActivityUpgrade,
+    ReqAmuletActivityUpgradeShopBuff,
+    ReqApplyFriend,
+    ReqArenaReward,
+    ReqAuthGame,
+    ReqAuthObserve,
+    ReqBindAccount,
+    ReqBindEmail,
+    ReqBindOauth2,
+    ReqBindPhoneNumber,
+    ReqBroadcastInGame,
+    ReqBuyArenaTicket,
+    ReqBuyFestivalProposal,
+    ReqBuyFromChestShop,
+    ReqBuyFromShop,
+    ReqBuyFromZhp,
+    ReqBuyInAbMatch,
+    ReqBuyShiLian,
+    ReqCancelGooglePlayOrder,
+    ReqCancelMatchQueue,
+    ReqCancelUnifiedMatch,
+    ReqChallangeLeaderboard,
+    ReqChangeAvatar,
+    ReqChangeCharacterSkin,
+    ReqChangeCharacterView,
+    ReqChangeCollectedGameRecordRemarks,
+    ReqChangeCommonView,
+    ReqChangeMainCharacter,
+    ReqCheckPrivacy,
+    ReqChiPengGang,
+    ReqClientMessage,
+    ReqCombiningRecycleCraft,
+    ReqCommon,
+    ReqCommonViews,
+    ReqCompleteActivityTask,
+    ReqCompleteActivityTaskBatch,
+    ReqCompletePeriodActivityTaskBatch,
+    ReqCompleteSegmentTaskReward,
+    ReqCompleteVillageTask,
+    ReqComposeShard,
+    ReqCreateAlipayAppOrder,
+    ReqCreateAlipayOrder,
+    ReqCreateAlipayScanOrder,
+    ReqCreateBillingOrder,
+    ReqCreateCustomizedContest,
+    ReqCreateDmmOrder,
+    ReqCreateEmailVerifyCode,
+    ReqCreateEnAlipayOrder,
+    ReqCreateEnMasterCardOrder,
+    ReqCreateEnPaypalOrder,
+    ReqCreateEnVisaOrder,
+    ReqCreateEnjcbOrder,
+    ReqCreateGameObserveAuth,
+    ReqCreateGamePlan,
+    ReqCreateIapOrder,
+    ReqCreateJpAuOrder,
+    ReqCreateJpCreditCardOrder,
+    ReqCreateJpDocomoOrder,
+    ReqCreateJpPayPayOrder,
+    ReqCreateJpPaypalOrder,
+    ReqCreateJpSoftbankOrder,
+    ReqCreateJpWebMoneyOrder,
+    ReqCreateJpgmoOrder,
+    ReqCreateKrAlipayOrder,
+    ReqCreateKrMasterCardOrder,
+    ReqCreateKrPaypalOrder,
+    ReqCreateKrVisaOrder,
+    ReqCreateKrjcbOrder,
+    ReqCreateMyCardOrder,
+    ReqCreateNickname,
+    ReqCreatePaypalOrder,
+    ReqCreatePhoneLoginBind,
+    ReqCreatePhoneVerifyCode,
+    ReqCreateRoom,
+    ReqCreateSteamOrder,
+    ReqCreateWechatAppOrder,
+    ReqCreateWechatNativeOrder,
+    ReqCreateXsollaOrder,
+    ReqCreateYostarOrder,
+    ReqCurrentMatchInfo,
+    ReqDeleteComment,
+    ReqDeleteMail,
+    ReqDeliverAa32Order,
+    ReqDigMine,
+    ReqDmmPreLogin,
+    ReqDoActivitySignIn,
+    ReqEmailLogin,
+    ReqEnterArena,
+    ReqEnterCustomizedContest,
+    ReqExchangeActivityItem,
+    ReqExchangeCurrency,
+    ReqFeedActivityFeed,
+    ReqFetchAccountGameHuRecords,
+    ReqFetchAccountInfoExtra,
+    ReqFetchActivityFlipInfo,
+    ReqFetchActivityRank,
+    ReqFetchAnnouncement,
+    ReqFetchCommentContent,
+    ReqFetchCommentList,
+    ReqFetchContestPlayerRank,
+    ReqFetchCustomizedContestAuthInfo,
+    ReqFetchCustomizedContestByContestId,
+    ReqFetchCustomizedContestGameLiveList,
+    ReqFetchCustomizedContestGameRecords,
+    ReqFetchCustomizedContestList,
+    ReqFetchCustomizedContestOnlineInfo,
+    ReqFetchFriendGiftActivityData,
+    ReqFetchJpCommonCreditCardOrder,
+    ReqFetchLastPrivacy,
+    ReqFetchManagerCustomizedContest,
+    ReqFetchOauth2,
+    ReqFetchObToken,
+    ReqFetchQuestionnaireDetail,
+    ReqFetchQuestionnaireList,
+    ReqFetchRankPointLeaderboard,
+    ReqFetchReadyPlayerList,
+    ReqFetchRollingNotice,
+    ReqFetchRpgBattleHistory,
+    ReqFetchSimulationGameRank,
+    ReqFetchSimulationGameRecord,
+    ReqFetchVoteActivity,
+    ReqFetchmanagerCustomizedContestList,
+    ReqFinishCombiningOrder,
+    ReqFinishedEnding,
+    ReqForceCompleteChallengeTask,
+    ReqGainAccumulatedPointActivityReward,
+    ReqGainMultiPointActivityReward,
+    ReqGainRankPointReward,
+    ReqGainVipReward,
+    ReqGameLiveInfo,
+    ReqGameLiveLeftSegment,
+    ReqGameLiveList,
+    ReqGamePointRank,
+    ReqGameRecord,
+    ReqGameRecordList,
+    ReqGameRecordListV2,
+    ReqGameRecordsDetail,
+    ReqGameRecordsDetailV2,
+    ReqGenerateCombiningCraft,
+    ReqGetFriendVillageData,
+    ReqGmCommand,
+    ReqGmCommandInGaming,
+    ReqHandleFriendApply,
+    ReqHeatBeat,
+    ReqIslandActivityBuy,
+    ReqIslandActivityMove,
+    ReqIslandActivitySell,
+    ReqIslandActivityTidyBag,
+    ReqIslandActivityUnlockBagGrid,
+    ReqJoinCustomizedContestChatRoom,
+    ReqJoinMatchQueue,
+    ReqJoinRoom,
+    ReqLeaveComment,
+    ReqLevelLeaderboard,
+    ReqLikeSns,
+    ReqLogReport,
+    ReqLogin,
+    ReqLoginBeat,
+    ReqLogout,
+    ReqModifyBirthday,
+    ReqModifyNickname,
+    ReqModifyPassword,
+    ReqModifyRoom,
+    ReqModifySignature,
+    ReqMoveCombiningCraft,
+    ReqMultiAccountId,
+    ReqMutiChallengeLevel,
+    ReqNextGameRecordList,
+    ReqNextRoundVillage,
+    ReqOauth2Auth,
+    ReqOauth2Check,
+    ReqOauth2Login,
+    ReqOauth2Signup,
+    ReqOpenAllRewardItem,
+    ReqOpenChest,
+    ReqOpenGacha,
+    ReqOpenManualItem,
+    ReqOpenPreChestItem,
+    ReqOpenRandomRewardItem,
+    ReqOpenidCheck,
+    ReqPlatformBillingProducts,
+    ReqRandomCharacter,
+    ReqReadAnnouncement,
+    ReqReadMail,
+    ReqReadSns,
+    ReqReceiveAchievementGroupReward,
+    ReqReceiveAchievementReward,
+    ReqReceiveActivityFlipTask,
+    ReqReceiveActivityGift,
+    ReqReceiveActivitySpotReward,
+    ReqReceiveAllActivityGift,
+    ReqReceiveChallengeRankReward,
+    ReqReceiveCharacterRewards,
+    ReqReceiveRpgReward,
+    ReqReceiveRpgRewards,
+    ReqReceiveUpgradeActivityReward,
+    ReqReceiveVillageBuildingReward,
+    ReqReceiveVillageTripReward,
+    ReqRecoverCombiningRecycle,
+    ReqRefreshDailyTask,
+    ReqRefreshGameObserveAuth,
+    ReqRemoveCollectedGameRecord,
+    ReqRemoveFriend,
+    ReqReplySns,
+    ReqReshZhpShop,
+    ReqResolveFestivalActivityEvent,
+    ReqResolveFestivalActivityProposal,
+    ReqResponseCaptcha,
+    ReqRichmanChestInfo,
+    ReqRichmanNextMove,
+    ReqRichmanSpecialMove,
+    ReqRoomDressing,
+    ReqRoomKickPlayer,
+    ReqRoomReady,
+    ReqRoomStart,
+    ReqSaveCommonViews,
+    ReqSayChatMessage,
+    ReqSearchAccountById,
+    ReqSearchAccountByPattern,
+    ReqSelfOperation,
+    ReqSellItem,
+    ReqSendActivityGiftToFriend,
+    ReqSendClientMessage,
+    ReqSendGiftToCharacter,
+    ReqSetAccountFavoriteHu,
+    ReqSetFriendRoomRandomBotChar,
+    ReqSetHiddenCharacter,
+    ReqSetLoadingImage,
+    ReqSetVerifiedHidden,
+    ReqSetVillageWorker,
+    ReqShopPurchase,
+    ReqSignupAccount,
+    ReqSignupCustomizedContest,
+    ReqSimulationActivityTrain,
+    ReqSolveGooglePlayOrder,
+    ReqSolveGooglePlayOrderV3,
+    ReqStartCustomizedContest,
+    ReqStartSimulationActivityGame,
+    ReqStartUnifiedMatch,
+    ReqStartVillageTrip,
+    ReqStopCustomizedContest,
+    ReqStoryActivityReceiveAllFinishReward,
+    ReqStoryActivityReceiveEndingReward,
+    ReqStoryActivityReceiveFinishReward,
+    ReqStoryActivityUnlock,
+    ReqStoryActivityUnlockEnding,
+    ReqStoryActivityUnlockEndingAndReceive,
+    ReqSubmitQuestionnaire,
+    ReqSyncGame,
+    ReqTakeAttachment,
+    ReqTargetCustomizedContest,
+    ReqTaskRequest,
+    ReqUnbindPhoneNumber,
+    ReqUnlockActivitySpot,
+    ReqUnlockActivitySpotEnding,
+    ReqUpdateAccountSettings,
+    ReqUpdateCharacterSort,
+    ReqUpdateClientValue,
+    ReqUpdateCommentSetting,
+    ReqUpdateIdCardInfo,
+    ReqUpdateManagerCustomizedContest,
+    ReqUpdateReadComment,
+    ReqUpgradeActivityBuff,
+    ReqUpgradeActivityLevel,
+    ReqUpgradeCharacter,
+    ReqUpgradeVillageBuilding,
+    ReqUseBagItem,
+    ReqUseCommonView,
+    ReqUseGiftCode,
+    ReqUseTitle,
+    ReqUserComplain,
+    ReqVerificationIapOrder,
+    ReqVerifyCodeForSecure,
+    ReqVerifyMyCardOrder,
+    ReqVerifySteamOrder,
+    ReqVoteActivity,
+    ReqVoteGameEnd,
+    ResAccountActivityData,
+    ResAccountChallengeRankInfo,
+    ResAccountCharacterInfo,
+    ResAccountInfo,
+    ResAccountSettings,
+    ResAccountStates,
+    ResAccountStatisticInfo,
+    ResAchievement,
+    ResActivityBuff,
+    ResActivityList,
+    ResAddCollectedGameRecord,
+    ResAllcommonViews,
+    ResAmuletActivityBuy,
+    ResAmuletActivityChangeHands,
+    ResAmuletActivityEndShopping,
+    ResAmuletActivityMaintainInfo,
+    ResAmuletActivityOperate,
+    ResAmuletActivityRefreshShop,
+    ResAmuletActivitySelectFreeEffect,
+    ResAmuletActivitySelectPack,
+    ResAmuletActivitySellEffect,
+    ResAmuletActivityStartGame,
+    ResAmuletActivityUpgrade,
+    ResAmuletActivityUpgradeShopBuff,
+    ResAnnouncement,
+    ResArenaReward,
+    ResAuthGame,
+    ResBagInfo,
+    ResBuyFestivalProposal,
+    ResBuyFromChestShop,
+    ResBuyFromShop,
+    ResChallengeLeaderboard,
+    ResChallengeSeasonInfo,
+    ResChangeCollectedGameRecordRemarks,
+    ResCharacterInfo,
+    ResClientValue,
+    ResCollectedGameRecordList,
+    ResCombiningRecycleCraft,
+    ResCommentSetting,
+    ResCommon,
+    ResCommonView,
+    ResCommonViews,
+    ResCompleteSegmentTaskReward,
+    ResCompleteVillageTask,
+    ResConnectionInfo,
+    ResCreateAlipayAppOrder,
+    ResCreateAlipayOrder,
+    ResCreateAlipayScanOrder,
+    ResCreateBillingOrder,
+    ResCreateCustomizedContest,
+    ResCreateDmmOrder,
+    ResCreateEnAlipayOrder,
+    ResCreateEnMasterCardOrder,
+    ResCreateEnPaypalOrder,
+    ResCreateEnVisaOrder,
+    ResCreateEnjcbOrder,
+    ResCreateGameObserveAuth,
+    ResCreateIapOrder,
+    ResCreateJpAuOrder,
+    ResCreateJpCreditCardOrder,
+    ResCreateJpDocomoOrder,
+    ResCreateJpPayPayOrder,
+    ResCreateJpPaypalOrder,
+    ResCreateJpSoftbankOrder,
+    ResCreateJpWebMoneyOrder,
+    ResCreateJpgmoOrder,
+    ResCreateKrAlipayOrder,
+    ResCreateKrMasterCardOrder,
+    ResCreateKrPaypalOrder,
+    ResCreateKrVisaOrder,
+    ResCreateKrjcbOrder,
+    ResCreateMyCardOrder,
+    ResCreatePaypalOrder,
+    ResCreateRoom,
+    ResCreateSteamOrder,
+    ResCreateWechatAppOrder,
+    ResCreateWechatNativeOrder,
+    ResCreateXsollaOrder,
+    ResCreateYostarOrder,
+    ResCurrentMatchInfo,
+    ResDailySignInInfo,
+    ResDailyTask,
+    ResDeleteAccount,
+    ResDigMine,
+    ResDmmPreLogin,
+    ResDoActivitySignIn,
+    ResEnterCustomizedContest,
+    ResEnterGame,
+    ResExchangeActivityItem,
+    ResFeedActivityFeed,
+    ResFetchAbMatch,
+    ResFetchAccountGameHuRecords,
+    ResFetchAccountInfoExtra,
+    ResFetchAchievementRate,
+    ResFetchActivityFlipInfo,
+    ResFetchActivityInterval,
+    ResFetchActivityRank,
+    ResFetchChallengeInfo,
+    ResFetchCommentContent,
+    ResFetchCommentList,
+    ResFetchContestPlayerRank,
+    ResFetchCustomizedContestAuthInfo,
+    ResFetchCustomizedContestByContestId,
+    ResFetchCustomizedContestGameLiveList,
+    ResFetchCustomizedContestGameRecords,
+    ResFetchCustomizedContestList,
+    ResFetchCustomizedContestOnlineInfo,
+    ResFetchFriendGiftActivityData,
+    ResFetchGamingInfo,
+    ResFetchInfo,
+    ResFetchJpCommonCreditCardOrder,
+    ResFetchLastPrivacy,
+    ResFetchMaintainNotice,
+    ResFetchManagerCustomizedContest,
+    ResFetchManagerCustomizedContestList,
+    ResFetchOauth2,
+    ResFetchObToken,
+    ResFetchPhoneLoginBind,
+    ResFetchQuestionnaireDetail,
+    ResFetchQuestionnaireList,
+    ResFetchQueueInfo,
+    ResFetchRankPointLeaderboard,
+    ResFetchReadyPlayerList,
+    ResFetchRefundOrder,
+    ResFetchRollingNotice,
+    ResFetchRpgBattleHistory,
+    ResFetchRpgBattleHistoryV2,
+    ResFetchSelfGamePointRank,
+    ResFetchServerMaintenanceInfo,
+    ResFetchShopInterval,
+    ResFetchSimulationGameRank,
+    ResFetchSimulationGameRecord,
+    ResFetchVoteActivity,
+    ResFetchrecentFriend,
+    ResFinishCombiningOrder,
+    ResFriendApplyList,
+    ResFriendList,
+    ResGameEndVote,
+    ResGameLiveInfo,
+    ResGameLiveLeftSegment,
+    ResGameLiveList,
+    ResGamePlayerState,
+    ResGamePointRank,
+    ResGameRecord,
+    ResGameRecordList,
+    ResGameRecordListV2,
+    ResGameRecordsDetail,
+    ResGameRecordsDetailV2,
+    ResGenerateCombiningCraft,
+    ResGenerateContestManagerLoginCode,
+    ResGetFriendVillageData,
+    ResIdCardInfo,
+    ResJoinCustomizedContestChatRoom,
+    ResJoinRoom,
+    ResLevelLeaderboard,
+    ResLikeSns,
+    ResLogin,
+    ResLogout,
+    ResMailInfo,
+    ResMisc,
+    ResModNicknameTime,
+    ResMonthTicketInfo,
+    ResMoveCombiningCraft,
+    ResMultiAccountBrief,
+    ResMutiChallengeLevel,
+    ResNextGameRecordList,
+    ResNextRoundVillage,
+    ResOauth2Auth,
+    ResOauth2Check,
+    ResOauth2Signup,
+    ResOpenAllRewardItem,
+    ResOpenChest,
+    ResOpenGacha,
+    ResOpenPreChestItem,
+    ResOpenRandomRewardItem,
+    ResPayMonthTicket,
+    ResPlatformBillingProducts,
+    ResRandomCharacter,
+    ResReadSns,
+    ResReceiveAchievementGroupReward,
+    ResReceiveAchievementReward,
+    ResReceiveActivityFlipTask,
+    ResReceiveActivitySpotReward,
+    ResReceiveAllActivityGift,
+    ResReceiveChallengeRankReward,
+    ResReceiveCharacterRewards,
+    ResReceiveRpgRewards,
+    ResReceiveUpgradeActivityReward,
+    ResReceiveVillageBuildingReward,
+    ResReceiveVillageTripReward,
+    ResRecoverCombiningRecycle,
+    ResRefreshChallenge,
+    ResRefreshDailyTask,
+    ResRefreshGameObserveAuth,
+    ResRefreshZhpShop,
+    ResRemoveCollectedGameRecord,
+    ResReplySns,
+    ResResolveFestivalActivityEvent,
+    ResResolveFestivalActivityProposal,
+    ResReviveCoinInfo,
+    ResRichmanChestInfo,
+    ResRichmanNextMove,
+    ResSearchAccountById,
+    ResSearchAccountByPattern,
+    ResSelfRoom,
+    ResSendActivityGiftToFriend,
+    ResSendGiftToCharacter,
+    ResServerSettings,
+    ResServerTime,
+    ResSetHiddenCharacter,
+    ResSetVillageWorker,
+    ResShopInfo,
+    ResShopPurchase,
+    ResSignupAccount,
+    ResSignupCustomizedContest,
+    ResSimulationActivityTrain,
+    ResStartObserve,
+    ResStartSimulationActivityGame,
+    ResStoryActivityUnlockEndingAndReceive,
+    ResStoryReward,
+    ResSyncGame,
+    ResTitleList,
+    ResUpgradeActivityLevel,
+    ResUpgradeChallenge,
+    ResUpgradeCharacter,
+    ResUseGiftCode,
+    ResUseSpecialGiftCode,
+    ResVerfiyCodeForSecure,
+    ResVerificationIapOrder,
+    ResVipReward,
+    ResVoteActivity,
+)
@@ -3,6 +3,7 @@ from typing import Dict
 from gsuid_core.handler import config_masters, config_superusers
 from gsuid_core.utils.plugins_config.models import (
     GSC,
+    GsIntConfig,
     GsStrConfig,
     GsBoolConfig,
 )
@@ -45,4 +46,80 @@ CONFIG_DEFAULT: Dict[str, GSC] = {
         "设置后账号池的账号将会自动同意添加所有好友申请",
         True,
     ),
+    "MajsProtoBackend": GsStrConfig(
+        "牌谱解码后端",
+        "upb 需要安装 protobuf, 解析牌谱更快",
+        "betterproto",
+        ["betterproto", "upb"],
+    ),
+    "MajsCaptureFrames": GsBoolConfig(
+        "记录收发的原始数据帧",
+        "开启后新建立的连接会把收发帧写入 capture 目录, 用于性能测试",
+        False,
+    ),
+    "MajsLoginConcurrency": GsIntConfig(
+        "账号池同时登陆的账号数",
+        "启动推送服务时最多同时登陆的账号数量",
+        4,
+        16,
+    ),
+    "MajsNotifyWorkers": GsIntConfig(
+        "同时处理的通知数",
+        "每个账号同时处理的好友通知数量, 同一好友的通知总是按顺序处理",
+        4,
+        32,
+    ),
+    "MajsNotifyQueueSize": GsIntConfig(
+        "通知队列长度",
+        "每个账号排队中的通知上限, 超出后丢弃可合并的通知(如好友信息变化)",
+        2000,
+        100000,
+    ),
+    "MajsNotifyCoalesceMs": GsIntConfig(
+        "通知合并窗口(毫秒)",
+        "在该时间内合并同一好友的状态/信息变化后再处理, 0 为不合并",
+        1000,
+        10000,
+    ),
+    "MajsPushBatchMs": GsIntConfig(
+        "推送合并窗口(毫秒)",
+        "在该时间内发往同一个群/用户的推送会合并为一条消息发送",
+        2000,
+        30000,
+    ),
+    "MajsPushRateLimit": GsIntConfig(
+        "推送限速(条/分钟)",
+        "每个Bot适配器每分钟最多发送的推送消息数",
+        20,
+        600,
+    ),
+    "MajsRecordRetryMaxAge": GsIntConfig(
+        "牌谱获取重试时长(秒)",
+        "对局结束时获取牌谱失败会先推送对局结束, 在该时间内重试成功后补发对局结果",
+        600,
+        3600,
+    ),
+    "MajsRecordBatchMs": GsIntConfig(
+        "对局结果查询合并窗口(毫秒)",
+        "在该时间内结束的对局合并为一次请求查询对局结果",
+        300,
+        5000,
+    ),
+    "MajsArchiveRateLimit": GsIntConfig(
+        "牌谱归档限速(次/分钟)",
+        "牌谱归档每分钟最多发出的请求数, 包括翻页和下载牌谱",
+        30,
+        600,
+    ),
+    "MajsArchiveConcurrency": GsIntConfig(
+        "牌谱归档并发数",
+        "牌谱归档时同时下载的牌谱数量",
+        2,
+        8,
+    ),
+    "MajsRecordBlobCompress": GsBoolConfig(
+        "压缩保存牌谱数据",
+        "从 data_url 下载的牌谱数据使用 gzip 压缩后保存",
+        True,
+    ),
 }
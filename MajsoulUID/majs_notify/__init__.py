@@ -1,7 +1,5 @@
-import random
 from urllib.parse import parse_qs, urlparse
 
-import httpx
 import email_validator
 from gsuid_core.sv import SV
 from gsuid_core.bot import Bot
@@ -9,9 +7,12 @@ from gsuid_core.models import Event
 from gsuid_core.logger import logger
 from gsuid_core.utils.database.api import get_uid
 
+from .archiver import archiver
 from .constants import USER_AGENT
 from .draw_frame import render_frame
+from .subscription import subscriptions
 from ..utils.error_reply import UID_HINT
+from ..utils.http_client import get_client
 from ..utils.api.remote import encode_account_id2
 from .draw_friend_rank import draw_friend_rank_img
 from .draw_review_info import draw_review_info_img
@@ -57,10 +58,9 @@ async def majsoul_review_command(bot: Bot, ev: Event):
     path2 = PAIPU_PATH / f"{desired_string} - review.json"
 
     if not (path1.exists() and path2.exists()):
-        conns = manager.get_all_conn()
-        if not conns:
+        conn = manager.pick_conn()
+        if conn is None:
             return await bot.send("❌ 未找到有效连接, 请先进行[雀魂推送启动]")
-        conn = random.choice(conns)
         tenhou_log = await conn.fetchLogs(desired_string)
     else:
         tenhou_log = await get_paipu_by_game_id(desired_string)
@@ -128,9 +128,9 @@ async def majsoul_jp_login_command(bot: Bot, ev: Event):
         return await bot.send("❌ 请输入有效的email!")
 
     lang = "ja" if "日" in ev.command else "en"
-    sess = httpx.AsyncClient(headers=headers, verify=False)
+    sess = get_client("passport")
     payload = {"account": email, "lang": lang}
-    response = await sess.post(url, json=payload)
+    response = await sess.post(url, json=payload, headers=headers)
     if response.status_code == 200:
         res = response.json()
         if res["result"] == 0:
@@ -147,7 +147,7 @@ async def majsoul_jp_login_command(bot: Bot, ev: Event):
 
     url = "https://passport.mahjongsoul.com/account/auth_submit"
     payload = {"account": email, "code": code.text}
-    response = await sess.post(url, json=payload)
+    response = await sess.post(url, json=payload, headers=headers)
     if response.status_code == 200:
         res = response.json()
         if res["result"] == 0:
@@ -162,7 +162,7 @@ async def majsoul_jp_login_command(bot: Bot, ev: Event):
 
     url = "https://passport.mahjongsoul.com/user/login"
     payload = {"uid": uid, "token": token, "deviceId": f"web|{uid}"}
-    response = await sess.post(url, json=payload)
+    response = await sess.post(url, json=payload, headers=headers)
     if response.status_code == 200:
         res = response.json()
         if res["result"] == 0:
@@ -210,6 +210,10 @@ async def majsoul_jp_login_command(bot: Bot, ev: Event):
             lang=lang,
             login_type=7,
         )
+    # 连接已加入连接池, 关联账号池记录后断线时才能刷新 AccessToken
+    connection.user = await MajsUser.select_data_by_uid(
+        str(connection.account_id)
+    )
 
     msg = f"🥰成功向账号池添加{lang}账号！\n"
     msg += f"当前雀魂账号ID: {connection.account_id}, 昵称: {connection.nick_name}"
@@ -298,6 +302,7 @@ async def majsoul_cancel_notify_command(bot: Bot, ev: Event):
                 ev.bot_id,
                 push_id="off",
             )
+            subscriptions.invalidate()
             if retcode == 0:
                 logger.success(f"[majs] {uid}订阅推送成功！当前值：{push_id}")
                 return await bot.send(
@@ -329,10 +334,7 @@ async def majsoul_get_notify_command(bot: Bot, ev: Event):
     if friend_code is None:
         return await bot.send("[majs] 账号池账号异常, 请联系管理员!")
 
-    for friend in conn.friends:
-        if uid == str(friend.account_id):
-            break
-    else:
+    if not uid.isdigit() or int(uid) not in conn.friends:
         return await bot.send(
             "[majs] 未找到好友信息! \n"
             f"请先在【游戏中】添加 {conn.nick_name}: {friend_code}好友再执行此操作！"
@@ -352,6 +354,7 @@ async def majsoul_get_notify_command(bot: Bot, ev: Event):
             user_id=ev.user_id,
             push_id=push_id,
         )
+    subscriptions.invalidate()
 
     if retcode == 0:
         logger.success(f"[majs] {uid}订阅推送成功！当前值：{push_id}")
@@ -398,13 +401,47 @@ async def majsoul_notify_check_command(bot: Bot, event: Event):
         else:
             a = f"❌ 当前雀魂账号ID: {conn.account_id}, 昵称: {conn.nick_name} 账号登录态失效!"
             a += "请使用[雀魂重启订阅服务]"
+        stats = conn.scheduler.stats()
+        a += (
+            f"\n通知队列: 排队 {stats.pending}, 处理中 {stats.running}, "
+            f"平均耗时 {stats.latency * 1000:.0f}ms, "
+            f"合并 {conn.coalescer.coalesced + stats.merged}, "
+            f"失败 {stats.failed}, 丢弃 {stats.dropped}"
+        )
 
         msg_list.append(a)
 
+    retry = manager.record_retry
+    msg_list.append(
+        f"牌谱重试: 等待 {len(retry)}, 成功 {retry.succeeded}, 放弃 {retry.expired}"
+    )
+    batch = manager.record_batch
+    msg_list.append(f"对局结果查询: 请求 {batch.requests} 次, 共 {batch.games} 局")
     msg = "\n".join(msg_list)
     await bot.send(msg)
 
 
+@majsoul_notify.on_command(("归档牌谱", "牌谱归档"))
+async def majsoul_archive_command(bot: Bot, event: Event):
+    if not manager.get_all_conn():
+        return await bot.send("未找到有效连接, 请先进行[雀魂推送启动]")
+
+    text = event.text.strip()
+    days = int(text) if text.isdigit() else 30
+    if not archiver.start(days):
+        return await bot.send("牌谱归档正在进行中, 请使用[雀魂归档进度]查看")
+    await bot.send(f"开始归档账号池账号最近 {days} 天的牌谱, 可能需要较长时间!")
+
+
+@majsoul_notify.on_fullmatch(("归档进度", "牌谱归档进度"))
+async def majsoul_archive_progress_command(bot: Bot, event: Event):
+    progress = archiver.progress_text()
+    if not progress:
+        return await bot.send("还没有进行过牌谱归档, 请使用[雀魂归档牌谱 天数]")
+    state = "进行中" if archiver.running else "已结束"
+    await bot.send(f"牌谱归档{state}\n{progress}")
+
+
 @majsoul_friend_level_billboard.on_command("好友排行榜")
 async def majsoul_friend_billboard_command(bot: Bot, event: Event):
     # get connection
@@ -412,13 +449,12 @@ async def majsoul_friend_billboard_command(bot: Bot, event: Event):
     if conn is None:
         return await bot.send("未找到有效连接, 请先进行[雀魂推送启动]")
 
-    # 去重
-    friends = conn.remove_duplicate_friends()
+    friends = conn.friend_list()
     if "三" in event.text:
-        friends.sort(key=lambda x: (x.level3.id, x.level3_score), reverse=True)
+        friends.sort(key=lambda x: (x.level3_id, x.level3_score), reverse=True)
         msg = await draw_friend_rank_img(friends, "3")
     else:
-        friends.sort(key=lambda x: (x.level.id, x.level_score), reverse=True)
+        friends.sort(key=lambda x: (x.level_id, x.level_score), reverse=True)
         msg = await draw_friend_rank_img(friends, "4")
     await bot.send(msg)
 
@@ -428,9 +464,8 @@ async def majsoul_friend_overview_command(bot: Bot, event: Event):
     conn = manager.get_conn()
     if conn is None:
         return await bot.send("未找到有效连接, 请先进行[雀魂推送启动]")
-    friends = conn.friends
     msg = "本群雀魂好友列表\n"
-    for friend in friends:
+    for friend in conn.friends.values():
         msg += f"{friend.nickname} {friend.account_id}\n"
     await bot.send(msg)
 
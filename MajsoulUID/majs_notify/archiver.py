@@ -0,0 +1,219 @@
+import time
+import asyncio
+from typing import Dict, cast
+
+import aiofiles
+from msgspec import Struct
+from msgspec import json as msgjson
+from gsuid_core.logger import logger
+
+from ..lib import lq as liblq
+from .push_dispatcher import RateLimiter
+from ..utils.database.models import MajsPaipu
+from ..utils.api.remote import encode_account_id
+from ..majs_config.majs_config import MAJS_CONFIG
+from .majsoul import MajsoulConnection, manager, get_category_name
+from ..utils.resource.RESOURCE_PATH import PAIPU_PATH, ARCHIVE_PATH
+
+# 牌谱归档: 按时间从新到旧翻页获取账号池账号自己的对局记录,
+# 补全停机期间未记录的牌谱. fetchGameRecordListV2 只能查询当前登陆账号的对局,
+# 无法查询好友的对局. 每页处理完后保存进度, 中断后从上次的位置继续
+
+PAGE_SIZE = 20
+# 0: 不按标签筛选
+RECORD_TAG_ALL = 0
+# 迭代器过期前预留的时间(秒)
+ITERATOR_MARGIN = 30
+
+
+class ArchiveCheckpoint(Struct):
+    account_id: int
+    begin_time: int
+    # 下一页从该时间往前查询
+    end_time: int
+    iterator: str = ""
+    iterator_expire: int = 0
+    done: bool = False
+    archived: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+
+def _checkpoint_path(account_id: int):
+    return ARCHIVE_PATH / f"{account_id}.json"
+
+
+async def load_checkpoint(account_id: int):
+    path = _checkpoint_path(account_id)
+    if not path.exists():
+        return None
+    async with aiofiles.open(path, "rb") as f:
+        content = await f.read()
+    try:
+        return msgjson.decode(content, type=ArchiveCheckpoint)
+    except ValueError:
+        return None
+
+
+async def save_checkpoint(ckpt: ArchiveCheckpoint):
+    path = _checkpoint_path(ckpt.account_id)
+    tmp_file = path.with_suffix(".tmp")
+    async with aiofiles.open(tmp_file, "wb") as f:
+        await f.write(msgjson.encode(ckpt))
+    tmp_file.replace(path)
+
+
+def format_progress(ckpt: ArchiveCheckpoint) -> str:
+    state = "完成" if ckpt.done else "进行中"
+    date = time.strftime("%Y-%m-%d", time.localtime(ckpt.end_time))
+    return (
+        f"{ckpt.account_id}: {state}, 已到 {date}, "
+        f"新增 {ckpt.archived}, 跳过 {ckpt.skipped}, 失败 {ckpt.failed}"
+    )
+
+
+class PaipuArchiver:
+    def __init__(self):
+        self._task: asyncio.Task | None = None
+        self.progress: Dict[int, ArchiveCheckpoint] = {}
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def start(self, days: int) -> bool:
+        if self.running:
+            return False
+        self._task = asyncio.create_task(self._run(days))
+        return True
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self, days: int):
+        per_minute = MAJS_CONFIG.get_config("MajsArchiveRateLimit").data
+        limiter = RateLimiter(per_minute)
+        concurrency = MAJS_CONFIG.get_config("MajsArchiveConcurrency").data
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        begin_time = int(time.time()) - days * 86400
+
+        for conn in list(manager.get_all_conn()):
+            try:
+                await self._archive_account(
+                    conn, begin_time, limiter, semaphore
+                )
+            except Exception as e:
+                logger.exception(f"[majs] 归档 {conn.account_id} 中断: {e}")
+        logger.info(f"[majs] 牌谱归档结束\n{self.progress_text()}")
+
+    async def _archive_account(
+        self,
+        conn: MajsoulConnection,
+        begin_time: int,
+        limiter: RateLimiter,
+        semaphore: asyncio.Semaphore,
+    ):
+        ckpt = await load_checkpoint(conn.account_id)
+        if ckpt is None or ckpt.done:
+            # 从当前时间开始新的一轮, 已归档的对局会被跳过
+            ckpt = ArchiveCheckpoint(
+                account_id=conn.account_id,
+                begin_time=begin_time,
+                end_time=int(time.time()),
+            )
+        elif ckpt.begin_time > begin_time:
+            # 未完成的归档继续进行, 要求更早的对局时重新获取迭代器
+            ckpt.begin_time = begin_time
+            ckpt.iterator_expire = 0
+        self.progress[conn.account_id] = ckpt
+
+        while not ckpt.done:
+            if ckpt.iterator_expire - ITERATOR_MARGIN < time.time():
+                await limiter.acquire()
+                res = cast(
+                    liblq.ResGameRecordListV2,
+                    await conn.rpc_call(
+                        ".lq.Lobby.fetchGameRecordListV2",
+                        {
+                            "tag": RECORD_TAG_ALL,
+                            "begin_time": ckpt.begin_time,
+                            "end_time": ckpt.end_time,
+                        },
+                    ),
+                )
+                if res.error.code:
+                    raise ValueError(res.error)
+                ckpt.iterator = res.iterator
+                ckpt.iterator_expire = res.iterator_expire
+
+            await limiter.acquire()
+            page = cast(
+                liblq.ResNextGameRecordList,
+                await conn.rpc_call(
+                    ".lq.Lobby.fetchNextGameRecordList",
+                    {"iterator": ckpt.iterator, "count": PAGE_SIZE},
+                ),
+            )
+            if page.error.code:
+                raise ValueError(page.error)
+
+            await asyncio.gather(
+                *(
+                    self._archive_entry(ckpt, entry, limiter, semaphore)
+                    for entry in page.entries
+                )
+            )
+            ckpt.iterator_expire = page.iterator_expire
+            if page.next_end_time:
+                ckpt.end_time = page.next_end_time
+            elif page.entries:
+                ckpt.end_time = min(e.end_time for e in page.entries)
+            ckpt.done = not page.next
+            await save_checkpoint(ckpt)
+            logger.info(f"[majs] 牌谱归档 {format_progress(ckpt)}")
+
+    async def _archive_entry(
+        self,
+        ckpt: ArchiveCheckpoint,
+        entry: liblq.RecordListEntry,
+        limiter: RateLimiter,
+        semaphore: asyncio.Semaphore,
+    ):
+        game_id = f"{entry.uuid}_a{encode_account_id(ckpt.account_id)}"
+        raw = PAIPU_PATH / f"{game_id} - raw.json"
+        exist = await MajsPaipu.data_exist(uuid=entry.uuid)
+        if exist and raw.exists():
+            ckpt.skipped += 1
+            return
+
+        async with semaphore:
+            # 下载牌谱分摊到连接池中的各个连接
+            conn = manager.pick_conn()
+            if conn is None:
+                ckpt.failed += 1
+                return
+            await limiter.acquire()
+            try:
+                tenhou_log = await conn.fetchLogs(game_id)
+            except Exception as e:
+                logger.warning(f"[majs] 归档牌谱 {entry.uuid} 失败: {e}")
+                ckpt.failed += 1
+                return
+
+        if not exist:
+            category = tenhou_log["head"]["config"]["category"]
+            await MajsPaipu.insert_data(
+                account_id=str(ckpt.account_id),
+                uuid=entry.uuid,
+                paipu_type=category,
+                paipu_type_name=get_category_name(category),
+            )
+        ckpt.archived += 1
+
+    def progress_text(self) -> str:
+        return "\n".join(map(format_progress, self.progress.values()))
+
+
+archiver = PaipuArchiver()
@@ -0,0 +1,65 @@
+import time
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from msgspec import Struct
+
+# 抓包文件格式:
+#   MAGIC, u16 版本号长度, pbVersion
+#   之后每一帧: u8 方向, f64 时间戳, u32 长度, 原始帧
+CAPTURE_MAGIC = b"MJSCAP\x01\n"
+FRAME_HEADER = struct.Struct("<BdI")
+
+INBOUND = 0
+OUTBOUND = 1
+
+
+class CapturedFrame(Struct):
+    direction: int
+    timestamp: float
+    data: bytes
+
+
+class FrameCapture:
+    def __init__(self, path: Path, version: str):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO | None = open(path, "wb")
+        raw_version = version.encode()
+        self._file.write(CAPTURE_MAGIC)
+        self._file.write(struct.pack("<H", len(raw_version)) + raw_version)
+
+    def write(self, direction: int, frame: bytes):
+        if self._file is None:
+            return
+        header = FRAME_HEADER.pack(direction, time.time(), len(frame))
+        self._file.write(header + frame)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_capture(path: Path) -> tuple[str, Iterator[CapturedFrame]]:
+    f = open(path, "rb")
+    if f.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+        f.close()
+        raise ValueError(f"{path} is not a frame capture")
+    (size,) = struct.unpack("<H", f.read(2))
+    version = f.read(size).decode()
+
+    def frames():
+        with f:
+            while header := f.read(FRAME_HEADER.size):
+                if len(header) < FRAME_HEADER.size:
+                    # 进程退出时最后一帧可能没有写完
+                    return
+                direction, timestamp, length = FRAME_HEADER.unpack(header)
+                data = f.read(length)
+                if len(data) < length:
+                    return
+                yield CapturedFrame(direction, timestamp, data)
+
+    return version, frames()
@@ -0,0 +1,78 @@
+import asyncio
+from typing import Dict, List, Tuple, Callable, Optional
+
+from .model import MajsoulDecodedMessage
+
+# 合并窗口期内同一好友的状态/信息变化, 窗口结束时只处理一次:
+# 信息变化只保留最新的一条, 状态变化只保留最终状态
+# 对局 uuid 变化(开始/结束对局)不会被合并, 保证每局的推送都会发出
+
+STATE_CHANGE = ".lq.NotifyFriendStateChange"
+VIEW_CHANGE = ".lq.NotifyFriendViewChange"
+COALESCED_NOTIFIES = (STATE_CHANGE, VIEW_CHANGE)
+
+# (target_id, state, view)
+Emit = Callable[
+    [int, Optional[MajsoulDecodedMessage], Optional[MajsoulDecodedMessage]],
+    None,
+]
+
+
+class PendingNotify:
+    __slots__ = ("state", "view", "timer")
+
+    def __init__(self, timer: asyncio.TimerHandle):
+        self.state: Optional[MajsoulDecodedMessage] = None
+        self.view: Optional[MajsoulDecodedMessage] = None
+        self.timer = timer
+
+
+def _game_uuid(notify: MajsoulDecodedMessage) -> str:
+    return notify.payload.active_state.playing.game_uuid
+
+
+class NotifyCoalescer:
+    def __init__(self, window: float, emit: Emit):
+        self.window = window
+        self._emit = emit
+        self._pending: Dict[int, PendingNotify] = {}
+        self.coalesced = 0
+
+    def add(self, notify: MajsoulDecodedMessage):
+        key = notify.payload.target_id
+        pending = self._pending.get(key)
+        if pending is None:
+            timer = asyncio.get_running_loop().call_later(
+                self.window, self.flush, key
+            )
+            pending = self._pending[key] = PendingNotify(timer)
+
+        if notify.method_name == VIEW_CHANGE:
+            if pending.view is not None:
+                self.coalesced += 1
+            pending.view = notify
+            return
+
+        if pending.state is not None:
+            if _game_uuid(pending.state) != _game_uuid(notify):
+                # 对局开始/结束, 先处理之前的状态
+                self.flush(key)
+                self.add(notify)
+                return
+            self.coalesced += 1
+        pending.state = notify
+
+    def flush(self, key: int):
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        pending.timer.cancel()
+        self._emit(key, pending.state, pending.view)
+
+    def drain(self) -> List[Tuple[int, PendingNotify]]:
+        # 取出所有未到期的通知, 由调用方在关闭前处理
+        drained = list(self._pending.items())
+        for _, pending in drained:
+            pending.timer.cancel()
+        self._pending.clear()
+        return drained
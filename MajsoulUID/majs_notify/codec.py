@@ -1,9 +1,21 @@
 import struct
 
 import betterproto
+from gsuid_core.logger import logger
 
 from ..lib import lq as liblq
-from .model import InflightRequest, MajsoulLiqiProto, MajsoulDecodedMessage
+from .schema import MajsoulSchema, MergedMessageType
+from .fast_decode import FAST_DECODERS, decode_wrapper
+from .proto_backend import ProtoBackend, BetterprotoBackend
+from .model import (
+    MjsLogItem,
+    MessageType,
+    InflightRequest,
+    MajsoulEnvelope,
+    MajsoulLiqiProto,
+    MajsoulRpcMethod,
+    MajsoulDecodedMessage,
+)
 
 
 class MajsoulProtoCodec:
@@ -11,12 +23,127 @@ class MajsoulProtoCodec:
     REQUEST = 2
     RESPONSE = 3
 
-    def __init__(self, pb_def: MajsoulLiqiProto, version: str):
+    # request index is packed into 16 bits, 0 is never used
+    MAX_INDEX = 0xFFFF
+
+    def __init__(
+        self,
+        pb_def: MajsoulLiqiProto,
+        version: str,
+        schema: MajsoulSchema | None = None,
+        backend: ProtoBackend | None = None,
+    ):
         self._pb = pb_def
+        # compiled liqi.json, decodes messages missing from lib/lq
+        self._schema = schema
+        # decodes game records, see proto_backend.py
+        self.backend = backend or BetterprotoBackend()
         self.index = 1
         self._inflight_requests: dict[int, InflightRequest] = {}
         self.version = version
 
+        # full method name -> (package, request, response) from liqi.json
+        self._rpc_names: dict[str, tuple[str, str, str]] = {}
+        # full notify name -> message type name
+        self._notify_names: dict[str, str] = {}
+        self._build_dispatch_table()
+
+        # resolved on first use, lib.lq only imports the messages we touch
+        self._rpc_table: dict[str, MajsoulRpcMethod] = {}
+        self._notify_table: dict[str, MessageType] = {}
+
+    def _build_dispatch_table(self):
+        for pkg_name, pkg in self._pb.nested.items():
+            for item_name, item in pkg.nested.items():
+                if item.methods:
+                    for rpc, proto_domain in item.methods.items():
+                        method_name = f".{pkg_name}.{item_name}.{rpc}"
+                        self._rpc_names[method_name] = (
+                            pkg_name,
+                            proto_domain.requestType,
+                            proto_domain.responseType,
+                        )
+                elif item.fields is not None:
+                    self._notify_names[f".{pkg_name}.{item_name}"] = item_name
+
+    def lookup_rpc(self, method_name: str) -> MajsoulRpcMethod:
+        rpc_method = self._rpc_table.get(method_name)
+        if rpc_method is None:
+            rpc_method = self._resolve_rpc(method_name)
+        return rpc_method
+
+    def _resolve_rpc(self, method_name: str) -> MajsoulRpcMethod:
+        names = self._rpc_names.get(method_name)
+        if names is None:
+            raise ValueError(f"Unknown method {method_name}")
+        pkg_name, request_name, response_name = names
+        requestType = self._resolve_type(
+            f".{pkg_name}.{request_name}", merge=False
+        )
+        responseType = self._resolve_type(f".{pkg_name}.{response_name}")
+        # requests are built with betterproto, only responses may fall back
+        if requestType is None or responseType is None:
+            raise ValueError(f"Unknown method {method_name}")
+        if not isinstance(requestType, type):
+            raise ValueError(f"Method {method_name} is missing in lib/lq")
+        rpc_method = MajsoulRpcMethod(
+            method_name=method_name,
+            request_type=requestType,
+            response_type=responseType,
+        )
+        self._rpc_table[method_name] = rpc_method
+        return rpc_method
+
+    def lookup_notify(self, method_name: str) -> MessageType:
+        msg_obj = self._notify_table.get(method_name)
+        if msg_obj is None:
+            if method_name not in self._notify_names:
+                raise ValueError(f"Unknown notify {method_name}")
+            msg_obj = self._resolve_type(method_name)
+            if msg_obj is None:
+                raise ValueError(f"Unknown notify {method_name}")
+            self._notify_table[method_name] = msg_obj
+        return msg_obj
+
+    def _resolve_type(self, full_name: str, merge: bool = True):
+        msg_obj = getattr(liblq, full_name.rsplit(".", 1)[-1], None)
+        if self._schema is None or full_name not in self._schema:
+            return msg_obj
+        if msg_obj is None:
+            logger.info(
+                f"[majs] {full_name} 不在 lib/lq 中, 使用 liqi.json 解码"
+            )
+            return self._schema.message_type(full_name)
+
+        # requests are encoded with betterproto and never need merging
+        missing = self._schema.missing_fields(full_name, msg_obj)
+        if not missing or not merge:
+            return msg_obj
+        logger.warning(
+            f"[majs] {full_name} 存在 lib/lq 中缺失的字段 {missing}, "
+            "已使用 liqi.json 补全, 请重新生成 lib/lq"
+        )
+        return MergedMessageType(self._schema, full_name, msg_obj)
+
+    def next_index(self) -> int:
+        # wrap around and skip indexes that are still waiting for a response
+        for _ in range(self.MAX_INDEX):
+            current_index = self.index
+            self.index = current_index % self.MAX_INDEX + 1
+            if current_index not in self._inflight_requests:
+                return current_index
+        raise RuntimeError("No free request index")
+
+    def track_request(self, index: int, method_name: str):
+        # 记录等待响应的请求, 抓包回放时也用它登记已发出的请求
+        self._inflight_requests[index] = InflightRequest(
+            method_name=method_name,
+            msg_obj=self.lookup_rpc(method_name).response_type,
+        )
+
+    def release(self, index: int):
+        self._inflight_requests.pop(index, None)
+
     def unwrap(self, wrapped: bytes):
         data = liblq.Wrapper().parse(wrapped)
         return data
@@ -31,28 +158,21 @@ class MajsoulProtoCodec:
         liqi_method = getattr(liblq, path)
         return liqi_method
 
-    def decode_message(self, buf: bytes):
-        type_byte = buf[0]
+    def decode_envelope(self, buf: bytes) -> MajsoulEnvelope:
+        # stage one: frame header and Wrapper.name only, payload untouched
+        view = memoryview(buf)
+        type_byte = view[0]
 
+        msg_obj = None
         if type_byte == self.NOTIFY:
             req_index = self.index
-            msg = self.unwrap(buf[1:])
-            method_name = msg.name
-            _, lq, notify = method_name.split(".")
-            msg_obj = self.lookup_method(notify)
+            method_name, data = decode_wrapper(view[1:])
         elif type_byte == self.REQUEST:
-            req_index = buf[1] | (buf[2] << 8)
-            msg = self.unwrap(buf[3:])
-            method_name = msg.name
-            _, lq, service, rpc = method_name.split(".")
-            proto_method = self._pb.nested[lq].nested[service].methods
-            if proto_method is None or rpc not in proto_method:
-                raise ValueError(f"Unknown method {rpc}")
-            proto_domain = proto_method[rpc]
-            msg_obj = self.lookup_method(proto_domain.requestType)
+            req_index = view[1] | (view[2] << 8)
+            method_name, data = decode_wrapper(view[3:])
         elif type_byte == self.RESPONSE:
-            req_index = buf[1] | (buf[2] << 8)
-            msg = self.unwrap(buf[3:])
+            req_index = view[1] | (view[2] << 8)
+            _, data = decode_wrapper(view[3:])
             inflight_req = self._inflight_requests.pop(req_index, None)
             if not inflight_req:
                 raise ValueError(f"Unknown request {req_index}")
@@ -61,32 +181,72 @@ class MajsoulProtoCodec:
         else:
             raise ValueError(f"Invalid message type: {type_byte}")
 
-        return MajsoulDecodedMessage(
+        return MajsoulEnvelope(
             msg_type=type_byte,
             req_index=req_index,
             method_name=method_name,
-            payload=msg_obj().parse(msg.data),
+            data=data,
+            msg_obj=msg_obj,
+        )
+
+    def decode_payload(self, envelope: MajsoulEnvelope):
+        # stage two: parse the payload, using a fast decoder when available
+        method_name = envelope.method_name
+        fast_decoder = FAST_DECODERS.get(method_name)
+        if fast_decoder is not None and envelope.msg_type == self.NOTIFY:
+            payload = fast_decoder(envelope.data)
+        else:
+            msg_obj = envelope.msg_obj
+            if msg_obj is None:
+                if envelope.msg_type == self.NOTIFY:
+                    msg_obj = self.lookup_notify(method_name)
+                else:
+                    msg_obj = self.lookup_rpc(method_name).request_type
+            payload = msg_obj().parse(bytes(envelope.data))
+
+        return MajsoulDecodedMessage(
+            msg_type=envelope.msg_type,
+            req_index=envelope.req_index,
+            method_name=method_name,
+            payload=payload,
         )
 
-    def encode_request(self, method_name: str, payload: dict):
-        current_index = self.index
-        self.index += 1
+    def decode_records(self, data: bytes) -> list[MjsLogItem]:
+        # ResGameRecord.data -> 牌谱中的每一个动作
+        backend = self.backend
+        detail_records = backend.parse("Wrapper", data)
+        payload = backend.parse("GameDetailRecords", detail_records.data)
 
-        _, lq, service, rpc = method_name.split(".")
-        proto_method = self._pb.nested[lq].nested[service].methods
-        if proto_method is None or rpc not in proto_method:
-            raise ValueError(f"Unknown method {rpc}")
-        proto_domain = proto_method[rpc]
+        if payload.version < 210715 and len(payload.records) > 0:
+            records = payload.records
+        else:
+            records = [
+                action.result
+                for action in payload.actions
+                if action.result and len(action.result) > 0
+            ]
+
+        action_list = []
+        for value in records:
+            raw = backend.parse("Wrapper", value)
+            name = raw.name.split(".")[2]
+            msg = backend.parse(name, raw.data)
+            action_list.append(MjsLogItem(name=name, data=msg))
+        return action_list
 
-        requestType = self.lookup_method(proto_domain.requestType)
-        responseType = self.lookup_method(proto_domain.responseType)
+    def decode_message(self, buf: bytes):
+        return self.decode_payload(self.decode_envelope(buf))
 
-        msg = requestType().from_dict(payload)
+    def encode_request(
+        self, method_name: str, payload: dict
+    ) -> tuple[int, bytes]:
+        rpc_method = self.lookup_rpc(method_name)
+
+        msg = rpc_method.request_type().from_dict(payload)
         msg = self.wrap(method_name, msg.SerializeToString())
 
-        self._inflight_requests[current_index] = InflightRequest(
-            method_name=method_name, msg_obj=responseType
-        )
+        current_index = self.next_index()
+        self.track_request(current_index, method_name)
 
         data = (
             struct.pack(
@@ -95,4 +255,15 @@ class MajsoulProtoCodec:
             + msg
         )
 
-        return data
+        return current_index, data
+
+    def encode_response(self, index: int, payload: betterproto.Message):
+        # 服务端方向, 用于 tools/mock_gateway.py
+        return struct.pack(
+            "<BBB", self.RESPONSE, index & 0xFF, index >> 8
+        ) + self.wrap("", bytes(payload))
+
+    def encode_notify(self, method_name: str, payload: betterproto.Message):
+        return struct.pack("<B", self.NOTIFY) + self.wrap(
+            method_name, bytes(payload)
+        )
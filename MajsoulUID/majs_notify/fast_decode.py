@@ -0,0 +1,185 @@
+from typing import Any, Callable, Iterator
+
+from msgspec import Struct, field
+
+# 只解析推送处理中用到的字段, 其余字段直接跳过
+
+
+class LiteGameMetaData(Struct):
+    mode_id: int = 0
+
+
+class LitePlayingGame(Struct):
+    game_uuid: str = ""
+    category: int = 0
+    meta: LiteGameMetaData = field(default_factory=LiteGameMetaData)
+
+    def __bool__(self):
+        # same truthiness as betterproto: any non-default field is set
+        return bool(self.game_uuid or self.category or self.meta.mode_id)
+
+
+class LiteActiveState(Struct):
+    account_id: int = 0
+    login_time: int = 0
+    logout_time: int = 0
+    is_online: bool = False
+    playing: LitePlayingGame = field(default_factory=LitePlayingGame)
+
+
+class LiteNotifyFriendStateChange(Struct):
+    target_id: int = 0
+    active_state: LiteActiveState = field(default_factory=LiteActiveState)
+
+
+class LiteAccountLevel(Struct):
+    id: int = 0
+    score: int = 0
+
+
+class LitePlayerBaseView(Struct):
+    account_id: int = 0
+    avatar_id: int = 0
+    nickname: str = ""
+    level: LiteAccountLevel = field(default_factory=LiteAccountLevel)
+    level3: LiteAccountLevel = field(default_factory=LiteAccountLevel)
+
+
+class LiteNotifyFriendViewChange(Struct):
+    target_id: int = 0
+    base: LitePlayerBaseView = field(default_factory=LitePlayerBaseView)
+
+
+def read_varint(buf: memoryview, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+def iter_fields(buf: memoryview) -> Iterator[tuple[int, Any]]:
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        key, pos = read_varint(buf, pos)
+        field_no = key >> 3
+        wire_type = key & 0x7
+        if wire_type == 0:
+            value, pos = read_varint(buf, pos)
+            yield field_no, value
+            continue
+        elif wire_type == 2:
+            length, pos = read_varint(buf, pos)
+        elif wire_type == 5:
+            length = 4
+        elif wire_type == 1:
+            length = 8
+        else:
+            raise ValueError(f"Unsupported wire type: {wire_type}")
+        start = pos
+        pos += length
+        yield field_no, buf[start:pos]
+
+
+def decode_wrapper(buf: memoryview) -> tuple[str, memoryview]:
+    name = ""
+    data = buf[0:0]
+    for field_no, value in iter_fields(buf):
+        if field_no == 1:
+            name = str(value, "utf-8")
+        elif field_no == 2:
+            data = value
+    return name, data
+
+
+def _decode_game_meta(buf: memoryview):
+    meta = LiteGameMetaData()
+    for field_no, value in iter_fields(buf):
+        if field_no == 2:
+            meta.mode_id = value
+    return meta
+
+
+def _decode_playing(buf: memoryview):
+    playing = LitePlayingGame()
+    for field_no, value in iter_fields(buf):
+        if field_no == 1:
+            playing.game_uuid = str(value, "utf-8")
+        elif field_no == 2:
+            playing.category = value
+        elif field_no == 3:
+            playing.meta = _decode_game_meta(value)
+    return playing
+
+
+def _decode_active_state(buf: memoryview):
+    state = LiteActiveState()
+    for field_no, value in iter_fields(buf):
+        if field_no == 1:
+            state.account_id = value
+        elif field_no == 2:
+            state.login_time = value
+        elif field_no == 3:
+            state.logout_time = value
+        elif field_no == 4:
+            state.is_online = bool(value)
+        elif field_no == 5:
+            state.playing = _decode_playing(value)
+    return state
+
+
+def _decode_level(buf: memoryview):
+    level = LiteAccountLevel()
+    for field_no, value in iter_fields(buf):
+        if field_no == 1:
+            level.id = value
+        elif field_no == 2:
+            level.score = value
+    return level
+
+
+def _decode_base_view(buf: memoryview):
+    base = LitePlayerBaseView()
+    for field_no, value in iter_fields(buf):
+        if field_no == 1:
+            base.account_id = value
+        elif field_no == 2:
+            base.avatar_id = value
+        elif field_no == 4:
+            base.nickname = str(value, "utf-8")
+        elif field_no == 5:
+            base.level = _decode_level(value)
+        elif field_no == 6:
+            base.level3 = _decode_level(value)
+    return base
+
+
+def decode_friend_state_change(buf: memoryview):
+    notify = LiteNotifyFriendStateChange()
+    for field_no, value in iter_fields(buf):
+        if field_no == 1:
+            notify.target_id = value
+        elif field_no == 2:
+            notify.active_state = _decode_active_state(value)
+    return notify
+
+
+def decode_friend_view_change(buf: memoryview):
+    notify = LiteNotifyFriendViewChange()
+    for field_no, value in iter_fields(buf):
+        if field_no == 1:
+            notify.target_id = value
+        elif field_no == 2:
+            notify.base = _decode_base_view(value)
+    return notify
+
+
+FAST_DECODERS: dict[str, Callable[[memoryview], Any]] = {
+    ".lq.NotifyFriendStateChange": decode_friend_state_change,
+    ".lq.NotifyFriendViewChange": decode_friend_view_change,
+}
@@ -0,0 +1,125 @@
+import time
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Tuple, Iterable, Optional
+
+from msgspec import json as msgjson
+from gsuid_core.logger import logger
+
+from .model import GameEndEvent
+from ..utils.resource.RESOURCE_PATH import JOURNAL_PATH
+
+# 对局结束事件在处理前写入 SQLite (WAL), 推送发出后确认并删除,
+# 进程重启后重放未确认的事件.
+# 写入与确认在后台批量提交: 上一批提交期间到达的操作在下一个事务中一起提交
+
+# 超过该时间的未确认事件不再重放
+JOURNAL_MAX_AGE = 6 * 3600
+
+APPEND = 0
+ACK = 1
+
+JournalOp = Tuple[int, Any, Optional[asyncio.Future]]
+
+
+class NotifyJournal:
+    def __init__(self, path: Path):
+        self.path = path
+        self._db: sqlite3.Connection | None = None
+        self._ops: List[JournalOp] = []
+        self._writer: asyncio.Task | None = None
+        # 写入与重放可能在不同线程中使用同一个连接
+        self._lock = threading.Lock()
+        # 只重放上次运行留下的事件, 本次运行写入的事件由在线处理负责
+        self.started_at = time.time()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            # WAL 模式下 NORMAL 可以保证进程崩溃时不丢失已提交的数据
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS game_end ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "created REAL NOT NULL, "
+                "data BLOB NOT NULL)"
+            )
+            self._db = db
+        return self._db
+
+    def _commit(self, ops: List[JournalOp]) -> List[int]:
+        ids = []
+        with self._lock, self._connect() as db:
+            for op, value, _ in ops:
+                if op == APPEND:
+                    cursor = db.execute(
+                        "INSERT INTO game_end (created, data) VALUES (?, ?)",
+                        (time.time(), value),
+                    )
+                    ids.append(cursor.lastrowid or 0)
+                else:
+                    db.execute("DELETE FROM game_end WHERE id = ?", (value,))
+                    ids.append(value)
+        return ids
+
+    async def _write_loop(self):
+        while self._ops:
+            ops, self._ops = self._ops, []
+            try:
+                ids = await asyncio.to_thread(self._commit, ops)
+            except Exception as e:
+                logger.exception(f"[majs] 写入推送 journal 失败: {e}")
+                ids = [0] * len(ops)
+            for (_, _, fut), entry_id in zip(ops, ids):
+                if fut is not None and not fut.done():
+                    fut.set_result(entry_id)
+
+    def _submit(self, op: int, value: Any, fut: Optional[asyncio.Future]):
+        self._ops.append((op, value, fut))
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def append(self, event: GameEndEvent) -> int:
+        # 返回 0 表示写入失败, 事件仍会正常处理
+        fut = asyncio.get_running_loop().create_future()
+        self._submit(APPEND, msgjson.encode(event), fut)
+        return await fut
+
+    def ack(self, entry_id: int):
+        if entry_id:
+            self._submit(ACK, entry_id, None)
+
+    def ack_after(self, entry_id: int, futures: Iterable[asyncio.Future]):
+        futures = list(futures)
+        if not futures:
+            self.ack(entry_id)
+            return
+        asyncio.gather(*futures, return_exceptions=True).add_done_callback(
+            lambda _: self.ack(entry_id)
+        )
+
+    def _load_pending(self, max_age: float):
+        with self._lock, self._connect() as db:
+            db.execute(
+                "DELETE FROM game_end WHERE created < ?",
+                (time.time() - max_age,),
+            )
+            rows = db.execute(
+                "SELECT id, data FROM game_end WHERE created < ? ORDER BY id",
+                (self.started_at,),
+            ).fetchall()
+        return [
+            (entry_id, msgjson.decode(data, type=GameEndEvent))
+            for entry_id, data in rows
+        ]
+
+    async def pending(
+        self, max_age: float = JOURNAL_MAX_AGE
+    ) -> List[Tuple[int, GameEndEvent]]:
+        return await asyncio.to_thread(self._load_pending, max_age)
+
+
+journal = NotifyJournal(JOURNAL_PATH)
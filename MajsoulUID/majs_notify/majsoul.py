@@ -1,30 +1,46 @@
 import hmac
 import json
+import time
 import uuid
 import random
 import asyncio
 import hashlib
+from functools import partial
 from collections.abc import Iterable
-from typing import Dict, Union, cast
+from typing import Dict, Tuple, Union, Optional, cast
 
-import httpx
 import aiofiles
 import websockets.client
-from httpx import AsyncClient
-from gsuid_core.gss import gss
 from gsuid_core.logger import logger
 from msgspec import ValidationError, convert
+from websockets.exceptions import ConnectionClosed
 
 from .utils import getRes
+from .journal import journal
 from ..lib import lq as liblq
+from .schema import load_schema
 from ._level import MajsoulLevel
 from .codec import MajsoulProtoCodec
+from .proto_backend import load_backend
+from .push_dispatcher import dispatcher
 from .majsoul_friend import MajsoulFriend
+from ..utils.http_client import get_client
+from .record_blob import fetch_record_blob
+from .record_batch import GameResultBatcher
 from .tenhou.parser import MajsoulPaipuParser
+from .retry_queue import RetryItem, RetryQueue
 from ..majs_config.majs_config import MAJS_CONFIG
-from ..utils.resource.RESOURCE_PATH import PAIPU_PATH
+from .scheduler import KEEP, MERGE, NotifyScheduler
+from .subscription import PushTarget, subscriptions
+from .capture import INBOUND, OUTBOUND, FrameCapture
+from ..utils.database.models import MajsUser, MajsPaipu
 from .constants import HEADERS, USER_AGENT, ModeId2Room
-from ..utils.database.models import MajsPush, MajsUser, MajsPaipu
+from .coalesce import STATE_CHANGE, COALESCED_NOTIFIES, NotifyCoalescer
+from ..utils.resource.RESOURCE_PATH import PAIPU_PATH, PROTO_PATH, CAPTURE_PATH
+from .fast_decode import (
+    LiteNotifyFriendViewChange,
+    LiteNotifyFriendStateChange,
+)
 from ..utils.api.remote import (
     decode_log_id,
     encode_account_id,
@@ -32,12 +48,13 @@ from ..utils.api.remote import (
 )
 from .model import (
     MjsLog,
-    MjsLogItem,
+    GameEndEvent,
     MajsoulConfig,
     MajsoulResInfo,
     MajsoulUSConfig,
     MajsoulLiqiProto,
     MajsoulServerList,
+    MajsoulUSConfigIp,
     MajsoulVersionInfo,
     MajsoulDecodedMessage,
 )
@@ -73,7 +90,61 @@ async def get_paipu_by_game_id(game_id: str) -> Union[Dict, None]:
             return data
 
 
+def get_category_name(category: int) -> str:
+    if category == 1:
+        return "歹人场"
+    elif category == 2:
+        return "段位场"
+    elif category == 4:
+        return "比赛场"
+    return "未知牌谱类型"
+
+
+def game_room_name(event: GameEndEvent) -> str:
+    return ModeId2Room.get(event.mode_id, "") or event.type_name
+
+
+def game_record_url(event: GameEndEvent) -> str:
+    return f"{PP_HOST}{event.uuid}_a{encode_account_id(event.target_id)}"
+
+
+def format_game_result(
+    event: GameEndEvent, entry: liblq.RecordListEntry
+) -> str:
+    # check 三麻 or 四麻
+    is_sanma = "三" in ModeId2Room.get(event.mode_id, "")
+
+    msg = ""
+    players = sorted(entry.players, key=lambda x: x.rank)
+    for i, player in enumerate(players):
+        if player.account_id == event.target_id:
+            msg += f"排名:{i + 1} "
+            msg += f"最终打点:{player.point} "
+            msg += f"得点:{player.pt}\n"
+
+            if event.category == 2:
+                level = player.level3 if is_sanma else player.level
+                level_info = MajsoulLevel(level.id).formatAdjustedScoreWithTag(
+                    level.score + player.pt
+                )
+                msg += f"当前段位:{level_info}\n"
+            break
+    return msg
+
+
 class MajsoulConnection:
+    # seconds to wait for a response before giving up on a request
+    RPC_TIMEOUT = 30.0
+    # weight of the newest sample in the rpc latency average
+    LATENCY_ALPHA = 0.2
+    # reconnect backoff: base * 2^n seconds with jitter, capped
+    RECONNECT_BASE = 2.0
+    RECONNECT_MAX = 300.0
+    # notify the meta target after this many failed reconnects
+    RECONNECT_ALERT = 5
+    # the protocol reports no token expiry, check it with oauth2Check
+    TOKEN_CHECK_INTERVAL = 6 * 3600
+
     def __init__(
         self,
         server: str,
@@ -84,17 +155,33 @@ class MajsoulConnection:
         self._endpoint = server
         self._codec = codec
         self._ws = None
-        self._req_events: dict[int, asyncio.Event] = {}
-        self._res: dict[int, MajsoulDecodedMessage] = {}
+        # 调试用的收发帧抓包, 见 capture.py
+        self._capture: FrameCapture | None = None
+        self._pending: dict[int, asyncio.Future[MajsoulDecodedMessage]] = {}
+        # 供连接池调度使用: 连接是否可用, rpc 延迟的滑动平均(秒)
+        self.healthy = False
+        self.latency = 0.0
         self.clientVersionString = "web-" + versionInfo.version.replace(
             ".w", ""
         )
+        self.version_info = versionInfo
         self.no_operation_counter = 0
-        self.bg_tasks = []
-        self.queue = asyncio.queues.Queue()
+        self._msg_dispatcher: asyncio.Task | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        # 由 MajsoulManager 管理的连接断开后自动重连
+        self.supervised = False
+        self._closing = False
+        # 账号池中的账号信息, 用于刷新 token
+        self.user: MajsUser | None = None
+        self.token_checked_at = time.time()
+        self.scheduler = NotifyScheduler(
+            MAJS_CONFIG.get_config("MajsNotifyWorkers").data,
+            MAJS_CONFIG.get_config("MajsNotifyQueueSize").data,
+        )
         self.account_id = 0
         self.nick_name = ""
-        self.friends: list[MajsoulFriend] = []
+        # account_id -> MajsoulFriend, 保持好友的添加顺序
+        self.friends: Dict[int, MajsoulFriend] = {}
         self.friend_apply_list: list[int] = []
         self.random_key = str(uuid.uuid4())
         self.login_type = login_type
@@ -103,26 +190,49 @@ class MajsoulConnection:
         self.manual_login_password = ""
         self.access_token = ""
 
+        # only notifies listed here get their payload decoded
+        self._notify_handlers = {
+            ".lq.NotifyFriendStateChange": self.handle_FriendStateChange,
+            ".lq.NotifyFriendViewChange": self.handle_FriendViewChange,
+            ".lq.NotifyNewFriendApply": self.handle_NewFriendApply,
+            ".lq.NotifyFriendChange": self.handle_FriendChange,
+            ".lq.NotifyAnotherLogin": self.handle_AnotherLogin,
+        }
+        self._notify_policies = {
+            ".lq.NotifyFriendViewChange": MERGE,
+        }
+        self.coalescer = NotifyCoalescer(
+            MAJS_CONFIG.get_config("MajsNotifyCoalesceMs").data / 1000,
+            self._submit_coalesced,
+        )
+
     async def check_alive(self):
         if self._ws is None:
             return False
-        resp = cast(
-            liblq.ResCommon,
-            await self.rpc_call(
-                ".lq.Lobby.heatbeat", {"no_operation_counter": 0}
-            ),
-        )
+        try:
+            resp = cast(
+                liblq.ResCommon,
+                await self.rpc_call(
+                    ".lq.Lobby.heatbeat", {"no_operation_counter": 0}
+                ),
+            )
+        except (TimeoutError, ConnectionError):
+            return False
         if resp.error.code:
             return False
         return True
 
-    async def start_sv(self):
-        await asyncio.gather(self.process(), self.dispatch_msg())
-
     async def connect(self):
         logger.info(f"Connecting to {self._endpoint}")
         self._ws = await websockets.client.connect(self._endpoint)
-        self._msg_dispatcher = asyncio.create_task(self.start_sv())
+        self.healthy = True
+        capture = MAJS_CONFIG.get_config("MajsCaptureFrames").data
+        if capture and self._capture is None:
+            path = CAPTURE_PATH / f"{int(time.time())}_{self.random_key}.cap"
+            self._capture = FrameCapture(path, self._codec.version)
+            logger.info(f"[majs] 抓包已开启, 写入 {path}")
+        self.scheduler.start()
+        self._msg_dispatcher = asyncio.create_task(self.dispatch_msg(self._ws))
 
     async def send_meta(self, meta_msg):
         meta_bot_id = MAJS_CONFIG.get_config("MajsFriendPushBotId").data
@@ -130,246 +240,193 @@ class MajsoulConnection:
         meta_id: str = MAJS_CONFIG.get_config("MajsFriendPushID").data
 
         if meta_id:
-            for BOT_ID in gss.active_bot:
-                bot = gss.active_bot[BOT_ID]
-                await bot.target_send(
-                    meta_msg,
-                    meta_type,
-                    meta_id,
-                    meta_bot_id,
-                    "",
-                )
+            return dispatcher.push(
+                PushTarget(meta_bot_id, meta_type, meta_id), meta_msg
+            )
         else:
             logger.warning(
                 "[majs] 未配置元数据推送对象, 请前往网页控制台配置推送对象!"
             )
 
     async def send_msg_to_user(self, target_user: str, msg):
+        # 返回各个推送对象的 future, 全部完成时消息已发出
+        futures: list[asyncio.Future] = []
         if MAJS_CONFIG.get_config("MajsIsPushActiveToMaster").data:
-            await self.send_meta(msg)
-
-        push_data = await MajsPush.select_data_by_uid(uid=str(target_user))
-        if push_data:
-            if push_data.push_id != "off":
-                bot_id = push_data.bot_id
-                if push_data.push_id == "on":
-                    push_target = push_data.user_id
-                    push_type = "direct"
-                else:
-                    push_target = push_data.push_id
-                    push_type = "group"
-
-                for BOT_ID in gss.active_bot:
-                    bot = gss.active_bot[BOT_ID]
-                    await bot.target_send(
-                        msg,
-                        push_type,
-                        push_target,
-                        bot_id,
-                        "",
-                    )
+            fut = await self.send_meta(msg)
+            if fut is not None:
+                futures.append(fut)
+
+        for target in await subscriptions.get(str(target_user)):
+            futures.append(dispatcher.push(target, msg))
+        return futures
 
     async def handle_notify(self, notify: MajsoulDecodedMessage):
         logger.info(f"[majs] 通知: {notify}")
-        if notify.method_name == ".lq.NotifyFriendStateChange":
-            self.queue.put_nowait(self.handle_FriendStateChange(notify))
-        elif notify.method_name == ".lq.NotifyFriendViewChange":
-            self.queue.put_nowait(self.handle_FriendViewChange(notify))
-        elif notify.method_name == ".lq.NotifyNewFriendApply":
-            self.queue.put_nowait(self.handle_NewFriendApply(notify))
-        elif notify.method_name == ".lq.NotifyFriendChange":
-            self.queue.put_nowait(self.handle_FriendChange(notify))
-        elif notify.method_name == ".lq.NotifyAnotherLogin":
-            self.queue.put_nowait(self.handle_AnotherLogin())
-        else:
+        handler = self._notify_handlers.get(notify.method_name)
+        if handler is None:
             logger.warning(f"[majs] 未知通知: {notify}")
+            return
+        if (
+            self.coalescer.window > 0
+            and notify.method_name in COALESCED_NOTIFIES
+        ):
+            self.coalescer.add(notify)
+            return
+        payload = notify.payload
+        # 同一好友的通知串行处理
+        key = getattr(payload, "target_id", 0) or getattr(
+            payload, "account_id", 0
+        )
+        self.scheduler.submit(
+            key,
+            notify.method_name,
+            partial(handler, notify),
+            self._notify_policies.get(notify.method_name, KEEP),
+        )
+
+    def _submit_coalesced(
+        self,
+        key: int,
+        state: MajsoulDecodedMessage | None,
+        view: MajsoulDecodedMessage | None,
+    ):
+        # 只有信息变化时与普通的信息变化通知一样可以合并/丢弃
+        notify = state or view
+        assert notify is not None
+        self.scheduler.submit(
+            key,
+            notify.method_name,
+            partial(self.handle_coalesced, state, view),
+            KEEP if state else MERGE,
+        )
+
+    async def handle_coalesced(
+        self,
+        state: MajsoulDecodedMessage | None,
+        view: MajsoulDecodedMessage | None,
+    ):
+        if view is not None:
+            await self.handle_FriendViewChange(view)
+        if state is not None:
+            await self.handle_FriendStateChange(state)
 
-    async def handle_AnotherLogin(self):
+    async def handle_AnotherLogin(self, notify: MajsoulDecodedMessage):
         meta_msg = f"账号 {self.nick_name}({self.account_id}) 在别处登陆\n"
         meta_msg += "请检查AccessToken, 可能已过期！"
         await self.send_meta(meta_msg)
 
     async def handle_FriendStateChange(self, notify: MajsoulDecodedMessage):
-        def get_playing(
-            active_state: liblq.AccountActiveState | liblq.AccountPlayingGame,
-        ):
-            if isinstance(active_state, liblq.AccountActiveState):
-                category = active_state.playing.category
-                mode_id = active_state.playing.meta.mode_id
-            elif isinstance(active_state, liblq.AccountPlayingGame):
-                category = active_state.category
-                mode_id = active_state.meta.mode_id
-            else:
-                err = "only accept AccountActiveState or AccountPlayingGame"
-                raise ValueError(err)
-
-            if category == 1:
-                type_name = "歹人场"
-            elif category == 2:
-                type_name = "段位场"
-            elif category == 4:
-                type_name = "比赛场"
-            else:
-                type_name = "未知牌谱类型"
-            return category, type_name, mode_id
+        def get_playing(category: int, mode_id: int):
+            return category, get_category_name(category), mode_id
 
-        data = cast(liblq.NotifyFriendStateChange, notify.payload)
+        data = cast(LiteNotifyFriendStateChange, notify.payload)
         target_user = data.target_id
         active_state = data.active_state
         msg = ""
-        for friend in self.friends:
-            if friend.account_id == target_user:
-                nick_name = friend.nickname
-                # find what changed
-                if active_state.is_online and not friend.is_online:
-                    msg = f"{nick_name} 上线了"
-                elif not active_state.is_online and friend.is_online:
-                    msg = f"{nick_name} 下线了"
-
-                # if active_state have playing
-                active_uuid = active_state.playing.game_uuid
-                if active_uuid and not friend.playing.game_uuid:
-                    category, type_name, mode_id = get_playing(active_state)
-
-                    room_name = ModeId2Room.get(mode_id, "")
-                    if room_name:
-                        msg = f"{nick_name} 开始了在 {room_name} 的对局\n"
-                    else:
-                        msg = f"{nick_name} 开始了在 {type_name} 的对局\n"
-                    msg += f"对局id: {active_state.playing.game_uuid}"
-                    # save game_uuid
-                    if not await MajsPaipu.data_exist(uuid=active_uuid):
-                        await MajsPaipu.insert_data(
-                            account_id=str(friend.account_id),
-                            uuid=active_uuid,
-                            paipu_type=category,
-                            paipu_type_name=type_name,
-                        )
-
-                elif not active_state.playing and friend.playing:
-                    category, type_name, mode_id = get_playing(friend.playing)
-
-                    mode_id = friend.playing.meta.mode_id
-                    room_name = ModeId2Room.get(mode_id, "")
-                    if room_name:
-                        msg = f"{nick_name} 结束了在 {room_name} 的对局\n"
-                    else:
-                        msg = f"{nick_name} 结束了在 {type_name} 的对局\n"
-                    uuid = friend.playing.game_uuid
-                    encode_aid = encode_account_id(friend.account_id)
-                    url = f"{PP_HOST}{uuid}_a{encode_aid}"
-
-                    # check 三麻 or 四麻
-                    is_sanma = False
-                    if "三" in room_name:
-                        is_sanma = True
-
-                    cvs = self.clientVersionString
-                    game_record = cast(
-                        liblq.ResGameRecord,
-                        await self.rpc_call(
-                            ".lq.Lobby.fetchGameRecord",
-                            {
-                                "game_uuid": uuid,
-                                "client_version_string": cvs,
-                            },
-                        ),
+        friend = self.friends.get(target_user)
+        if friend is not None:
+            nick_name = friend.nickname
+            # find what changed
+            if active_state.is_online and not friend.is_online:
+                msg = f"{nick_name} 上线了"
+            elif not active_state.is_online and friend.is_online:
+                msg = f"{nick_name} 下线了"
+
+            # if active_state have playing
+            active_uuid = active_state.playing.game_uuid
+            if active_uuid and not friend.game_uuid:
+                category, type_name, mode_id = get_playing(
+                    active_state.playing.category,
+                    active_state.playing.meta.mode_id,
+                )
+
+                room_name = ModeId2Room.get(mode_id, "")
+                if room_name:
+                    msg = f"{nick_name} 开始了在 {room_name} 的对局\n"
+                else:
+                    msg = f"{nick_name} 开始了在 {type_name} 的对局\n"
+                msg += f"对局id: {active_state.playing.game_uuid}"
+                # save game_uuid
+                if not await MajsPaipu.data_exist(uuid=active_uuid):
+                    await MajsPaipu.insert_data(
+                        account_id=str(friend.account_id),
+                        uuid=active_uuid,
+                        paipu_type=category,
+                        paipu_type_name=type_name,
                     )
 
-                    # check if game_record is valid
-                    if game_record.error.code:
-                        # check is_online before send message
-                        if not active_state.is_online:
-                            friend.change_state(active_state)
-                            if not await MajsPaipu.data_exist(
-                                uuid=active_uuid
-                            ):
-                                await MajsPaipu.insert_data(
-                                    account_id=str(friend.account_id),
-                                    uuid=active_uuid,
-                                    paipu_type=category,
-                                    paipu_type_name=type_name,
-                                )
-                            return
-                        logger.error(
-                            f"获取牌谱失败: {game_record.error}, retrying"
-                        )
-                        # sleep 1s
-                        await asyncio.sleep(1)
-                        # retry 1 time
-                        cvs = self.clientVersionString
-                        game_record = cast(
-                            liblq.ResGameRecord,
-                            await self.rpc_call(
-                                ".lq.Lobby.fetchGameRecord",
-                                {
-                                    "game_uuid": uuid,
-                                    "client_version_string": cvs,
-                                },
-                            ),
-                        )
-                        if game_record.error.code:
-                            logger.error(f"获取牌谱失败: {game_record.error}")
-                            msg += "获取牌谱失败\n"
-                            msg += f"对局id: {uuid}"
-                            msg += f"对局牌谱:{url}"
-                            friend.change_state(active_state)
-                            await self.send_msg_to_user(str(target_user), msg)
-                            continue
-
-                    accounts = game_record.head.accounts
-                    friend_seat = 0
-                    friend_level_id = 0
-                    friend_score = 0
-                    for account in accounts:
-                        if account.account_id == friend.account_id:
-                            friend_seat = account.seat
-                            if is_sanma:
-                                friend_level_id = account.level3.id
-                                friend_score = account.level3.score
-                            else:
-                                friend_level_id = account.level.id
-                                friend_score = account.level.score
-                            break
-                    record_result = game_record.head.result.players
-                    for i, player in enumerate(record_result):
-                        if player.seat == friend_seat:
-                            msg += f"排名:{i + 1} "
-                            msg += f"最终打点:{player.part_point_1} "
-                            msg += f"得点:{player.grading_score}\n"
-
-                            if category == 2:
-                                level_info = MajsoulLevel(
-                                    friend_level_id
-                                ).formatAdjustedScoreWithTag(
-                                    friend_score + player.grading_score
-                                )
-                                msg += f"当前段位:{level_info}\n"
-                            break
-
-                    msg += f"对局牌谱:{url}"
-                    if not await MajsPaipu.data_exist(uuid=active_uuid):
-                        await MajsPaipu.insert_data(
-                            account_id=str(friend.account_id),
-                            uuid=active_uuid,
-                            paipu_type=category,
-                            paipu_type_name=type_name,
-                        )
-
-                # set friend state
+            elif not active_state.playing and friend.game_uuid:
+                category, type_name, mode_id = get_playing(
+                    friend.category, friend.mode_id
+                )
+                event = GameEndEvent(
+                    target_id=target_user,
+                    nickname=nick_name,
+                    uuid=friend.game_uuid,
+                    category=category,
+                    type_name=type_name,
+                    mode_id=mode_id,
+                    is_online=active_state.is_online,
+                    end_time=time.time(),
+                )
                 friend.change_state(active_state)
+                # 先写入 journal, 推送发出前进程退出时重启后会补发
+                entry_id = await journal.append(event)
+                await self.handle_game_end(event, entry_id)
+                return
+
+            # set friend state
+            friend.change_state(active_state)
         if msg:
             await self.send_msg_to_user(str(target_user), msg)
 
+    async def handle_game_end(self, event: GameEndEvent, entry_id: int = 0):
+        msg = f"{event.nickname} 结束了在 {game_room_name(event)} 的对局\n"
+        entry = await manager.fetch_game_result(event.uuid)
+
+        if entry is None:
+            # check is_online before send message
+            if not event.is_online:
+                await self._save_paipu(event)
+                journal.ack(entry_id)
+                return
+            # 牌谱通常还没有生成, 先推送对局结束, 对局结果由重试队列补发
+            logger.warning(f"[majs] 获取对局 {event.uuid} 结果失败, 稍后重试")
+            msg += f"对局牌谱:{game_record_url(event)}\n"
+            msg += "对局结果获取中..."
+            await self.send_msg_to_user(str(event.target_id), msg)
+            # journal 在补发完成后确认. 同一局的多个好友各自重试,
+            # 对局结果查询仍由 record_batch 合并
+            if not manager.record_retry.schedule(
+                f"{event.uuid}_{event.target_id}", (event, entry_id)
+            ):
+                journal.ack(entry_id)
+            return
+
+        msg += format_game_result(event, entry)
+        msg += f"对局牌谱:{game_record_url(event)}"
+        await self._save_paipu(event)
+        futures = await self.send_msg_to_user(str(event.target_id), msg)
+        journal.ack_after(entry_id, futures)
+
+    async def _save_paipu(self, event: GameEndEvent):
+        if not await MajsPaipu.data_exist(uuid=event.uuid):
+            await MajsPaipu.insert_data(
+                account_id=str(event.target_id),
+                uuid=event.uuid,
+                paipu_type=event.category,
+                paipu_type_name=event.type_name,
+            )
+
     async def handle_FriendViewChange(self, notify: MajsoulDecodedMessage):
-        data = cast(liblq.NotifyFriendViewChange, notify.payload)
+        data = cast(LiteNotifyFriendViewChange, notify.payload)
         target_user = data.target_id
         changed_base = data.base
         msg = ""
-        for friend in self.friends:
-            if friend.account_id == target_user:
-                # set friend base
-                friend.change_base(changed_base)
+        friend = self.friends.get(target_user)
+        if friend is not None:
+            # set friend base
+            friend.change_base(changed_base)
         if msg:
             await self.send_msg_to_user(str(target_user), msg)
 
@@ -379,33 +436,27 @@ class MajsoulConnection:
         meta_msg = ""
         if data.type == 1:
             # TODO: The meaning of type 1 is not clear, need to check
-            for friend in self.friends:
-                if friend.account_id == data.account_id:
-                    meta_msg = f"好友 {data.account_id} 已在好友列表中！"
-                    logger.error(meta_msg)
+            friend = self.friends.get(data.account_id)
+            if friend is not None:
+                meta_msg = f"好友 {data.account_id} 已在好友列表中！"
+                logger.error(meta_msg)
             else:
                 # maybe add friend
                 friend = MajsoulFriend(data.friend)
-                if friend not in self.friends:
-                    self.friends.append(friend)
-                    meta_msg = f"账号成功添加好友 {friend.nickname}！"
-                    if data.account_id in self.friend_apply_list:
-                        self.friend_apply_list.remove(data.account_id)
-                else:
-                    meta_msg = f"账号已存在好友 {friend.nickname}！"
+                self.friends[friend.account_id] = friend
+                meta_msg = f"账号成功添加好友 {friend.nickname}！"
+                if data.account_id in self.friend_apply_list:
+                    self.friend_apply_list.remove(data.account_id)
         elif data.type == 2:
             # 删除好友
-            for friend in self.friends:
-                if friend.account_id == data.account_id:
-                    self.friends.remove(friend)
-                    meta_msg = f"账号成功删除好友 {friend.nickname}！"
-                    break
-        else:
-            # check if friend is in self.friends
-            for friend in self.friends:
-                if friend.account_id == data.account_id:
-                    friend = MajsoulFriend(data.friend)
-                    meta_msg = f"数据成功更新好友 {friend.nickname}！"
+            friend = self.friends.pop(data.account_id, None)
+            if friend is not None:
+                meta_msg = f"账号成功删除好友 {friend.nickname}！"
+        elif data.account_id in self.friends:
+            # 更新好友信息
+            friend = MajsoulFriend(data.friend)
+            self.friends[data.account_id] = friend
+            meta_msg = f"数据成功更新好友 {friend.nickname}！"
         if meta_msg:
             await self.send_meta(meta_msg)
 
@@ -416,9 +467,10 @@ class MajsoulConnection:
         self.friend_apply_list.append(account_id)
         resp = cast(
             liblq.ResMultiAccountBrief,
-            await self.rpc_call(
+            await manager.call(
                 ".lq.Lobby.fetchMultiAccountBrief",
                 {"account_id_list": [account_id]},
+                fallback=self,
             ),
         )
         if resp.error.code:
@@ -435,98 +487,413 @@ class MajsoulConnection:
         if MAJS_CONFIG.get_config("MajsIsAutoApplyFriend").data:
             await self.acceptFriendApply(account_id)
 
-    async def dispatch_msg(self):
-        if self._ws is None:
-            raise ConnectionError("Connection is broken")
-
+    async def dispatch_msg(
+        self, ws: websockets.client.WebSocketClientProtocol
+    ):
         while True:
-            msg = await self._ws.recv()
+            try:
+                msg = await ws.recv()
+            except ConnectionClosed as e:
+                logger.warning(f"[majs] {self.account_id} 连接已断开: {e}")
+                self._fail_pending(ConnectionError("Connection is closed"))
+                self._connection_lost()
+                return
             assert isinstance(msg, bytes)
-            data = self._codec.decode_message(msg)
-            logger.debug(f"[majs] 收到消息, index: {data.req_index}")
-            if data.msg_type == self._codec.RESPONSE:
-                idx = data.req_index
-                if idx not in self._req_events:
+            if self._capture is not None:
+                self._capture.write(INBOUND, msg)
+            try:
+                envelope = self._codec.decode_envelope(msg)
+            except ValueError as e:
+                # e.g. a late response for a request that already timed out
+                logger.warning(f"[majs] 消息解析失败: {e}")
+                continue
+            logger.debug(f"[majs] 收到消息, index: {envelope.req_index}")
+            if envelope.msg_type == self._codec.RESPONSE:
+                fut = self._pending.get(envelope.req_index)
+                if fut is None or fut.done():
                     continue
-                self._res[idx] = data
-                self._req_events[idx].set()
-            if data.msg_type == self._codec.NOTIFY:
                 try:
+                    fut.set_result(self._codec.decode_payload(envelope))
+                except Exception as e:
+                    fut.set_exception(e)
+                continue
+            if envelope.msg_type == self._codec.NOTIFY:
+                if envelope.method_name not in self._notify_handlers:
+                    logger.debug(f"[majs] 未处理通知: {envelope.method_name}")
+                    continue
+                try:
+                    data = self._codec.decode_payload(envelope)
                     await self.handle_notify(data)
                 except Exception as e:
                     logger.exception(f"发生错误： {e}")
                 continue
-            if data.msg_type == self._codec.REQUEST:
-                logger.info(f"Request: {data}")
+            if envelope.msg_type == self._codec.REQUEST:
+                logger.info(f"Request: {envelope.method_name}")
                 continue
 
-    async def rpc_call(self, method_name: str, payload: dict):
-        idx = self._codec.index
-        logger.debug(f"[majs] 触发rpc_call, index: {idx}")
+    async def rpc_call(
+        self,
+        method_name: str,
+        payload: dict,
+        timeout: float | None = None,
+    ):
         if self._ws is None:
             raise ConnectionError("Connection is broken")
 
-        req = self._codec.encode_request(method_name, payload)
+        idx, fut = await self._send_request(method_name, payload)
+        return await self._wait_response(idx, fut, timeout)
 
-        evt = asyncio.Event()
-        self._req_events[idx] = evt
-        await self._ws.send(req)
-        await evt.wait()
+    async def rpc_many(
+        self,
+        calls: list[tuple[str, dict]],
+        timeout: float | None = None,
+    ) -> list:
+        """发送多个请求后统一等待, 按顺序返回结果, 失败的请求返回对应异常"""
+        if self._ws is None:
+            raise ConnectionError("Connection is broken")
 
-        res = self._res[idx]
-        del self._res[idx]
-        if idx in self._req_events:
-            del self._req_events[idx]
+        results: list = [None] * len(calls)
+        sent: dict[int, tuple[int, asyncio.Future]] = {}
+        try:
+            for i, (method_name, payload) in enumerate(calls):
+                try:
+                    sent[i] = await self._send_request(method_name, payload)
+                except (ValueError, ConnectionError) as e:
+                    results[i] = e
+        except BaseException:
+            # 发送中途出错或被取消, 已发出的请求不会再有人等待, 释放其 index
+            for idx, fut in sent.values():
+                self._abandon_request(idx, fut)
+            raise
+
+        responses = await asyncio.gather(
+            *(
+                self._wait_response(idx, fut, timeout)
+                for idx, fut in sent.values()
+            ),
+            return_exceptions=True,
+        )
+        for i, res in zip(sent, responses):
+            results[i] = res
+        return results
+
+    def _abandon_request(self, idx: int, fut: asyncio.Future):
+        self._codec.release(idx)
+        if self._pending.get(idx) is fut:
+            del self._pending[idx]
+        fut.cancel()
+
+    async def _send_request(self, method_name: str, payload: dict):
+        assert self._ws is not None
+        idx, req = self._codec.encode_request(method_name, payload)
+        logger.debug(f"[majs] 触发rpc_call, index: {idx}")
 
+        fut: asyncio.Future[MajsoulDecodedMessage] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending[idx] = fut
+        if self._capture is not None:
+            self._capture.write(OUTBOUND, req)
+        try:
+            await self._ws.send(req)
+        except BaseException as e:
+            self._codec.release(idx)
+            if self._pending.get(idx) is fut:
+                del self._pending[idx]
+            if isinstance(e, ConnectionClosed):
+                raise ConnectionError("Connection is closed") from e
+            raise
+        return idx, fut
+
+    async def _wait_response(
+        self,
+        idx: int,
+        fut: asyncio.Future[MajsoulDecodedMessage],
+        timeout: float | None = None,
+    ):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            res = await asyncio.wait_for(fut, timeout or self.RPC_TIMEOUT)
+        except BaseException:
+            # timed out, cancelled or the socket died: free the index
+            self._codec.release(idx)
+            raise
+        finally:
+            if self._pending.get(idx) is fut:
+                del self._pending[idx]
+
+        elapsed = loop.time() - start
+        if self.latency:
+            alpha = self.LATENCY_ALPHA
+            self.latency = alpha * elapsed + (1 - alpha) * self.latency
+        else:
+            self.latency = elapsed
         return res.payload
 
-    async def error_handler(self, error: liblq.Error):
+    @property
+    def inflight(self):
+        return len(self._pending)
+
+    def _fail_pending(self, exc: Exception):
+        pending = self._pending
+        self._pending = {}
+        for idx, fut in pending.items():
+            self._codec.release(idx)
+            if not fut.done():
+                fut.set_exception(exc)
+
+    async def close(self):
+        self._closing = True
+        self.healthy = False
+        current = asyncio.current_task()
+        for task in (
+            self._reconnect_task,
+            self._msg_dispatcher,
+        ):
+            # close() may be reached from one of these tasks itself
+            if task is not None and task is not current:
+                task.cancel()
+        await self._flush_game_changes()
+        self.scheduler.close()
+        if self._ws is not None:
+            await self._ws.close()
+        if self._capture is not None:
+            self._capture.close()
+            self._capture = None
+        self._fail_pending(ConnectionError("Connection is closed"))
+
+    async def _flush_game_changes(self):
+        # 合并窗口内的对局开始/结束不能随连接一起丢弃, 关闭前直接处理,
+        # 对局结束会先写入 journal
+        for key, pending in self.coalescer.drain():
+            friend = self.friends.get(key)
+            state = pending.state
+            if friend is None or state is None:
+                continue
+            if (
+                state.payload.active_state.playing.game_uuid
+                == friend.game_uuid
+            ):
+                continue
+            try:
+                await self.handle_FriendStateChange(state)
+            except Exception as e:
+                logger.exception(f"[majs] 处理好友 {key} 的状态变化失败: {e}")
+
+    async def error_handler(self, error: liblq.Error | Exception):
         logger.error(f"[majs] {self.account_id} Connection lost: {error}")
-        await manager.restart()
-
-    async def create_heatbeat_task(self):
-        # create a new task to keep the connection alive, 300s heartbeat
-        async def heartbeat():
-            while True:
-                # random sleep to avoid heartbeat collision
-                timeout = random.randint(300, 360)
-                await asyncio.sleep(timeout)
-                resp = cast(
-                    liblq.ResServerTime,
-                    await self.rpc_call(".lq.Lobby.fetchServerTime", {}),
+        self._connection_lost()
+
+    def _connection_lost(self):
+        self.healthy = False
+        if self._closing or not self.supervised:
+            return
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+
+    async def _reconnect_loop(self):
+        # 只重连这一个连接, 指数退避并加入随机抖动
+        attempt = 0
+        while not self._closing:
+            delay = min(self.RECONNECT_MAX, self.RECONNECT_BASE * 2**attempt)
+            attempt += 1
+            await asyncio.sleep(random.uniform(delay / 2, delay))
+            try:
+                await self.reconnect()
+            except Exception as e:
+                logger.warning(
+                    f"[majs] {self.account_id} 第 {attempt} 次重连失败: {e}"
                 )
-                # check if the connection is still alive
-                if resp.error.code:
-                    await self.error_handler(resp.error)
-                resp = cast(
-                    liblq.ResCommon,
-                    await self.rpc_call(
-                        ".lq.Lobby.heatbeat",
-                        {"no_operation_counter": 0},
-                    ),
-                )
-                if resp.error.code:
-                    await self.error_handler(resp.error)
+                if attempt == self.RECONNECT_ALERT:
+                    await self.send_meta(
+                        f"账号 {self.nick_name}({self.account_id}) "
+                        f"已连续重连失败 {attempt} 次, 将继续尝试\n{e}"
+                    )
+                continue
+            logger.info(f"[majs] {self.account_id} 重连成功")
+            return
+
+    async def reconnect(self):
+        if self._msg_dispatcher is not None:
+            self._msg_dispatcher.cancel()
+        if self._ws is not None:
+            await self._ws.close()
+        self._fail_pending(ConnectionError("Connection is closed"))
+
+        await self.connect()
+        self.healthy = False
+        try:
+            await self.resume_login()
+        except BaseException:
+            if self._msg_dispatcher is not None:
+                self._msg_dispatcher.cancel()
+            if self._ws is not None:
+                await self._ws.close()
+            raise
+        self.healthy = True
+        try:
+            await self.resync_friends()
+        except Exception as e:
+            logger.warning(f"[majs] {self.account_id} 重连后同步好友失败: {e}")
+
+    async def resync_friends(self):
+        # 断线期间收不到好友通知, 重新获取好友列表,
+        # 把与本地记录不同的状态当作通知处理, 补发上下线/对局开始/结束的推送
+        resp = cast(
+            liblq.ResFriendList,
+            await self.rpc_call(".lq.Lobby.fetchFriendList", {}),
+        )
+        if resp.error.code:
+            raise ValueError(f"Failed to fetchFriendList: {resp.error}")
+
+        friends: Dict[int, MajsoulFriend] = {}
+        changed = 0
+        for item in resp.friends:
+            account_id = item.base.account_id
+            friend = self.friends.get(account_id)
+            if friend is None:
+                friends[account_id] = MajsoulFriend(item)
+                continue
+            friends[account_id] = friend
+            friend.change_base(item.base)
+
+            state = item.state
+            game_uuid = state.playing.game_uuid
+            if friend.game_uuid and game_uuid != friend.game_uuid:
+                if game_uuid:
+                    # 断线期间结束了一局又开始了新的一局, 先处理上一局的结束
+                    ended = liblq.AccountActiveState(
+                        account_id=account_id,
+                        login_time=state.login_time,
+                        logout_time=state.logout_time,
+                        is_online=state.is_online,
+                    )
+                    await self._resync_state(account_id, ended)
+            elif (
+                state.is_online == friend.is_online
+                and game_uuid == friend.game_uuid
+            ):
+                continue
+            await self._resync_state(account_id, state)
+            changed += 1
+        self.friends = friends
+        logger.info(
+            f"[majs] {self.account_id} 重连后 {changed} 个好友状态有变化"
+        )
 
-        task = asyncio.create_task(heartbeat())
-        self.bg_tasks.append(task)
+    async def _resync_state(
+        self, account_id: int, state: liblq.AccountActiveState
+    ):
+        await self.handle_notify(
+            MajsoulDecodedMessage(
+                msg_type=self._codec.NOTIFY,
+                req_index=0,
+                method_name=STATE_CHANGE,
+                payload=liblq.NotifyFriendStateChange(
+                    target_id=account_id, active_state=state
+                ),
+            )
+        )
 
-    async def process(self):
-        while True:
-            data = await self.queue.get()
-            asyncio.create_task(data)
-            self.queue.task_done()
+    async def resume_login(self):
+        # 使用保存的 AccessToken 恢复会话, 失效时刷新后重试
+        try:
+            await self.oauth2_login(self.access_token, reconnect=True)
+            return
+        except ValueError as e:
+            logger.warning(f"[majs] {self.account_id} AccessToken已失效: {e}")
+
+        if self.login_type == 7:
+            await self.refresh_token()
+            await self.oauth2_login(self.access_token, reconnect=True)
+            return
+
+        # 国服账号只能使用账密重新登陆获取新的 AccessToken
+        if self.user is None or not self.user.password:
+            raise ValueError("没有保存的账密, 无法刷新 AccessToken")
+        account_id, access_token = await self.manual_login(
+            self.user.username, self.user.password, self.version_info
+        )
+        await MajsUser.update_data_by_data(
+            {"uid": str(account_id)}, {"cookie": access_token}
+        )
+
+    async def refresh_token(self):
+        if self.login_type != 7 or self.user is None:
+            raise ValueError("只有账号池中的 Yostar 账号可以刷新 AccessToken")
+        code = await yostar_passport_login(
+            self.user.uid, self.user.token, self.user.lang
+        )
+        resp = cast(
+            liblq.ResOauth2Auth,
+            await self.rpc_call(
+                ".lq.Lobby.oauth2Auth",
+                {
+                    "type": 7,
+                    "code": code,
+                    "uid": self.user.uid,
+                    "client_version_string": self.clientVersionString,
+                },
+            ),
+        )
+        if resp.error.code:
+            raise ValueError(f"Failed to oauth2Auth: {resp.error}")
+        self.access_token = resp.access_token
+        self.token_checked_at = time.time()
+
+    async def check_token(self):
+        # 定期检查 AccessToken, Yostar 账号失效时立即刷新
+        self.token_checked_at = time.time()
+        resp = cast(
+            liblq.ResOauth2Check,
+            await self.rpc_call(
+                ".lq.Lobby.oauth2Check",
+                {"type": self.login_type, "access_token": self.access_token},
+            ),
+        )
+        if resp.has_account:
+            return
+        logger.warning(f"[majs] {self.account_id} AccessToken已失效")
+        if self.login_type == 7:
+            await self.refresh_token()
+
+    async def heartbeat(self):
+        try:
+            resp = cast(
+                liblq.ResServerTime,
+                await self.rpc_call(".lq.Lobby.fetchServerTime", {}),
+            )
+            # check if the connection is still alive
+            if resp.error.code:
+                await self.error_handler(resp.error)
+                return
+            resp = cast(
+                liblq.ResCommon,
+                await self.rpc_call(
+                    ".lq.Lobby.heatbeat",
+                    {"no_operation_counter": 0},
+                ),
+            )
+            if resp.error.code:
+                await self.error_handler(resp.error)
+                return
+            if time.time() - self.token_checked_at > self.TOKEN_CHECK_INTERVAL:
+                await self.check_token()
+        except (TimeoutError, ConnectionError) as e:
+            await self.error_handler(e)
+        except ValueError as e:
+            logger.warning(
+                f"[majs] {self.account_id} 刷新AccessToken失败: {e}"
+            )
 
     async def check_connection(self):
         if self._ws is None:
             raise ConnectionError("Connection is broken")
         return True
 
-    def remove_duplicate_friends(self):
-        # friends: List[MajsoulFriend] = []
-        unique_friends = {friend.account_id: friend for friend in self.friends}
-        self.friends = list(unique_friends.values())
-        return self.friends
+    def friend_list(self) -> list[MajsoulFriend]:
+        return list(self.friends.values())
 
     def encode_p(self, password: str):
         return hmac.new(
@@ -555,11 +922,15 @@ class MajsoulConnection:
         if resp.error.code:
             raise ValueError(f"Failed to oauth2Auth: {resp}")
         access_token = resp.access_token
+        await self.oauth2_check(access_token)
+        await self.oauth2_login(access_token)
+
+    async def oauth2_check(self, access_token: str):
         resp = cast(
             liblq.ResOauth2Check,
             await self.rpc_call(
                 ".lq.Lobby.oauth2Check",
-                {"type": 7, "access_token": access_token},
+                {"type": self.login_type, "access_token": access_token},
             ),
         )
         logger.info(f"OAuth2 Check: {resp}")
@@ -569,37 +940,38 @@ class MajsoulConnection:
                 liblq.ResOauth2Check,
                 await self.rpc_call(
                     ".lq.Lobby.oauth2Check",
-                    {"type": 7, "access_token": access_token},
+                    {"type": self.login_type, "access_token": access_token},
                 ),
             )
         if not resp.has_account:
             raise ValueError("Failed to check account")
 
+    async def oauth2_login(self, access_token: str, reconnect: bool = False):
+        payload = {
+            "type": self.login_type,
+            "access_token": access_token,
+            "reconnect": reconnect,
+            "device": {
+                "platform": "pc",
+                "hardware": "pc",
+                "os": "windows",
+                "os_version": "win10",
+                "is_browser": True,
+                "software": "Chrome",
+                "sale_platform": "web",
+            },
+            "random_key": self.random_key,
+            "client_version": {"resource": self.version_info.version},
+            "currency_platforms": [],
+            "client_version_string": self.clientVersionString,
+        }
+        if self.login_type == 7:
+            payload["currency_platforms"] = [1, 3, 5, 9, 12]
+            payload["gen_access_token"] = False
+            payload["tag"] = "jp"
         resp = cast(
             liblq.ResLogin,
-            await self.rpc_call(
-                ".lq.Lobby.oauth2Login",
-                {
-                    "type": 7,
-                    "access_token": access_token,
-                    "reconnect": False,
-                    "device": {
-                        "platform": "pc",
-                        "hardware": "pc",
-                        "os": "windows",
-                        "os_version": "win10",
-                        "is_browser": True,
-                        "software": "Chrome",
-                        "sale_platform": "web",
-                    },
-                    "random_key": self.random_key,
-                    "client_version": {"resource": version_info.version},
-                    "currency_platforms": [1, 3, 5, 9, 12],
-                    "client_version_string": self.clientVersionString,
-                    "gen_access_token": False,
-                    "tag": "jp",
-                },
-            ),
+            await self.rpc_call(".lq.Lobby.oauth2Login", payload),
         )
         if not resp.account_id:
             raise ValueError("Failed to login")
@@ -617,6 +989,7 @@ class MajsoulConnection:
             raise ValueError(f"Failed to loginBeat: {resp}")
         logger.info("Connection ready")
         self.access_token = access_token
+        self.token_checked_at = time.time()
 
     async def manual_login(
         self,
@@ -649,9 +1022,12 @@ class MajsoulConnection:
                 },
             ),
         )
+        if not resp.account_id:
+            raise ValueError(f"Failed to login: {resp.error}")
         self.account_id = resp.account_id
         self.nick_name = resp.account.nickname
         self.access_token = resp.access_token
+        self.token_checked_at = time.time()
 
         self.manual_login_username = username
         self.manual_login_password = password
@@ -663,90 +1039,23 @@ class MajsoulConnection:
         version_info: MajsoulVersionInfo,
         access_token: str,
     ):
-        resp = cast(
-            liblq.ResOauth2Check,
-            await self.rpc_call(
-                ".lq.Lobby.oauth2Check",
-                {"type": 0, "access_token": access_token},
-            ),
-        )
-        logger.info(f"OAuth2 Check: {resp}")
-        if not resp.has_account:
-            await asyncio.sleep(2)
-            resp = cast(
-                liblq.ResOauth2Check,
-                await self.rpc_call(
-                    ".lq.Lobby.oauth2Check",
-                    {"type": 0, "access_token": access_token},
-                ),
-            )
-        if not resp.has_account:
-            raise ValueError("Failed to check account")
-
-        resp = cast(
-            liblq.ResLogin,
-            await self.rpc_call(
-                ".lq.Lobby.oauth2Login",
-                {
-                    "type": 0,
-                    "access_token": access_token,
-                    "reconnect": False,
-                    "device": {
-                        "platform": "pc",
-                        "hardware": "pc",
-                        "os": "windows",
-                        "os_version": "win10",
-                        "is_browser": True,
-                        "software": "Chrome",
-                        "sale_platform": "web",
-                    },
-                    "random_key": self.random_key,
-                    "client_version": {"resource": version_info.version},
-                    "currency_platforms": [],
-                    "client_version_string": self.clientVersionString,
-                },
-            ),
-        )
-        if not resp.account_id:
-            raise ValueError("Failed to login")
-        self.account_id = resp.account_id
-        self.nick_name = resp.account.nickname
-
-        resp = cast(
-            liblq.ResCommon,
-            await self.rpc_call(
-                ".lq.Lobby.loginBeat",
-                {"contract": "DF2vkXCnfeXp4WoGSBGNcJBufZiMN3UP"},
-            ),
-        )
-        if resp.error.code:
-            raise ValueError(f"Failed to loginBeat: {resp}")
-        logger.info("Connection ready")
-        self.access_token = access_token
+        await self.oauth2_check(access_token)
+        await self.oauth2_login(access_token)
 
     async def fetchLiveGames(self):
-        game216 = cast(
-            liblq.ResGameLiveList,
-            await self.rpc_call(
-                ".lq.Lobby.fetchGameLiveList",
-                {"filter_id": 216},
-            ),
+        resps = await self.rpc_many(
+            [
+                (".lq.Lobby.fetchGameLiveList", {"filter_id": filter_id})
+                for filter_id in (216, 209, 212)
+            ]
         )
-        game209 = cast(
-            liblq.ResGameLiveList,
-            await self.rpc_call(
-                ".lq.Lobby.fetchGameLiveList",
-                {"filter_id": 209},
-            ),
-        )
-        game212 = cast(
-            liblq.ResGameLiveList,
-            await self.rpc_call(
-                ".lq.Lobby.fetchGameLiveList",
-                {"filter_id": 212},
-            ),
-        )
-        return game216.live_list + game209.live_list + game212.live_list
+        live_list = []
+        for resp in resps:
+            if isinstance(resp, BaseException):
+                logger.warning(f"[majs] 获取直播列表失败: {resp}")
+                continue
+            live_list += cast(liblq.ResGameLiveList, resp).live_list
+        return live_list
 
     async def fetchInfo(self):
         resp = cast(
@@ -758,10 +1067,11 @@ class MajsoulConnection:
         )
         friend_list = resp.friend_list.friends
         if isinstance(friend_list, Iterable):
-            for friend in friend_list:
-                friend = MajsoulFriend(friend)
-                if friend not in self.friends:
-                    self.friends.append(friend)
+            # fetchInfo 返回完整的好友列表, 重新建立索引
+            self.friends = {
+                friend.base.account_id: MajsoulFriend(friend)
+                for friend in friend_list
+            }
         friend_apply_list = resp.friend_apply_list.applies
         if isinstance(friend_apply_list, Iterable):
             for apply in friend_apply_list:
@@ -808,26 +1118,11 @@ class MajsoulConnection:
                 },
             ),
         )
-        detail_records = liblq.Wrapper().parse(logs.data)
-
-        payload = liblq.GameDetailRecords().parse(detail_records.data)
-
-        action_list = []
-        if payload.version < 210715 and len(payload.records) > 0:
-            for value in payload.records:
-                raw = liblq.Wrapper().parse(value)
-                name = raw.name.split(".")[2]
-                msg = getattr(liblq, name)().parse(raw.data)
-                item = MjsLogItem(name=name, data=msg)
-                action_list.append(item)
-        else:
-            for action in payload.actions:
-                if action.result and len(action.result) > 0:
-                    raw = liblq.Wrapper().parse(action.result)
-                    name = raw.name.split(".")[2]
-                    msg = getattr(liblq, name)().parse(raw.data)
-                    item = MjsLogItem(name=name, data=msg)
-                    action_list.append(item)
+        data = logs.data
+        if not data and logs.data_url:
+            # 较早或较大的对局需要从 data_url 下载牌谱数据
+            data = await fetch_record_blob(log_id, logs.data_url)
+        action_list = self._codec.decode_records(data)
 
         tenhou_log = MajsoulPaipuParser().handle_game_record(
             record=MjsLog(logs.head, action_list)
@@ -863,13 +1158,56 @@ class MajsoulConnection:
         return tenhou_log
 
 
-async def fetchMajsoulInfo(URL_BASE: str):
-    version_info = convert(
-        await getRes(URL_BASE, "version.json", bust_cache=True),
-        MajsoulVersionInfo,
+async def yostar_passport_login(uid: str, token: str, lang: str) -> str:
+    # Yostar 账号用长期 token 换取 oauth2Auth 使用的 code
+    URL_BASE = (
+        "https://game.mahjongsoul.com/"
+        if lang == "jp"
+        else "https://mahjongsoul.game.yo-star.com/"
     )
+    headers = {
+        "Content-Type": "application/json; charset=utf-8",
+        "User-Agent": USER_AGENT,
+        "Referer": URL_BASE,
+        "Origin": URL_BASE,
+    }
+    url = "https://passport.mahjongsoul.com/user/login"
+    payload = {
+        "uid": uid,
+        "token": token,
+        "deviceId": f"web|{uid}",
+    }
+    response = await get_client("passport").post(
+        url, json=payload, headers=headers
+    )
+    if response.status_code != 200:
+        logger.error(response.text)
+        raise ValueError("JP Yostar token已失效, 请重新登录！")
+    res = response.json()
+    if res["result"] != 0:
+        logger.error(res)
+        raise ValueError("JP Yostar token已失效, 请重新登录！")
+    return res["accessToken"]
+
+
+# (server, pbDef, pbVersion, version_info)
+MajsoulInfo = Tuple[str, MajsoulLiqiProto, str, MajsoulVersionInfo]
+
+
+# URL_BASE -> (version, pbVersion, pbDef, ipDef)
+# 每个区服只保留当前版本解析后的对象, 重连与多账号登录时不再重复解析
+_REGION_RES: Dict[
+    str, Tuple[str, str, MajsoulLiqiProto, MajsoulUSConfigIp]
+] = {}
+
+
+async def loadRegionRes(URL_BASE: str, version: str):
+    cached = _REGION_RES.get(URL_BASE)
+    if cached is not None and cached[0] == version:
+        return cached[1:]
+
     resInfo = convert(
-        await getRes(URL_BASE, f"resversion{version_info.version}.json"),
+        await getRes(URL_BASE, f"resversion{version}.json"),
         MajsoulResInfo,
     )
     pbVersion = resInfo.res["res/proto/liqi.json"].prefix
@@ -891,6 +1229,18 @@ async def fetchMajsoulInfo(URL_BASE: str):
         )
 
     ipDef = next(filter(lambda x: x.name == "player", config.ip))
+    _REGION_RES[URL_BASE] = (version, pbVersion, pbDef, ipDef)
+    return pbVersion, pbDef, ipDef
+
+
+async def fetchMajsoulInfo(URL_BASE: str) -> MajsoulInfo:
+    version_info = convert(
+        await getRes(URL_BASE, "version.json", bust_cache=True),
+        MajsoulVersionInfo,
+    )
+    pbVersion, pbDef, ipDef = await loadRegionRes(
+        URL_BASE, version_info.version
+    )
 
     serverListUrl = random.choice(ipDef.region_urls).url
     serverListUrl += (
@@ -900,7 +1250,7 @@ async def fetchMajsoulInfo(URL_BASE: str):
 
     headers = HEADERS.copy()
     headers["Referer"] = URL_BASE
-    resp = await AsyncClient(headers=headers).get(serverListUrl)
+    resp = await get_client("majsoul").get(serverListUrl, headers=headers)
     resp.raise_for_status()
     serverList = convert(resp.json(), MajsoulServerList)
 
@@ -921,12 +1271,19 @@ async def createMajsoulConnection(
     username: str = "",
     password: str = "",
     access_token: str = "",
+    info: MajsoulInfo | None = None,
 ):
     URL_BASE = "https://game.maj-soul.com/"
 
-    server, pbDef, pbVersion, version_info = await fetchMajsoulInfo(URL_BASE)
+    if info is None:
+        info = await fetchMajsoulInfo(URL_BASE)
+    server, pbDef, pbVersion, version_info = info
 
-    codec = MajsoulProtoCodec(pbDef, pbVersion)
+    schema = load_schema(pbDef, pbVersion, PROTO_PATH)
+    backend = load_backend(
+        MAJS_CONFIG.get_config("MajsProtoBackend").data, pbDef, pbVersion
+    )
+    codec = MajsoulProtoCodec(pbDef, pbVersion, schema, backend)
     conn = MajsoulConnection(f"wss://{server}", 0, codec, version_info)
     await conn.connect()
 
@@ -962,21 +1319,30 @@ async def createMajsoulConnection(
         except ValueError as e:
             raise ValueError(f"Manual login failed: {e}")
 
-    await conn.create_heatbeat_task()
-
     return conn
 
 
-async def createYostarMajsoulConnection(uid: str, code: str, lang: str):
+async def createYostarMajsoulConnection(
+    uid: str,
+    code: str,
+    lang: str,
+    info: MajsoulInfo | None = None,
+):
     URL_BASE = (
         "https://game.mahjongsoul.com/"
         if lang == "jp"
         else "https://mahjongsoul.game.yo-star.com/"
     )
 
-    server, pbDef, pbVersion, version_info = await fetchMajsoulInfo(URL_BASE)
+    if info is None:
+        info = await fetchMajsoulInfo(URL_BASE)
+    server, pbDef, pbVersion, version_info = info
 
-    codec = MajsoulProtoCodec(pbDef, pbVersion)
+    schema = load_schema(pbDef, pbVersion, PROTO_PATH)
+    backend = load_backend(
+        MAJS_CONFIG.get_config("MajsProtoBackend").data, pbDef, pbVersion
+    )
+    codec = MajsoulProtoCodec(pbDef, pbVersion, schema, backend)
     conn = MajsoulConnection(f"wss://{server}", 7, codec, version_info)
     await conn.connect()
 
@@ -986,15 +1352,30 @@ async def createYostarMajsoulConnection(uid: str, code: str, lang: str):
 
     await conn.jp_login(uid, code, version_info)
 
-    await conn.create_heatbeat_task()
-
     return conn
 
 
 class MajsoulManager:
+    # latency floor so fresh connections are not always preferred
+    MIN_LATENCY = 0.05
+
     def __init__(self):
         # maybe we need to support multiple connections in the future
         self.conn: list[MajsoulConnection] = []
+        self._starting: asyncio.Task | None = None
+        # 后台登陆账号池中其余账号的任务
+        self._login_task: asyncio.Task | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self._journal_replayed = False
+        self.record_retry = RetryQueue(
+            self._retry_game_record,
+            self._expire_game_record,
+            MAJS_CONFIG.get_config("MajsRecordRetryMaxAge").data,
+        )
+        self.record_batch = GameResultBatcher(
+            MAJS_CONFIG.get_config("MajsRecordBatchMs").data / 1000,
+            self._fetch_records_detail,
+        )
 
     async def check_username_password(
         self,
@@ -1026,91 +1407,248 @@ class MajsoulManager:
         except ValueError as e:
             logger.error(e)
             return False
-        self.conn.append(conn)
+        self.add_conn(conn)
         return conn
 
+    def add_conn(self, conn: MajsoulConnection):
+        # 加入连接池后由管理器负责心跳与断线重连
+        conn.supervised = True
+        self.conn.append(conn)
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def _heartbeat_loop(self):
+        # 所有账号共用一个心跳定时器
+        while True:
+            # random sleep to avoid heartbeat collision
+            await asyncio.sleep(random.randint(300, 360))
+            await asyncio.gather(
+                *(conn.heartbeat() for conn in self.conn if conn.healthy),
+                return_exceptions=True,
+            )
+
     async def start(self):
-        if len(self.conn) == 0:
-            # get all accounts
+        if self.conn:
+            return self.conn[0]
+        # 多个命令同时触发时共用同一次登陆
+        if self._starting is None:
+            self._starting = asyncio.create_task(self._start())
+        return await asyncio.shield(self._starting)
+
+    async def _start(self) -> Union[MajsoulConnection, str]:
+        try:
             users = await MajsUser.get_all_user()
-            for user in users:
-                if user.login_type == 0:
-                    try:
-                        conn = await createMajsoulConnection(
-                            access_token=user.cookie
-                        )
-                    except MajsoulMaintenanceError as e:
-                        return (
-                            f"❌ 登陆失败, 雀魂服务器正在维护中!\ncontext: {e}"
-                        )
-                    except ValueError as e:
-                        logger.warning(
-                            f"[majs] AccessToken已失效, 使用账密进行刷新！\n{e}"
-                        )
-                        conn = await createMajsoulConnection(
-                            username=user.username,
-                            password=user.password,
-                        )
-
-                    self.conn.append(conn)
-                    await conn.fetchInfo()
-                elif user.login_type == 7:
-                    URL_BASE = (
-                        "https://game.mahjongsoul.com/"
-                        if user.lang == "jp"
-                        else "https://mahjongsoul.game.yo-star.com/"
-                    )
-                    headers = {
-                        "Content-Type": "application/json; charset=utf-8",
-                        "User-Agent": USER_AGENT,
-                        "Referer": URL_BASE,
-                        "Origin": URL_BASE,
-                    }
-                    sess = httpx.AsyncClient(headers=headers, verify=False)
-                    url = "https://passport.mahjongsoul.com/user/login"
-                    payload = {
-                        "uid": user.uid,
-                        "token": user.token,
-                        "deviceId": f"web|{user.uid}",
-                    }
-                    response = await sess.post(url, json=payload)
-                    if response.status_code == 200:
-                        res = response.json()
-                        if res["result"] == 0:
-                            code = res["accessToken"]
-                        else:
-                            logger.error(res)
-                            return "❌ JP Yostar token已失效, 请重新登录！"
-                    else:
-                        logger.error(response.text)
-                        return "❌ JP Yostar token已失效, 请重新登录！"
-
-                    try:
-                        conn = await createYostarMajsoulConnection(
-                            user.uid,
-                            code,
-                            user.lang,
-                        )
-                    except ValueError as e:
-                        logger.warning(
-                            f"[majs] Yostar token已失效, 请重新登录！\n{e}"
-                        )
-                        return "❌ Yostar token已失效, 请重新登录！"
-
-                    self.conn.append(conn)
+            if not users:
+                return "❌ 账号池中没有账号, 请先添加账号!"
+            await subscriptions.load()
+
+            first: asyncio.Future[MajsoulConnection] = (
+                asyncio.get_running_loop().create_future()
+            )
+            self._login_task = asyncio.create_task(
+                self._login_all(users, first)
+            )
+            # 第一个可用的连接就绪后立即返回, 其余账号在后台继续登陆
+            await asyncio.wait(
+                [first, self._login_task],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if first.done():
+                if not self._journal_replayed:
+                    self._journal_replayed = True
+                    asyncio.create_task(self._replay_journal())
+                return first.result()
+            first.cancel()
+            return "\n".join(self._login_task.result())
+        finally:
+            self._starting = None
+
+    async def _replay_journal(self):
+        # 补发上次运行时未发出的对局结束推送
+        entries = await journal.pending()
+        if entries:
+            logger.info(f"[majs] 重放 {len(entries)} 条未发出的对局结束推送")
+        for entry_id, event in entries:
+            conn = self.pick_conn()
+            if conn is None:
+                logger.warning("[majs] 没有可用的连接, 停止重放推送")
+                return
+            try:
+                await conn.handle_game_end(event, entry_id)
+            except Exception as e:
+                logger.exception(f"[majs] 重放对局 {event.uuid} 推送失败: {e}")
+
+    async def fetch_game_result(
+        self, uuid: str
+    ) -> Optional[liblq.RecordListEntry]:
+        # 只查询对局结果, 完整牌谱仅在需要解析牌谱时通过 fetchLogs 获取
+        return await self.record_batch.get(uuid)
+
+    async def _fetch_records_detail(
+        self, uuids: list[str]
+    ) -> list[liblq.RecordListEntry]:
+        res = cast(
+            liblq.ResGameRecordsDetailV2,
+            await self.call(
+                ".lq.Lobby.fetchGameRecordsDetailV2", {"uuid_list": uuids}
+            ),
+        )
+        if res.error.code:
+            raise ValueError(res.error)
+        return res.entries
+
+    async def _retry_game_record(self, item: RetryItem) -> bool:
+        event, entry_id = cast(Tuple[GameEndEvent, int], item.data)
+        conn = self.pick_conn()
+        if conn is None:
+            return False
+        entry = await self.fetch_game_result(event.uuid)
+        if entry is None:
+            return False
+
+        msg = f"{event.nickname} 在 {game_room_name(event)} 的对局结果\n"
+        msg += format_game_result(event, entry)
+        msg += f"对局牌谱:{game_record_url(event)}"
+        await conn._save_paipu(event)
+        futures = await conn.send_msg_to_user(str(event.target_id), msg)
+        journal.ack_after(entry_id, futures)
+        return True
+
+    async def _expire_game_record(self, item: RetryItem):
+        event, entry_id = cast(Tuple[GameEndEvent, int], item.data)
+        msg = f"{event.nickname} 在 {game_room_name(event)} 的对局结果\n"
+        msg += "获取牌谱失败\n"
+        msg += f"对局id: {event.uuid}"
+        conn = self.pick_conn()
+        if conn is None:
+            journal.ack(entry_id)
+            return
+        futures = await conn.send_msg_to_user(str(event.target_id), msg)
+        journal.ack_after(entry_id, futures)
+
+    async def _login_all(
+        self,
+        users: list[MajsUser],
+        first: asyncio.Future[MajsoulConnection],
+    ):
+        limit = MAJS_CONFIG.get_config("MajsLoginConcurrency").data
+        semaphore = asyncio.Semaphore(max(1, limit))
+        # 同一区服只获取一次版本/服务器信息
+        infos: dict[str, asyncio.Task] = {}
+
+        def get_info(URL_BASE: str):
+            if URL_BASE not in infos:
+                infos[URL_BASE] = asyncio.create_task(
+                    fetchMajsoulInfo(URL_BASE)
+                )
+            return infos[URL_BASE]
+
+        async def login(user: MajsUser):
+            async with semaphore:
+                try:
+                    conn = await self._login_user(user, get_info)
+                except MajsoulMaintenanceError as e:
+                    return f"❌ {user.uid} 登陆失败, 雀魂服务器正在维护中: {e}"
+                except Exception as e:
+                    logger.exception(f"[majs] 账号 {user.uid} 登陆失败")
+                    return f"❌ {user.uid} 登陆失败: {e}"
+                try:
                     await conn.fetchInfo()
-        return self.conn[0]
+                except Exception as e:
+                    await conn.close()
+                    return f"❌ {user.uid} 获取好友列表失败: {e}"
+            conn.user = user
+            self.add_conn(conn)
+            if not first.done():
+                first.set_result(conn)
+            return f"✅ {conn.account_id}({conn.nick_name}) 登陆成功"
+
+        results = await asyncio.gather(*(login(user) for user in users))
+        for result in results:
+            logger.info(f"[majs] {result}")
+        return results
+
+    async def _login_user(self, user: MajsUser, get_info):
+        if user.login_type == 7:
+            URL_BASE = (
+                "https://game.mahjongsoul.com/"
+                if user.lang == "jp"
+                else "https://mahjongsoul.game.yo-star.com/"
+            )
+            code = await yostar_passport_login(user.uid, user.token, user.lang)
+            return await createYostarMajsoulConnection(
+                user.uid,
+                code,
+                user.lang,
+                info=await get_info(URL_BASE),
+            )
+
+        info = await get_info("https://game.maj-soul.com/")
+        try:
+            return await createMajsoulConnection(
+                access_token=user.cookie, info=info
+            )
+        except ValueError as e:
+            logger.warning(
+                f"[majs] AccessToken已失效, 使用账密进行刷新！\n{e}"
+            )
+            return await createMajsoulConnection(
+                username=user.username,
+                password=user.password,
+                info=info,
+            )
 
     async def restart(self):
+        if self._login_task is not None:
+            self._login_task.cancel()
+            self._login_task = None
         if self.conn:
-            if len(self.conn) >= 1:
-                for task in self.conn[0].bg_tasks:
-                    task.cancel()  # type: ignore
             for conn in self.conn:
-                await conn._ws.close()  # type: ignore
+                await conn.close()
         self.conn = []
         return await self.start()
 
+    def pick_conn(self, exclude: Iterable[MajsoulConnection] = ()):
+        # 选择在途请求少, 近期延迟低的可用连接, 分数相同时随机
+        excluded = set(map(id, exclude))
+        candidates = [
+            conn
+            for conn in self.conn
+            if conn.healthy and id(conn) not in excluded
+        ]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda conn: (
+                (conn.inflight + 1) * max(conn.latency, self.MIN_LATENCY),
+                random.random(),
+            ),
+        )
+
+    async def call(
+        self,
+        method_name: str,
+        payload: dict,
+        timeout: float | None = None,
+        fallback: MajsoulConnection | None = None,
+    ):
+        # 连接池的统一 rpc 入口, 连接断开时换一个连接重试
+        # fallback: 连接池中没有可用连接时使用, 例如尚未加入池的连接
+        tried: list[MajsoulConnection] = []
+        while conn := self.pick_conn(tried):
+            tried.append(conn)
+            try:
+                return await conn.rpc_call(method_name, payload, timeout)
+            except ConnectionError as e:
+                conn.healthy = False
+                logger.warning(
+                    f"[majs] {conn.account_id} 请求 {method_name} 失败: {e}"
+                )
+        if fallback is not None and fallback not in tried:
+            return await fallback.rpc_call(method_name, payload, timeout)
+        raise ConnectionError("No healthy connection")
+
     def get_conn(self):
         conns = self.get_all_conn()
         if conns:
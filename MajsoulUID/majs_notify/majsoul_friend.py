@@ -1,32 +1,51 @@
 from ..lib import lq as liblq
 from ._level import MajsoulLevel
+from .fast_decode import LiteActiveState, LitePlayerBaseView
 
 
 class MajsoulFriend:
+    # 每个账号有上千个好友, 只保留推送和排行榜用到的字段
+    __slots__ = (
+        "account_id",
+        "nickname",
+        "avatar_id",
+        "level_id",
+        "level_score",
+        "level3_id",
+        "level3_score",
+        "is_online",
+        "login_time",
+        "logout_time",
+        "game_uuid",
+        "category",
+        "mode_id",
+    )
+
     def __init__(self, friend: liblq.Friend):
-        self.player = friend
         self.account_id = friend.base.account_id
-        self.nickname = friend.base.nickname
-        self.avatar_id = friend.base.avatar_id
+        self.change_base(friend.base)
+        self.change_state(friend.state)
+
+    @property
+    def level(self) -> MajsoulLevel:
+        return MajsoulLevel(self.level_id)
 
-        self.level = MajsoulLevel(friend.base.level.id)
-        self.level_score = friend.base.level.score
-        self.level3 = MajsoulLevel(friend.base.level3.id)
-        self.level3_score = friend.base.level3.score
-        self.login_time = friend.state.login_time
-        self.logout_time = friend.state.logout_time
-        self.is_online = friend.state.is_online
-        self.playing = friend.state.playing
+    @property
+    def level3(self) -> MajsoulLevel:
+        return MajsoulLevel(self.level3_id)
 
-    def change_base(self, base: liblq.PlayerBaseView):
+    def change_base(self, base: liblq.PlayerBaseView | LitePlayerBaseView):
         self.nickname = base.nickname
-        self.level = MajsoulLevel(base.level.id)
+        self.avatar_id = base.avatar_id
+        self.level_id = base.level.id
         self.level_score = base.level.score
-        self.level3 = MajsoulLevel(base.level3.id)
+        self.level3_id = base.level3.id
         self.level3_score = base.level3.score
 
-    def change_state(self, state: liblq.AccountActiveState):
+    def change_state(self, state: liblq.AccountActiveState | LiteActiveState):
         self.login_time = state.login_time
         self.logout_time = state.logout_time
         self.is_online = state.is_online
-        self.playing = state.playing
+        self.game_uuid = state.playing.game_uuid
+        self.category = state.playing.category
+        self.mode_id = state.playing.meta.mode_id
@@ -1,14 +1,28 @@
-from typing import List, Union
+from typing import TYPE_CHECKING, Any, List, Union
 
 import betterproto
 from msgspec import Struct
 
 from ..lib.lq import RecordGame
 
+if TYPE_CHECKING:
+    from .schema import MergedMessageType, SchemaMessageType
+
+# betterproto message class, or a liqi.json fallback for new messages/fields
+MessageType = Union[
+    type[betterproto.Message], "SchemaMessageType", "MergedMessageType"
+]
+
 
 class InflightRequest(Struct):
     method_name: str
-    msg_obj: type[betterproto.Message]
+    msg_obj: MessageType
+
+
+class MajsoulRpcMethod(Struct, frozen=True):
+    method_name: str
+    request_type: type[betterproto.Message]
+    response_type: MessageType
 
 
 class MajsoulVersionInfo(Struct):
@@ -38,6 +52,8 @@ class ReqRes(Struct):
 class MajsoulLiqiItem(Struct):
     fields: dict[str, dict] | None = None
     methods: dict[str, ReqRes] | None = None
+    values: dict[str, int] | None = None
+    nested: Union[dict[str, "MajsoulLiqiItem"], None] = None
 
 
 class MajsoulLiqiNested(Struct):
@@ -102,11 +118,32 @@ class MajsoulServerList(Struct):
     maintenance: Union[MajsoulMaintenance, None] = None
 
 
+class MajsoulEnvelope(Struct):
+    msg_type: int
+    req_index: int
+    method_name: str
+    data: memoryview
+    msg_obj: Union[MessageType, None] = None
+
+
 class MajsoulDecodedMessage(Struct):
     msg_type: int
     req_index: int
     method_name: str
-    payload: betterproto.Message
+    # betterproto message, or a lite struct from fast_decode
+    payload: Any
+
+
+class GameEndEvent(Struct):
+    # 好友结束对局, 写入 journal 以便重启后补发推送
+    target_id: int
+    nickname: str
+    uuid: str
+    category: int
+    type_name: str
+    mode_id: int
+    is_online: bool
+    end_time: float
 
 
 class MajsoulFriend(Struct):
@@ -117,7 +154,8 @@ class MajsoulFriend(Struct):
 
 class MjsLogItem(Struct):
     name: str
-    data: betterproto.Message
+    # lib/lq 消息, 或 upb 后端的同名消息
+    data: Any
 
 
 class MjsLog(Struct):
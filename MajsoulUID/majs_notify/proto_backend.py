@@ -0,0 +1,167 @@
+from typing import Any, Dict, Union
+
+from gsuid_core.logger import logger
+
+from ..lib import lq as liblq
+from .model import MajsoulLiqiItem, MajsoulLiqiProto
+
+# 牌谱等大消息的解码后端, 解码结果的属性名与 lib/lq 保持一致
+
+SCALAR_TYPES = {
+    "double": 1,
+    "float": 2,
+    "int64": 3,
+    "uint64": 4,
+    "int32": 5,
+    "fixed64": 6,
+    "fixed32": 7,
+    "bool": 8,
+    "string": 9,
+    "bytes": 12,
+    "uint32": 13,
+    "sfixed32": 15,
+    "sfixed64": 16,
+    "sint32": 17,
+    "sint64": 18,
+}
+TYPE_MESSAGE = 11
+LABEL_OPTIONAL = 1
+LABEL_REPEATED = 3
+
+
+class BetterprotoBackend:
+    name = "betterproto"
+
+    def parse(self, name: str, data: bytes) -> Any:
+        return getattr(liblq, name)().parse(data)
+
+
+class UpbBackend:
+    # google.protobuf 的 upb 运行时, 消息类由 liqi.json 在运行时生成
+    name = "upb"
+
+    def __init__(self, pb_def: MajsoulLiqiProto, version: str):
+        from google.protobuf import descriptor_pool, message_factory
+
+        self.version = version
+        self._pool = descriptor_pool.DescriptorPool()
+        for pkg_name, pkg in pb_def.nested.items():
+            self._pool.Add(build_file_proto(pkg_name, pkg.nested))
+        self._get_class = message_factory.GetMessageClass
+        self._classes: Dict[str, Any] = {}
+
+    def message_class(self, name: str):
+        cls = self._classes.get(name)
+        if cls is None:
+            descriptor = self._pool.FindMessageTypeByName(f"lq.{name}")
+            cls = self._get_class(descriptor)
+            self._classes[name] = cls
+        return cls
+
+    def parse(self, name: str, data: bytes) -> Any:
+        msg = self.message_class(name)()
+        msg.ParseFromString(data)
+        return msg
+
+
+ProtoBackend = Union[BetterprotoBackend, UpbBackend]
+
+
+def _map_entry_name(field_name: str) -> str:
+    # protoc naming: foo_bar -> FooBarEntry
+    camel = "".join(p[:1].upper() + p[1:] for p in field_name.split("_"))
+    return f"{camel}Entry"
+
+
+def _fill_field(field_proto, name: str, number: int, type_name: str):
+    field_proto.name = name
+    field_proto.number = number
+    if type_name in SCALAR_TYPES:
+        field_proto.type = SCALAR_TYPES[type_name]
+    else:
+        # message or enum, the pool infers which when resolving the name
+        field_proto.type_name = type_name
+
+
+def _fill_message(msg_proto, name: str, item: MajsoulLiqiItem):
+    msg_proto.name = name
+    for field_name, field in (item.fields or {}).items():
+        field_proto = msg_proto.field.add()
+        key_type = field.get("keyType")
+        if key_type:
+            entry_name = _map_entry_name(field_name)
+            entry = msg_proto.nested_type.add()
+            entry.name = entry_name
+            entry.options.map_entry = True
+            for entry_field, number, type_name in (
+                ("key", 1, key_type),
+                ("value", 2, field["type"]),
+            ):
+                entry_field_proto = entry.field.add()
+                entry_field_proto.label = LABEL_OPTIONAL
+                _fill_field(entry_field_proto, entry_field, number, type_name)
+            field_proto.name = field_name
+            field_proto.number = field["id"]
+            field_proto.label = LABEL_REPEATED
+            field_proto.type = TYPE_MESSAGE
+            field_proto.type_name = entry_name
+            continue
+        if field.get("rule") == "repeated":
+            field_proto.label = LABEL_REPEATED
+        else:
+            field_proto.label = LABEL_OPTIONAL
+        _fill_field(field_proto, field_name, field["id"], field["type"])
+
+    for nested_name, nested in (item.nested or {}).items():
+        if nested.values is not None:
+            _fill_enum(msg_proto.enum_type.add(), nested_name, nested)
+        elif nested.fields is not None:
+            _fill_message(msg_proto.nested_type.add(), nested_name, nested)
+
+
+def _fill_enum(enum_proto, name: str, item: MajsoulLiqiItem):
+    enum_proto.name = name
+    for value_name, number in (item.values or {}).items():
+        value = enum_proto.value.add()
+        value.name = value_name
+        value.number = number
+
+
+def build_file_proto(pkg_name: str, nested: Dict[str, MajsoulLiqiItem]):
+    from google.protobuf import descriptor_pb2
+
+    file_proto = descriptor_pb2.FileDescriptorProto()
+    file_proto.name = f"{pkg_name}.proto"
+    file_proto.package = pkg_name
+    file_proto.syntax = "proto3"
+    for name, item in nested.items():
+        if item.values is not None:
+            _fill_enum(file_proto.enum_type.add(), name, item)
+        elif item.fields is not None:
+            _fill_message(file_proto.message_type.add(), name, item)
+    return file_proto
+
+
+_BACKENDS: Dict[str, ProtoBackend] = {}
+
+
+def load_backend(
+    name: str, pb_def: MajsoulLiqiProto, version: str
+) -> ProtoBackend:
+    if name != UpbBackend.name:
+        return _BACKENDS.setdefault(name, BetterprotoBackend())
+
+    key = f"{name}:{version}"
+    backend = _BACKENDS.get(key)
+    if backend is not None:
+        return backend
+    try:
+        backend = UpbBackend(pb_def, version)
+    except ImportError:
+        logger.warning("[majs] 未安装 protobuf, 回退到 betterproto 解码")
+        return load_backend(BetterprotoBackend.name, pb_def, version)
+    except TypeError as e:
+        logger.warning(f"[majs] 构建 upb 消息类失败, 回退到 betterproto: {e}")
+        return load_backend(BetterprotoBackend.name, pb_def, version)
+    _BACKENDS[key] = backend
+    return backend
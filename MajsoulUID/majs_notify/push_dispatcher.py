@@ -0,0 +1,135 @@
+import time
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+from gsuid_core.gss import gss
+from gsuid_core.logger import logger
+
+from .subscription import PushTarget
+from ..majs_config.majs_config import MAJS_CONFIG
+
+# 推送发送: 窗口期内发往同一对象的文字消息合并为一条,
+# 每个适配器(bot_id)按令牌桶限速, 发送失败时重试
+
+# 一条合并消息最多包含的推送数
+MAX_MERGE = 10
+RATE_BURST = 5
+RETRY_TIMES = 3
+RETRY_DELAY = 1.0
+
+
+class RateLimiter:
+    def __init__(self, per_minute: int, burst: int = RATE_BURST):
+        # 配置为 0 时按 1 条/分钟处理, 避免除零
+        self.rate = max(1, per_minute) / 60
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def merge_messages(
+    items: List[Tuple[Any, asyncio.Future]]
+) -> List[Tuple[Any, List[asyncio.Future]]]:
+    # 只合并相邻的文字消息, 图片等消息保持原样和顺序
+    merged: List[Tuple[Any, List[asyncio.Future]]] = []
+    texts: List[str] = []
+    futures: List[asyncio.Future] = []
+    for msg, fut in items:
+        if isinstance(msg, str) and len(texts) < MAX_MERGE:
+            texts.append(msg)
+            futures.append(fut)
+            continue
+        if texts:
+            merged.append(("\n\n".join(texts), futures))
+            texts, futures = [], []
+        if isinstance(msg, str):
+            texts.append(msg)
+            futures.append(fut)
+        else:
+            merged.append((msg, [fut]))
+    if texts:
+        merged.append(("\n\n".join(texts), futures))
+    return merged
+
+
+class PushDispatcher:
+    def __init__(self):
+        self._pending: Dict[PushTarget, List[Tuple[Any, asyncio.Future]]] = {}
+        # 每个推送对象一个发送任务, 保证消息顺序
+        self._senders: Dict[PushTarget, asyncio.Task] = {}
+        self._limiters: Dict[str, RateLimiter] = {}
+
+    def push(self, target: PushTarget, msg: Any) -> asyncio.Future:
+        # 返回的 future 在消息发出(或放弃重试)后完成
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(target, []).append((msg, fut))
+        if target not in self._senders:
+            self._senders[target] = asyncio.create_task(self._sender(target))
+        return fut
+
+    async def _sender(self, target: PushTarget):
+        window = MAJS_CONFIG.get_config("MajsPushBatchMs").data / 1000
+        try:
+            while self._pending.get(target):
+                # 等待窗口期内发往同一对象的其他推送
+                await asyncio.sleep(window)
+                items = self._pending.pop(target)
+                for msg, futures in merge_messages(items):
+                    try:
+                        await self._send(target, msg)
+                    finally:
+                        for fut in futures:
+                            if not fut.done():
+                                fut.set_result(None)
+        finally:
+            del self._senders[target]
+
+    def _limiter(self, bot_id: str) -> RateLimiter:
+        limiter = self._limiters.get(bot_id)
+        if limiter is None:
+            per_minute = MAJS_CONFIG.get_config("MajsPushRateLimit").data
+            limiter = self._limiters[bot_id] = RateLimiter(per_minute)
+        return limiter
+
+    async def _send(self, target: PushTarget, msg: Any):
+        limiter = self._limiter(target.bot_id)
+        for BOT_ID in list(gss.active_bot):
+            for attempt in range(RETRY_TIMES):
+                bot = gss.active_bot.get(BOT_ID)
+                if bot is None:
+                    break
+                await limiter.acquire()
+                try:
+                    await bot.target_send(
+                        msg,
+                        target.target_type,
+                        target.target_id,
+                        target.bot_id,
+                        "",
+                    )
+                    break
+                except Exception as e:
+                    logger.warning(
+                        f"[majs] 推送到 {target.target_id} 失败"
+                        f"({attempt + 1}/{RETRY_TIMES}): {e}"
+                    )
+                    await asyncio.sleep(RETRY_DELAY * 2**attempt)
+            else:
+                logger.error(f"[majs] 推送到 {target.target_id} 失败, 已放弃")
+
+
+dispatcher = PushDispatcher()
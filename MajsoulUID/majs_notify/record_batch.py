@@ -0,0 +1,71 @@
+import asyncio
+from typing import Dict, List, Callable, Optional, Awaitable
+
+from gsuid_core.logger import logger
+
+from ..lib import lq as liblq
+
+# 对局结果批量查询: 窗口期内需要查询的对局 uuid 合并为一次
+# fetchGameRecordsDetailV2 请求, 只返回对局结果(RecordListEntry), 不含牌谱内容.
+# 同一局有多个好友时共用同一个查询结果
+
+# 单次请求最多查询的对局数
+MAX_BATCH = 20
+
+Fetch = Callable[[List[str]], Awaitable[List[liblq.RecordListEntry]]]
+
+
+class GameResultBatcher:
+    def __init__(self, window: float, fetch: Fetch):
+        self.window = window
+        self._fetch = fetch
+        self._waiters: Dict[
+            str, asyncio.Future[Optional[liblq.RecordListEntry]]
+        ] = {}
+        self._flusher: asyncio.Task | None = None
+
+        self.requests = 0
+        self.games = 0
+
+    def get(
+        self, uuid: str
+    ) -> asyncio.Future[Optional[liblq.RecordListEntry]]:
+        # 对局结果尚未生成或查询失败时结果为 None
+        fut = self._waiters.get(uuid)
+        if fut is None:
+            fut = asyncio.get_running_loop().create_future()
+            self._waiters[uuid] = fut
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+        return fut
+
+    async def _flush_loop(self):
+        while self._waiters:
+            await asyncio.sleep(self.window)
+            waiters, self._waiters = self._waiters, {}
+            uuids = list(waiters)
+            batches = []
+            while uuids:
+                batches.append(uuids[:MAX_BATCH])
+                uuids = uuids[MAX_BATCH:]
+            await asyncio.gather(
+                *(self._resolve(batch, waiters) for batch in batches)
+            )
+
+    async def _resolve(
+        self,
+        uuids: List[str],
+        waiters: Dict[str, asyncio.Future[Optional[liblq.RecordListEntry]]],
+    ):
+        self.requests += 1
+        self.games += len(uuids)
+        entries: Dict[str, liblq.RecordListEntry] = {}
+        try:
+            for entry in await self._fetch(uuids):
+                entries[entry.uuid] = entry
+        except Exception as e:
+            logger.warning(f"[majs] 批量查询 {len(uuids)} 局对局结果失败: {e}")
+        for uuid in uuids:
+            fut = waiters[uuid]
+            if not fut.done():
+                fut.set_result(entries.get(uuid))
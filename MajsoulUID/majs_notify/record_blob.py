@@ -0,0 +1,95 @@
+import gzip
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional
+
+import aiofiles
+from gsuid_core.logger import logger
+
+from .constants import HEADERS
+from ..utils.http_client import get_client
+from ..majs_config.majs_config import MAJS_CONFIG
+from ..utils.resource.RESOURCE_PATH import RECORD_BLOB_PATH
+
+# 较早或较大的对局 ResGameRecord.data 为空, 需要从 data_url 下载牌谱数据.
+# 下载的数据按内容的 sha256 保存(objects/ab/abcd...), 对局 uuid 通过
+# refs/<uuid> 指向对应的内容, 再次解析时直接读取本地文件
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+OBJECTS_PATH = RECORD_BLOB_PATH / "objects"
+REFS_PATH = RECORD_BLOB_PATH / "refs"
+
+# 同一局的并发请求共用同一次下载
+_downloading: Dict[str, asyncio.Task] = {}
+
+
+def _object_path(digest: str) -> Path:
+    return OBJECTS_PATH / digest[:2] / digest
+
+
+async def _write_atomic(path: Path, content: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix(".tmp")
+    async with aiofiles.open(tmp_file, "wb") as f:
+        await f.write(content)
+    tmp_file.replace(path)
+
+
+async def read_record_blob(uuid: str) -> Optional[bytes]:
+    ref = REFS_PATH / uuid
+    if not ref.exists():
+        return None
+    digest = ref.read_text().strip()
+    path = _object_path(digest)
+    if not path.exists():
+        return None
+    async with aiofiles.open(path, "rb") as f:
+        content = await f.read()
+    try:
+        if content[:2] == GZIP_MAGIC:
+            content = await asyncio.to_thread(gzip.decompress, content)
+    except (OSError, EOFError):
+        content = b""
+    if hashlib.sha256(content).hexdigest() != digest:
+        # 写入中断等原因导致文件损坏, 删除后重新下载
+        logger.warning(f"[majs] 牌谱数据 {uuid} 校验失败")
+        path.unlink(missing_ok=True)
+        return None
+    return content
+
+
+async def save_record_blob(uuid: str, content: bytes):
+    digest = hashlib.sha256(content).hexdigest()
+    path = _object_path(digest)
+    if not path.exists():
+        data = content
+        if MAJS_CONFIG.get_config("MajsRecordBlobCompress").data:
+            data = await asyncio.to_thread(gzip.compress, content)
+        await _write_atomic(path, data)
+    await _write_atomic(REFS_PATH / uuid, digest.encode())
+
+
+async def _download(uuid: str, data_url: str) -> bytes:
+    resp = await get_client("record").get(data_url, headers=HEADERS)
+    resp.raise_for_status()
+    content = resp.content
+    if not content:
+        raise ValueError(f"牌谱数据为空: {data_url}")
+    await save_record_blob(uuid, content)
+    logger.info(f"[majs] 已下载牌谱数据 {uuid}, {len(content)} 字节")
+    return content
+
+
+async def fetch_record_blob(uuid: str, data_url: str) -> bytes:
+    content = await read_record_blob(uuid)
+    if content is not None:
+        return content
+
+    task = _downloading.get(uuid)
+    if task is None:
+        task = asyncio.create_task(_download(uuid, data_url))
+        _downloading[uuid] = task
+        task.add_done_callback(lambda _: _downloading.pop(uuid, None))
+    return await asyncio.shield(task)
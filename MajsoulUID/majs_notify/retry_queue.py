@@ -0,0 +1,107 @@
+import time
+import heapq
+import asyncio
+import itertools
+from typing import Any, Set, List, Tuple, Callable, Awaitable
+
+from msgspec import Struct
+from gsuid_core.logger import logger
+
+# 延迟重试队列: 失败的任务按指数退避(2s, 4s, 8s ... 最长 120s)重新执行,
+# 超过 max_age 仍未成功时放弃. 所有任务共用一个按到期时间排序的堆和一个定时任务
+
+RETRY_BASE = 2.0
+RETRY_MAX_DELAY = 120.0
+
+
+class RetryItem(Struct):
+    key: str
+    data: Any
+    first_at: float
+    attempt: int = 0
+
+
+# 返回 True 表示成功, 不再重试
+Attempt = Callable[[RetryItem], Awaitable[bool]]
+Expire = Callable[[RetryItem], Awaitable[None]]
+
+
+def retry_delay(attempt: int) -> float:
+    return min(RETRY_BASE * 2**attempt, RETRY_MAX_DELAY)
+
+
+class RetryQueue:
+    def __init__(self, attempt: Attempt, expire: Expire, max_age: float):
+        self._attempt = attempt
+        self._expire = expire
+        self.max_age = max_age
+        self._heap: List[Tuple[float, int, RetryItem]] = []
+        self._seq = itertools.count()
+        # 等待中或正在重试的 key, 同一个 key 只保留一个任务
+        self._keys: Set[str] = set()
+        self._running: Set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._timer: asyncio.Task | None = None
+
+        self.succeeded = 0
+        self.expired = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def schedule(self, key: str, data: Any) -> bool:
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        self._push(RetryItem(key, data, time.time()))
+        return True
+
+    def _push(self, item: RetryItem):
+        due = time.monotonic() + retry_delay(item.attempt)
+        heapq.heappush(self._heap, (due, next(self._seq), item))
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._run())
+        else:
+            # 新任务可能比当前等待的任务更早到期
+            self._wakeup.set()
+
+    async def _run(self):
+        while self._heap:
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            _, _, item = heapq.heappop(self._heap)
+            task = asyncio.create_task(self._retry(item))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _retry(self, item: RetryItem):
+        item.attempt += 1
+        try:
+            done = await self._attempt(item)
+        except Exception as e:
+            logger.exception(f"[majs] 重试 {item.key} 失败: {e}")
+            done = False
+
+        if done:
+            self._keys.discard(item.key)
+            self.succeeded += 1
+            return
+
+        age = time.time() - item.first_at + retry_delay(item.attempt)
+        if age <= self.max_age:
+            self._push(item)
+            return
+
+        self._keys.discard(item.key)
+        self.expired += 1
+        logger.warning(f"[majs] {item.key} 重试 {item.attempt} 次后放弃")
+        try:
+            await self._expire(item)
+        except Exception as e:
+            logger.exception(f"[majs] 处理放弃的重试 {item.key} 失败: {e}")
@@ -0,0 +1,151 @@
+import time
+import asyncio
+from collections import deque
+from typing import Any, Dict, Deque, Callable, Awaitable
+
+from msgspec import Struct
+from gsuid_core.logger import logger
+
+# 通知处理调度: 最多 workers 个通知同时处理,
+# 同一个 key (好友 account_id) 的通知按到达顺序串行处理
+
+# 必须处理, 队列已满时也会接收
+KEEP = 0
+# 同一好友排队中的同类通知只保留最新的一条, 队列已满时丢弃
+MERGE = 1
+
+LATENCY_ALPHA = 0.2
+
+Job = Callable[[], Awaitable[Any]]
+
+
+class ScheduledJob(Struct):
+    kind: str
+    job: Job
+    policy: int
+    enqueued_at: float
+
+
+class SchedulerStats(Struct):
+    pending: int
+    running: int
+    lanes: int
+    handled: int
+    failed: int
+    merged: int
+    dropped: int
+    overflow: int
+    # 滑动平均(秒)
+    wait: float
+    latency: float
+    max_latency: float
+
+
+class NotifyScheduler:
+    def __init__(self, workers: int, max_pending: int):
+        # 配置为 0 时至少保留一个 worker 和一个排队位置
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        # key -> 排队中的任务, 处理中的 key 即使没有排队任务也保留
+        self._lanes: Dict[Any, Deque[ScheduledJob]] = {}
+        # 有任务且没有 worker 在处理的 key
+        self._ready: asyncio.Queue[Any] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._full = False
+
+        self.pending = 0
+        self.running = 0
+        self.handled = 0
+        self.failed = 0
+        self.merged = 0
+        self.dropped = 0
+        self.overflow = 0
+        self.wait = 0.0
+        self.latency = 0.0
+        self.max_latency = 0.0
+
+    def start(self):
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+
+    def close(self):
+        current = asyncio.current_task()
+        for task in self._tasks:
+            # close() may be reached from a handler running on a worker
+            if task is not current:
+                task.cancel()
+        self._tasks = []
+
+    def submit(self, key: Any, kind: str, job: Job, policy: int = KEEP):
+        lane = self._lanes.get(key)
+        if policy == MERGE and lane:
+            for scheduled in lane:
+                if scheduled.kind == kind:
+                    scheduled.job = job
+                    self.merged += 1
+                    return True
+
+        if self.pending >= self.max_pending:
+            if not self._full:
+                self._full = True
+                logger.warning(
+                    f"[majs] 通知队列已满({self.pending}), 开始丢弃可合并的通知"
+                )
+            if policy != KEEP:
+                self.dropped += 1
+                return False
+            self.overflow += 1
+        elif self._full and self.pending < self.max_pending // 2:
+            self._full = False
+
+        scheduled = ScheduledJob(kind, job, policy, time.perf_counter())
+        if lane is None:
+            lane = self._lanes[key] = deque()
+            self._ready.put_nowait(key)
+        lane.append(scheduled)
+        self.pending += 1
+        return True
+
+    async def _worker(self):
+        while True:
+            key = await self._ready.get()
+            lane = self._lanes[key]
+            scheduled = lane.popleft()
+            self.pending -= 1
+            self.running += 1
+            start = time.perf_counter()
+            waited = start - scheduled.enqueued_at
+            self.wait += (waited - self.wait) * LATENCY_ALPHA
+            try:
+                await scheduled.job()
+            except Exception as e:
+                self.failed += 1
+                logger.exception(f"[majs] 通知处理失败 {scheduled.kind}: {e}")
+            finally:
+                elapsed = time.perf_counter() - start
+                self.latency += (elapsed - self.latency) * LATENCY_ALPHA
+                self.max_latency = max(self.max_latency, elapsed)
+                self.running -= 1
+                self.handled += 1
+                if lane:
+                    self._ready.put_nowait(key)
+                else:
+                    del self._lanes[key]
+
+    def stats(self) -> SchedulerStats:
+        return SchedulerStats(
+            pending=self.pending,
+            running=self.running,
+            lanes=len(self._lanes),
+            handled=self.handled,
+            failed=self.failed,
+            merged=self.merged,
+            dropped=self.dropped,
+            overflow=self.overflow,
+            wait=self.wait,
+            latency=self.latency,
+            max_latency=self.max_latency,
+        )
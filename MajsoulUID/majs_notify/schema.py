@@ -0,0 +1,305 @@
+import pickle
+import struct
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Set, Dict, List, Tuple, Union, Optional
+
+import betterproto
+
+from .fast_decode import iter_fields, read_varint
+from .model import MajsoulLiqiItem, MajsoulLiqiProto
+
+# 由 liqi.json 编译出的解码表, 用于解码 lib/lq 中尚未生成的消息
+
+# bump when the table layout changes so stale caches are recompiled
+SCHEMA_FORMAT = 1
+
+# field number -> (name, kind, repeated, map key kind)
+# kind is a scalar type name, "enum", or the full name of a message
+FieldTable = Dict[int, Tuple[str, str, bool, Optional[str]]]
+
+VARINT_KINDS = {
+    "int32",
+    "int64",
+    "uint32",
+    "uint64",
+    "sint32",
+    "sint64",
+    "bool",
+    "enum",
+}
+FIXED_KINDS = {
+    "fixed32": "<I",
+    "sfixed32": "<i",
+    "float": "<f",
+    "fixed64": "<Q",
+    "sfixed64": "<q",
+    "double": "<d",
+}
+SCALAR_KINDS = VARINT_KINDS | set(FIXED_KINDS) | {"string", "bytes"}
+
+DEFAULTS: Dict[str, Any] = {
+    "string": "",
+    "bytes": b"",
+    "bool": False,
+    "float": 0.0,
+    "double": 0.0,
+}
+
+
+class SchemaMessage(SimpleNamespace):
+    pass
+
+
+class SchemaMessageType:
+    # 与 betterproto 消息类相同的 msg_obj().parse(data) 用法
+    def __init__(self, schema: "MajsoulSchema", full_name: str):
+        self._schema = schema
+        self.full_name = full_name
+
+    def __call__(self):
+        return self
+
+    def parse(self, data: bytes) -> SchemaMessage:
+        return self._schema.decode(self.full_name, data)
+
+
+class MergedMessageType:
+    # lib/lq 中的消息缺少字段时使用: 先用 betterproto 解码,
+    # 再把 liqi.json 中新增的字段补到解码结果上
+    def __init__(
+        self,
+        schema: "MajsoulSchema",
+        full_name: str,
+        msg_cls: type[betterproto.Message],
+    ):
+        self._schema = schema
+        self.full_name = full_name
+        self.msg_cls = msg_cls
+
+    def __call__(self):
+        return self
+
+    def parse(self, data: bytes) -> betterproto.Message:
+        msg = self.msg_cls().parse(data)
+        decoded = self._schema.decode(self.full_name, data)
+        self._schema.merge(msg, self.full_name, decoded)
+        return msg
+
+
+class MajsoulSchema:
+    def __init__(self, version: str, tables: Dict[str, FieldTable]):
+        self.version = version
+        self.tables = tables
+
+    def __contains__(self, full_name: str):
+        return full_name in self.tables
+
+    def message_type(self, full_name: str) -> Optional[SchemaMessageType]:
+        if full_name not in self.tables:
+            return None
+        return SchemaMessageType(self, full_name)
+
+    def missing_fields(
+        self,
+        full_name: str,
+        msg_cls: type[betterproto.Message],
+        seen: Optional[Set[str]] = None,
+    ) -> List[str]:
+        # liqi.json 中有而 lib/lq 中没有的字段, 包括嵌套消息中的字段
+        seen = set() if seen is None else seen
+        if full_name in seen:
+            return []
+        seen.add(full_name)
+        meta = msg_cls._betterproto
+        known = meta.field_name_by_number
+        missing = []
+        for number, (name, kind, _, key_kind) in self.tables[
+            full_name
+        ].items():
+            if number not in known:
+                missing.append(f"{full_name}.{name}")
+            elif kind in self.tables and key_kind is None:
+                sub_cls = meta.cls_by_field.get(known[number])
+                if isinstance(sub_cls, type) and issubclass(
+                    sub_cls, betterproto.Message
+                ):
+                    missing += self.missing_fields(kind, sub_cls, seen)
+        return missing
+
+    def merge(
+        self, msg: betterproto.Message, full_name: str, decoded: SchemaMessage
+    ):
+        known = msg._betterproto.field_name_by_number
+        for number, (name, kind, repeated, key_kind) in self.tables[
+            full_name
+        ].items():
+            value = getattr(decoded, name)
+            if number not in known:
+                setattr(msg, name, value)
+            elif kind in self.tables and key_kind is None:
+                current = getattr(msg, known[number])
+                if repeated:
+                    for item, sub_value in zip(current, value):
+                        self.merge(item, kind, sub_value)
+                elif value is not None:
+                    self.merge(current, kind, value)
+
+    def decode(self, full_name: str, data: Union[bytes, memoryview]):
+        return self._decode(full_name, memoryview(data))
+
+    def _decode(self, full_name: str, buf: memoryview) -> SchemaMessage:
+        table = self.tables[full_name]
+        values: Dict[str, Any] = {}
+        for name, kind, repeated, key_kind in table.values():
+            if key_kind is not None:
+                values[name] = {}
+            elif repeated:
+                values[name] = []
+            elif kind in SCALAR_KINDS:
+                values[name] = DEFAULTS.get(kind, 0)
+            else:
+                values[name] = None
+
+        for field_no, value in iter_fields(buf):
+            field = table.get(field_no)
+            if field is None:
+                continue
+            name, kind, repeated, key_kind = field
+            if key_kind is not None:
+                entry = self._decode_map_entry(key_kind, kind, value)
+                values[name][entry[0]] = entry[1]
+            elif repeated:
+                if kind in SCALAR_KINDS and kind not in ("string", "bytes"):
+                    if isinstance(value, memoryview):
+                        values[name].extend(self._unpack(kind, value))
+                        continue
+                values[name].append(self._value(kind, value))
+            else:
+                values[name] = self._value(kind, value)
+        return SchemaMessage(**values)
+
+    def _decode_map_entry(self, key_kind: str, kind: str, buf: memoryview):
+        key = DEFAULTS.get(key_kind, 0)
+        value = DEFAULTS.get(kind, 0) if kind in SCALAR_KINDS else None
+        for field_no, raw in iter_fields(buf):
+            if field_no == 1:
+                key = self._value(key_kind, raw)
+            elif field_no == 2:
+                value = self._value(kind, raw)
+        return key, value
+
+    def _unpack(self, kind: str, buf: memoryview):
+        # packed repeated scalars
+        if kind in VARINT_KINDS:
+            pos = 0
+            while pos < len(buf):
+                raw, pos = read_varint(buf, pos)
+                yield self._value(kind, raw)
+        else:
+            fmt = FIXED_KINDS[kind]
+            for (raw,) in struct.iter_unpack(fmt, buf):
+                yield raw
+
+    def _value(self, kind: str, raw: Any):
+        if kind in ("uint32", "uint64", "enum"):
+            return raw
+        if kind in ("int32", "int64"):
+            return raw - (1 << 64) if raw >= 1 << 63 else raw
+        if kind in ("sint32", "sint64"):
+            return (raw >> 1) ^ -(raw & 1)
+        if kind == "bool":
+            return bool(raw)
+        if kind == "string":
+            return str(raw, "utf-8")
+        if kind == "bytes":
+            return bytes(raw)
+        if kind in FIXED_KINDS:
+            return struct.unpack(FIXED_KINDS[kind], raw)[0]
+        return self._decode(kind, raw)
+
+
+def compile_schema(pb_def: MajsoulLiqiProto, version: str) -> MajsoulSchema:
+    items: Dict[str, MajsoulLiqiItem] = {}
+
+    def collect(prefix: str, nested: Dict[str, MajsoulLiqiItem]):
+        for name, item in nested.items():
+            full_name = f"{prefix}.{name}"
+            items[full_name] = item
+            if item.nested:
+                collect(full_name, item.nested)
+
+    for pkg_name, pkg in pb_def.nested.items():
+        collect(f".{pkg_name}", pkg.nested)
+
+    def resolve(scope: str, type_name: str) -> str:
+        if type_name in SCALAR_KINDS:
+            return type_name
+        if type_name.startswith("."):
+            full_name = type_name
+        else:
+            # protobuf scoping: innermost message first, then outwards
+            parts = scope.split(".")
+            full_name = ""
+            while parts:
+                candidate = ".".join(parts + [type_name])
+                if candidate in items:
+                    full_name = candidate
+                    break
+                parts.pop()
+        item = items.get(full_name)
+        if item is None:
+            # unknown reference, keep the raw bytes
+            return "bytes"
+        if item.values is not None:
+            return "enum"
+        return full_name
+
+    tables: Dict[str, FieldTable] = {}
+    for full_name, item in items.items():
+        if item.fields is None:
+            continue
+        table: FieldTable = {}
+        for name, field in item.fields.items():
+            key_type = field.get("keyType")
+            table[field["id"]] = (
+                name,
+                resolve(full_name, field["type"]),
+                field.get("rule") == "repeated",
+                resolve(full_name, key_type) if key_type else None,
+            )
+        tables[full_name] = table
+    return MajsoulSchema(version, tables)
+
+
+_SCHEMAS: Dict[str, MajsoulSchema] = {}
+
+
+def load_schema(
+    pb_def: MajsoulLiqiProto, version: str, cache_dir: Path
+) -> MajsoulSchema:
+    # 每个 pbVersion 只编译一次, 之后从磁盘缓存读取
+    schema = _SCHEMAS.get(version)
+    if schema is not None:
+        return schema
+
+    cache_file = cache_dir / f"{version.replace('/', '_')}.pkl"
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                fmt, tables = pickle.load(f)
+            if fmt == SCHEMA_FORMAT:
+                schema = MajsoulSchema(version, tables)
+        except (pickle.UnpicklingError, EOFError, ValueError):
+            schema = None
+
+    if schema is None:
+        schema = compile_schema(pb_def, version)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump((SCHEMA_FORMAT, schema.tables), f)
+        tmp_file.replace(cache_file)
+
+    _SCHEMAS[version] = schema
+    return schema
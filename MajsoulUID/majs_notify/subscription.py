@@ -0,0 +1,59 @@
+import time
+import asyncio
+from typing import Dict, List
+
+from msgspec import Struct
+from gsuid_core.logger import logger
+
+from ..utils.database.models import MajsPush
+
+# 网页控制台直接修改推送表时无法通知到这里, 定期重新加载
+SUBSCRIPTION_TTL = 600
+
+
+class PushTarget(Struct, frozen=True):
+    bot_id: str
+    # direct / group
+    target_type: str
+    target_id: str
+
+
+class SubscriptionIndex:
+    # 雀魂 uid -> 推送对象, 订阅/取消订阅时调用 invalidate
+    def __init__(self):
+        self._targets: Dict[str, List[PushTarget]] = {}
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._loading: asyncio.Task | None = None
+
+    async def load(self):
+        generation = self._generation
+        targets: Dict[str, List[PushTarget]] = {}
+        for push in await MajsPush.get_all_push():
+            if not push.uid:
+                continue
+            if push.push_id == "on":
+                target = PushTarget(push.bot_id, "direct", push.user_id)
+            else:
+                target = PushTarget(push.bot_id, "group", push.push_id)
+            targets.setdefault(push.uid, []).append(target)
+        self._targets = targets
+        # 加载期间订阅有变化时需要重新加载
+        if generation == self._generation:
+            self._loaded_at = time.time()
+        logger.info(f"[majs] 已加载 {len(targets)} 个推送订阅")
+
+    def invalidate(self):
+        self._generation += 1
+        self._loaded_at = 0.0
+
+    async def get(self, uid: str) -> List[PushTarget]:
+        while time.time() - self._loaded_at > SUBSCRIPTION_TTL:
+            # 同时到达的推送共用同一次加载
+            if self._loading is None or self._loading.done():
+                self._loading = asyncio.create_task(self.load())
+            await asyncio.shield(self._loading)
+        return self._targets.get(uid, [])
+
+
+subscriptions = SubscriptionIndex()
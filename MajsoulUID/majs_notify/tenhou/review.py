@@ -7,28 +7,28 @@ import httpx
 import aiofiles
 from gsuid_core.logger import logger
 
+from ...utils.http_client import get_client
 from ...utils.resource.RESOURCE_PATH import PAIPU_PATH
 
 
 async def check_url(tag: str, url: str):
-    async with httpx.AsyncClient() as client:
-        try:
-            start_time = time.time()
-            response = await client.get(f"{url}/status")
-            elapsed_time = time.time() - start_time
-            if response.status_code == 200:
-                if response.json() == "ok":
-                    logger.debug(f"{tag} {url} 延时: {elapsed_time}")
-                    return tag, url, elapsed_time
-                else:
-                    logger.info(f"{tag} {url} 未超时但失效...")
-                    return tag, url, float("inf")
+    try:
+        start_time = time.time()
+        response = await get_client("review").get(f"{url}/status", timeout=5)
+        elapsed_time = time.time() - start_time
+        if response.status_code == 200:
+            if response.json() == "ok":
+                logger.debug(f"{tag} {url} 延时: {elapsed_time}")
+                return tag, url, elapsed_time
             else:
-                logger.info(f"{tag} {url} 超时...")
+                logger.info(f"{tag} {url} 未超时但失效...")
                 return tag, url, float("inf")
-        except httpx.ConnectError:
+        else:
             logger.info(f"{tag} {url} 超时...")
             return tag, url, float("inf")
+    except httpx.ConnectError:
+        logger.info(f"{tag} {url} 超时...")
+        return tag, url, float("inf")
 
 
 async def find_fastest_url(
@@ -55,7 +55,7 @@ async def review_tenhou(tenhou_log: Dict[str, str]) -> Union[str, Dict]:
             data = json.loads(await f.read())
             return data
 
-    sess = httpx.AsyncClient(verify=False)
+    sess = get_client("review")
     urls = {
         # "[wegt]": "https://majsoul.wget.es",
         "[cn]": "http://183.36.37.120:62800",
@@ -1,19 +1,41 @@
+import json
 import random
 import hashlib
-from typing import Dict
 from pathlib import Path
+from typing import Dict, Optional
 
 import aiofiles
-from httpx import AsyncClient
 
 from .constants import HEADERS
+from ..utils.http_client import get_client
+from ..utils.resource.RESOURCE_PATH import RES_CACHE_PATH
 
-HTTPX_CLIENT = AsyncClient(headers=HEADERS)
 
+async def _read_cache(cache_file: Path) -> Optional[Dict]:
+    if not cache_file.exists():
+        return None
+    async with aiofiles.open(cache_file, "rb") as f:
+        content = await f.read()
+    try:
+        return json.loads(content)
+    except ValueError:
+        # 写入中断等原因导致缓存损坏, 重新下载
+        return None
+
+
+async def _write_cache(cache_file: Path, content: bytes, meta: Dict):
+    tmp_file = cache_file.with_suffix(".tmp")
+    async with aiofiles.open(tmp_file, "wb") as f:
+        await f.write(content)
+    tmp_file.replace(cache_file)
+    meta_file = cache_file.with_suffix(".meta")
+    async with aiofiles.open(meta_file, "w", encoding="utf-8") as f:
+        await f.write(json.dumps(meta))
 
-async def getRes(URL_BASE: str, path: str, bust_cache: bool = False) -> Dict:
-    HTTPX_CLIENT.headers["Referer"] = URL_BASE
 
+async def getRes(URL_BASE: str, path: str, bust_cache: bool = False) -> Dict:
+    # 带版本号前缀的资源内容不会变化, 有缓存时直接读取磁盘;
+    # version.json 需要 bust_cache, 每次都用 ETag/Last-Modified 向服务器验证
     url = (
         f"{URL_BASE}/1/{path}"
         if URL_BASE == "https://game.maj-soul.com/"
@@ -21,15 +43,35 @@ async def getRes(URL_BASE: str, path: str, bust_cache: bool = False) -> Dict:
     )
 
     cache_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    cache_file = RES_CACHE_PATH / cache_hash
+    meta_file = cache_file.with_suffix(".meta")
+
+    cached = await _read_cache(cache_file)
+    if cached is not None and not bust_cache:
+        return cached
+
+    headers = {**HEADERS, "Referer": URL_BASE}
+    if cached is not None and meta_file.exists():
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
     if bust_cache:
         url += f"?randv={str(random.random())[2:]}"
 
-    cache_dir = Path(".cache")
-    cache_dir.mkdir(exist_ok=True)
-    cache_file = cache_dir / cache_hash
-
-    resp = await HTTPX_CLIENT.get(url)
+    resp = await get_client("majsoul").get(url, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        return cached
     resp.raise_for_status()
-    async with aiofiles.open(cache_file, "wb") as f:
-        await f.write(resp.content)
-    return resp.json()
+    data = resp.json()
+    await _write_cache(
+        cache_file,
+        resp.content,
+        {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        },
+    )
+    return data
@@ -0,0 +1,202 @@
+# 回放抓包文件, 测试 MajsoulProtoCodec 的解码/编码性能
+# 用法: python -m MajsoulUID.tools.bench_codec liqi.json 抓包文件... \
+#           [--save 结果.json] [--baseline 结果.json]
+# 抓包文件由配置项 MajsCaptureFrames 开启后生成, 位于资源目录的 capture 下
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+from collections import defaultdict
+
+from msgspec import convert
+
+from ..majs_notify.model import MajsoulLiqiProto
+from ..majs_notify.codec import MajsoulProtoCodec
+from ..majs_notify.capture import OUTBOUND, CapturedFrame, read_capture
+
+ROUNDS = 5
+# 与基准相比慢多少视为退化
+REGRESSION = 1.2
+
+
+def p99(samples: list[int]) -> int:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+def replay_decode(codec: MajsoulProtoCodec, frames: list[CapturedFrame]):
+    # 发出的请求只登记 index, 使后面的响应能找到对应的消息类型
+    timings: dict[str, list[int]] = defaultdict(list)
+    requests: list[tuple[str, dict]] = []
+    errors = 0
+    for frame in frames:
+        if frame.direction == OUTBOUND:
+            envelope = codec.decode_envelope(frame.data)
+            codec.track_request(envelope.req_index, envelope.method_name)
+            payload = codec.decode_payload(envelope).payload
+            requests.append((envelope.method_name, payload.to_dict()))
+            continue
+        start = time.perf_counter_ns()
+        try:
+            msg = codec.decode_message(frame.data)
+        except ValueError:
+            errors += 1
+            continue
+        timings[msg.method_name].append(time.perf_counter_ns() - start)
+    return timings, requests, errors
+
+
+def replay_encode(codec: MajsoulProtoCodec, requests: list[tuple[str, dict]]):
+    timings: dict[str, list[int]] = defaultdict(list)
+    for method_name, payload in requests:
+        start = time.perf_counter_ns()
+        idx, _ = codec.encode_request(method_name, payload)
+        timings[method_name].append(time.perf_counter_ns() - start)
+        codec.release(idx)
+    return timings
+
+
+def measure_memory(codec: MajsoulProtoCodec, frames: list[CapturedFrame]):
+    # 每帧解码过程中的峰值内存与分配的内存块数
+    peak: dict[str, list[int]] = defaultdict(list)
+    blocks: dict[str, list[int]] = defaultdict(list)
+    tracemalloc.start()
+    try:
+        for frame in frames:
+            if frame.direction == OUTBOUND:
+                envelope = codec.decode_envelope(frame.data)
+                codec.track_request(envelope.req_index, envelope.method_name)
+                continue
+            tracemalloc.reset_peak()
+            before_size, _ = tracemalloc.get_traced_memory()
+            before_blocks = sys.getallocatedblocks()
+            try:
+                msg = codec.decode_message(frame.data)
+            except ValueError:
+                continue
+            _, peak_size = tracemalloc.get_traced_memory()
+            peak[msg.method_name].append(peak_size - before_size)
+            blocks[msg.method_name].append(
+                sys.getallocatedblocks() - before_blocks
+            )
+            del msg
+    finally:
+        tracemalloc.stop()
+    return peak, blocks
+
+
+def summarize(
+    decode: dict[str, list[int]],
+    encode: dict[str, list[int]],
+    peak: dict[str, list[int]],
+    blocks: dict[str, list[int]],
+):
+    result = {}
+    for kind, timings in (("decode", decode), ("encode", encode)):
+        for method_name, samples in timings.items():
+            entry = {
+                "count": len(samples) // ROUNDS,
+                "mean_us": sum(samples) / len(samples) / 1000,
+                "p99_us": p99(samples) / 1000,
+            }
+            if kind == "decode":
+                entry["peak_bytes"] = max(peak.get(method_name, [0]))
+                method_blocks = blocks.get(method_name, [0])
+                entry["blocks"] = sum(method_blocks) / len(method_blocks)
+            result[f"{kind} {method_name}"] = entry
+    return result
+
+
+def report(result: dict[str, dict], baseline: dict[str, dict]):
+    print(
+        f"{'method':<52} {'count':>6} {'frames/s':>10} {'mean(us)':>9} "
+        f"{'p99(us)':>9} {'peak(B)':>8} {'blocks':>7}"
+    )
+    regressions = []
+    for name, entry in sorted(result.items()):
+        line = (
+            f"{name:<52} {entry['count']:>6} "
+            f"{1e6 / entry['mean_us']:>10.0f} {entry['mean_us']:>9.1f} "
+            f"{entry['p99_us']:>9.1f} {entry.get('peak_bytes', ''):>8} "
+            f"{entry.get('blocks', 0):>7.1f}"
+        )
+        old = baseline.get(name)
+        if old is not None:
+            ratio = entry["mean_us"] / old["mean_us"]
+            line += f"  x{ratio:.2f}"
+            if ratio > REGRESSION:
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MajsoulProtoCodec 性能测试")
+    parser.add_argument("liqi", type=Path, help="抓包时使用的 liqi.json")
+    parser.add_argument("captures", type=Path, nargs="+", help="抓包文件")
+    parser.add_argument("--save", type=Path, help="保存本次结果")
+    parser.add_argument("--baseline", type=Path, help="与之前保存的结果比较")
+    args = parser.parse_args()
+
+    with open(args.liqi, "r", encoding="utf-8") as f:
+        pb_def = convert(json.load(f), MajsoulLiqiProto)
+
+    captures = []
+    for path in args.captures:
+        version, frames = read_capture(path)
+        captures.append((version, list(frames)))
+    total_frames = sum(
+        1
+        for _, frames in captures
+        for frame in frames
+        if frame.direction != OUTBOUND
+    )
+    print(f"{len(captures)} 个抓包文件, {total_frames} 个收到的帧")
+
+    decode: dict[str, list[int]] = defaultdict(list)
+    encode: dict[str, list[int]] = defaultdict(list)
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for version, frames in captures:
+            # 每个抓包文件使用独立的 codec, 与一条连接对应
+            codec = MajsoulProtoCodec(pb_def, version)
+            timings, requests, failed = replay_decode(codec, frames)
+            errors += failed
+            for method_name, samples in timings.items():
+                decode[method_name].extend(samples)
+            for method_name, samples in replay_encode(codec, requests).items():
+                encode[method_name].extend(samples)
+    elapsed = time.perf_counter() - start
+
+    peak: dict[str, list[int]] = defaultdict(list)
+    blocks: dict[str, list[int]] = defaultdict(list)
+    for version, frames in captures:
+        codec = MajsoulProtoCodec(pb_def, version)
+        frame_peak, frame_blocks = measure_memory(codec, frames)
+        for method_name, samples in frame_peak.items():
+            peak[method_name].extend(samples)
+        for method_name, samples in frame_blocks.items():
+            blocks[method_name].extend(samples)
+
+    result = summarize(decode, encode, peak, blocks)
+    baseline = {}
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = report(result, baseline)
+    print(
+        f"总计: {total_frames * ROUNDS / elapsed:.0f} frames/s "
+        f"(包含请求编码), 解析失败 {errors // ROUNDS} 帧"
+    )
+
+    if args.save:
+        args.save.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    if regressions:
+        print(f"性能退化超过 {REGRESSION}x: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
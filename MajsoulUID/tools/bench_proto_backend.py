@@ -0,0 +1,92 @@
+# 比较牌谱解码后端的速度
+# 用法: python -m MajsoulUID.tools.bench_proto_backend liqi.json 牌谱目录
+# 牌谱目录中的每个 *.bin 文件为一局的 ResGameRecord.data 原始数据
+import sys
+import json
+import time
+import statistics
+from pathlib import Path
+
+import betterproto
+from msgspec import convert
+
+from ..majs_notify.model import MajsoulLiqiProto
+from ..majs_notify.codec import MajsoulProtoCodec
+from ..majs_notify.proto_backend import UpbBackend, BetterprotoBackend
+
+ROUNDS = 5
+
+
+def same_value(a, b) -> bool:
+    if isinstance(a, betterproto.Message):
+        return all(
+            same_value(getattr(a, name), getattr(b, name))
+            for name in a._betterproto.meta_by_field_name
+        )
+    if isinstance(a, list):
+        return len(a) == len(b) and all(map(same_value, a, b))
+    if isinstance(a, dict):
+        return set(a) == set(b) and all(
+            same_value(v, b[k]) for k, v in a.items()
+        )
+    return a == b
+
+
+def bench(codec: MajsoulProtoCodec, corpus: list[bytes]):
+    times = []
+    actions = 0
+    for _ in range(ROUNDS):
+        actions = 0
+        for data in corpus:
+            start = time.perf_counter()
+            actions += len(codec.decode_records(data))
+            times.append(time.perf_counter() - start)
+    return times, actions
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("用法: bench_proto_backend liqi.json 牌谱目录")
+        sys.exit(1)
+
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        pb_def = convert(json.load(f), MajsoulLiqiProto)
+    corpus = [p.read_bytes() for p in sorted(Path(sys.argv[2]).glob("*.bin"))]
+    if not corpus:
+        print("没有找到牌谱文件")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    upb = UpbBackend(pb_def, "bench")
+    print(f"upb 消息类构建耗时: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    codecs = [
+        MajsoulProtoCodec(pb_def, "bench", backend=BetterprotoBackend()),
+        MajsoulProtoCodec(pb_def, "bench", backend=upb),
+    ]
+
+    # 两个后端的解码结果应当一致
+    for data in corpus:
+        expected, actual = (c.decode_records(data) for c in codecs)
+        for a, b in zip(expected, actual):
+            if a.name != b.name or not same_value(a.data, b.data):
+                print(f"解码结果不一致: {a.name}")
+                sys.exit(1)
+
+    print(f"{len(corpus)} 局牌谱, 每个后端 {ROUNDS} 轮")
+    baseline = 0.0
+    for codec in codecs:
+        times, actions = bench(codec, corpus)
+        total = sum(times)
+        baseline = baseline or total
+        print(
+            f"{codec.backend.name:>12}: "
+            f"平均 {statistics.mean(times) * 1000:.2f}ms/局, "
+            f"p99 {statistics.quantiles(times, n=100)[-1] * 1000:.2f}ms, "
+            f"{actions * ROUNDS / total:.0f} 动作/s, "
+            f"x{baseline / total:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+# 本地模拟的雀魂网关, 返回合成数据, 用于压测通知→推送链路
+# 用法:
+#   python -m MajsoulUID.tools.mock_gateway serve liqi.json \
+#       [--port 8765] [--friends 2000] [--rate 500] [--games]
+#   python -m MajsoulUID.tools.mock_gateway bench liqi.json \
+#       [--friends 2000] [--rate 500] [--duration 10] [--games] [--memory]
+# serve 只启动网关; bench 在同一进程中用 MajsoulConnection 连接网关,
+# 统计从网关发出 NotifyFriendStateChange 到 send_msg_to_user 的延迟.
+# --games 会让好友开始/结束对局, 对局结束时的处理会写入 MajsPaipu.
+# 每个好友每 friends / rate 秒收到一次通知, 该间隔应大于处理延迟.
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import tracemalloc
+from pathlib import Path
+from collections import deque, defaultdict
+from typing import Any, Dict, Deque, Callable, Optional
+
+import websockets
+from msgspec import convert
+from websockets.exceptions import ConnectionClosed
+
+from ..lib import lq as liblq
+from ..majs_notify.model import MajsoulLiqiProto
+from ..majs_notify.codec import MajsoulProtoCodec
+
+FRIEND_BASE = 900000000
+ACCOUNT_ID = 800000000
+# 雀士一
+LEVEL_ID = 10301
+MODE_ID = 2
+TICK = 0.01
+
+
+class MockGateway:
+    def __init__(
+        self,
+        pb_def: MajsoulLiqiProto,
+        version: str,
+        friends: int = 2000,
+        rate: float = 0.0,
+        games: bool = False,
+    ):
+        self.pb_def = pb_def
+        self.version = version
+        self.friend_ids = [FRIEND_BASE + i for i in range(friends)]
+        self.rate = rate
+        self.games = games
+        # 好友在状态循环中的位置
+        self.steps: Dict[int, int] = defaultdict(int)
+        # target_id -> 通知的发送时间, 用于计算延迟
+        self.sent: Dict[int, Deque[float]] = defaultdict(deque)
+        self.notify_count = 0
+        self.handlers: Dict[str, Callable[[Any], Any]] = {
+            ".lq.Lobby.heatbeat": self.res_common,
+            ".lq.Lobby.loginBeat": self.res_common,
+            ".lq.Lobby.oauth2Check": self.oauth2_check,
+            ".lq.Lobby.oauth2Login": self.login,
+            ".lq.Lobby.login": self.login,
+            ".lq.Lobby.fetchServerTime": self.server_time,
+            ".lq.Lobby.fetchInfo": self.fetch_info,
+            ".lq.Lobby.fetchGameRecord": self.fetch_game_record,
+            ".lq.Lobby.fetchGameRecordsDetailV2": self.fetch_records_detail,
+            ".lq.Lobby.fetchMultiAccountBrief": self.fetch_account_brief,
+        }
+
+    def res_common(self, req):
+        return liblq.ResCommon()
+
+    def oauth2_check(self, req):
+        return liblq.ResOauth2Check(has_account=True)
+
+    def login(self, req):
+        return liblq.ResLogin(
+            account_id=ACCOUNT_ID,
+            account=liblq.Account(account_id=ACCOUNT_ID, nickname="mock"),
+            access_token="mock-access-token",
+        )
+
+    def server_time(self, req):
+        return liblq.ResServerTime(server_time=int(time.time()))
+
+    def player_view(self, account_id: int):
+        level = liblq.AccountLevel(id=LEVEL_ID, score=100)
+        return liblq.PlayerBaseView(
+            account_id=account_id,
+            avatar_id=400101,
+            nickname=f"friend{account_id - FRIEND_BASE}",
+            level=level,
+            level3=level,
+        )
+
+    def fetch_info(self, req):
+        friends = [
+            liblq.Friend(
+                base=self.player_view(account_id),
+                state=liblq.AccountActiveState(account_id=account_id),
+            )
+            for account_id in self.friend_ids
+        ]
+        return liblq.ResFetchInfo(
+            friend_list=liblq.ResFriendList(
+                friends=friends,
+                friend_max_count=len(friends),
+                friend_count=len(friends),
+            )
+        )
+
+    def fetch_game_record(self, req: liblq.ReqGameRecord):
+        # game_uuid: mock-<account_id>-<step>
+        account_id = int(req.game_uuid.split("-")[1])
+        level = liblq.AccountLevel(id=LEVEL_ID, score=100)
+        head = liblq.RecordGame(
+            uuid=req.game_uuid,
+            end_time=int(time.time()),
+            accounts=[
+                liblq.RecordGameAccountInfo(
+                    account_id=account_id,
+                    seat=0,
+                    level=level,
+                    level3=level,
+                )
+            ],
+            result=liblq.GameEndResult(
+                players=[
+                    liblq.GameEndResultPlayerItem(
+                        seat=0, part_point_1=35000, grading_score=45
+                    )
+                ]
+            ),
+        )
+        return liblq.ResGameRecord(head=head)
+
+    def fetch_records_detail(self, req: liblq.ReqGameRecordsDetailV2):
+        # 只返回对局结果, 与 fetch_game_record 的数据一致
+        level = liblq.AccountLevel(id=LEVEL_ID, score=100)
+        entries = [
+            liblq.RecordListEntry(
+                uuid=uuid,
+                end_time=int(time.time()),
+                players=[
+                    liblq.RecordPlayerResult(
+                        rank=1,
+                        account_id=int(uuid.split("-")[1]),
+                        level=level,
+                        level3=level,
+                        pt=45,
+                        point=35000,
+                    )
+                ],
+            )
+            for uuid in req.uuid_list
+        ]
+        return liblq.ResGameRecordsDetailV2(entries=entries)
+
+    def fetch_account_brief(self, req: liblq.ReqMultiAccountId):
+        return liblq.ResMultiAccountBrief(
+            players=[self.player_view(i) for i in req.account_id_list]
+        )
+
+    def next_state(self, account_id: int):
+        # 不开对局: 上线 -> 下线; 开对局: 上线 -> 开始对局 -> 结束对局 -> 下线
+        step = self.steps[account_id]
+        cycle = ("online", "playing", "ended", "offline")
+        if not self.games:
+            cycle = ("online", "offline")
+        self.steps[account_id] = step + 1
+        phase = cycle[step % len(cycle)]
+
+        playing = liblq.AccountPlayingGame()
+        if phase == "playing":
+            playing = liblq.AccountPlayingGame(
+                game_uuid=f"mock-{account_id}-{step}",
+                category=2,
+                meta=liblq.GameMetaData(mode_id=MODE_ID),
+            )
+        return liblq.NotifyFriendStateChange(
+            target_id=account_id,
+            active_state=liblq.AccountActiveState(
+                account_id=account_id,
+                login_time=int(time.time()),
+                is_online=phase != "offline",
+                playing=playing,
+            ),
+        )
+
+    async def storm(
+        self,
+        ws,
+        codec: MajsoulProtoCodec,
+        duration: Optional[float] = None,
+    ):
+        # 按 rate 匀速轮流给每个好友发送状态变化, 共 rate * duration 条
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sent = 0
+        total = None if duration is None else int(self.rate * duration)
+        while total is None or sent < total:
+            due = int(self.rate * (loop.time() - start)) - sent
+            if total is not None:
+                due = min(due, total - sent)
+            for _ in range(due):
+                account_id = self.friend_ids[sent % len(self.friend_ids)]
+                frame = codec.encode_notify(
+                    ".lq.NotifyFriendStateChange",
+                    self.next_state(account_id),
+                )
+                self.sent[account_id].append(time.perf_counter())
+                await ws.send(frame)
+                sent += 1
+            self.notify_count += due
+            await asyncio.sleep(TICK)
+
+    async def handle(self, ws, storm_duration: Optional[float] = None):
+        codec = MajsoulProtoCodec(self.pb_def, self.version)
+        storm_task = None
+        try:
+            async for frame in ws:
+                envelope = codec.decode_envelope(frame)
+                if envelope.msg_type != codec.REQUEST:
+                    continue
+                handler = self.handlers.get(envelope.method_name)
+                if handler is None:
+                    # 未实现的接口返回空消息, 即全部字段为默认值
+                    res = liblq.ResCommon()
+                else:
+                    req = codec.decode_payload(envelope).payload
+                    res = handler(req)
+                await ws.send(codec.encode_response(envelope.req_index, res))
+
+                if (
+                    envelope.method_name == ".lq.Lobby.fetchInfo"
+                    and self.rate > 0
+                    and self.friend_ids
+                    and storm_task is None
+                ):
+                    storm_task = asyncio.create_task(
+                        self.storm(ws, codec, storm_duration)
+                    )
+        except ConnectionClosed:
+            pass
+        finally:
+            if storm_task is not None:
+                storm_task.cancel()
+
+
+def load_pb_def(path: Path):
+    with open(path, "r", encoding="utf-8") as f:
+        return convert(json.load(f), MajsoulLiqiProto)
+
+
+async def serve(args):
+    gateway = MockGateway(
+        load_pb_def(args.liqi), "mock", args.friends, args.rate, args.games
+    )
+    async with websockets.serve(gateway.handle, args.host, args.port):
+        print(f"模拟网关已启动: ws://{args.host}:{args.port}")
+        await asyncio.Future()
+
+
+async def bench(args):
+    from ..majs_notify.model import MajsoulVersionInfo
+    from ..majs_notify.majsoul import MajsoulConnection, manager
+
+    pb_def = load_pb_def(args.liqi)
+    gateway = MockGateway(pb_def, "mock", args.friends, args.rate, args.games)
+
+    async def handle(ws):
+        await gateway.handle(ws, args.duration)
+
+    async with websockets.serve(handle, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        version_info = MajsoulVersionInfo(
+            version="0.0.0.w", force_version="", code=""
+        )
+        conn = MajsoulConnection(
+            f"ws://127.0.0.1:{port}",
+            0,
+            MajsoulProtoCodec(pb_def, "mock"),
+            version_info,
+        )
+
+        latencies: list[float] = []
+        send_msg_to_user = conn.send_msg_to_user
+
+        async def timed_send_msg_to_user(target_user: str, msg):
+            sent = gateway.sent[int(target_user)]
+            if sent:
+                latencies.append(time.perf_counter() - sent.popleft())
+            return await send_msg_to_user(target_user, msg)
+
+        conn.send_msg_to_user = timed_send_msg_to_user
+
+        await conn.connect()
+        await conn.rpc_call(".lq.Lobby.heatbeat", {"no_operation_counter": 0})
+        await conn.access_token_login(version_info, "mock-access-token")
+        # 对局结果通过连接池批量查询
+        manager.add_conn(conn)
+
+        if args.memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        await conn.fetchInfo()
+        print(
+            f"fetchInfo: {len(conn.friends)} 个好友, "
+            f"{(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+        if args.memory:
+            current, _ = tracemalloc.get_traced_memory()
+            print(f"好友列表内存: {current / 1024 / 1024:.1f}MiB")
+            tracemalloc.reset_peak()
+
+        # 等待通知全部发出并处理完
+        total = int(args.rate * args.duration)
+        deadline = time.perf_counter() + args.duration + 10
+        while time.perf_counter() < deadline and (
+            gateway.notify_count < total or any(gateway.sent.values())
+        ):
+            await asyncio.sleep(0.1)
+
+        print(
+            f"发送通知 {gateway.notify_count} 条, 推送 {len(latencies)} 条, "
+            f"未处理 {sum(len(v) for v in gateway.sent.values())} 条"
+        )
+        if len(latencies) >= 2:
+            ordered = sorted(latencies)
+            print(
+                f"延迟: p50 {statistics.median(ordered) * 1000:.2f}ms, "
+                f"p99 {ordered[int(len(ordered) * 0.99)] * 1000:.2f}ms, "
+                f"max {ordered[-1] * 1000:.2f}ms"
+            )
+        if args.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"内存: 当前 {current / 1024 / 1024:.1f}MiB, "
+                f"峰值 {peak / 1024 / 1024:.1f}MiB"
+            )
+        manager.conn.remove(conn)
+        await conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地模拟雀魂网关")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("serve", "bench"):
+        p = sub.add_parser(name)
+        p.add_argument("liqi", type=Path, help="liqi.json")
+        p.add_argument("--friends", type=int, default=2000)
+        p.add_argument("--rate", type=float, default=500, help="通知/秒")
+        p.add_argument("--games", action="store_true", help="模拟对局")
+    serve_parser = sub.choices["serve"]
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    bench_parser = sub.choices["bench"]
+    bench_parser.add_argument("--duration", type=float, default=10)
+    bench_parser.add_argument("--memory", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(serve(args) if args.command == "serve" else bench(args))
+
+
+if __name__ == "__main__":
+    main()
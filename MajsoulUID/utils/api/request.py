@@ -2,10 +2,10 @@ import datetime
 from json import JSONDecodeError
 from typing import Any, Dict, List, Union, Literal, Optional, cast
 
-from httpx import AsyncClient
 from gsuid_core.logger import logger
 
 from .remote_const import GameMode
+from ..http_client import get_client
 from .models import Game, Stats, Player, Extended
 from .api import (
     KOROMO_PLAYER_STATS,
@@ -113,22 +113,20 @@ class KoromoApi:
         json: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
     ) -> Union[Dict, int]:
-        async with AsyncClient() as client:
-            resp = await client.request(
-                method,
-                url=url,
-                headers=header,
-                params=params,
-                json=json,
-                data=data,
-                timeout=300,
-            )
-            try:
-                raw_data = resp.json()
-            except JSONDecodeError:
-                _raw_data = resp.text
-                raw_data = {"retcode": -999, "data": _raw_data}
-            logger.debug(raw_data)
-            if "error" in raw_data:
-                return -1
-            return raw_data
+        resp = await get_client("koromo").request(
+            method,
+            url=url,
+            headers=header,
+            params=params,
+            json=json,
+            data=data,
+        )
+        try:
+            raw_data = resp.json()
+        except JSONDecodeError:
+            _raw_data = resp.text
+            raw_data = {"retcode": -999, "data": _raw_data}
+        logger.debug(raw_data)
+        if "error" in raw_data:
+            return -1
+        return raw_data
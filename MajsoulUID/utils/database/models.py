@@ -1,4 +1,4 @@
-from typing import Type, TypeVar, Optional
+from typing import List, Type, TypeVar, Optional
 
 from sqlmodel import Field, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -62,6 +62,15 @@ class MajsPush(Push, table=True):
     user_id: str = Field(default="", title="用户ID")
     push_id: str = Field(default="off", title="是否开启推送")
 
+    @classmethod
+    @with_session
+    async def get_all_push(
+        cls: Type["MajsPush"], session: AsyncSession
+    ) -> List["MajsPush"]:
+        stmt = select(cls).where(cls.push_id != "off")
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
 
 class MajsBind(Bind, table=True):
     uid: Optional[str] = Field(default=None, title="雀魂UID")
@@ -0,0 +1,62 @@
+import importlib.util
+from typing import Any, Dict
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+from gsuid_core.logger import logger
+from httpx import Limits, Timeout, AsyncClient
+from gsuid_core.server import on_core_start, on_core_shutdown
+
+# 插件内所有对外 HTTP 请求共用的客户端, 每个服务一个
+# httpx 在客户端内按主机维护连接池, 复用 TCP/TLS 连接
+# 安装了 h2 时启用 HTTP/2, 由 TLS 协商决定主机是否使用
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+SERVICES: Dict[str, Dict[str, Any]] = {
+    # 雀魂资源, 服务器列表
+    "majsoul": {"timeout": Timeout(15, connect=5), "verify": True},
+    # Yostar passport, 登陆凭证经过该服务, 必须校验证书
+    "passport": {"timeout": Timeout(15, connect=5), "verify": True},
+    # 角色图片等静态资源
+    "resource": {"timeout": Timeout(30, connect=5), "verify": True},
+    # 牌谱数据(ResGameRecord.data_url)
+    "record": {"timeout": Timeout(60, connect=5), "verify": True},
+    # 牌谱 review
+    "review": {"timeout": Timeout(30, connect=5), "verify": True},
+    # 雀魂牌谱屋
+    "koromo": {"timeout": Timeout(300, connect=10), "verify": True},
+}
+LIMITS = Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=60
+)
+
+_CLIENTS: Dict[str, AsyncClient] = {}
+
+
+def get_client(service: str) -> AsyncClient:
+    client = _CLIENTS.get(service)
+    if client is None or client.is_closed:
+        # 客户端被多个账号共用, 不保存任何 cookie
+        cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+        client = AsyncClient(
+            http2=HTTP2,
+            limits=LIMITS,
+            cookies=cookies,
+            **SERVICES[service],
+        )
+        _CLIENTS[service] = client
+    return client
+
+
+@on_core_start
+async def open_clients():
+    for service in SERVICES:
+        get_client(service)
+    logger.info(f"[majs] HTTP 客户端已创建, HTTP/2: {HTTP2}")
+
+
+@on_core_shutdown
+async def close_clients():
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,179 @@
+# 将 protoc 生成的 lib/lq/__init__.py 拆分为按需加载的单消息模块
+# 用法: python split_lq.py [lib/lq 目录]
+import re
+import ast
+import sys
+import shutil
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+LQ_PATH = Path(__file__).parents[2] / "lib" / "lq"
+MESSAGES_PACKAGE = "_messages"
+SERVICES_MODULE = "_services"
+MARKER = "# Lazily loaded by split_lq.py"
+
+GENERATED_HEADER = """\
+# Generated by split_lq.py from the python-betterproto output.  DO NOT EDIT!
+# This file has been @generated
+"""
+
+IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+TYPING_NAMES = ("Dict", "List", "Optional")
+SERVICE_BASES = ("ServiceStub", "ServiceBase")
+
+
+def base_names(node: ast.ClassDef) -> List[str]:
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Attribute):
+            names.append(base.attr)
+        elif isinstance(base, ast.Name):
+            names.append(base.id)
+    return names
+
+
+def referenced_names(node: ast.ClassDef) -> set:
+    names = set()
+    for sub in ast.walk(node):
+        if isinstance(sub, ast.Name):
+            names.add(sub.id)
+        elif isinstance(sub, ast.Constant) and isinstance(sub.value, str):
+            # forward references such as "AccountActiveState"
+            if IDENTIFIER.match(sub.value):
+                names.add(sub.value)
+    return names
+
+
+def class_source(lines: List[str], node: ast.ClassDef) -> str:
+    start = node.lineno
+    if node.decorator_list:
+        start = node.decorator_list[0].lineno
+    assert node.end_lineno is not None
+    return "".join(lines[start - 1 : node.end_lineno])  # noqa: E203
+
+
+def trailing_import(names: List[str], package: str) -> str:
+    if not names:
+        return ""
+    body = "".join(f"    {name},\n" for name in names)
+    return f"\n\nfrom {package} import (  # noqa: E402\n{body})\n"
+
+
+def render_message(source: str, deps: List[str]) -> str:
+    typing_names = [t for t in TYPING_NAMES if re.search(rf"\b{t}\[", source)]
+    header = GENERATED_HEADER
+    if "@dataclass" in source:
+        header += "\nfrom dataclasses import dataclass\n"
+    if typing_names:
+        header += f"from typing import {', '.join(typing_names)}\n"
+    header += "\nimport betterproto\n"
+    # 依赖放在类定义之后导入, 相互引用的消息也能正常加载
+    return f"{header}\n\n{source}{trailing_import(deps, '..')}"
+
+
+def render_services(head: str, sources: List[str], deps: List[str]) -> str:
+    body = "\n\n".join(sources)
+    return f"{GENERATED_HEADER}\n{head}\n\n{body}{trailing_import(deps, '.')}"
+
+
+def render_init(index: Dict[str, str]) -> str:
+    entries = "".join(
+        f'    "{name}": "{module}",\n' for name, module in index.items()
+    )
+    return f'''{GENERATED_HEADER}{MARKER}
+# 首次访问消息类型时才导入对应模块, 不会加载 grpclib 服务存根
+import importlib
+
+_MODULES = {{
+{entries}}}
+
+
+def __getattr__(name: str):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        msg = f"module {{__name__!r}} has no attribute {{name!r}}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
+'''
+
+
+def split(lq_path: Path):
+    init_file = lq_path / "__init__.py"
+    source = init_file.read_text(encoding="utf-8")
+    if MARKER in source:
+        print(f"{init_file} 已经拆分过, 请先重新生成 betterproto 代码")
+        sys.exit(1)
+
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+
+    classes: List[Tuple[ast.ClassDef, bool]] = []
+    first_class_line = len(lines) + 1
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            is_service = any(b in SERVICE_BASES for b in base_names(node))
+            classes.append((node, is_service))
+            start = node.lineno
+            if node.decorator_list:
+                start = node.decorator_list[0].lineno
+            first_class_line = min(first_class_line, start)
+
+    message_names = {
+        node.name for node, is_service in classes if not is_service
+    }
+    # 原文件的导入部分, 只有服务存根需要 grpclib 相关导入
+    head = "".join(lines[: first_class_line - 1]).rstrip() + "\n"
+    head = head.split("\n\n", 1)[1] if head.startswith("#") else head
+
+    messages_dir = lq_path / MESSAGES_PACKAGE
+    if messages_dir.exists():
+        shutil.rmtree(messages_dir)
+    messages_dir.mkdir()
+    (messages_dir / "__init__.py").write_text(
+        GENERATED_HEADER, encoding="utf-8"
+    )
+
+    index: Dict[str, str] = {}
+    service_sources: List[str] = []
+    service_deps: set = set()
+    for node, is_service in classes:
+        src = class_source(lines, node)
+        deps = referenced_names(node) & message_names
+        if is_service:
+            service_sources.append(src)
+            service_deps |= deps
+            index[node.name] = f".{SERVICES_MODULE}"
+            continue
+        deps.discard(node.name)
+        module = messages_dir / f"{node.name}.py"
+        module.write_text(render_message(src, sorted(deps)), encoding="utf-8")
+        index[node.name] = f".{MESSAGES_PACKAGE}.{node.name}"
+
+    services_file = lq_path / f"{SERVICES_MODULE}.py"
+    if service_sources:
+        services_file.write_text(
+            render_services(head, service_sources, sorted(service_deps)),
+            encoding="utf-8",
+        )
+    elif services_file.exists():
+        services_file.unlink()
+
+    init_file.write_text(render_init(index), encoding="utf-8")
+    print(
+        f"拆分完成: {len(message_names)} 个消息, {len(service_sources)} 个服务"
+    )
+
+
+def main():
+    lq_path = Path(sys.argv[1]) if len(sys.argv) > 1 else LQ_PATH
+    split(lq_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,23 @@ CONFIG_PATH = MAIN_PATH / "config.json"
 EXTEND_RES = MAIN_PATH / "extendRes"
 CHARACTOR_PATH = EXTEND_RES / "charactor"
 PAIPU_PATH = MAIN_PATH / "paipu"
+PROTO_PATH = MAIN_PATH / "proto"
+CAPTURE_PATH = MAIN_PATH / "capture"
+RES_CACHE_PATH = MAIN_PATH / "cache"
+JOURNAL_PATH = MAIN_PATH / "notify_journal.db"
+ARCHIVE_PATH = MAIN_PATH / "archive"
+RECORD_BLOB_PATH = MAIN_PATH / "records"
 
 
-for i in [EXTEND_RES, CHARACTOR_PATH, PAIPU_PATH]:
+for i in [
+    EXTEND_RES,
+    CHARACTOR_PATH,
+    PAIPU_PATH,
+    PROTO_PATH,
+    CAPTURE_PATH,
+    RES_CACHE_PATH,
+    ARCHIVE_PATH,
+    RECORD_BLOB_PATH,
+]:
     if not i.exists():
         i.mkdir(parents=True)
@@ -5,9 +5,11 @@ import httpx
 from gsuid_core.logger import logger
 from PIL import Image, UnidentifiedImageError
 
+from ..http_client import get_client
+
 
 async def get_charactor_img(url: str, path: Path):
-    sess = httpx.AsyncClient(verify=False)
+    sess = get_client("resource")
     path.parent.mkdir(parents=True, exist_ok=True)
 
     response = None